@@ -0,0 +1,53 @@
+"""add resume minhash signatures and lsh buckets
+
+Revision ID: 7f3a9c1e5b20
+Revises: 233263f4477e
+Create Date: 2026-10-19 09:12:41.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7f3a9c1e5b20'
+down_revision: Union[str, Sequence[str], None] = '233263f4477e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(name: str) -> bool:
+    # The baseline tables predate these migrations and may not exist yet on a fresh database
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if _has_table('resumes'):
+        with op.batch_alter_table('resumes') as batch_op:
+            batch_op.add_column(sa.Column('minhash_signature', sa.LargeBinary(), nullable=True))
+
+    op.create_table(
+        'resume_lsh_buckets',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('resume_id', sa.Integer(), nullable=False),
+        sa.Column('band', sa.Integer(), nullable=False),
+        sa.Column('bucket', sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(['resume_id'], ['resumes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_resume_lsh_buckets_resume_id', 'resume_lsh_buckets', ['resume_id'])
+    op.create_index('ix_resume_lsh_buckets_bucket', 'resume_lsh_buckets', ['bucket'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_resume_lsh_buckets_bucket', table_name='resume_lsh_buckets')
+    op.drop_index('ix_resume_lsh_buckets_resume_id', table_name='resume_lsh_buckets')
+    op.drop_table('resume_lsh_buckets')
+
+    if _has_table('resumes'):
+        with op.batch_alter_table('resumes') as batch_op:
+            batch_op.drop_column('minhash_signature')
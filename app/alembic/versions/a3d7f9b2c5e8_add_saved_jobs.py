@@ -0,0 +1,42 @@
+"""add saved jobs table and keyset index
+
+Revision ID: a3d7f9b2c5e8
+Revises: f2a6d8c4e1b9
+Create Date: 2026-10-24 10:31:07.264518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d7f9b2c5e8'
+down_revision: Union[str, Sequence[str], None] = 'f2a6d8c4e1b9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _has_table('saved_jobs'):
+        op.create_table(
+            'saved_jobs',
+            sa.Column('id', sa.Integer(), primary_key=True),
+            sa.Column('applicant_id', sa.Integer(), sa.ForeignKey('users.id')),
+            sa.Column('job_id', sa.Integer(), sa.ForeignKey('jobs.id')),
+            sa.Column('saved_at', sa.DateTime()),
+            sa.UniqueConstraint('applicant_id', 'job_id', name='unique_saved_job'),
+        )
+        op.create_index('ix_saved_jobs_id', 'saved_jobs', ['id'])
+    op.create_index('ix_saved_jobs_applicant_id_id', 'saved_jobs', ['applicant_id', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_saved_jobs_applicant_id_id', table_name='saved_jobs')
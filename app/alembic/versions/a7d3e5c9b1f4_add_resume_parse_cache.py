@@ -0,0 +1,37 @@
+"""add resume parse cache
+
+Revision ID: a7d3e5c9b1f4
+Revises: f4c1a9d7e3b2
+Create Date: 2026-10-21 09:12:55.340118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e5c9b1f4'
+down_revision: Union[str, Sequence[str], None] = 'f4c1a9d7e3b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'resume_parse_cache',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('prompt_version', sa.Integer(), nullable=False),
+        sa.Column('model', sa.String(), nullable=False),
+        sa.Column('result', sa.JSON(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.UniqueConstraint('content_hash', 'prompt_version', 'model', name='uq_resume_parse_cache_key'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('resume_parse_cache')
@@ -0,0 +1,36 @@
+"""add resume feature vector cache
+
+Revision ID: b41d0e6c2a97
+Revises: 7f3a9c1e5b20
+Create Date: 2026-10-19 11:40:03.527118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41d0e6c2a97'
+down_revision: Union[str, Sequence[str], None] = '7f3a9c1e5b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if _has_table('resumes'):
+        with op.batch_alter_table('resumes') as batch_op:
+            batch_op.add_column(sa.Column('feature_vector', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _has_table('resumes'):
+        with op.batch_alter_table('resumes') as batch_op:
+            batch_op.drop_column('feature_vector')
@@ -0,0 +1,52 @@
+"""add review rating aggregates and review keyset index
+
+Revision ID: b6e4c8a2d9f3
+Revises: a3d7f9b2c5e8
+Create Date: 2026-10-24 15:47:22.093614
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e4c8a2d9f3'
+down_revision: Union[str, Sequence[str], None] = 'a3d7f9b2c5e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+RATINGS = range(1, 6)
+
+
+def _has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'review_stats',
+        sa.Column('reviewee_id', sa.Integer(), sa.ForeignKey('users.id'), primary_key=True),
+        sa.Column('review_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('rating_sum', sa.Integer(), nullable=False, server_default='0'),
+        *(sa.Column(f'rating_{rating}', sa.Integer(), nullable=False, server_default='0') for rating in RATINGS),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+    )
+    if _has_table('reviews'):
+        op.create_index('ix_reviews_reviewee_id_id', 'reviews', ['reviewee_id', 'id'])
+        histogram = ", ".join(f"rating_{rating}" for rating in RATINGS)
+        buckets = ", ".join(f"SUM(CASE WHEN rating = {rating} THEN 1 ELSE 0 END)" for rating in RATINGS)
+        op.execute(
+            f"INSERT INTO review_stats (reviewee_id, review_count, rating_sum, {histogram}, updated_at) "
+            f"SELECT reviewee_id, COUNT(id), COALESCE(SUM(rating), 0), {buckets}, CURRENT_TIMESTAMP "
+            f"FROM reviews WHERE reviewee_id IS NOT NULL GROUP BY reviewee_id"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _has_table('reviews'):
+        op.drop_index('ix_reviews_reviewee_id_id', table_name='reviews')
+    op.drop_table('review_stats')
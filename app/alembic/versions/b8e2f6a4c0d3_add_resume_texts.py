@@ -0,0 +1,50 @@
+"""add compressed resume text storage
+
+Revision ID: b8e2f6a4c0d3
+Revises: a7d3e5c9b1f4
+Create Date: 2026-10-21 15:40:21.907345
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e2f6a4c0d3'
+down_revision: Union[str, Sequence[str], None] = 'a7d3e5c9b1f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'resume_texts',
+        sa.Column('content_hash', sa.String(length=64), primary_key=True),
+        sa.Column('compressed', sa.LargeBinary(), nullable=False),
+        sa.Column('char_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+    )
+    if _has_table('resumes'):
+        with op.batch_alter_table('resumes') as batch_op:
+            batch_op.add_column(sa.Column('text_hash', sa.String(length=64), nullable=True))
+            batch_op.create_foreign_key(
+                'fk_resumes_text_hash_resume_texts', 'resume_texts', ['text_hash'], ['content_hash']
+            )
+        op.create_index('ix_resumes_text_hash', 'resumes', ['text_hash'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _has_table('resumes'):
+        op.drop_index('ix_resumes_text_hash', table_name='resumes')
+        with op.batch_alter_table('resumes') as batch_op:
+            batch_op.drop_constraint('fk_resumes_text_hash_resume_texts', type_='foreignkey')
+            batch_op.drop_column('text_hash')
+    op.drop_table('resume_texts')
@@ -0,0 +1,75 @@
+"""add application status history and daily funnel rollups
+
+Revision ID: c4f8a2e6b1d7
+Revises: b6e4c8a2d9f3
+Create Date: 2026-10-25 10:12:48.551203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f8a2e6b1d7'
+down_revision: Union[str, Sequence[str], None] = 'b6e4c8a2d9f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'application_events',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('application_id', sa.Integer(), nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('from_status', sa.String(), nullable=True),
+        sa.Column('to_status', sa.String(), nullable=False),
+        sa.Column('actor_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('ix_application_events_job_id_created_at', 'application_events', ['job_id', 'created_at'])
+    op.create_index('ix_application_events_application_id_created_at', 'application_events',
+                    ['application_id', 'created_at'])
+    op.create_table(
+        'application_daily_stats',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('entered', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('exited', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('stage_seconds', sa.Float(), nullable=False, server_default='0'),
+        sa.Column('hire_seconds', sa.Float(), nullable=False, server_default='0'),
+        sa.UniqueConstraint('day', 'job_id', 'status', name='uq_application_daily_stats_key'),
+    )
+    op.create_index('ix_application_daily_stats_job_id_day', 'application_daily_stats', ['job_id', 'day'])
+
+    if _has_table('applications'):
+        # Best-effort history for existing applications: the submission, then (when it has
+        # moved on) the current status at the last update. Intermediate steps are unknown.
+        op.execute(
+            "INSERT INTO application_events (application_id, job_id, from_status, to_status, created_at) "
+            "SELECT id, job_id, NULL, 'pending', COALESCE(created_at, CURRENT_TIMESTAMP) "
+            "FROM applications WHERE job_id IS NOT NULL"
+        )
+        op.execute(
+            "INSERT INTO application_events (application_id, job_id, from_status, to_status, created_at) "
+            "SELECT id, job_id, 'pending', status, COALESCE(updated_at, created_at, CURRENT_TIMESTAMP) "
+            "FROM applications WHERE job_id IS NOT NULL AND status IS NOT NULL AND status <> 'pending'"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_application_daily_stats_job_id_day', table_name='application_daily_stats')
+    op.drop_table('application_daily_stats')
+    op.drop_index('ix_application_events_application_id_created_at', table_name='application_events')
+    op.drop_index('ix_application_events_job_id_created_at', table_name='application_events')
+    op.drop_table('application_events')
@@ -0,0 +1,74 @@
+"""add resume search columns and skills index
+
+Revision ID: d5a8f3b7e614
+Revises: c9e27d4f1a08
+Create Date: 2026-10-19 16:25:12.341870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a8f3b7e614'
+down_revision: Union[str, Sequence[str], None] = 'c9e27d4f1a08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_INDEXES = {
+    'ix_resumes_current_position': ['current_position'],
+    'ix_resumes_experience_years': ['experience_years'],
+    'ix_resumes_created_at_id': ['created_at', 'id'],
+    'ix_resumes_field_created_at_id': ['field', 'created_at', 'id'],
+    'ix_resumes_email_domain_created_at_id': ['email_domain', 'created_at', 'id'],
+}
+
+
+def _has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if _has_table('resumes'):
+        with op.batch_alter_table('resumes') as batch_op:
+            batch_op.add_column(sa.Column('field', sa.String(), nullable=True))
+            batch_op.add_column(sa.Column('current_position', sa.String(), nullable=True))
+            batch_op.add_column(sa.Column('experience_years', sa.Integer(), nullable=True))
+            batch_op.add_column(sa.Column('email_domain', sa.String(), nullable=True))
+            batch_op.add_column(sa.Column('education_text', sa.Text(), nullable=True))
+        for name, columns in SEARCH_INDEXES.items():
+            op.create_index(name, 'resumes', columns)
+
+    if _has_table('applications'):
+        op.create_index('ix_applications_job_id', 'applications', ['job_id'])
+        op.create_index('ix_applications_applicant_id', 'applications', ['applicant_id'])
+
+    op.create_table(
+        'resume_skills',
+        sa.Column('resume_id', sa.Integer(), nullable=False),
+        sa.Column('skill', sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(['resume_id'], ['resumes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('resume_id', 'skill'),
+    )
+    op.create_index('ix_resume_skills_skill_resume_id', 'resume_skills', ['skill', 'resume_id'])
+    # Existing rows are populated by: python -m app.jobs.backfill_resume_search
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_resume_skills_skill_resume_id', table_name='resume_skills')
+    op.drop_table('resume_skills')
+
+    if _has_table('applications'):
+        op.drop_index('ix_applications_applicant_id', table_name='applications')
+        op.drop_index('ix_applications_job_id', table_name='applications')
+
+    if _has_table('resumes'):
+        for name in SEARCH_INDEXES:
+            op.drop_index(name, table_name='resumes')
+        with op.batch_alter_table('resumes') as batch_op:
+            for column in ['education_text', 'email_domain', 'experience_years', 'current_position', 'field']:
+                batch_op.drop_column(column)
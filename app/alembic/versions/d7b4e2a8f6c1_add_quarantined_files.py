@@ -0,0 +1,51 @@
+"""add storage gc quarantine and file path indexes
+
+Revision ID: d7b4e2a8f6c1
+Revises: c3f9a1e7d5b2
+Create Date: 2026-10-22 16:05:33.418207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7b4e2a8f6c1'
+down_revision: Union[str, Sequence[str], None] = 'c3f9a1e7d5b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'quarantined_files',
+        sa.Column('id', sa.Integer(), primary_key=True),
+        sa.Column('store', sa.String(length=16), nullable=False),
+        sa.Column('key', sa.String(), nullable=False),
+        sa.Column('size', sa.BigInteger(), nullable=False),
+        sa.Column('quarantined_at', sa.DateTime(), nullable=False),
+        sa.UniqueConstraint('store', 'key', name='uq_quarantined_files_store_key'),
+    )
+    op.create_index('ix_quarantined_files_quarantined_at', 'quarantined_files', ['quarantined_at'])
+    # the GC looks up references by path in batches
+    if _has_table('resumes'):
+        op.create_index('ix_resumes_file_path', 'resumes', ['file_path'])
+    if _has_table('applications'):
+        op.create_index('ix_applications_resume_file_path', 'applications', ['resume_file_path'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _has_table('applications'):
+        op.drop_index('ix_applications_resume_file_path', table_name='applications')
+    if _has_table('resumes'):
+        op.drop_index('ix_resumes_file_path', table_name='resumes')
+    op.drop_index('ix_quarantined_files_quarantined_at', table_name='quarantined_files')
+    op.drop_table('quarantined_files')
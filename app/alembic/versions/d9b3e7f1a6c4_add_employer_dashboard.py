@@ -0,0 +1,40 @@
+"""add dashboard visit timestamp and applications (job_id, created_at) index
+
+Revision ID: d9b3e7f1a6c4
+Revises: c4f8a2e6b1d7
+Create Date: 2026-10-25 16:03:51.274410
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9b3e7f1a6c4'
+down_revision: Union[str, Sequence[str], None] = 'c4f8a2e6b1d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if _has_table('users'):
+        with op.batch_alter_table('users') as batch_op:
+            batch_op.add_column(sa.Column('dashboard_visited_at', sa.DateTime(), nullable=True))
+    if _has_table('applications'):
+        op.create_index('ix_applications_job_id_created_at', 'applications', ['job_id', 'created_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _has_table('applications'):
+        op.drop_index('ix_applications_job_id_created_at', table_name='applications')
+    if _has_table('users'):
+        with op.batch_alter_table('users') as batch_op:
+            batch_op.drop_column('dashboard_visited_at')
@@ -0,0 +1,40 @@
+"""add resume parser version and archived_at
+
+Revision ID: e2b6c8d04f71
+Revises: d5a8f3b7e614
+Create Date: 2026-10-20 10:08:44.215903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b6c8d04f71'
+down_revision: Union[str, Sequence[str], None] = 'd5a8f3b7e614'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if _has_table('resumes'):
+        with op.batch_alter_table('resumes') as batch_op:
+            batch_op.add_column(sa.Column('parser_version', sa.Integer(), nullable=True))
+            batch_op.add_column(sa.Column('archived_at', sa.DateTime(), nullable=True))
+        op.create_index('ix_resumes_parser_version', 'resumes', ['parser_version'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _has_table('resumes'):
+        op.drop_index('ix_resumes_parser_version', table_name='resumes')
+        with op.batch_alter_table('resumes') as batch_op:
+            batch_op.drop_column('archived_at')
+            batch_op.drop_column('parser_version')
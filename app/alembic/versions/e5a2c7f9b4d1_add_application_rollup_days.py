@@ -0,0 +1,38 @@
+"""record which days the application funnel rollups cover
+
+Revision ID: e5a2c7f9b4d1
+Revises: d9b3e7f1a6c4
+Create Date: 2026-10-27 09:41:06.382915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a2c7f9b4d1'
+down_revision: Union[str, Sequence[str], None] = 'd9b3e7f1a6c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'application_rollup_days',
+        sa.Column('day', sa.Date(), primary_key=True),
+        sa.Column('rolled_up_at', sa.DateTime(), nullable=False),
+    )
+    # Days rolled up before this table existed: only those with stats rows are known.
+    # Readers use the unbroken run ending at the latest day, so a gap is read live.
+    op.execute(
+        "INSERT INTO application_rollup_days (day, rolled_up_at) "
+        "SELECT DISTINCT day, CURRENT_TIMESTAMP FROM application_daily_stats"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('application_rollup_days')
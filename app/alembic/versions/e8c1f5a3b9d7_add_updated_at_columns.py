@@ -0,0 +1,47 @@
+"""add updated_at to applications, reviews and user profiles
+
+Revision ID: e8c1f5a3b9d7
+Revises: d7b4e2a8f6c1
+Create Date: 2026-10-23 09:41:07.512336
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8c1f5a3b9d7'
+down_revision: Union[str, Sequence[str], None] = 'd7b4e2a8f6c1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# table -> value existing rows start with (profiles have no created_at)
+TABLES = {
+    'applications': 'COALESCE(created_at, CURRENT_TIMESTAMP)',
+    'reviews': 'COALESCE(created_at, CURRENT_TIMESTAMP)',
+    'user_profiles': 'CURRENT_TIMESTAMP',
+}
+
+
+def _has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, backfill in TABLES.items():
+        if not _has_table(table):
+            continue
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+        op.execute(f"UPDATE {table} SET updated_at = {backfill}")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        if _has_table(table):
+            with op.batch_alter_table(table) as batch_op:
+                batch_op.drop_column('updated_at')
@@ -0,0 +1,41 @@
+"""add notification keyset indexes
+
+Revision ID: f2a6d8c4e1b9
+Revises: e8c1f5a3b9d7
+Create Date: 2026-10-23 14:12:48.905126
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a6d8c4e1b9'
+down_revision: Union[str, Sequence[str], None] = 'e8c1f5a3b9d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = {
+    'ix_notifications_user_id_id': ['user_id', 'id'],
+    'ix_notifications_user_id_is_read_id': ['user_id', 'is_read', 'id'],
+}
+
+
+def _has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if _has_table('notifications'):
+        for name, columns in INDEXES.items():
+            op.create_index(name, 'notifications', columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _has_table('notifications'):
+        for name in INDEXES:
+            op.drop_index(name, table_name='notifications')
@@ -0,0 +1,38 @@
+"""add resume parser fingerprint
+
+Revision ID: f4c1a9d7e3b2
+Revises: e2b6c8d04f71
+Create Date: 2026-10-20 14:31:07.582210
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4c1a9d7e3b2'
+down_revision: Union[str, Sequence[str], None] = 'e2b6c8d04f71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if _has_table('resumes'):
+        with op.batch_alter_table('resumes') as batch_op:
+            batch_op.add_column(sa.Column('parser_fingerprint', sa.String(length=16), nullable=True))
+        op.create_index('ix_resumes_parser_fingerprint', 'resumes', ['parser_fingerprint'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _has_table('resumes'):
+        op.drop_index('ix_resumes_parser_fingerprint', table_name='resumes')
+        with op.batch_alter_table('resumes') as batch_op:
+            batch_op.drop_column('parser_fingerprint')
@@ -0,0 +1,65 @@
+"""index the words of resume education and current position
+
+Revision ID: f7d3b9a5c2e8
+Revises: e5a2c7f9b4d1
+Create Date: 2026-10-27 14:18:52.907341
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7d3b9a5c2e8'
+down_revision: Union[str, Sequence[str], None] = 'e5a2c7f9b4d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 5000
+
+
+def _has_table(name: str) -> bool:
+    return sa.inspect(op.get_bind()).has_table(name)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    resume_terms = op.create_table(
+        'resume_terms',
+        sa.Column('resume_id', sa.Integer(), nullable=False),
+        sa.Column('field', sa.String(), nullable=False),
+        sa.Column('term', sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(['resume_id'], ['resumes.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('resume_id', 'field', 'term'),
+    )
+    op.create_index('ix_resume_terms_field_term_resume_id', 'resume_terms', ['field', 'term', 'resume_id'])
+
+    if not _has_table('resumes'):
+        return
+    # Same words as app.repository.resumesearch.search_terms, from the already promoted columns
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        batch = bind.execute(sa.text(
+            "SELECT id, education_text, current_position FROM resumes WHERE id > :last_id ORDER BY id LIMIT :limit"
+        ), {"last_id": last_id, "limit": BATCH_SIZE}).all()
+        if not batch:
+            break
+        rows = [
+            {"resume_id": resume_id, "field": field, "term": term}
+            for resume_id, education, position in batch
+            for field, value in (("education", education), ("current_position", position))
+            for term in dict.fromkeys(re.findall(r"\w+", (value or "").lower()))
+        ]
+        if rows:
+            op.bulk_insert(resume_terms, rows)
+        last_id = batch[-1][0]
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_resume_terms_field_term_resume_id', table_name='resume_terms')
+    op.drop_table('resume_terms')
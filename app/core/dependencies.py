@@ -7,6 +7,8 @@ from app.models.user import User
 from app.core.security import secret_key, ALGORITHM
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+# Same scheme, but a missing Authorization header yields None instead of a 401
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
 
 
 def get_db():
@@ -126,13 +128,15 @@ def require_any_role(*roles: str):
 
 
 def get_current_user_optional(
-        token: str = Depends(oauth2_scheme),
+        token: str | None = Depends(optional_oauth2_scheme),
         db: Session = Depends(get_db)
 ) -> User | None:
     """
     Get current user but don't raise exception if not authenticated
     Useful for endpoints that work for both authenticated and anonymous users
     """
+    if token is None:
+        return None
     try:
         payload = jwt.decode(token, secret_key, algorithms=[ALGORITHM])
         user_id = int(payload.get("sub"))
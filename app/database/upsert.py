@@ -0,0 +1,9 @@
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def upsert_insert(db: Session, model):
+    """INSERT for the session's dialect, with .on_conflict_do_nothing / .on_conflict_do_update
+    (PostgreSQL and SQLite share the ON CONFLICT syntax)"""
+    dialect = postgresql if db.get_bind().dialect.name == "postgresql" else sqlite
+    return dialect.insert(model)
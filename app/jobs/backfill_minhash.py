@@ -0,0 +1,37 @@
+"""Backfill MinHash signatures and LSH buckets for existing resumes.
+
+Usage:
+    python -m app.jobs.backfill_minhash --batch-size 200
+"""
+import argparse
+
+import structlog
+
+from app.config.logging_config import configure_logging
+from app.database.session import SessionLocal
+from app.repository.resumededup import ResumeDedupRepository
+
+log = structlog.get_logger()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--start-after-id", type=int, default=0,
+                        help="Resume from this resume id (exclusive)")
+    args = parser.parse_args()
+
+    configure_logging()
+    db = SessionLocal()
+    try:
+        result = ResumeDedupRepository(db).backfill_signatures(
+            batch_size=args.batch_size,
+            start_after_id=args.start_after_id
+        )
+        log.info("jobs.backfill_minhash.complete", **result)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""Populate resume search columns, skill rows and word (term) rows from existing parsed_data.
+
+Usage:
+    python -m app.jobs.backfill_resume_search --batch-size 1000
+"""
+import argparse
+
+import structlog
+
+from app.config.logging_config import configure_logging
+from app.database.session import SessionLocal
+from app.repository.resumesearch import ResumeSearchRepository
+
+log = structlog.get_logger()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--start-after-id", type=int, default=0,
+                        help="Resume from this resume id (exclusive)")
+    args = parser.parse_args()
+
+    configure_logging()
+    db = SessionLocal()
+    try:
+        result = ResumeSearchRepository(db).backfill(
+            batch_size=args.batch_size,
+            start_after_id=args.start_after_id
+        )
+        log.info("jobs.backfill_resume_search.complete", **result)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
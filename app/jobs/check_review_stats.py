@@ -0,0 +1,40 @@
+"""Recompute review rating aggregates from the reviews table and repair drift.
+
+Usage:
+    python -m app.jobs.check_review_stats --batch-size 500
+    python -m app.jobs.check_review_stats --dry-run
+
+Writes keep the aggregates in step transactionally; this is the safety net
+for rows written around them (manual SQL, restores). Meant to run from cron.
+"""
+import argparse
+
+import structlog
+
+from app.config.logging_config import configure_logging
+from app.database.session import SessionLocal
+from app.repository.review import CHECK_BATCH_SIZE, check_review_stats
+
+log = structlog.get_logger()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=CHECK_BATCH_SIZE)
+    parser.add_argument("--after-id", type=int, default=None, help="Start after this reviewee id")
+    parser.add_argument("--max-batches", type=int, default=None, help="Stop after this many batches")
+    parser.add_argument("--dry-run", action="store_true", help="Report mismatches without fixing them")
+    args = parser.parse_args()
+
+    configure_logging()
+    db = SessionLocal()
+    try:
+        result = check_review_stats(db, batch_size=args.batch_size, fix=not args.dry_run,
+                                    after_id=args.after_id, max_batches=args.max_batches)
+        log.info("jobs.check_review_stats.complete", dry_run=args.dry_run, **result)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
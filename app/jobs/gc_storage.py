@@ -0,0 +1,47 @@
+"""Quarantine unreferenced resume uploads and delete expired quarantine.
+
+Usage:
+    python -m app.jobs.gc_storage --max-objects 50000 --checkpoint gc_storage.checkpoint.json
+    python -m app.jobs.gc_storage --dry-run
+
+Meant to run from cron. With --max-objects each run sweeps the next slice
+of the storage listing and the checkpoint carries the position over.
+"""
+import argparse
+import asyncio
+
+import structlog
+
+from app.config.logging_config import configure_logging
+from app.database.session import SessionLocal
+from app.repository.storagegc import BATCH_SIZE, StorageGCRepository
+
+log = structlog.get_logger()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--max-objects", type=int, default=None,
+                        help="Stop after listing this many objects (continue next run)")
+    parser.add_argument("--checkpoint", default="gc_storage.checkpoint.json",
+                        help="Checkpoint file holding the listing position per store")
+    parser.add_argument("--dry-run", action="store_true", help="Report orphans without moving anything")
+    args = parser.parse_args()
+
+    configure_logging()
+    db = SessionLocal()
+    try:
+        result = asyncio.run(StorageGCRepository(db).sweep(
+            batch_size=args.batch_size,
+            max_objects=args.max_objects,
+            checkpoint_path=None if args.dry_run else args.checkpoint,
+            dry_run=args.dry_run
+        ))
+        log.info("jobs.gc_storage.complete", dry_run=args.dry_run, **result)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
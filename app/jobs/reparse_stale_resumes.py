@@ -0,0 +1,45 @@
+"""Reparse resumes whose parsed data came from an older parser, newest first.
+
+Usage:
+    python -m app.jobs.reparse_stale_resumes --batch-size 50 --rate 5 \
+        --checkpoint reparse_stale.checkpoint.json
+
+Rerunning with the same checkpoint file continues an interrupted run.
+"""
+import argparse
+
+import structlog
+
+from app.config.logging_config import configure_logging
+from app.database.session import SessionLocal
+from app.repository.resumebulk import ResumeBulkRepository
+
+log = structlog.get_logger()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--rate", type=float, default=None,
+                        help="Maximum resumes reparsed per second")
+    parser.add_argument("--checkpoint", default="reparse_stale.checkpoint.json",
+                        help="Checkpoint file used to resume an interrupted run")
+    parser.add_argument("--max-batches", type=int, default=None)
+    args = parser.parse_args()
+
+    configure_logging()
+    db = SessionLocal()
+    try:
+        result = ResumeBulkRepository(db).reparse_stale(
+            batch_size=args.batch_size,
+            rate=args.rate,
+            checkpoint_path=args.checkpoint,
+            max_batches=args.max_batches
+        )
+        log.info("jobs.reparse_stale_resumes.complete", **result)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
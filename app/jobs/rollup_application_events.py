@@ -0,0 +1,52 @@
+"""Materialize daily funnel rollups from the application status history.
+
+Usage:
+    python -m app.jobs.rollup_application_events              # yesterday (UTC)
+    python -m app.jobs.rollup_application_events --days 30    # the last 30 days
+    python -m app.jobs.rollup_application_events --day 2026-10-01
+    python -m app.jobs.rollup_application_events --backfill    # every day since the first event
+
+Each day is recomputed from application_events and replaced, so re-running is
+safe. Meant to run from cron shortly after midnight UTC; the analytics
+endpoints read rollups for large employers for the unbroken run of rolled-up
+days and everything outside it live, so run --backfill once before relying on
+rollups for older history.
+"""
+import argparse
+from datetime import date, datetime, timedelta
+
+import structlog
+from sqlalchemy import func
+
+from app.config.logging_config import configure_logging
+from app.database.session import SessionLocal
+from app.models.applicationevent import ApplicationEvent
+from app.repository.applicationevent import ApplicationEventRepository
+
+log = structlog.get_logger()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--day", type=date.fromisoformat, default=None, help="Roll up this day only (YYYY-MM-DD)")
+    parser.add_argument("--days", type=int, default=1, help="Roll up this many days, ending yesterday")
+    parser.add_argument("--backfill", action="store_true", help="Roll up every day since the first event")
+    args = parser.parse_args()
+
+    configure_logging()
+    db = SessionLocal()
+    try:
+        yesterday = datetime.utcnow().date() - timedelta(days=1)
+        if args.backfill:
+            first = db.query(func.min(ApplicationEvent.created_at)).scalar()
+            args.days = max((yesterday - first.date()).days + 1, 1) if first else 1
+        days = [args.day] if args.day else [yesterday - timedelta(days=n) for n in reversed(range(args.days))]
+        rows = sum(ApplicationEventRepository(db).rollup_day(day) for day in days)
+        log.info("jobs.rollup_application_events.complete", first_day=str(days[0]), last_day=str(days[-1]),
+                 days=len(days), rows=rows)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,11 +11,19 @@ from starlette.middleware.sessions import SessionMiddleware
 
 # Routers
 from app.api import auth
-from app.routes import job, review, userprofile, applicationwithresumeparser
+from app.routes import (
+    job, review, userprofile, applicationwithresumeparser, resume, backgroundjob, storage, metrics, notification, events,
+    savedjob, analytics, dashboard
+)
+from app.repository.dashboard import dashboard_invalidations
+from app.repository.notification import notification_outbox
+from app.utils.event_broker import event_broker
 from app.database.session import engine
 from app.database.base import Base
 
 from app.config.logging_config import configure_logging
+from app.utils.compression import CompressionMiddleware
+from app.utils.json_response import FastJSONResponse
 import structlog
 import structlog.contextvars
 
@@ -77,10 +85,15 @@ async def init_rate_limit():
     await FastAPILimiter.init(r, identifier=identifier)
 
 app = FastAPI(
+    default_response_class=FastJSONResponse,
     dependencies=[Depends(RateLimiter(times=120, seconds=60))]
 )
 
 # middlewares
+app.add_middleware(
+    CompressionMiddleware,
+    skip_paths=[r"^/applications/\d+/resume$"],  # resume downloads: already-compressed formats, Range requests
+)
 app.add_middleware(LoggingMiddleware)
 app.add_middleware(
     SessionMiddleware,
@@ -113,9 +126,18 @@ async def health():
 @app.on_event("startup")
 async def on_startup():
     await init_rate_limit()
+    notification_outbox.start()
+    dashboard_invalidations.start()
     log.info("app.startup.complete")
 
 
+@app.on_event("shutdown")
+async def on_shutdown():
+    await notification_outbox.stop()  # write notifications still buffered
+    await dashboard_invalidations.stop()
+    await event_broker.stop()
+
+
 @app.get("/test")
 async def home():
     return {"message": "It is working"}
@@ -128,6 +150,15 @@ app.include_router(
 app.include_router(job.router)
 app.include_router(review.router)
 app.include_router(userprofile.router)
+app.include_router(resume.router)
+app.include_router(backgroundjob.router)
+app.include_router(storage.router)
+app.include_router(metrics.router)
+app.include_router(notification.router)
+app.include_router(events.router)
+app.include_router(savedjob.router)
+app.include_router(analytics.router)
+app.include_router(dashboard.router)
 
 app.include_router(
     applicationwithresumeparser.router,
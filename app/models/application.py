@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.types import JSON
 from datetime import datetime
@@ -8,10 +8,10 @@ class Application(Base):
     __tablename__ = "applications"
 
     id = Column(Integer, primary_key=True, index=True)
-    job_id = Column(Integer, ForeignKey("jobs.id"))
-    applicant_id = Column(Integer, ForeignKey("users.id"))
+    job_id = Column(Integer, ForeignKey("jobs.id"), index=True)
+    applicant_id = Column(Integer, ForeignKey("users.id"), index=True)
 
-    resume_file_path = Column(String, nullable=True)
+    resume_file_path = Column(String, nullable=True, index=True)
     cover_letter = Column(Text, nullable=True)
     parsed_resume = Column(JSON, nullable=True)
     status = Column(String, default="pending")  # 'pending', 'reviewed', 'rejected'
@@ -20,3 +20,8 @@ class Application(Base):
     applicant = relationship("User", back_populates="applications")
 
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_applications_job_id_created_at", "job_id", "created_at"),
+    )
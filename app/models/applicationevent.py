@@ -0,0 +1,53 @@
+from sqlalchemy import Column, Integer, String, DateTime, Date, Float, Index, UniqueConstraint
+from datetime import datetime
+from app.database.base import Base
+
+
+class ApplicationEvent(Base):
+    """Append-only status history: one row per status an application enters,
+    written in the same transaction as the change. application_id and job_id
+    carry no foreign keys so history outlives withdrawn applications and
+    deleted jobs (funnels stay stable after the fact)."""
+    __tablename__ = "application_events"
+
+    id = Column(Integer, primary_key=True)
+    application_id = Column(Integer, nullable=False)
+    job_id = Column(Integer, nullable=False)
+    from_status = Column(String, nullable=True)  # None for the submission itself
+    to_status = Column(String, nullable=False)
+    actor_id = Column(Integer, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        Index("ix_application_events_job_id_created_at", "job_id", "created_at"),
+        Index("ix_application_events_application_id_created_at", "application_id", "created_at"),
+    )
+
+
+class ApplicationDailyStats(Base):
+    """Per day, job and status rollup of application_events (see rollup_application_events)"""
+    __tablename__ = "application_daily_stats"
+
+    id = Column(Integer, primary_key=True)
+    day = Column(Date, nullable=False)
+    job_id = Column(Integer, nullable=False)
+    status = Column(String, nullable=False)
+    entered = Column(Integer, nullable=False, default=0)  # transitions into the status that day
+    exited = Column(Integer, nullable=False, default=0)  # stays in the status that ended that day...
+    stage_seconds = Column(Float, nullable=False, default=0)  # ...and their total length
+    hire_seconds = Column(Float, nullable=False, default=0)  # submission to acceptance, for "accepted"
+
+    __table_args__ = (
+        UniqueConstraint("day", "job_id", "status", name="uq_application_daily_stats_key"),
+        Index("ix_application_daily_stats_job_id_day", "job_id", "day"),
+    )
+
+
+class ApplicationRollupDay(Base):
+    """One row per day rollup_day has materialized, including days without events, so
+    readers know which days application_daily_stats covers (an absent stats row is a zero
+    only on these days)"""
+    __tablename__ = "application_rollup_days"
+
+    day = Column(Date, primary_key=True)
+    rolled_up_at = Column(DateTime, nullable=False, default=datetime.utcnow)
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text
+from sqlalchemy.orm import relationship
+from sqlalchemy.types import JSON
+from datetime import datetime
+from app.database.base import Base
+
+
+class BackgroundJob(Base):
+    __tablename__ = "background_jobs"
+
+    id = Column(String(36), primary_key=True)  # uuid4
+    kind = Column(String, nullable=False)  # 'resume_export', ...
+    owner_id = Column(Integer, ForeignKey("users.id"), index=True)
+    status = Column(String, nullable=False, default="queued")  # 'queued', 'running', 'completed', 'failed'
+    params = Column(JSON, nullable=True)
+    progress = Column(Integer, default=0)
+    total = Column(Integer, nullable=True)
+    result = Column(JSON, nullable=True)
+    result_path = Column(String, nullable=True)
+    error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
+
+    owner = relationship("User")
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime, UniqueConstraint
+from datetime import datetime
+from app.database.base import Base
+
+
+class QuarantinedFile(Base):
+    """An unreferenced upload moved aside by the storage GC, awaiting deletion or restore"""
+    __tablename__ = "quarantined_files"
+
+    id = Column(Integer, primary_key=True)
+    store = Column(String(16), nullable=False)  # "objects" (content-addressed) or "legacy" (uploads/resumes)
+    key = Column(String, nullable=False)
+    size = Column(BigInteger, nullable=False)
+    quarantined_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+
+    __table_args__ = (
+        UniqueConstraint("store", "key", name="uq_quarantined_files_store_key"),
+    )
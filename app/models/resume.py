@@ -1,8 +1,12 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Text, LargeBinary, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.types import JSON
 from datetime import datetime
 from app.database.base import Base
+from app.models.resumelsh import ResumeLSHBucket
+from app.models.resumeskill import ResumeSkill
+from app.models.resumeterm import ResumeTerm
+from app.models.resumetext import ResumeText  # noqa: F401  text_hash foreign key target
 
 
 class Resume(Base):
@@ -10,8 +14,31 @@ class Resume(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     applicant_id = Column(Integer, ForeignKey("users.id"))
-    file_path = Column(String, nullable=False)
+    file_path = Column(String, nullable=False, index=True)
     parsed_data = Column(JSON, nullable=True)
+    minhash_signature = Column(LargeBinary, nullable=True)  # packed uint32 MinHash values
+    feature_vector = Column(LargeBinary, nullable=True)  # cached comparison vector, cleared on reparse
+    parser_version = Column(Integer, nullable=True, index=True)  # ResumeParser.VERSION that produced parsed_data
+    parser_fingerprint = Column(String(16), nullable=True, index=True)  # parser_fingerprint() at parse time
+    text_hash = Column(String(64), ForeignKey("resume_texts.content_hash"), nullable=True, index=True)  # full text
+    archived_at = Column(DateTime, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # Search columns promoted from parsed_data at parse time (normalized to lowercase)
+    field = Column(String, nullable=True)
+    current_position = Column(String, nullable=True, index=True)
+    experience_years = Column(Integer, nullable=True, index=True)
+    email_domain = Column(String, nullable=True)
+    education_text = Column(Text, nullable=True)
+
     applicant = relationship("User", backref="resumes")
+    lsh_buckets = relationship(ResumeLSHBucket, cascade="all, delete-orphan", passive_deletes=True)
+    skill_rows = relationship(ResumeSkill, cascade="all, delete-orphan", passive_deletes=True)
+    term_rows = relationship(ResumeTerm, cascade="all, delete-orphan", passive_deletes=True)
+
+    # Equality filters lead composite indexes so the newest-first page order comes from the index
+    __table_args__ = (
+        Index("ix_resumes_created_at_id", "created_at", "id"),
+        Index("ix_resumes_field_created_at_id", "field", "created_at", "id"),
+        Index("ix_resumes_email_domain_created_at_id", "email_domain", "created_at", "id"),
+    )
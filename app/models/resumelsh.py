@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, BigInteger, ForeignKey, Index
+from app.database.base import Base
+
+
+class ResumeLSHBucket(Base):
+    __tablename__ = "resume_lsh_buckets"
+
+    id = Column(Integer, primary_key=True)
+    resume_id = Column(Integer, ForeignKey("resumes.id", ondelete="CASCADE"), nullable=False, index=True)
+    band = Column(Integer, nullable=False)
+    bucket = Column(BigInteger, nullable=False)  # band-salted hash of the band's rows
+
+    __table_args__ = (Index("ix_resume_lsh_buckets_bucket", "bucket"),)
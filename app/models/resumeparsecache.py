@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, DateTime, UniqueConstraint
+from sqlalchemy.types import JSON
+from datetime import datetime
+from app.database.base import Base
+
+
+class ResumeParseCache(Base):
+    """LLM parse results keyed by resume text hash, prompt version and model"""
+    __tablename__ = "resume_parse_cache"
+
+    id = Column(Integer, primary_key=True)
+    content_hash = Column(String(64), nullable=False)  # sha256 of the resume text
+    prompt_version = Column(Integer, nullable=False)
+    model = Column(String, nullable=False)
+    result = Column(JSON, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    __table_args__ = (
+        UniqueConstraint("content_hash", "prompt_version", "model", name="uq_resume_parse_cache_key"),
+    )
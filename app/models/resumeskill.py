@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from app.database.base import Base
+
+
+class ResumeSkill(Base):
+    __tablename__ = "resume_skills"
+
+    resume_id = Column(Integer, ForeignKey("resumes.id", ondelete="CASCADE"), primary_key=True)
+    skill = Column(String, primary_key=True)  # normalized (lowercase, stripped)
+
+    __table_args__ = (Index("ix_resume_skills_skill_resume_id", "skill", "resume_id"),)
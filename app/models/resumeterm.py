@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, Index
+from app.database.base import Base
+
+
+class ResumeTerm(Base):
+    """Words of a resume's free-text search columns (education, current position), so
+    word-prefix filters are index range scans instead of LIKE '%x%' over every resume"""
+    __tablename__ = "resume_terms"
+
+    resume_id = Column(Integer, ForeignKey("resumes.id", ondelete="CASCADE"), primary_key=True)
+    field = Column(String, primary_key=True)  # "education" or "current_position"
+    term = Column(String, primary_key=True)  # one lowercase word
+
+    __table_args__ = (Index("ix_resume_terms_field_term_resume_id", "field", "term", "resume_id"),)
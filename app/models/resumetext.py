@@ -0,0 +1,19 @@
+import zlib
+from sqlalchemy import Column, Integer, String, DateTime, LargeBinary
+from sqlalchemy.orm import deferred
+from datetime import datetime
+from app.database.base import Base
+
+
+class ResumeText(Base):
+    """Full extracted resume text, zlib-compressed and stored once per distinct text"""
+    __tablename__ = "resume_texts"
+
+    content_hash = Column(String(64), primary_key=True)  # sha256 of the UTF-8 text
+    compressed = deferred(Column(LargeBinary, nullable=False))
+    char_count = Column(Integer, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    @property
+    def text(self) -> str:
+        return zlib.decompress(self.compressed).decode("utf-8")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database.base import Base
@@ -12,6 +12,12 @@ class Review(Base):
     rating = Column(Integer)  # 1 to 5
     comment = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     reviewer = relationship("User", foreign_keys=[reviewer_id], backref="given_reviews")
     reviewee = relationship("User", foreign_keys=[reviewee_id], backref="received_reviews")
+
+    __table_args__ = (
+        # keyset pages (newest first) of a user's reviews
+        Index("ix_reviews_reviewee_id_id", "reviewee_id", "id"),
+    )
@@ -0,0 +1,21 @@
+from sqlalchemy import Column, Integer, ForeignKey, DateTime
+from datetime import datetime
+from app.database.base import Base
+
+RATINGS = range(1, 6)
+
+class ReviewStats(Base):
+    """Per-reviewee rating aggregates, kept in step with `reviews` by the review
+    repository in the same transaction as each write (see check_review_stats)"""
+    __tablename__ = "review_stats"
+
+    reviewee_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    review_count = Column(Integer, nullable=False, default=0)
+    rating_sum = Column(Integer, nullable=False, default=0)
+    # histogram: number of reviews with each rating
+    rating_1 = Column(Integer, nullable=False, default=0)
+    rating_2 = Column(Integer, nullable=False, default=0)
+    rating_3 = Column(Integer, nullable=False, default=0)
+    rating_4 = Column(Integer, nullable=False, default=0)
+    rating_5 = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, UniqueConstraint
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database.base import Base
@@ -14,4 +14,8 @@ class SavedJob(Base):
     applicant = relationship("User", backref="saved_jobs")
     job = relationship("Job", backref="saved_by")
 
-    __table_args__ = (UniqueConstraint('applicant_id', 'job_id', name='unique_saved_job'),)
+    __table_args__ = (
+        UniqueConstraint('applicant_id', 'job_id', name='unique_saved_job'),
+        # keyset pages (most recently saved first) per applicant
+        Index("ix_saved_jobs_applicant_id_id", "applicant_id", "id"),
+    )
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, BigInteger, String, DateTime
+from datetime import datetime
+from app.database.base import Base
+
+
+class StoredFile(Base):
+    """One content-addressed object in resume storage and how many rows point at it"""
+    __tablename__ = "stored_files"
+
+    key = Column(String, primary_key=True)  # e.g. "ab/ab12....pdf" (sha256 of the bytes + extension)
+    size = Column(BigInteger, nullable=False)
+    refcount = Column(Integer, nullable=False, default=0)
+    upload_count = Column(Integer, nullable=False, default=0)  # uploads that resolved to this object
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
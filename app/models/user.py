@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean
+from sqlalchemy import Column, Integer, String, Boolean, DateTime
 from sqlalchemy.orm import relationship
 from app.database.base import Base
 from app.models.application import Application
@@ -18,6 +18,9 @@ class User(Base):
     name = Column(String, nullable=True)
     profile_picture = Column(String, nullable=True)
 
+    # Employers: when the dashboard was last opened ("new since last visit")
+    dashboard_visited_at = Column(DateTime, nullable=True)
+
     # Relationships
     jobs = relationship("Job", back_populates="employer", cascade="all, delete")
     applications = relationship(Application, back_populates="applicant", cascade="all, delete")
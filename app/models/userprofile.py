@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime
 from sqlalchemy.orm import relationship
+from datetime import datetime
 from app.database.base import Base
 
 class UserProfile(Base):
@@ -12,5 +13,6 @@ class UserProfile(Base):
     linkedin = Column(String, nullable=True)
     github = Column(String, nullable=True)
     website = Column(String, nullable=True)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     user = relationship("User", backref="profile")
@@ -1,68 +1,87 @@
-import os
+import asyncio
+from typing import Optional
+import structlog
 from sqlalchemy.orm import Session
 from fastapi import HTTPException
 from app.models.application import Application
+from app.database.upsert import upsert_insert
+from app.models.resumeparsecache import ResumeParseCache
+from app.repository.applicationevent import record_status_events, status_event
+from app.repository.dashboard import invalidate_dashboards
+from app.repository.notification import notify_new_application, notify_status_change
+from app.repository.resumestorage import ResumeStorageRepository
 from app.schemas.application import ApplicationCreate, ApplicationUpdateStatus
-from openai import OpenAI
-from pdfminer.high_level import extract_text as extract_pdf_text
-from docx import Document
-import mimetypes
+from app.utils import llm_parser, text_extractors
+from app.utils.resume_parser import ResumeParser
+
+log = structlog.get_logger()
 
 
 def extract_resume_text(file_path: str) -> str:
-    mime_type, _ = mimetypes.guess_type(file_path)
-
-    if mime_type == "application/pdf":
-        return extract_pdf_text(file_path)
-    elif mime_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-        doc = Document(file_path)
-        return "\n".join([para.text for para in doc.paragraphs])
-    else:
+    try:
+        return text_extractors.extract_text(file_path)
+    except text_extractors.UnsupportedFormatError:
         raise HTTPException(status_code=400, detail="Unsupported file type for resume")
 
 
-def parse_resume_with_openai(text: str) -> dict:
-    from openai import OpenAI
-    import os
-    import json
+def _cached_parse(bind, key: dict) -> Optional[dict]:
+    with Session(bind) as db:
+        cached = db.query(ResumeParseCache).filter_by(**key).first()
+        return cached.result if cached else None
 
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-    prompt = f"""
-    Extract the following structured JSON from the resume text:
 
-    {{
-        "name": "",
-        "email": "",
-        "phone": "",
-        "education": [{{"degree": "", "institution": "", "year": ""}}],
-        "experience": [{{"title": "", "company": "", "dates": "", "description": ""}}],
-        "skills": []
-    }}
-
-    Resume text:
-    \"\"\"{text}\"\"\"
-    """
+def _store_parse(bind, key: dict, result: dict):
+    with Session(bind) as db:
+        # ON CONFLICT DO NOTHING: a concurrent request may have cached the same text first
+        db.execute(upsert_insert(db, ResumeParseCache).values(result=result, **key).on_conflict_do_nothing(
+            index_elements=[ResumeParseCache.content_hash, ResumeParseCache.prompt_version, ResumeParseCache.model]
+        ))
+        db.commit()
 
-    try:
-        response = client.chat.completions.create(
-            model="gpt-4",  # or "gpt-3.5-turbo"
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0,
-        )
-        content = response.choices[0].message.content
-        return json.loads(content)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"OpenAI error: {str(e)}")
 
+async def parse_resume_with_openai(db: Session, text: str) -> dict:
+    """Parse resume text with the LLM, reusing cached results for identical text.
 
+    Falls back to the local ResumeParser when the LLM is unconfigured, slow,
+    failing, or over its error budget. Only LLM results are cached. The cache
+    is read and written in a worker thread through its own short-lived session,
+    so neither blocks the loop nor commits or rolls back the caller's work.
+    """
+    key = {
+        "content_hash": llm_parser.content_hash(text),
+        "prompt_version": llm_parser.PROMPT_VERSION,
+        "model": llm_parser.MODEL,
+    }
+    cached = await asyncio.to_thread(_cached_parse, db.get_bind(), key)
+    if cached:
+        return cached
 
-def create_application(db: Session, applicant_id: int, application: ApplicationCreate):
-    if not os.path.isfile(application.resume_file_path):
+    try:
+        result = await llm_parser.parse_with_llm(text)
+    except llm_parser.LLMUnavailable as e:
+        log.warning("resume.llm_parse.fallback", reason=str(e))
+        result = await asyncio.to_thread(ResumeParser("").parse_text, text)
+        if "error" in result:
+            raise HTTPException(status_code=422, detail=f"Resume parsing failed: {result['error']}")
+        result["source"] = "local"
+        return result
+
+    result["source"] = "llm"
+    await asyncio.to_thread(_store_parse, db.get_bind(), key, result)
+    return result
+
+
+async def create_application(db: Session, applicant_id: int, application: ApplicationCreate):
+    storage = ResumeStorageRepository(db)
+    if not storage.exists(application.resume_file_path):
         raise HTTPException(status_code=400, detail="Resume file not found")
 
     try:
-        text = extract_resume_text(application.resume_file_path)
-        parsed_resume = parse_resume_with_openai(text)
+        async with storage.local_copy_async(application.resume_file_path) as local_path:
+            text = await asyncio.to_thread(extract_resume_text, local_path)
+        parsed_resume = await parse_resume_with_openai(db, text)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to parse resume: {str(e)}")
 
@@ -75,8 +94,13 @@ def create_application(db: Session, applicant_id: int, application: ApplicationC
     )
 
     db.add(new_application)
+    db.flush()
+    record_status_events(db, [status_event(new_application, new_application.status, actor_id=applicant_id)])
     db.commit()
     db.refresh(new_application)
+    if new_application.job:
+        invalidate_dashboards(new_application.job.posted_by)
+        notify_new_application(new_application.job.posted_by, new_application.job.title)
     return new_application
 
 
@@ -95,14 +119,21 @@ def get_applications_by_user(db: Session, applicant_id: int):
     return db.query(Application).filter(Application.applicant_id == applicant_id).all()
 
 
-def update_application_status(db: Session, app_id: int, status_data: ApplicationUpdateStatus):
+def update_application_status(db: Session, app_id: int, status_data: ApplicationUpdateStatus,
+                              actor_id: Optional[int] = None):
     application = db.query(Application).filter(Application.id == app_id).first()
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
 
+    if application.status != status_data.status:
+        record_status_events(db, [status_event(application, status_data.status, application.status, actor_id)])
     application.status = status_data.status
     db.commit()
     db.refresh(application)
+    if application.job:
+        invalidate_dashboards(application.job.posted_by)
+    notify_status_change(application.applicant_id, application.id,
+                         application.job.title if application.job else None, application.status)
     return application
 
 
@@ -114,6 +145,9 @@ def delete_application(db: Session, app_id: int, current_user_id: int, is_admin=
     if application.applicant_id != current_user_id and not is_admin:
         raise HTTPException(status_code=403, detail="Not authorized to delete this application")
 
+    employer_id = application.job.posted_by if application.job else None
+    ResumeStorageRepository(db).release(application.resume_file_path)
     db.delete(application)
     db.commit()
+    invalidate_dashboards(employer_id)
     return {"detail": "Application deleted successfully"}
\ No newline at end of file
@@ -0,0 +1,251 @@
+import os
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+from sqlalchemy import and_, case, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.database.upsert import upsert_insert
+from app.models.application import Application
+from app.models.applicationevent import ApplicationDailyStats, ApplicationEvent, ApplicationRollupDay
+from app.models.job import Job
+
+STAGES = ["pending", "reviewed", "accepted", "rejected"]
+HIRED = "accepted"
+SOURCES = ("auto", "live", "rollup")
+# Scopes with more applications than this are answered from the daily rollups
+ROLLUP_THRESHOLD = int(os.getenv("ANALYTICS_ROLLUP_THRESHOLD", "20000"))
+
+
+def status_event(application: Application, to_status: str, from_status: Optional[str] = None,
+                 actor_id: Optional[int] = None) -> Dict:
+    return {"application_id": application.id, "job_id": application.job_id, "from_status": from_status,
+            "to_status": to_status, "actor_id": actor_id}
+
+
+def record_status_events(db: Session, events: List[Dict]):
+    """Append history rows in the caller's transaction (one executemany; does not commit)"""
+    if events:
+        now = datetime.utcnow()
+        db.execute(insert(ApplicationEvent), [{"created_at": now, **event} for event in events])
+
+
+def _seconds_between(db: Session, start, end):
+    if db.get_bind().dialect.name == "postgresql":
+        return func.extract("epoch", end - start)
+    return (func.julianday(end) - func.julianday(start)) * 86400.0
+
+
+def _day_bounds(since: Optional[date], until: Optional[date]):
+    return (datetime.combine(since, time.min) if since else None,
+            datetime.combine(until + timedelta(days=1), time.min) if until else None)
+
+
+def _add_totals(into: Dict[str, Dict], totals: Dict[str, Dict]):
+    for status, values in totals.items():
+        row = into.setdefault(status, {"entered": 0, "exited": 0, "stage_seconds": 0.0, "hire_seconds": 0.0})
+        for key in row:
+            row[key] += values[key] or 0
+
+
+class ApplicationEventRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def history(self, application_id: int) -> List[ApplicationEvent]:
+        return self.db.query(ApplicationEvent).filter(ApplicationEvent.application_id == application_id).order_by(
+            ApplicationEvent.created_at, ApplicationEvent.id
+        ).all()
+
+    def report_jobs(self, employer_id: Optional[int], job_id: Optional[int] = None):
+        """The jobs a report covers, as a subquery: one job or all of an employer's
+        (employer_id None: every job, for admins). 404 for a job outside the scope."""
+        query = select(Job.id)
+        if employer_id is not None:
+            query = query.where(Job.posted_by == employer_id)
+        if job_id is not None:
+            query = query.where(Job.id == job_id)
+            if self.db.execute(query).first() is None:
+                raise HTTPException(status_code=404, detail="Job not found")
+        return query
+
+    def _stays(self, job_ids, active_from: Optional[datetime] = None, active_until: Optional[datetime] = None):
+        """Each event as a stay in its status: when it began, when it ended (LEAD over the
+        application's history) and when the application was submitted (MIN). With bounds,
+        only applications that have an event inside them are windowed, but over their full
+        history, so stays that began earlier still end correctly."""
+        E = ApplicationEvent
+        query = select(
+            E.application_id, E.job_id, E.to_status, E.created_at,
+            func.lead(E.created_at).over(partition_by=E.application_id, order_by=(E.created_at, E.id)).label("left_at"),
+            func.min(E.created_at).over(partition_by=E.application_id).label("submitted_at"),
+        ).where(E.job_id.in_(job_ids))
+        if active_from or active_until:
+            active = select(E.application_id).where(E.job_id.in_(job_ids))
+            if active_from:
+                active = active.where(E.created_at >= active_from)
+            if active_until:
+                active = active.where(E.created_at < active_until)
+            query = query.where(E.application_id.in_(active))
+        return query.subquery()
+
+    def _range_totals(self, job_ids, since: Optional[date], until: Optional[date], per_job: bool = False):
+        """Per status (and job): stays that began in the range, stays that ended in it and
+        their total length, and for HIRED the total time from submission. One windowed
+        query; exits count on the day they happen, so past days never change."""
+        start, end = _day_bounds(since, until)
+        stays = self._stays(job_ids, start, end)
+
+        def within(column):
+            conditions = [column.isnot(None)]
+            if start:
+                conditions.append(column >= start)
+            if end:
+                conditions.append(column < end)
+            return and_(*conditions)
+
+        began, ended = within(stays.c.created_at), within(stays.c.left_at)
+        seconds_to_entry = _seconds_between(self.db, stays.c.submitted_at, stays.c.created_at)
+        keys = [stays.c.job_id, stays.c.to_status] if per_job else [stays.c.to_status]
+        query = select(
+            *keys,
+            func.count(case((began, 1))).label("entered"),
+            func.count(case((ended, 1))).label("exited"),
+            func.sum(case((ended, _seconds_between(self.db, stays.c.created_at, stays.c.left_at)))).label(
+                "stage_seconds"),
+            func.sum(case((and_(began, stays.c.to_status == HIRED), seconds_to_entry))).label("hire_seconds"),
+        ).group_by(*keys)
+        if start or end:
+            query = query.where(began | ended)
+        return self.db.execute(query).all()
+
+    def _live_totals(self, job_ids, since: Optional[date], until: Optional[date]) -> Dict[str, Dict]:
+        totals = {}
+        _add_totals(totals, {row.to_status: row._asdict() for row in self._range_totals(job_ids, since, until)})
+        return totals
+
+    def _rollup_totals(self, job_ids, since: Optional[date], until: Optional[date]) -> Dict[str, Dict]:
+        """The same totals summed from the daily rows: cost grows with days x jobs, not events"""
+        S = ApplicationDailyStats
+        query = select(
+            S.status.label("to_status"), func.sum(S.entered).label("entered"), func.sum(S.exited).label("exited"),
+            func.sum(S.stage_seconds).label("stage_seconds"), func.sum(S.hire_seconds).label("hire_seconds"),
+        ).where(S.job_id.in_(job_ids)).group_by(S.status)
+        if since:
+            query = query.where(S.day >= since)
+        if until:
+            query = query.where(S.day <= until)
+        totals = {}
+        _add_totals(totals, {row.to_status: row._asdict() for row in self.db.execute(query)})
+        return totals
+
+    def rollup_coverage(self) -> Optional[Tuple[date, date]]:
+        """(first, last) of the unbroken run of rolled-up days ending at the latest one.
+        Days outside it, including any history older than the first rollup, are read live."""
+        days = self.db.scalars(select(ApplicationRollupDay.day).order_by(ApplicationRollupDay.day.desc())).all()
+        if not days:
+            return None
+        first = days[0]
+        for day in days[1:]:
+            if day != first - timedelta(days=1):
+                break
+            first = day
+        return first, days[0]
+
+    def resolve_source(self, job_ids, source: str) -> str:
+        if source != "auto":
+            return source
+        if self.rollup_coverage() is None:
+            return "live"
+        scope_size = self.db.query(func.count(Application.id)).filter(Application.job_id.in_(job_ids)).scalar()
+        return "rollup" if scope_size > ROLLUP_THRESHOLD else "live"
+
+    def stage_totals(self, job_ids, since: Optional[date] = None, until: Optional[date] = None,
+                     source: str = "auto") -> Tuple[Dict[str, Dict], str]:
+        """Totals per status for the range and the source used. "rollup" reads the daily
+        rows for the days the rollups cover and the days before and after them live."""
+        source = self.resolve_source(job_ids, source)
+        if source == "live":
+            return self._live_totals(job_ids, since, until), source
+        coverage = self.rollup_coverage()
+        if coverage is None:
+            return self._live_totals(job_ids, since, until), "live"
+        first, last = coverage
+        day = timedelta(days=1)
+        totals = {}
+        if since is None or since < first:  # before the first rollup
+            before = min(until, first - day) if until else first - day
+            if since is None or since <= before:
+                _add_totals(totals, self._live_totals(job_ids, since, before))
+        rolled_from = max(since, first) if since else first
+        rolled_until = min(until, last) if until else last
+        if rolled_from <= rolled_until:
+            _add_totals(totals, self._rollup_totals(job_ids, rolled_from, rolled_until))
+        if until is None or until > last:  # not rolled up yet
+            _add_totals(totals, self._live_totals(job_ids, max(since, last + day) if since else last + day, until))
+        return totals, source
+
+    def funnel(self, job_ids, since: Optional[date] = None, until: Optional[date] = None,
+               source: str = "auto") -> Dict:
+        totals, source = self.stage_totals(job_ids, since, until, source)
+        current = dict(self.db.query(Application.status, func.count(Application.id)).filter(
+            Application.job_id.in_(job_ids)
+        ).group_by(Application.status).all())
+        submitted = totals.get(STAGES[0], {}).get("entered", 0)
+        stages = []
+        for status in STAGES + sorted(set(totals) - set(STAGES)):
+            row = totals.get(status, {"entered": 0, "exited": 0, "stage_seconds": 0.0})
+            stages.append({
+                "status": status,
+                "entered": row["entered"],
+                "conversion": round(row["entered"] / submitted, 4) if submitted else None,
+                "exited": row["exited"],
+                "avg_stage_seconds": row["stage_seconds"] / row["exited"] if row["exited"] else None,
+                "current": current.get(status, 0),
+            })
+        return {"since": since, "until": until, "source": source, "stages": stages}
+
+    def time_to_hire(self, job_ids, since: Optional[date] = None, until: Optional[date] = None,
+                     source: str = "auto") -> Dict:
+        """Submission to acceptance for applications accepted in the range. Min and max
+        need the events themselves, so they are only reported by the live source."""
+        source = self.resolve_source(job_ids, source)
+        if source == "rollup":
+            totals, source = self.stage_totals(job_ids, since, until, source)
+            hired = totals.get(HIRED, {"entered": 0, "hire_seconds": 0.0})
+            return {"since": since, "until": until, "source": source, "hired": hired["entered"],
+                    "avg_seconds": hired["hire_seconds"] / hired["entered"] if hired["entered"] else None,
+                    "min_seconds": None, "max_seconds": None}
+
+        start, end = _day_bounds(since, until)
+        stays = self._stays(job_ids, start, end)
+        seconds = _seconds_between(self.db, stays.c.submitted_at, stays.c.created_at)
+        query = select(func.count(), func.avg(seconds), func.min(seconds), func.max(seconds)).where(
+            stays.c.to_status == HIRED
+        )
+        if start:
+            query = query.where(stays.c.created_at >= start)
+        if end:
+            query = query.where(stays.c.created_at < end)
+        hired, average, fastest, slowest = self.db.execute(query).one()
+        return {"since": since, "until": until, "source": source, "hired": hired,
+                "avg_seconds": average, "min_seconds": fastest, "max_seconds": slowest}
+
+    def rollup_day(self, day: date) -> int:
+        """Materialize one day of application_daily_stats for every job and record the day
+        as covered. Idempotent: the day's rows are replaced. Returns the number of rows written."""
+        rows = self._range_totals(select(ApplicationEvent.job_id).distinct(), day, day, per_job=True)
+        self.db.execute(delete(ApplicationDailyStats).where(ApplicationDailyStats.day == day))
+        self.db.execute(
+            upsert_insert(self.db, ApplicationRollupDay).values(day=day, rolled_up_at=datetime.utcnow())
+            .on_conflict_do_update(index_elements=[ApplicationRollupDay.day], set_={"rolled_up_at": datetime.utcnow()})
+        )
+        if rows:
+            self.db.execute(insert(ApplicationDailyStats), [
+                {"day": day, "job_id": row.job_id, "status": row.to_status, "entered": row.entered,
+                 "exited": row.exited, "stage_seconds": row.stage_seconds or 0, "hire_seconds": row.hire_seconds or 0}
+                for row in rows
+            ])
+        self.db.commit()
+        return len(rows)
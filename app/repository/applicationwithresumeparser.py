@@ -1,26 +1,38 @@
+import asyncio
 import os
-import shutil
 from typing import Dict, List, Optional
+from sqlalchemy import and_, func, select, update
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, UploadFile
 from app.models.application import Application
 from app.models.resume import Resume
 from app.models.job import Job
 from app.models.user import User
-from app.utils.resume_parser import ResumeParser
+from app.models.applicationevent import ApplicationEvent
+from app.repository.applicationevent import ApplicationEventRepository, record_status_events, status_event
+from app.repository.dashboard import invalidate_dashboards
+from app.repository.notification import notify_new_application, notify_status_change
+from app.repository.resumededup import ResumeDedupRepository
+from app.repository.resumesearch import ResumeSearchRepository
+from app.repository.resumestorage import ResumeStorageRepository, is_storage_key, object_name
+from app.repository.resumetext import ResumeTextRepository
+from app.utils.resume_parser import ResumeParser, parser_fingerprint
+
+VALID_STATUSES = ["pending", "reviewed", "accepted", "rejected"]
+MAX_BULK_STATUS_IDS = 5000
+BULK_STATUS_CHUNK = 500  # ids per statement (also keeps SQLite under its bound-parameter limit)
 
 
 class ApplicationWithResumeRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def create_application_with_resume(
+    async def create_application_with_resume(
             self,
             job_id: int,
             applicant_id: int,
             resume_file: UploadFile,
-            cover_letter: Optional[str] = None,
-            upload_dir: str = "uploads/resumes"
+            cover_letter: Optional[str] = None
     ) -> Dict:
         """Create application and parse resume in one operation"""
 
@@ -43,39 +55,41 @@ class ApplicationWithResumeRepository:
         if existing_application:
             raise HTTPException(status_code=400, detail="You have already applied for this job")
 
+        storage = ResumeStorageRepository(self.db)
         try:
-            # Create upload directory if it doesn't exist
-            os.makedirs(upload_dir, exist_ok=True)
-
-            # Generate unique filename
-            file_extension = resume_file.filename.split('.')[-1]
-            unique_filename = f"resume_{applicant_id}_{job_id}.{file_extension}"
-            file_path = os.path.join(upload_dir, unique_filename)
-
-            # Save the uploaded file
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(resume_file.file, buffer)
+            # Write the object only: its reference is taken with the rows below, so
+            # no transaction (and, on SQLite, no write lock) is held while parsing
+            file_path, size = await storage.store_upload(resume_file)
 
             # Parse the resume
-            parser = ResumeParser(file_path)
-            parsed_data = parser.get_extracted_data()
+            async with storage.local_copy_async(file_path) as local_path:
+                parser = ResumeParser(local_path)
+                parsed_data = await asyncio.to_thread(parser.get_extracted_data)
 
             # Check if parsing was successful
             if "error" in parsed_data:
-                # Clean up the uploaded file on parsing error
-                if os.path.exists(file_path):
-                    os.remove(file_path)
+                # Nothing references the object; it is left for the orphan sweep
                 raise HTTPException(status_code=422, detail=f"Resume parsing failed: {parsed_data['error']}")
 
+            # The resume and the application each hold a reference
+            storage.acquire(object_name(file_path), size, references=2)
+
             # Create resume record
             resume = Resume(
                 applicant_id=applicant_id,
                 file_path=file_path,
-                parsed_data=parsed_data
+                parsed_data=parsed_data,
+                parser_version=ResumeParser.VERSION,
+                parser_fingerprint=parser_fingerprint(),
+                text_hash=ResumeTextRepository(self.db).store(parser.text)
             )
             self.db.add(resume)
             self.db.flush()  # Get the resume ID
 
+            # Index for near-duplicate detection and search
+            ResumeDedupRepository(self.db).index_resume(resume, parser.text)
+            ResumeSearchRepository(self.db).index_resume(resume, parsed_data)
+
             # Create application record
             application = Application(
                 job_id=job_id,
@@ -86,11 +100,15 @@ class ApplicationWithResumeRepository:
                 status="pending"
             )
             self.db.add(application)
+            self.db.flush()
+            record_status_events(self.db, [status_event(application, application.status, actor_id=applicant_id)])
 
             # Commit both records
             self.db.commit()
             self.db.refresh(application)
             self.db.refresh(resume)
+            invalidate_dashboards(job.posted_by)
+            notify_new_application(job.posted_by, job.title)
 
             return {
                 "application_id": application.id,
@@ -100,11 +118,10 @@ class ApplicationWithResumeRepository:
                 "message": "Application submitted and resume parsed successfully"
             }
 
+        except HTTPException:
+            raise
         except Exception as e:
             self.db.rollback()
-            # Clean up uploaded file on error
-            if os.path.exists(file_path):
-                os.remove(file_path)
             raise HTTPException(status_code=500, detail=f"Failed to process application: {str(e)}")
 
     def get_application_with_parsed_resume(self, application_id: int, user_id: Optional[int] = None) -> Optional[Dict]:
@@ -130,6 +147,14 @@ class ApplicationWithResumeRepository:
             "applicant_name": application.applicant.email if application.applicant else None
         }
 
+    def user_applications_version(self, user_id: int) -> tuple:
+        """(count, max id, latest application and job updated_at) for a user's applications;
+        changes whenever get_user_applications_with_resumes would return something different"""
+        return tuple(self.db.query(
+            func.count(Application.id), func.max(Application.id),
+            func.max(Application.updated_at), func.max(Job.updated_at)
+        ).outerjoin(Job, Job.id == Application.job_id).filter(Application.applicant_id == user_id).one())
+
     def get_user_applications_with_resumes(self, user_id: int) -> List[Dict]:
         """Get all applications for a user with parsed resume data"""
         applications = self.db.query(Application).filter(
@@ -155,12 +180,7 @@ class ApplicationWithResumeRepository:
 
         # If employer_id is provided, verify they own the job
         if employer_id:
-            job = self.db.query(Job).filter(
-                Job.id == job_id,
-                Job.posted_by == employer_id
-            ).first()
-            if not job:
-                raise HTTPException(status_code=403, detail="Not authorized to view these applications")
+            self.ensure_job_owner(job_id, employer_id)
 
         applications = query.all()
 
@@ -178,40 +198,140 @@ class ApplicationWithResumeRepository:
             for app in applications
         ]
 
+    def ensure_job_owner(self, job_id: int, employer_id: int):
+        """Raise 403 unless the employer posted the job"""
+        job = self.db.query(Job).filter(
+            Job.id == job_id,
+            Job.posted_by == employer_id
+        ).first()
+        if not job:
+            raise HTTPException(status_code=403, detail="Not authorized to view these applications")
+
+    def get_readable_application(self, application_id: int, user: User) -> Application:
+        """The application, if `user` is its applicant, the employer who owns the job, or an admin"""
+        application = self.db.query(Application).filter(Application.id == application_id).first()
+        if not application:
+            raise HTTPException(status_code=404, detail="Application not found")
+
+        if user.role != "admin" and application.applicant_id != user.id:
+            self.ensure_job_owner(application.job_id, user.id)
+        return application
+
+    def get_application_history(self, application_id: int, user: User) -> List[ApplicationEvent]:
+        """Status changes of an application, oldest first"""
+        self.get_readable_application(application_id, user)
+        return ApplicationEventRepository(self.db).history(application_id)
+
+    def get_resume_file_for_download(self, application_id: int, user: User) -> Dict:
+        """Locate the original resume file behind an application, if `user` may read it.
+
+        Applicants can fetch their own upload, employers the resumes sent to
+        their jobs (same check as get_job_applications_with_resumes), admins any.
+        """
+        application = self.get_readable_application(application_id, user)
+        stored = ResumeStorageRepository(self.db).describe(application.resume_file_path)
+        if stored is None:
+            raise HTTPException(status_code=404, detail="Resume file no longer exists")
+
+        extension = os.path.splitext(application.resume_file_path)[1]
+        stored["filename"] = f"resume_{application.id}{extension}"
+        return stored
+
     def update_application_status(self, application_id: int, new_status: str,
                                   employer_id: Optional[int] = None) -> bool:
         """Update application status"""
-        valid_statuses = ["pending", "reviewed", "accepted", "rejected"]
-        if new_status not in valid_statuses:
-            raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {valid_statuses}")
+        if new_status not in VALID_STATUSES:
+            raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {VALID_STATUSES}")
 
         query = self.db.query(Application).filter(Application.id == application_id)
 
         # If employer_id provided, verify they own the job
         if employer_id:
-            query = query.join(Job).filter(Job.employer_id == employer_id)
+            query = query.join(Job).filter(Job.posted_by == employer_id)
 
         application = query.first()
         if not application:
             return False
 
+        if application.status != new_status:
+            record_status_events(self.db, [status_event(application, new_status, application.status, employer_id)])
         application.status = new_status
         self.db.commit()
+        if application.job:
+            invalidate_dashboards(application.job.posted_by)
+        notify_status_change(application.applicant_id, application.id,
+                             application.job.title if application.job else None, new_status)
         return True
 
+    def bulk_update_application_status(self, application_ids: List[int], new_status: str,
+                                       employer_id: int) -> Dict[int, str]:
+        """Set one status on many of an employer's applications; returns an outcome per id.
+
+        Works in chunks of BULK_STATUS_CHUNK ids, each costing one SELECT joined
+        to Job.posted_by (ownership) and one UPDATE .. WHERE id IN (..), committed
+        per chunk. Outcomes: "updated", "unchanged" (already in that status) or
+        "not_found" (missing, or on another employer's job: not distinguished).
+        """
+        if new_status not in VALID_STATUSES:
+            raise HTTPException(status_code=400, detail=f"Invalid status. Must be one of: {VALID_STATUSES}")
+        application_ids = list(dict.fromkeys(application_ids))
+        if len(application_ids) > MAX_BULK_STATUS_IDS:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_STATUS_IDS} applications per request")
+
+        owned_jobs = select(Job.id).where(Job.posted_by == employer_id)
+        outcomes = {}
+        for start in range(0, len(application_ids), BULK_STATUS_CHUNK):
+            chunk = application_ids[start:start + BULK_STATUS_CHUNK]
+            rows = self.db.execute(
+                select(Application.id, Application.job_id, Application.status, Application.applicant_id, Job.title)
+                .join(Job, Job.id == Application.job_id)
+                .where(Application.id.in_(chunk), Job.posted_by == employer_id)
+            ).all()
+            changing = [row for row in rows if row.status != new_status]
+            if changing:
+                # Ownership and status are checked again in the UPDATE itself, so a row
+                # changed between the two statements is never updated on stale grounds
+                updated_ids = set(self.db.execute(
+                    update(Application)
+                    .where(Application.id.in_([row.id for row in changing]),
+                           Application.job_id.in_(owned_jobs),
+                           Application.status != new_status)
+                    .values(status=new_status)
+                    .returning(Application.id)
+                    .execution_options(synchronize_session=False)
+                ).scalars())
+                changing = [row for row in changing if row.id in updated_ids]
+                record_status_events(self.db, [
+                    {"application_id": row.id, "job_id": row.job_id, "from_status": row.status,
+                     "to_status": new_status, "actor_id": employer_id}
+                    for row in changing
+                ])
+                self.db.commit()
+                invalidate_dashboards(employer_id)
+                for row in changing:
+                    notify_status_change(row.applicant_id, row.id, row.title, new_status)
+            updated = {row.id for row in changing}
+            found = {row.id for row in rows}
+            for application_id in chunk:
+                outcomes[application_id] = "updated" if application_id in updated else \
+                    "unchanged" if application_id in found else "not_found"
+        return outcomes
+
     def reparse_resume(self, application_id: int) -> Dict:
         """Reparse an existing resume file"""
         application = self.db.query(Application).filter(Application.id == application_id).first()
         if not application or not application.resume_file_path:
             raise HTTPException(status_code=404, detail="Application or resume file not found")
 
-        if not os.path.exists(application.resume_file_path):
+        storage = ResumeStorageRepository(self.db)
+        if not storage.exists(application.resume_file_path):
             raise HTTPException(status_code=404, detail="Resume file no longer exists")
 
         try:
             # Reparse the resume
-            parser = ResumeParser(application.resume_file_path)
-            parsed_data = parser.get_extracted_data()
+            with storage.local_copy(application.resume_file_path) as local_path:
+                parser = ResumeParser(local_path)
+                parsed_data = parser.get_extracted_data()
 
             if "error" in parsed_data:
                 raise HTTPException(status_code=422, detail=f"Resume parsing failed: {parsed_data['error']}")
@@ -226,20 +346,44 @@ class ApplicationWithResumeRepository:
             ).first()
 
             if resume:
-                resume.parsed_data = parsed_data
+                self.apply_parse_result(resume, parsed_data, parser.text)
 
             self.db.commit()
 
             return {
                 "status": "success",
                 "message": "Resume reparsed successfully",
-                "parsed_data": parsed_data
+                "parsed_data": parsed_data,
+                "parser_version": ResumeParser.VERSION,
+                "parser_fingerprint": parser_fingerprint()
             }
 
         except Exception as e:
             self.db.rollback()
             raise HTTPException(status_code=500, detail=f"Failed to reparse resume: {str(e)}")
 
+    def apply_parse_result(self, resume: Resume, parsed_data: Dict, text: str):
+        """Store a fresh parse on a resume and refresh everything derived from it. Does not commit."""
+        resume.parsed_data = parsed_data
+        resume.parser_version = ResumeParser.VERSION
+        resume.parser_fingerprint = parser_fingerprint()
+        resume.text_hash = ResumeTextRepository(self.db).store(text)
+        resume.feature_vector = None  # comparison vector is recomputed lazily
+        ResumeDedupRepository(self.db).index_resume(resume, text)
+        ResumeSearchRepository(self.db).index_resume(resume, parsed_data)
+
+    def get_resume_text_for_application(self, application_id: int, user_id: Optional[int] = None) -> Optional[str]:
+        """Full extracted text of the resume behind an application, loaded from resume_texts"""
+        query = self.db.query(Resume).join(Application, and_(
+            Application.applicant_id == Resume.applicant_id,
+            Application.resume_file_path == Resume.file_path
+        )).filter(Application.id == application_id)
+        if user_id:
+            query = query.filter(Application.applicant_id == user_id)
+
+        resume = query.first()
+        return ResumeTextRepository(self.db).text_for_resume(resume) if resume else None
+
     def delete_application(self, application_id: int, user_id: int) -> bool:
         """Delete application and associated resume file"""
         application = self.db.query(Application).filter(
@@ -250,14 +394,20 @@ class ApplicationWithResumeRepository:
         if not application:
             return False
 
-        # Remove file if it exists
-        if application.resume_file_path and os.path.exists(application.resume_file_path):
+        # Stored objects are shared by content: drop this application's reference.
+        # Legacy per-application files are still removed directly.
+        storage = ResumeStorageRepository(self.db)
+        if is_storage_key(application.resume_file_path):
+            storage.release(application.resume_file_path)
+        elif application.resume_file_path and os.path.exists(application.resume_file_path):
             try:
                 os.remove(application.resume_file_path)
             except OSError:
                 pass  # File might be in use or already deleted
 
         # Delete from database
+        employer_id = application.job.posted_by if application.job else None
         self.db.delete(application)
         self.db.commit()
+        invalidate_dashboards(employer_id)
         return True
\ No newline at end of file
@@ -0,0 +1,59 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from app.models.backgroundjob import BackgroundJob
+
+
+def create_background_job(db: Session, kind: str, owner_id: int, params: Optional[dict] = None,
+                          total: Optional[int] = None) -> BackgroundJob:
+    job = BackgroundJob(
+        id=str(uuid.uuid4()),
+        kind=kind,
+        owner_id=owner_id,
+        status="queued",
+        params=params,
+        total=total
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def get_background_job(db: Session, job_id: str, current_user) -> BackgroundJob:
+    job = db.query(BackgroundJob).filter(BackgroundJob.id == job_id).first()
+    if not job:
+        raise HTTPException(status_code=404, detail="Background job not found")
+    if job.owner_id != current_user.id and current_user.role != "admin":
+        raise HTTPException(status_code=403, detail="Not authorized to view this job")
+    return job
+
+
+def mark_running(db: Session, job: BackgroundJob, total: Optional[int] = None):
+    job.status = "running"
+    if total is not None:
+        job.total = total
+    db.commit()
+
+
+def update_progress(db: Session, job: BackgroundJob, progress: int):
+    job.progress = progress
+    db.commit()
+
+
+def mark_completed(db: Session, job: BackgroundJob, result: Optional[dict] = None,
+                   result_path: Optional[str] = None):
+    job.status = "completed"
+    job.result = result
+    job.result_path = result_path
+    job.finished_at = datetime.utcnow()
+    db.commit()
+
+
+def mark_failed(db: Session, job: BackgroundJob, error: str):
+    job.status = "failed"
+    job.error = error
+    job.finished_at = datetime.utcnow()
+    db.commit()
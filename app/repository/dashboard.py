@@ -0,0 +1,236 @@
+import asyncio
+import json
+import os
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, Iterable, List, Optional
+
+import structlog
+from sqlalchemy import case, distinct, func, select
+from sqlalchemy.orm import Session
+
+from app.models.application import Application
+from app.models.job import Job
+from app.models.user import User
+from app.utils.redis_client import get_redis
+
+DASHBOARD_TTL_SECONDS = int(os.getenv("DASHBOARD_CACHE_SECONDS", "300"))
+# Generations outlive any cached dashboard, so an expired one can never match a stale entry
+GENERATION_TTL_SECONDS = 7 * 24 * 3600
+INVALIDATE_INTERVAL = float(os.getenv("DASHBOARD_INVALIDATE_SECONDS", "0.25"))
+STATUSES = ["pending", "reviewed", "accepted", "rejected"]
+
+log = structlog.get_logger()
+
+
+def dashboard_key(employer_id: int) -> str:
+    return f"dashboard:{employer_id}"
+
+
+def generation_key(employer_id: int) -> str:
+    return f"dashboard:generation:{employer_id}"
+
+
+class DashboardInvalidations:
+    """Employers whose dashboards changed, published to Redis in the background.
+
+    mark() only appends to an in-memory buffer, so it is safe to call from the
+    synchronous repository code that changes applications (in any thread). A
+    background task started with the app bumps each marked employer's
+    generation every INVALIDATE_INTERVAL seconds; cached dashboards stamped
+    with an older generation are then ignored by every worker. Dashboard reads
+    flush first, so a worker always sees its own writes.
+    """
+
+    def __init__(self, interval: float = INVALIDATE_INTERVAL):
+        self.interval = interval
+        self._pending: Deque[int] = deque()  # appends are thread-safe
+        self._task: Optional[asyncio.Task] = None
+
+    def mark(self, *employer_ids: Optional[int]):
+        self._pending.extend(employer_id for employer_id in employer_ids if employer_id is not None)
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    async def flush(self) -> int:
+        """Bump the generation of every employer marked so far (one pipelined round trip)"""
+        employer_ids = set()
+        while self._pending:
+            employer_ids.add(self._pending.popleft())
+        if not employer_ids:
+            return 0
+        try:
+            pipe = get_redis().pipeline(transaction=False)
+            for employer_id in employer_ids:
+                pipe.incr(generation_key(employer_id))
+                pipe.expire(generation_key(employer_id), GENERATION_TTL_SECONDS)
+            await pipe.execute()
+        except Exception as e:
+            self._pending.extend(employer_ids)  # retried on the next tick
+            log.warning("dashboard.invalidate_failed", employers=len(employer_ids), error=str(e))
+            return 0
+        return len(employer_ids)
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+dashboard_invalidations = DashboardInvalidations()
+
+
+def invalidate_dashboards(*employer_ids: Optional[int]):
+    """Call after committing a change to applications on these employers' jobs"""
+    dashboard_invalidations.mark(*employer_ids)
+
+
+class DashboardRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def compute(self, employer_id: int, since: Optional[datetime]) -> Dict:
+        """Per-job status counts, new applications since `since` and distinct applicants
+        across all of the employer's jobs, from one grouped statement"""
+        applicants = select(func.count(distinct(Application.applicant_id))).join(
+            Job, Job.id == Application.job_id
+        ).where(Job.posted_by == employer_id).scalar_subquery()
+        is_new = Application.created_at > since if since else Application.id.isnot(None)
+        status = func.coalesce(Application.status, "pending").label("status")
+        rows = self.db.execute(
+            select(
+                Job.id, Job.title, status,
+                func.count(Application.id).label("applications"),
+                func.count(case((is_new, Application.id))).label("new"),
+                func.max(Application.created_at).label("latest"),
+                applicants.label("applicants"),
+            )
+            .outerjoin(Application, Application.job_id == Job.id)
+            .where(Job.posted_by == employer_id)
+            .group_by(Job.id, Job.title, status)
+            .order_by(Job.id.desc())
+        ).all()
+
+        jobs: Dict[int, Dict] = {}
+        total_applicants = 0
+        for row in rows:
+            job = jobs.setdefault(row.id, {
+                "job_id": row.id, "title": row.title, "applications": 0, "new": 0,
+                "by_status": dict.fromkeys(STATUSES, 0), "latest_application_at": None,
+            })
+            total_applicants = row.applicants
+            if not row.applications:  # the outer join's row for a job without applications
+                continue
+            job["applications"] += row.applications
+            job["new"] += row.new
+            job["by_status"][row.status] = job["by_status"].get(row.status, 0) + row.applications
+            if job["latest_application_at"] is None or row.latest > job["latest_application_at"]:
+                job["latest_application_at"] = row.latest
+        return {"jobs": list(jobs.values()), "applicants": total_applicants}
+
+    def count_new(self, job_ids: List[int], since: datetime) -> Dict[int, int]:
+        """Applications since `since` for a few jobs (uses the (job_id, created_at) index)"""
+        return dict(self.db.execute(
+            select(Application.job_id, func.count(Application.id))
+            .where(Application.job_id.in_(job_ids), Application.created_at > since)
+            .group_by(Application.job_id)
+        ).all())
+
+    async def dashboard(self, employer: User, record_visit: bool = True) -> Dict:
+        """The employer's dashboard, served from Redis while no application on their jobs
+        has changed. New-application counts depend on the caller's last visit, so a hit
+        recounts them, but only for jobs that received applications since then. Queries
+        and the visit commit run in a worker thread, so only Redis is awaited on the loop."""
+        since = employer.dashboard_visited_at
+        await dashboard_invalidations.flush()
+        snapshot, generation = await self._cached(employer.id)
+        if snapshot is not None:
+            jobs = snapshot["jobs"]
+            new = {}
+            if since is not None:
+                fresh = [job["job_id"] for job in jobs
+                         if job["latest_application_at"] and job["latest_application_at"] > since]
+                new = await asyncio.to_thread(self.count_new, fresh, since) if fresh else {}
+            for job in jobs:
+                job["new"] = job["applications"] if since is None else new.get(job["job_id"], 0)
+            result = {"jobs": jobs, "applicants": snapshot["applicants"]}
+        else:
+            result = await asyncio.to_thread(self.compute, employer.id, since)
+            await self._store(employer.id, generation, result)
+
+        if record_visit:
+            await asyncio.to_thread(self._record_visit, employer)
+        return _summarize(result["jobs"], result["applicants"], since, cache_hit=snapshot is not None)
+
+    def _record_visit(self, employer: User):
+        employer.dashboard_visited_at = datetime.utcnow()
+        self.db.commit()
+
+    async def _cached(self, employer_id: int):
+        """(snapshot or None when missing/stale, the employer's current generation)"""
+        try:
+            cached, generation = await get_redis().mget(dashboard_key(employer_id), generation_key(employer_id))
+        except Exception as e:
+            log.warning("dashboard.cache_failed", employer_id=employer_id, error=str(e))
+            return None, None
+        generation = generation or "0"
+        snapshot = json.loads(cached) if cached else None
+        if snapshot is None or snapshot["generation"] != generation:
+            return None, generation
+        for job in snapshot["jobs"]:
+            if job["latest_application_at"]:
+                job["latest_application_at"] = datetime.fromisoformat(job["latest_application_at"])
+        return snapshot, generation
+
+    async def _store(self, employer_id: int, generation: Optional[str], result: Dict):
+        # Stamped with the generation read before the query: a change committed
+        # meanwhile bumps it, so this entry is never served after that change
+        if generation is None:
+            return
+        snapshot = {"generation": generation, "applicants": result["applicants"],
+                    "jobs": [{key: value for key, value in job.items() if key != "new"} for job in result["jobs"]]}
+        try:
+            await get_redis().set(dashboard_key(employer_id), json.dumps(snapshot, default=_isoformat),
+                                  ex=DASHBOARD_TTL_SECONDS)
+        except Exception as e:
+            log.warning("dashboard.cache_failed", employer_id=employer_id, error=str(e))
+
+
+def _isoformat(value):
+    return value.isoformat() if isinstance(value, datetime) else str(value)
+
+
+def _summarize(jobs: Iterable[Dict], applicants: int, since: Optional[datetime], cache_hit: bool) -> Dict:
+    jobs = list(jobs)
+    by_status = dict.fromkeys(STATUSES, 0)
+    for job in jobs:
+        for status, count in job["by_status"].items():
+            by_status[status] = by_status.get(status, 0) + count
+    return {
+        "last_visit_at": since,
+        "cached": cache_hit,
+        "totals": {
+            "jobs": len(jobs),
+            "applications": sum(job["applications"] for job in jobs),
+            "new": sum(job["new"] for job in jobs),
+            "applicants": applicants,
+            "by_status": by_status,
+        },
+        "jobs": jobs,
+    }
@@ -1,5 +1,9 @@
+from sqlalchemy import func
 from sqlalchemy.orm import Session
+from app.models.application import Application
 from app.models.job import Job
+from app.repository.dashboard import invalidate_dashboards
+from app.repository.resumestorage import ResumeStorageRepository
 from app.schemas.job import JobCreate, ShowJobs, UpdateJobs
 from fastapi import HTTPException, status
 
@@ -15,11 +19,21 @@ def create_job(db: Session, job: JobCreate, employer_id: int):
     db.add(new_job)
     db.commit()
     db.refresh(new_job)
+    invalidate_dashboards(employer_id)
     return new_job
 
 def list_jobs(db: Session):
     return db.query(Job).all()
 
+def jobs_listing_version(db: Session):
+    """(count, max id, latest updated_at) over all jobs: changes whenever the listing does"""
+    return tuple(db.query(func.count(Job.id), func.max(Job.id), func.max(Job.updated_at)).one())
+
+def job_version(id: int, db: Session):
+    """updated_at of one job without loading the row, or None if it does not exist"""
+    row = db.query(Job.updated_at).filter(Job.id == id).first()
+    return row[0] if row else None
+
 def get_job_details(id: int, db: Session):
     job = db.query(Job).filter(Job.id == id).first()
     if not job:
@@ -32,8 +46,12 @@ def delete_job(id: int, db: Session, current_user):
         raise HTTPException(status_code=404, detail="Job not found")
     if job.posted_by != current_user.id and current_user.role != "admin":
         raise HTTPException(status_code=403, detail="Not authorized to delete this job")
+    # The applications go with the job (cascade): drop their references to stored resumes too
+    paths = db.query(Application.resume_file_path).filter(Application.job_id == job.id)
+    ResumeStorageRepository(db).release_all(path for (path,) in paths)
     db.delete(job)
     db.commit()
+    invalidate_dashboards(job.posted_by)
     return {"message": "Job deleted"}
 
 def update_job(id: int, job_data: UpdateJobs, db: Session, current_user):
@@ -48,4 +66,5 @@ def update_job(id: int, job_data: UpdateJobs, db: Session, current_user):
 
     db.commit()
     db.refresh(job)
+    invalidate_dashboards(job.posted_by)  # titles are shown on the dashboard
     return job
@@ -0,0 +1,239 @@
+import asyncio
+import os
+from collections import Counter, deque
+from datetime import datetime
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import structlog
+from sqlalchemy import func, insert, update
+from sqlalchemy.orm import Session
+
+from app.database.session import SessionLocal
+from app.models.notification import Notification
+from app.utils.event_broker import publish_events
+from app.utils.redis_client import get_redis
+
+FLUSH_INTERVAL = float(os.getenv("NOTIFICATION_FLUSH_SECONDS", "0.5"))
+BATCH_SIZE = 500
+MAX_ATTEMPTS = 3
+PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+# Counters are rebuilt from the table at least this often, which bounds any drift
+UNREAD_TTL_SECONDS = 3600
+
+# Writers bump the user's version and only adjust a counter that exists: a
+# missing one is rebuilt from the table on the next read, so creating it here
+# would store a partial count
+ADJUST_IF_EXISTS = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    local value = redis.call('INCRBY', KEYS[1], ARGV[1])
+    if value < 0 then
+        redis.call('SET', KEYS[1], 0, 'KEEPTTL')
+        return 0
+    end
+    return value
+end
+return nil
+"""
+
+# A rebuilt counter is only stored if no write bumped the version since it was
+# read: the count may predate a change that found no counter to adjust
+SET_IF_UNCHANGED = """
+if redis.call('EXISTS', KEYS[1]) == 0 and (redis.call('GET', KEYS[2]) or '0') == ARGV[2] then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
+
+log = structlog.get_logger()
+
+
+def unread_key(user_id: int) -> str:
+    return f"notifications:unread:{user_id}"
+
+
+def unread_version_key(user_id: int) -> str:
+    return f"notifications:unread:{user_id}:version"
+
+
+async def adjust_unread(deltas: Dict[int, int]):
+    """Apply unread-count changes to the Redis counters; errors are logged, not raised"""
+    deltas = {user_id: delta for user_id, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    client = get_redis()
+    script = client.register_script(ADJUST_IF_EXISTS)
+    try:
+        for user_id, delta in deltas.items():
+            await script(keys=[unread_key(user_id), unread_version_key(user_id)], args=[delta, UNREAD_TTL_SECONDS])
+    except Exception as e:
+        log.warning("notifications.unread_counter_failed", users=len(deltas), error=str(e))
+
+
+def insert_notifications(db: Session, rows: List[Dict]) -> List[int]:
+    """One multi-row INSERT; returns the new ids in the order of `rows`"""
+    ids = db.execute(
+        insert(Notification).returning(Notification.id, sort_by_parameter_order=True), rows
+    ).scalars().all()
+    db.commit()
+    return ids
+
+
+class NotificationOutbox:
+    """Notifications raised while handling a request, written later in batches.
+
+    enqueue() only appends to an in-memory buffer, so request handlers never
+    wait on the insert. A background task started with the app flushes the
+    buffer every FLUSH_INTERVAL seconds as multi-row INSERTs of up to
+    BATCH_SIZE rows, then bumps the recipients' unread counters and pushes
+    the new notifications (plus any attached event) to their open event
+    streams. A batch that fails to insert is retried up to MAX_ATTEMPTS
+    times; anything still buffered at shutdown is flushed by stop().
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal,
+                 interval: float = FLUSH_INTERVAL, batch_size: int = BATCH_SIZE):
+        self.session_factory = session_factory
+        self.interval = interval
+        self.batch_size = batch_size
+        # (attempts, row, event pushed alongside); appends are thread-safe
+        self._pending: Deque[Tuple[int, Dict, Optional[Dict]]] = deque()
+        self._task: Optional[asyncio.Task] = None
+
+    def enqueue(self, user_id: Optional[int], message: str, event: Optional[Dict] = None):
+        if user_id is None:
+            return
+        self._pending.append((0, {"user_id": user_id, "message": message, "is_read": False,
+                                  "created_at": datetime.utcnow()}, event))
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def _write(self, rows: List[Dict]) -> List[int]:
+        db = self.session_factory()
+        try:
+            return insert_notifications(db, rows)
+        finally:
+            db.close()
+
+    async def flush(self) -> int:
+        """Write everything buffered so far; returns the number of notifications stored"""
+        written = 0
+        for _ in range(-(-len(self._pending) // self.batch_size)):
+            batch = [self._pending.popleft() for _ in range(min(self.batch_size, len(self._pending)))]
+            if not batch:
+                break
+            try:
+                ids = await asyncio.to_thread(self._write, [row for _, row, _ in batch])
+            except Exception as e:
+                retry = [(attempts + 1, row, event) for attempts, row, event in batch
+                         if attempts + 1 < MAX_ATTEMPTS]
+                self._pending.extend(retry)
+                log.error("notifications.flush_failed", batch=len(batch), dropped=len(batch) - len(retry),
+                          error=str(e))
+                continue
+            await adjust_unread(Counter(row["user_id"] for _, row, _ in batch))
+            events = []
+            for (_, row, event), notification_id in zip(batch, ids):
+                events.append((row["user_id"], {"type": "notification", "id": notification_id,
+                                                "message": row["message"], "created_at": row["created_at"]}))
+                if event:
+                    events.append((row["user_id"], event))
+            await publish_events(events)
+            written += len(batch)
+        return written
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+
+notification_outbox = NotificationOutbox()
+
+
+def notify_new_application(employer_id: Optional[int], job_title: str):
+    notification_outbox.enqueue(employer_id, f"New application received for {job_title}")
+
+
+def notify_status_change(applicant_id: Optional[int], application_id: int, job_title: Optional[str], status: str):
+    notification_outbox.enqueue(
+        applicant_id, f"Your application for {job_title or 'a job'} is now {status}",
+        event={"type": "application_status", "application_id": application_id, "status": status}
+    )
+
+
+class NotificationRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def list_notifications(self, user_id: int, limit: int = PAGE_SIZE, before_id: Optional[int] = None,
+                           unread_only: bool = False) -> Dict:
+        """Newest first, keyset-paginated on id: pass next_before_id back to get the next page"""
+        query = self.db.query(Notification).filter(Notification.user_id == user_id)
+        if unread_only:
+            query = query.filter(Notification.is_read.is_(False))
+        if before_id is not None:
+            query = query.filter(Notification.id < before_id)
+        rows = query.order_by(Notification.id.desc()).limit(limit + 1).all()
+        items = rows[:limit]
+        return {"items": items, "next_before_id": items[-1].id if len(rows) > limit else None}
+
+    def count_unread(self, user_id: int) -> int:
+        return self.db.query(func.count(Notification.id)).filter(
+            Notification.user_id == user_id, Notification.is_read.is_(False)
+        ).scalar()
+
+    async def unread_count(self, user_id: int) -> int:
+        """Served from the Redis counter; the table is only counted when the counter is missing,
+        and the count is only stored if no write adjusted the counter meanwhile"""
+        client = get_redis()
+        try:
+            cached, version = await client.mget(unread_key(user_id), unread_version_key(user_id))
+        except Exception as e:
+            log.warning("notifications.unread_counter_failed", error=str(e))
+            return self.count_unread(user_id)
+        if cached is not None:
+            return int(cached)
+
+        count = self.count_unread(user_id)
+        try:
+            script = client.register_script(SET_IF_UNCHANGED)
+            await script(keys=[unread_key(user_id), unread_version_key(user_id)],
+                         args=[count, version or "0", UNREAD_TTL_SECONDS])
+        except Exception as e:
+            log.warning("notifications.unread_counter_failed", error=str(e))
+        return count
+
+    async def mark_read(self, user_id: int, ids: Optional[List[int]] = None,
+                        up_to_id: Optional[int] = None) -> int:
+        """Mark the given notifications (or all up to an id, or all) read in a single UPDATE"""
+        statement = update(Notification).where(
+            Notification.user_id == user_id, Notification.is_read.is_(False)
+        )
+        if ids is not None:
+            statement = statement.where(Notification.id.in_(ids))
+        if up_to_id is not None:
+            statement = statement.where(Notification.id <= up_to_id)
+        updated = self.db.execute(statement.values(is_read=True)).rowcount
+        self.db.commit()
+        await adjust_unread({user_id: -updated})
+        return updated
@@ -0,0 +1,336 @@
+import json
+import os
+import time
+from contextlib import ExitStack
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy import and_, delete, exists, or_, select, update
+from sqlalchemy.orm import Session
+from app.database.session import SessionLocal
+from app.models.application import Application
+from app.models.backgroundjob import BackgroundJob
+from app.models.resume import Resume
+from app.models.resumelsh import ResumeLSHBucket
+from app.models.resumeskill import ResumeSkill
+from app.models.resumeterm import ResumeTerm
+from app.models.resumetext import ResumeText
+from app.repository import backgroundjob as job_repo
+from app.repository.applicationwithresumeparser import ApplicationWithResumeRepository
+from app.repository.resumestorage import ResumeStorageRepository, is_storage_key
+from app.utils.parse_pool import parse_many
+from app.utils.resume_parser import ResumeParser, parser_fingerprint
+
+WRITE_BATCH_SIZE = 20
+
+# Throttling for the admin "reparse everything outdated" mode
+OUTDATED_BATCH_SIZE = int(os.getenv("RESUME_REPARSE_BATCH_SIZE", "50"))
+OUTDATED_PAUSE_SECONDS = float(os.getenv("RESUME_REPARSE_PAUSE_SECONDS", "1.0"))
+OUTDATED_MAX_LOAD = float(os.getenv("RESUME_REPARSE_MAX_LOAD", "0.7"))  # 1-minute load per CPU
+
+
+def _system_load() -> float:
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (AttributeError, OSError):
+        return 0.0
+
+
+def wait_for_capacity(max_load: float = OUTDATED_MAX_LOAD, pause: float = OUTDATED_PAUSE_SECONDS):
+    """Back off while the host is busy serving live traffic"""
+    time.sleep(pause)
+    delay = pause
+    while _system_load() > max_load:
+        time.sleep(delay)
+        delay = min(delay * 2, 60)
+
+
+def stale_resumes(fingerprint: str):
+    """Predicate for live resumes whose parse did not come from the given parser fingerprint"""
+    return and_(
+        Resume.archived_at.is_(None),
+        or_(Resume.parser_fingerprint.is_(None), Resume.parser_fingerprint != fingerprint)
+    )
+
+
+def load_checkpoint(path: Optional[str], fingerprint: str) -> Dict:
+    """Read a stale-reparse checkpoint; a finished run or another parser fingerprint starts over"""
+    fresh = {"fingerprint": fingerprint, "created_at": None, "id": None,
+             "processed": 0, "outcomes": {}, "complete": False}
+    if not path or not os.path.exists(path):
+        return fresh
+    with open(path) as f:
+        state = json.load(f)
+    if state.get("fingerprint") != fingerprint or state.get("complete"):
+        return fresh
+    return state
+
+
+def save_checkpoint(path: Optional[str], state: Dict):
+    if not path:
+        return
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, path)  # atomic, so a crash never leaves a torn checkpoint
+
+
+class ResumeBulkRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def resolve_targets(self, resume_ids: List[int], user_id: int, is_admin: bool) -> Dict:
+        """Split requested ids into the ones this user may operate on and per-id failures"""
+        query = self.db.query(Resume.id, Resume.applicant_id).filter(Resume.id.in_(resume_ids))
+        owners = {rid: owner for rid, owner in query}
+
+        allowed, outcomes = [], {}
+        for resume_id in dict.fromkeys(resume_ids):
+            if resume_id not in owners:
+                outcomes[resume_id] = "not_found"
+            elif not is_admin and owners[resume_id] != user_id:
+                outcomes[resume_id] = "forbidden"
+            else:
+                allowed.append(resume_id)
+        return {"allowed": allowed, "outcomes": outcomes}
+
+    def reparse(self, resume_ids: List[int], on_progress=None) -> Dict[int, str]:
+        """Reparse resumes across the worker pool and write results back in batches"""
+        outcomes = {}
+        resumes = {r.id: r for r in self.db.query(Resume).filter(Resume.id.in_(resume_ids))}
+
+        storage = ResumeStorageRepository(self.db)
+        writer = ApplicationWithResumeRepository(self.db)
+        pending = []
+        with ExitStack() as local_files:
+            items = []
+            for resume_id, resume in resumes.items():
+                try:
+                    items.append((resume_id, local_files.enter_context(storage.local_copy(resume.file_path))))
+                except FileNotFoundError:
+                    outcomes[resume_id] = "file_missing"
+
+            for resume_id, parsed_data, text in parse_many(items):
+                if "error" in parsed_data:
+                    outcomes[resume_id] = f"failed: {parsed_data['error']}"
+                    continue
+                writer.apply_parse_result(resumes[resume_id], parsed_data, text)
+                pending.append(resumes[resume_id])
+
+                if len(pending) >= WRITE_BATCH_SIZE:
+                    self._flush_reparsed(pending, outcomes)
+                    pending = []
+                    if on_progress:
+                        on_progress(len(outcomes))
+
+        self._flush_reparsed(pending, outcomes)
+        return outcomes
+
+    def _flush_reparsed(self, resumes: List[Resume], outcomes: Dict[int, str]):
+        """Copy new parses onto linked applications with one bulk UPDATE, then commit"""
+        if not resumes:
+            return
+        by_key = {(r.applicant_id, r.file_path): r for r in resumes}
+        linked = self.db.query(Application.id, Application.applicant_id, Application.resume_file_path).filter(
+            or_(*[
+                and_(Application.applicant_id == applicant_id, Application.resume_file_path == path)
+                for applicant_id, path in by_key
+            ])
+        ).all()
+        if linked:
+            self.db.execute(update(Application), [
+                {"id": app_id, "parsed_resume": by_key[(applicant_id, path)].parsed_data}
+                for app_id, applicant_id, path in linked
+            ])
+        self.db.commit()
+        for resume in resumes:
+            outcomes[resume.id] = "reparsed"
+
+    def reparse_stale(self, batch_size: int = OUTDATED_BATCH_SIZE, rate: Optional[float] = None,
+                      checkpoint_path: Optional[str] = None, max_batches: Optional[int] = None) -> Dict:
+        """Reparse resumes not produced by the current parser, newest first.
+
+        Progress is checkpointed after every committed batch, so an interrupted
+        run continues where it stopped. `rate` caps throughput in resumes per
+        second. Resumes that fail to parse stay stale and are retried on the
+        next full pass.
+        """
+        fingerprint = parser_fingerprint()
+        state = load_checkpoint(checkpoint_path, fingerprint)
+        started = time.monotonic()
+        processed_this_run = 0
+        batches = 0
+
+        while max_batches is None or batches < max_batches:
+            stmt = select(Resume.id, Resume.created_at).where(stale_resumes(fingerprint))
+            if state["id"] is not None:
+                after = datetime.fromisoformat(state["created_at"])
+                stmt = stmt.where(or_(
+                    Resume.created_at < after,
+                    and_(Resume.created_at == after, Resume.id < state["id"])
+                ))
+            batch = self.db.execute(
+                stmt.order_by(Resume.created_at.desc(), Resume.id.desc()).limit(batch_size)
+            ).all()
+            if not batch:
+                state["complete"] = True
+                save_checkpoint(checkpoint_path, state)
+                break
+
+            for outcome in self.reparse([row.id for row in batch]).values():
+                key = outcome.split(":", 1)[0]
+                state["outcomes"][key] = state["outcomes"].get(key, 0) + 1
+
+            state["created_at"] = batch[-1].created_at.isoformat()
+            state["id"] = batch[-1].id
+            state["processed"] += len(batch)
+            save_checkpoint(checkpoint_path, state)
+
+            batches += 1
+            processed_this_run += len(batch)
+            if rate:
+                ahead = processed_this_run / rate - (time.monotonic() - started)
+                if ahead > 0:
+                    time.sleep(ahead)
+
+        return state
+
+    def archive(self, resume_ids: List[int]) -> Dict[int, str]:
+        self.db.execute(
+            update(Resume)
+            .where(Resume.id.in_(resume_ids))
+            .values(archived_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        return {resume_id: "archived" for resume_id in resume_ids}
+
+    def delete(self, resume_ids: List[int]) -> Dict[int, str]:
+        """Delete resume rows (and derived index rows) in a few set-based statements.
+
+        Stored objects lose the resume's reference; legacy files still
+        referenced by an application are kept.
+        """
+        rows = self.db.query(Resume.applicant_id, Resume.file_path, Resume.text_hash) \
+            .filter(Resume.id.in_(resume_ids)).all()
+
+        self.db.execute(delete(ResumeLSHBucket).where(ResumeLSHBucket.resume_id.in_(resume_ids)))
+        self.db.execute(delete(ResumeSkill).where(ResumeSkill.resume_id.in_(resume_ids)))
+        self.db.execute(delete(ResumeTerm).where(ResumeTerm.resume_id.in_(resume_ids)))
+        self.db.execute(
+            delete(Resume).where(Resume.id.in_(resume_ids)).execution_options(synchronize_session=False)
+        )
+        text_hashes = {text_hash for _, _, text_hash in rows if text_hash}
+        if text_hashes:
+            # Stored texts are shared by content; drop only the ones nothing references any more
+            self.db.execute(delete(ResumeText).where(
+                ResumeText.content_hash.in_(text_hashes),
+                ~exists().where(Resume.text_hash == ResumeText.content_hash)
+            ))
+        storage = ResumeStorageRepository(self.db)
+        for _, path, _ in rows:
+            storage.release(path)
+        self.db.commit()
+
+        paths = {path for _, path, _ in rows if path and not is_storage_key(path)}
+        if paths:
+            still_used = {p for (p,) in self.db.query(Application.resume_file_path)
+                          .filter(Application.resume_file_path.in_(paths))}
+            for path in paths - still_used:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass  # already gone
+
+        return {resume_id: "deleted" for resume_id in resume_ids}
+
+
+def run_bulk_resume_operation(job_id: str, resume_ids: List[int], operation: str,
+                              user_id: int, is_admin: bool):
+    """Background task for BulkResumeOperation; progress is visible on the background job"""
+    db = SessionLocal()
+    try:
+        job = db.query(BackgroundJob).filter(BackgroundJob.id == job_id).first()
+        if not job:
+            return
+        repo = ResumeBulkRepository(db)
+        targets = repo.resolve_targets(resume_ids, user_id, is_admin)
+        outcomes = targets["outcomes"]
+        job_repo.mark_running(db, job, total=len(resume_ids))
+
+        try:
+            if targets["allowed"]:
+                if operation == "reparse":
+                    done = repo.reparse(
+                        targets["allowed"],
+                        on_progress=lambda n: job_repo.update_progress(db, job, len(outcomes) + n)
+                    )
+                elif operation == "archive":
+                    done = repo.archive(targets["allowed"])
+                else:
+                    done = repo.delete(targets["allowed"])
+                outcomes.update(done)
+        except Exception as e:
+            db.rollback()
+            job_repo.mark_failed(db, job, str(e))
+            return
+
+        job.progress = len(outcomes)
+        job_repo.mark_completed(db, job, result={
+            "operation": operation,
+            "outcomes": {str(k): v for k, v in outcomes.items()}
+        })
+    finally:
+        db.close()
+
+
+def run_reparse_outdated(job_id: str, below_version: int, batch_size: int = OUTDATED_BATCH_SIZE,
+                         max_load: float = OUTDATED_MAX_LOAD):
+    """Background task: reparse every resume parsed by a parser older than `below_version`.
+
+    Walks resumes in id order in small batches and waits between batches
+    (longer while the host is loaded) so live traffic keeps priority.
+    """
+    db = SessionLocal()
+    try:
+        job = db.query(BackgroundJob).filter(BackgroundJob.id == job_id).first()
+        if not job:
+            return
+
+        outdated = or_(Resume.parser_version.is_(None), Resume.parser_version < below_version)
+        total = db.query(Resume.id).filter(outdated, Resume.archived_at.is_(None)).count()
+        job_repo.mark_running(db, job, total=total)
+
+        repo = ResumeBulkRepository(db)
+        last_id, processed = 0, 0
+        counts: Dict[str, int] = {}
+        try:
+            while True:
+                ids = [rid for (rid,) in db.query(Resume.id)
+                       .filter(outdated, Resume.archived_at.is_(None), Resume.id > last_id)
+                       .order_by(Resume.id)
+                       .limit(batch_size)]
+                if not ids:
+                    break
+
+                for outcome in repo.reparse(ids).values():
+                    key = outcome.split(":", 1)[0]
+                    counts[key] = counts.get(key, 0) + 1
+
+                processed += len(ids)
+                last_id = ids[-1]
+                job_repo.update_progress(db, job, processed)
+                wait_for_capacity(max_load=max_load)
+        except Exception as e:
+            db.rollback()
+            job_repo.mark_failed(db, job, f"stopped after resume id {last_id}: {e}")
+            return
+
+        job_repo.mark_completed(db, job, result={
+            "below_version": below_version,
+            "current_version": ResumeParser.VERSION,
+            "processed": processed,
+            "outcomes": counts,
+            "last_id": last_id
+        })
+    finally:
+        db.close()
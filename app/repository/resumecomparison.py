@@ -0,0 +1,131 @@
+from typing import Dict, List, Optional
+import numpy as np
+from sqlalchemy import and_
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from app.models.application import Application
+from app.models.job import Job
+from app.models.resume import Resume
+from app.repository.resumetext import ResumeTextRepository
+from app.utils.resume_vectors import (
+    build_vector,
+    normalize_skills,
+    pack_vector,
+    similarity_scores,
+    unpack_vector,
+)
+
+
+class ResumeComparisonRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_vectors(self, resumes: List[Resume]) -> np.ndarray:
+        """Return one feature vector row per resume, computing and caching missing ones.
+
+        Vectors are cached in `Resume.feature_vector` and cleared whenever the
+        resume is reparsed, so a cached vector always matches `parsed_data`.
+        """
+        rows = []
+        computed = False
+        # Full texts are only loaded (in one query) for resumes without a cached vector
+        texts = ResumeTextRepository(self.db).load_many(
+            r.text_hash for r in resumes if r.feature_vector is None
+        )
+        for resume in resumes:
+            if resume.feature_vector is None:
+                parsed = resume.parsed_data or {}
+                text = texts.get(resume.text_hash) or parsed.get("extracted_text", "")
+                vector = build_vector(text, parsed.get("skills"))
+                resume.feature_vector = pack_vector(vector)
+                computed = True
+            rows.append(unpack_vector(resume.feature_vector))
+
+        if computed:
+            self.db.commit()
+
+        if not rows:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.vstack(rows)
+
+    def compare(self, resume1_id: int, resume2_id: int, employer_id: Optional[int] = None) -> Dict:
+        """Compare two resumes"""
+        if employer_id:
+            self._verify_employer_access([resume1_id, resume2_id], employer_id)
+
+        resumes = {r.id: r for r in self.db.query(Resume).filter(Resume.id.in_([resume1_id, resume2_id]))}
+        if resume1_id not in resumes or resume2_id not in resumes:
+            raise HTTPException(status_code=404, detail="Resume not found")
+
+        first, second = resumes[resume1_id], resumes[resume2_id]
+        vectors = self.get_vectors([first, second])
+        score = float(similarity_scores(vectors[0], vectors[1:])[0])
+        return self._comparison(first, second, score)
+
+    def compare_against_job(self, resume_id: int, job_id: int, employer_id: Optional[int] = None) -> List[Dict]:
+        """Compare one resume against the resumes of every applicant to a job, in one batch"""
+        job = self.db.query(Job).filter(Job.id == job_id).first()
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        if employer_id and job.posted_by != employer_id:
+            raise HTTPException(status_code=403, detail="Not authorized to view these applications")
+
+        resume = self.db.query(Resume).filter(Resume.id == resume_id).first()
+        if not resume:
+            raise HTTPException(status_code=404, detail="Resume not found")
+        if employer_id:
+            self._verify_employer_access([resume_id], employer_id)
+
+        applicant_resumes = (
+            self.db.query(Resume)
+            .join(Application, and_(
+                Application.applicant_id == Resume.applicant_id,
+                Application.resume_file_path == Resume.file_path
+            ))
+            .filter(Application.job_id == job_id, Resume.id != resume_id)
+            .all()
+        )
+        if not applicant_resumes:
+            return []
+
+        vectors = self.get_vectors([resume] + applicant_resumes)
+        scores = similarity_scores(vectors[0], vectors[1:])
+
+        results = [
+            self._comparison(resume, other, float(score))
+            for other, score in zip(applicant_resumes, scores)
+        ]
+        results.sort(key=lambda r: r["similarity_score"], reverse=True)
+        return results
+
+    def _verify_employer_access(self, resume_ids: List[int], employer_id: int):
+        """Employers may only compare resumes submitted to one of their jobs"""
+        visible = (
+            self.db.query(Resume.id)
+            .join(Application, and_(
+                Application.applicant_id == Resume.applicant_id,
+                Application.resume_file_path == Resume.file_path
+            ))
+            .join(Job, Job.id == Application.job_id)
+            .filter(Resume.id.in_(resume_ids), Job.posted_by == employer_id)
+            .distinct()
+            .count()
+        )
+        if visible != len(set(resume_ids)):
+            raise HTTPException(status_code=403, detail="Not authorized to view these resumes")
+
+    @staticmethod
+    def _comparison(first: Resume, second: Resume, score: float) -> Dict:
+        skills1 = normalize_skills((first.parsed_data or {}).get("skills"))
+        skills2 = normalize_skills((second.parsed_data or {}).get("skills"))
+        common = [s for s in skills1 if s in skills2]
+        return {
+            "resume1_id": first.id,
+            "resume2_id": second.id,
+            "similarity_score": round(min(max(score, 0.0), 1.0), 4),
+            "common_skills": common,
+            "skill_differences": {
+                "resume1_only": [s for s in skills1 if s not in skills2],
+                "resume2_only": [s for s in skills2 if s not in skills1],
+            }
+        }
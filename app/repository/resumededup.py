@@ -0,0 +1,182 @@
+from typing import Dict, List, Optional
+from sqlalchemy import insert, delete
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from app.models.application import Application
+from app.models.job import Job
+from app.models.resume import Resume
+from app.models.resumelsh import ResumeLSHBucket
+from app.repository.resumestorage import ResumeStorageRepository
+from app.repository.resumetext import ResumeTextRepository
+from app.utils.minhash import compute_signature, band_buckets, estimate_similarity
+from app.utils.resume_parser import ResumeParser
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.8
+
+
+class ResumeDedupRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def index_resume(self, resume: Resume, text: str) -> Optional[bytes]:
+        """Compute the MinHash signature for a resume and (re)write its LSH buckets.
+
+        The resume must already have an id (flush first). Does not commit.
+        """
+        signature = compute_signature(text)
+        resume.minhash_signature = signature
+
+        self.db.execute(delete(ResumeLSHBucket).where(ResumeLSHBucket.resume_id == resume.id))
+        if signature:
+            self.db.execute(
+                insert(ResumeLSHBucket),
+                [
+                    {"resume_id": resume.id, "band": band, "bucket": bucket}
+                    for band, bucket in enumerate(band_buckets(signature))
+                ],
+            )
+        return signature
+
+    def find_near_duplicates(
+            self,
+            resume_id: int,
+            threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+            limit: int = 50
+    ) -> List[Dict]:
+        """Find resumes whose estimated Jaccard similarity is at least `threshold`"""
+        resume = self.db.query(Resume).filter(Resume.id == resume_id).first()
+        if not resume:
+            raise HTTPException(status_code=404, detail="Resume not found")
+        if not resume.minhash_signature:
+            return []
+
+        buckets = band_buckets(resume.minhash_signature)
+        candidate_ids = (
+            self.db.query(ResumeLSHBucket.resume_id)
+            .filter(
+                ResumeLSHBucket.bucket.in_(buckets),
+                ResumeLSHBucket.resume_id != resume_id
+            )
+            .distinct()
+            .subquery()
+        )
+        candidates = (
+            self.db.query(Resume.id, Resume.applicant_id, Resume.minhash_signature, Resume.created_at)
+            .filter(Resume.id.in_(candidate_ids.select()))
+            .all()
+        )
+
+        matches = []
+        for candidate in candidates:
+            if not candidate.minhash_signature:
+                continue
+            similarity = estimate_similarity(resume.minhash_signature, candidate.minhash_signature)
+            if similarity >= threshold:
+                matches.append({
+                    "resume_id": candidate.id,
+                    "applicant_id": candidate.applicant_id,
+                    "similarity": round(similarity, 4),
+                    "created_at": candidate.created_at
+                })
+
+        matches.sort(key=lambda m: m["similarity"], reverse=True)
+        return matches[:limit]
+
+    def get_resume_for_application(self, application: Application) -> Optional[Resume]:
+        return self.db.query(Resume).filter(
+            Resume.applicant_id == application.applicant_id,
+            Resume.file_path == application.resume_file_path
+        ).first()
+
+    def find_near_duplicates_for_application(
+            self,
+            application_id: int,
+            employer_id: Optional[int] = None,
+            threshold: float = DEFAULT_SIMILARITY_THRESHOLD
+    ) -> Dict:
+        """Near-duplicates of an application's resume, with the applications they were used in.
+
+        When `employer_id` is given the caller must own the job, and only
+        applications to that employer's jobs are returned.
+        """
+        application = self.db.query(Application).filter(Application.id == application_id).first()
+        if not application:
+            raise HTTPException(status_code=404, detail="Application not found")
+
+        if employer_id and (not application.job or application.job.posted_by != employer_id):
+            raise HTTPException(status_code=403, detail="Not authorized to view this application")
+
+        resume = self.get_resume_for_application(application)
+        if not resume:
+            raise HTTPException(status_code=404, detail="No resume record for this application")
+
+        duplicates = self.find_near_duplicates(resume.id, threshold=threshold)
+        if not duplicates:
+            return {"application_id": application_id, "resume_id": resume.id, "duplicates": []}
+
+        by_resume = {d["resume_id"]: d for d in duplicates}
+        rows = (
+            self.db.query(Resume.id, Application.id, Application.job_id)
+            .join(Application, (Application.applicant_id == Resume.applicant_id)
+                  & (Application.resume_file_path == Resume.file_path))
+            .join(Job, Job.id == Application.job_id)
+            .filter(Resume.id.in_(by_resume.keys()))
+        )
+        if employer_id:
+            rows = rows.filter(Job.posted_by == employer_id)
+
+        for dup in duplicates:
+            dup["applications"] = []
+        for dup_resume_id, dup_application_id, dup_job_id in rows.all():
+            by_resume[dup_resume_id]["applications"].append(
+                {"application_id": dup_application_id, "job_id": dup_job_id}
+            )
+
+        if employer_id:
+            duplicates = [d for d in duplicates if d["applications"]]
+
+        return {"application_id": application_id, "resume_id": resume.id, "duplicates": duplicates}
+
+    def backfill_signatures(self, batch_size: int = 200, start_after_id: int = 0) -> Dict:
+        """Compute signatures for resumes that don't have one yet, committing per batch.
+
+        Text is re-extracted from the stored file where possible, falling back
+        to the text kept in `parsed_data`.
+        """
+        last_id = start_after_id
+        indexed = skipped = 0
+
+        while True:
+            batch = (
+                self.db.query(Resume)
+                .filter(Resume.id > last_id, Resume.minhash_signature.is_(None))
+                .order_by(Resume.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not batch:
+                break
+
+            for resume in batch:
+                text = self._load_text(resume)
+                if self.index_resume(resume, text):
+                    indexed += 1
+                else:
+                    skipped += 1
+
+            last_id = batch[-1].id
+            self.db.commit()
+
+        return {"indexed": indexed, "skipped": skipped, "last_id": last_id}
+
+    def _load_text(self, resume: Resume) -> str:
+        stored = ResumeTextRepository(self.db).load(resume.text_hash)
+        if stored is not None:
+            return stored
+        try:
+            with ResumeStorageRepository(self.db).local_copy(resume.file_path) as local_path:
+                return ResumeParser(local_path).extract_text()
+        except (FileNotFoundError, HTTPException):
+            pass
+        return (resume.parsed_data or {}).get("extracted_text") or ""
+
@@ -0,0 +1,156 @@
+import os
+from typing import Dict, Iterator, List, Optional
+from sqlalchemy import and_, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from app.database.session import SessionLocal
+from app.models.application import Application
+from app.models.backgroundjob import BackgroundJob
+from app.models.job import Job
+from app.models.resume import Resume
+from app.models.user import User
+from app.repository import backgroundjob as job_repo
+from app.repository.resumesearch import apply_search_filters
+from app.schemas.resume import ResumeExport
+from app.utils.export_writers import WRITERS, FILE_EXTENSIONS
+
+EXPORT_DIR = os.getenv("EXPORT_DIR", "exports")
+YIELD_PER = 1000
+
+# Export field name -> how to read it from a result row / parsed resume
+APPLICATION_FIELDS = {
+    "application_id": "application_id",
+    "job_id": "job_id",
+    "job_title": "job_title",
+    "status": "status",
+    "applicant_id": "applicant_id",
+    "applicant_email": "applicant_email",
+    "resume_id": "resume_id",
+    "applied_at": "applied_at",
+}
+PARSED_FIELDS = {
+    "name", "email", "mobile_number", "field", "skills", "education",
+    "experience", "current_position", "years_experience", "no_of_pages",
+}
+EXPORTABLE_FIELDS = set(APPLICATION_FIELDS) | PARSED_FIELDS
+
+
+class ResumeExportRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def validate_fields(export: ResumeExport) -> List[str]:
+        unknown = [f for f in export.fields if f not in EXPORTABLE_FIELDS]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown export fields: {unknown}. Allowed: {sorted(EXPORTABLE_FIELDS)}"
+            )
+        return export.fields
+
+    def _statement(self, export: ResumeExport, employer_id: Optional[int]):
+        stmt = (
+            select(
+                Application.id.label("application_id"),
+                Application.job_id,
+                Application.status,
+                Application.created_at.label("applied_at"),
+                Job.title.label("job_title"),
+                Resume.id.label("resume_id"),
+                Resume.applicant_id,
+                Resume.parsed_data,
+                User.email.label("applicant_email"),
+            )
+            .join(Job, Job.id == Application.job_id)
+            .join(Resume, and_(
+                Resume.applicant_id == Application.applicant_id,
+                Resume.file_path == Application.resume_file_path
+            ))
+            .join(User, User.id == Application.applicant_id)
+            .order_by(Application.id)
+        )
+        if employer_id:
+            stmt = stmt.where(Job.posted_by == employer_id)
+        return apply_search_filters(stmt, export.filters)
+
+    def iter_rows(self, export: ResumeExport, employer_id: Optional[int] = None) -> Iterator[Dict]:
+        """Yield flat export rows using a server-side cursor, YIELD_PER rows at a time"""
+        result = self.db.execute(
+            self._statement(export, employer_id).execution_options(yield_per=YIELD_PER)
+        )
+        for row in result:
+            parsed = row.parsed_data or {}
+            data = {field: parsed.get(field) for field in PARSED_FIELDS}
+            data.update({field: getattr(row, column) for field, column in APPLICATION_FIELDS.items()})
+            yield data
+
+    def stream(self, export: ResumeExport, employer_id: Optional[int] = None) -> Iterator[bytes]:
+        fields = self.validate_fields(export)
+        return WRITERS[export.format](self.iter_rows(export, employer_id), fields)
+
+    def write_to_file(self, export: ResumeExport, path: str, employer_id: Optional[int] = None,
+                      on_progress=None) -> Dict:
+        """Write a full export to disk; `on_progress(rows)` is called periodically"""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        rows = 0
+
+        def counted(iterator):
+            nonlocal rows
+            for row in iterator:
+                rows += 1
+                if on_progress and rows % (YIELD_PER * 10) == 0:
+                    on_progress(rows)
+                yield row
+
+        fields = self.validate_fields(export)
+        with open(path, "wb") as out:
+            for chunk in WRITERS[export.format](counted(self.iter_rows(export, employer_id)), fields):
+                out.write(chunk)
+
+        return {"rows": rows, "bytes": os.path.getsize(path)}
+
+    @staticmethod
+    def export_path(job_id: str, export_format: str) -> str:
+        return os.path.join(EXPORT_DIR, f"resume_export_{job_id}.{FILE_EXTENSIONS[export_format]}")
+
+
+def run_resume_export_job(job_id: str, export_data: Dict, employer_id: Optional[int]):
+    """Background task: write an export to disk and record the outcome on the job.
+
+    Status updates go through their own session, since committing on the
+    session that owns the streaming cursor would close it on Postgres.
+    """
+    export = ResumeExport(**export_data)
+    status_db = SessionLocal()
+    data_db = SessionLocal()
+    try:
+        job = status_db.query(BackgroundJob).filter(BackgroundJob.id == job_id).first()
+        if not job:
+            return
+        job_repo.mark_running(status_db, job)
+
+        def report_progress(rows: int):
+            try:
+                job_repo.update_progress(status_db, job, rows)
+            except OperationalError:
+                # Progress is best effort (e.g. SQLite is locked by the reader)
+                status_db.rollback()
+
+        path = ResumeExportRepository.export_path(job_id, export.format)
+        try:
+            result = ResumeExportRepository(data_db).write_to_file(
+                export, path, employer_id, on_progress=report_progress
+            )
+        except Exception as e:
+            if os.path.exists(path):
+                os.remove(path)
+            job_repo.mark_failed(status_db, job, str(e))
+            return
+
+        job.progress = result["rows"]
+        job_repo.mark_completed(status_db, job, result=result, result_path=path)
+    finally:
+        data_db.close()
+        status_db.close()
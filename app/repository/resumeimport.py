@@ -0,0 +1,286 @@
+import csv
+import io
+import json
+import time
+from datetime import datetime
+from typing import Dict, Iterator, List, Tuple
+from sqlalchemy import insert, tuple_
+from sqlalchemy.orm import Session
+from fastapi import HTTPException
+from app.models.application import Application
+from app.models.job import Job
+from app.models.resume import Resume
+from app.models.user import User
+from app.repository.applicationevent import record_status_events, status_event
+from app.repository.dashboard import invalidate_dashboards
+from app.repository.resumesearch import ResumeSearchRepository, search_columns
+from app.schemas.resume import ResumeImport
+
+CHUNK_SIZE = 1000
+MAX_REPORTED_ERRORS = 1000
+
+VALID_STATUSES = {"pending", "reviewed", "accepted", "rejected"}
+LIST_FIELDS = {"skills", "education"}
+INT_FIELDS = {"applicant_id", "job_id", "years_experience"}
+PARSED_FIELDS = {
+    "name", "email", "mobile_number", "field", "skills", "education",
+    "current_position", "years_experience",
+}
+RECORD_FIELDS = {"applicant_id", "applicant_email", "file_path", "job_id", "cover_letter", "status"}
+IMPORTABLE_FIELDS = RECORD_FIELDS | PARSED_FIELDS
+
+
+class RowError(ValueError):
+    pass
+
+
+def _text(target: str, value) -> str:
+    """A text field's value: strings as they are, JSON numbers as their digits"""
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    raise RowError(f"{target}: expected text, got {value!r}")
+
+
+def _split_list(target: str, value) -> List[str]:
+    if isinstance(value, list):
+        return [str(v).strip() for v in value if str(v).strip()]
+    value = _text(target, value)
+    separator = ";" if ";" in value else ","
+    return [v.strip() for v in value.split(separator) if v.strip()]
+
+
+def map_row(raw: Dict, mapping: Dict[str, str]) -> Dict:
+    """Apply the source->target field mapping to one raw row and coerce types"""
+    record = {}
+    for source, target in mapping.items():
+        value = raw.get(source)
+        if value is None or (isinstance(value, str) and not value.strip()):
+            continue
+        if target in LIST_FIELDS:
+            value = _split_list(target, value)
+        elif target in INT_FIELDS:
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                raise RowError(f"{target}: expected an integer, got {value!r}")
+        else:
+            value = _text(target, value)
+        record[target] = value
+
+    if "applicant_id" not in record and "applicant_email" not in record:
+        raise RowError("applicant_email or applicant_id is required")
+    if "file_path" not in record:
+        raise RowError("file_path is required")
+    if record.get("status") and record["status"] not in VALID_STATUSES:
+        raise RowError(f"status must be one of {sorted(VALID_STATUSES)}")
+    if record.get("status") and "job_id" not in record:
+        raise RowError("status requires job_id")
+    return record
+
+
+def iter_source_rows(file, file_format: str) -> Iterator[Dict]:
+    """Yield raw rows from an uploaded CSV or JSON (Lines) file without loading it whole.
+
+    A JSON document that is a single top-level array is also accepted, but
+    has to be parsed in one go; JSON Lines is preferred for large imports.
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    if file_format == "csv":
+        yield from csv.DictReader(text)
+        return
+
+    first = text.read(1)
+    while first and first.isspace():
+        first = text.read(1)
+    if first == "[":
+        rows = json.loads(first + text.read())
+        yield from (r if isinstance(r, dict) else {"__invalid__": r} for r in rows)
+        return
+
+    pending = first
+    for line in text:
+        line = pending + line
+        pending = ""
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            row = {"__invalid__": f"invalid JSON: {e.msg}"}
+        yield row if isinstance(row, dict) else {"__invalid__": row}
+
+
+class ResumeImportRepository:
+    def __init__(self, db: Session):
+        self.db = db
+        self._user_ids: Dict[str, int] = {}
+        self._job_owners: Dict[int, int] = {}
+
+    @staticmethod
+    def validate_mapping(spec: ResumeImport):
+        unknown = sorted(set(spec.mapping.values()) - IMPORTABLE_FIELDS)
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown target fields in mapping: {unknown}. Allowed: {sorted(IMPORTABLE_FIELDS)}"
+            )
+
+    def run(self, file, spec: ResumeImport) -> Dict:
+        """Import rows chunk by chunk, committing after each chunk unless validate_only"""
+        self.validate_mapping(spec)
+        started = time.perf_counter()
+        summary = {
+            "total_rows": 0,
+            "valid_rows": 0,
+            "imported_resumes": 0,
+            "imported_applications": 0,
+            "error_count": 0,
+            "errors": [],
+            "validate_only": spec.validate_only,
+        }
+
+        chunk: List[Tuple[int, Dict]] = []
+        for row_number, raw in enumerate(iter_source_rows(file, spec.file_format), start=1):
+            summary["total_rows"] += 1
+            try:
+                if "__invalid__" in raw:
+                    raise RowError(f"not an object: {raw['__invalid__']}")
+                chunk.append((row_number, map_row(raw, spec.mapping)))
+            except RowError as e:
+                self._record_error(summary, row_number, str(e))
+
+            if len(chunk) >= CHUNK_SIZE:
+                self._process_chunk(chunk, spec.validate_only, summary)
+                chunk = []
+
+        if chunk:
+            self._process_chunk(chunk, spec.validate_only, summary)
+
+        summary["elapsed_seconds"] = round(time.perf_counter() - started, 3)
+        return summary
+
+    def _process_chunk(self, chunk: List[Tuple[int, Dict]], validate_only: bool, summary: Dict):
+        valid = self._validate_chunk(chunk, summary)
+        summary["valid_rows"] += len(valid)
+        if validate_only or not valid:
+            return
+
+        now = datetime.utcnow()
+        resume_rows = []
+        application_rows = []
+        for record in valid:
+            parsed = {k: record[k] for k in PARSED_FIELDS if k in record}
+            parsed["source"] = "import"
+            resume_rows.append({
+                "applicant_id": record["applicant_id"],
+                "file_path": record["file_path"],
+                "parsed_data": parsed,
+                "created_at": now,
+                **search_columns(parsed),
+            })
+            if "job_id" in record:
+                application_rows.append({
+                    "job_id": record["job_id"],
+                    "applicant_id": record["applicant_id"],
+                    "resume_file_path": record["file_path"],
+                    "cover_letter": record.get("cover_letter"),
+                    "parsed_resume": parsed,
+                    "status": record.get("status", "pending"),
+                    "created_at": now,
+                })
+
+        try:
+            # executemany: batched multi-row inserts, one round trip per batch
+            resume_ids = self.db.scalars(
+                insert(Resume).returning(Resume.id, sort_by_parameter_order=True),
+                resume_rows
+            ).all()
+            search = ResumeSearchRepository(self.db)
+            search.index_skills([
+                {"id": resume_id, "parsed_data": row["parsed_data"]}
+                for resume_id, row in zip(resume_ids, resume_rows)
+            ])
+            search.index_terms([{**row, "id": resume_id} for resume_id, row in zip(resume_ids, resume_rows)])
+            if application_rows:
+                applications = self.db.execute(
+                    insert(Application).returning(Application.id, Application.job_id, Application.status,
+                                                  sort_by_parameter_order=True),
+                    application_rows
+                ).all()
+                # History in the same transaction: the submission, then the imported status
+                events = [status_event(application, "pending") for application in applications]
+                events += [status_event(application, application.status, from_status="pending")
+                           for application in applications if application.status != "pending"]
+                record_status_events(self.db, events)
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            first_row = chunk[0][0]
+            self._record_error(summary, first_row, f"chunk starting at row {first_row} failed: {e}")
+            summary["valid_rows"] -= len(valid)
+            return
+
+        invalidate_dashboards(*{self._job_owners[row["job_id"]] for row in application_rows})
+        summary["imported_resumes"] += len(resume_rows)
+        summary["imported_applications"] += len(application_rows)
+
+    def _validate_chunk(self, chunk: List[Tuple[int, Dict]], summary: Dict) -> List[Dict]:
+        """Resolve applicants and jobs and check for duplicates with one query each"""
+        emails = {r["applicant_email"].lower() for _, r in chunk
+                  if "applicant_id" not in r} - self._user_ids.keys()
+        if emails:
+            for user_id, email in self.db.query(User.id, User.email).filter(User.email.in_(emails)):
+                self._user_ids[email.lower()] = user_id
+
+        given_ids = {r["applicant_id"] for _, r in chunk if "applicant_id" in r}
+        known_ids = {uid for (uid,) in self.db.query(User.id).filter(User.id.in_(given_ids))} if given_ids else set()
+
+        job_ids = {r["job_id"] for _, r in chunk if "job_id" in r} - self._job_owners.keys()
+        if job_ids:
+            self._job_owners.update(self.db.query(Job.id, Job.posted_by).filter(Job.id.in_(job_ids)))
+
+        resolved = []
+        for row_number, record in chunk:
+            if "applicant_id" in record:
+                if record["applicant_id"] not in known_ids:
+                    self._record_error(summary, row_number, f"applicant_id {record['applicant_id']} not found")
+                    continue
+            else:
+                user_id = self._user_ids.get(record["applicant_email"].lower())
+                if user_id is None:
+                    self._record_error(summary, row_number, f"no user with email {record['applicant_email']}")
+                    continue
+                record["applicant_id"] = user_id
+
+            if "job_id" in record and record["job_id"] not in self._job_owners:
+                self._record_error(summary, row_number, f"job_id {record['job_id']} not found")
+                continue
+            resolved.append((row_number, record))
+
+        pairs = {(r["job_id"], r["applicant_id"]) for _, r in resolved if "job_id" in r}
+        existing = set()
+        if pairs:
+            existing = set(
+                self.db.query(Application.job_id, Application.applicant_id)
+                .filter(tuple_(Application.job_id, Application.applicant_id).in_(pairs))
+            )
+
+        valid = []
+        seen = set()
+        for row_number, record in resolved:
+            if "job_id" in record:
+                pair = (record["job_id"], record["applicant_id"])
+                if pair in existing or pair in seen:
+                    self._record_error(summary, row_number, "applicant already applied for this job")
+                    continue
+                seen.add(pair)
+            valid.append(record)
+        return valid
+
+    @staticmethod
+    def _record_error(summary: Dict, row_number: int, message: str):
+        summary["error_count"] += 1
+        if len(summary["errors"]) < MAX_REPORTED_ERRORS:
+            summary["errors"].append({"row": row_number, "error": message})
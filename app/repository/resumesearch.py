@@ -0,0 +1,222 @@
+import math
+import os
+import re
+from typing import Dict, List, Optional
+from sqlalchemy import and_, delete, exists, false, func, insert, select, update
+from sqlalchemy.orm import Session
+from app.models.application import Application
+from app.models.job import Job
+from app.models.resume import Resume
+from app.models.resumeskill import ResumeSkill
+from app.models.resumeterm import ResumeTerm
+from app.schemas.resume import ResumeSearchFilters
+from app.utils.resume_vectors import normalize_skills
+
+MAX_PER_PAGE = 100
+# Pages with more matches than this walk the newest-first index and probe the filters per
+# row (cheap when matches are common); fewer are looked up by id and sorted instead
+SORT_LIMIT = int(os.getenv("RESUME_SEARCH_SORT_LIMIT", "2000"))
+# Free-text search columns matched word by word through resume_terms
+TERM_FIELDS = {"education": "education_text", "current_position": "current_position"}
+
+
+def _lower(value) -> Optional[str]:
+    value = str(value).strip().lower() if value is not None else ""
+    return value or None
+
+
+def search_columns(parsed: Optional[Dict]) -> Dict:
+    """Derive the typed search column values for a parsed resume"""
+    parsed = parsed or {}
+    experience = parsed.get("experience") if isinstance(parsed.get("experience"), dict) else {}
+
+    years = parsed.get("years_experience", experience.get("years_experience"))
+    try:
+        years = int(years) if years is not None else None
+    except (TypeError, ValueError):
+        years = None
+
+    email = parsed.get("email") or ""
+    education = parsed.get("education") or []
+    if isinstance(education, str):
+        education = [education]
+
+    return {
+        "field": _lower(parsed.get("field")),
+        "current_position": _lower(parsed.get("current_position") or experience.get("current_position")),
+        "experience_years": years,
+        "email_domain": _lower(email.rsplit("@", 1)[1]) if "@" in email else None,
+        "education_text": _lower(" | ".join(str(e) for e in education)),
+    }
+
+
+def search_terms(text: Optional[str]) -> List[str]:
+    """Distinct lowercase words of a free-text value, in order"""
+    return list(dict.fromkeys(re.findall(r"\w+", text.lower()))) if text else []
+
+
+def term_rows(resume_id: int, columns: Dict) -> List[Dict]:
+    """resume_terms rows for a resume's search column values (see search_columns)"""
+    return [
+        {"resume_id": resume_id, "field": field, "term": term}
+        for field, column in TERM_FIELDS.items()
+        for term in search_terms(columns.get(column))
+    ]
+
+
+def _matching(id_column, conditions, per_row: bool):
+    """Resume.id IN (matching ids), or with per_row an EXISTS probe of the same index per resume"""
+    if per_row:
+        return exists().where(id_column == Resume.id, *conditions)
+    return Resume.id.in_(select(id_column).where(*conditions))
+
+
+def _has_words(field: str, query: str, per_row: bool = False):
+    """Every word of `query` starts a word of the field: one index range scan per word"""
+    words = search_terms(query)
+    if not words:
+        return false()
+    return and_(*(
+        _matching(ResumeTerm.resume_id, [
+            # [word, next string after every word starting with it): a prefix match any B-tree can range scan
+            ResumeTerm.field == field, ResumeTerm.term >= word, ResumeTerm.term < word[:-1] + chr(ord(word[-1]) + 1)
+        ], per_row)
+        for word in words
+    ))
+
+
+def apply_search_filters(stmt, filters: Optional[ResumeSearchFilters], per_row: bool = False):
+    """Add WHERE clauses for ResumeSearchFilters against the indexed search columns.
+
+    per_row phrases the skill and word filters as correlated EXISTS, for plans that
+    walk resumes in index order and stop at a LIMIT rather than collect every match.
+    """
+    if not filters:
+        return stmt
+
+    if filters.field:
+        stmt = stmt.where(Resume.field == filters.field.strip().lower())
+    if filters.skills:
+        wanted = normalize_skills(filters.skills)
+        stmt = stmt.where(_matching(ResumeSkill.resume_id, [ResumeSkill.skill.in_(wanted)], per_row))
+    if filters.education:
+        stmt = stmt.where(_has_words("education", filters.education, per_row))
+    if filters.current_position:
+        stmt = stmt.where(_has_words("current_position", filters.current_position, per_row))
+    if filters.email_domain:
+        stmt = stmt.where(Resume.email_domain == filters.email_domain.strip().lower().lstrip("@"))
+    if filters.experience_years_min is not None:
+        stmt = stmt.where(Resume.experience_years >= filters.experience_years_min)
+    if filters.experience_years_max is not None:
+        stmt = stmt.where(Resume.experience_years <= filters.experience_years_max)
+    return stmt
+
+
+class ResumeSearchRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def index_resume(self, resume: Resume, parsed: Optional[Dict] = None):
+        """Populate the search columns and skill rows for a resume. Does not commit."""
+        parsed = parsed if parsed is not None else resume.parsed_data
+        columns = search_columns(parsed)
+        for column, value in columns.items():
+            setattr(resume, column, value)
+
+        self.db.execute(delete(ResumeSkill).where(ResumeSkill.resume_id == resume.id))
+        skills = normalize_skills((parsed or {}).get("skills"))
+        if skills:
+            self.db.execute(insert(ResumeSkill), [{"resume_id": resume.id, "skill": s} for s in skills])
+        self.db.execute(delete(ResumeTerm).where(ResumeTerm.resume_id == resume.id))
+        terms = term_rows(resume.id, columns)
+        if terms:
+            self.db.execute(insert(ResumeTerm), terms)
+
+    def index_many(self, rows: List[Dict]):
+        """Bulk variant of index_resume: rows of {"id", "parsed_data"}. Does not commit."""
+        if not rows:
+            return
+        columns = [{"id": row["id"], **search_columns(row["parsed_data"])} for row in rows]
+        self.db.execute(update(Resume), columns)
+        self.index_skills(rows)
+        self.index_terms(columns)
+
+    def index_skills(self, rows: List[Dict]):
+        """Insert skill rows for resumes that have none yet. Does not commit."""
+        skill_rows = [
+            {"resume_id": row["id"], "skill": skill}
+            for row in rows
+            for skill in normalize_skills((row["parsed_data"] or {}).get("skills"))
+        ]
+        if skill_rows:
+            self.db.execute(insert(ResumeSkill), skill_rows)
+
+    def index_terms(self, rows: List[Dict]):
+        """Insert term rows for resumes that have none yet, from rows of {"id", **search_columns()}.
+        Does not commit."""
+        terms = [term for row in rows for term in term_rows(row["id"], row)]
+        if terms:
+            self.db.execute(insert(ResumeTerm), terms)
+
+    def search(self, filters: ResumeSearchFilters, page: int = 1, per_page: int = 20,
+               employer_id: Optional[int] = None) -> Dict:
+        """Filter on indexed columns; the total is a COUNT over the same index-only predicate"""
+        per_page = max(1, min(per_page, MAX_PER_PAGE))
+        page = max(1, page)
+
+        def matching(per_row: bool = False):
+            stmt = apply_search_filters(select(Resume.id).where(Resume.archived_at.is_(None)), filters, per_row)
+            if employer_id:
+                stmt = stmt.where(exists().where(
+                    Application.applicant_id == Resume.applicant_id,
+                    Application.resume_file_path == Resume.file_path,
+                    Job.id == Application.job_id,
+                    Job.posted_by == employer_id
+                ))
+            return stmt
+
+        total = self.db.scalar(matching().with_only_columns(func.count(Resume.id)))
+        resumes = []
+        if total:
+            # Page over ids only, then load just the rows on this page. Common matches: walk
+            # (created_at, id) newest first until the page is full; rare ones: sort the few ids.
+            page_ids = self.db.scalars(
+                matching(per_row=total > SORT_LIMIT)
+                .order_by(Resume.created_at.desc(), Resume.id.desc())
+                .offset((page - 1) * per_page)
+                .limit(per_page)
+            ).all()
+            by_id = {r.id: r for r in self.db.query(Resume).filter(Resume.id.in_(page_ids))}
+            resumes = [by_id[i] for i in page_ids if i in by_id]
+
+        return {
+            "resumes": resumes,
+            "total": total,
+            "page": page,
+            "pages": math.ceil(total / per_page) if total else 0,
+        }
+
+    def backfill(self, batch_size: int = 1000, start_after_id: int = 0) -> Dict:
+        """Populate search columns for existing resumes, committing per batch"""
+        last_id = start_after_id
+        indexed = 0
+        while True:
+            batch = self.db.execute(
+                select(Resume.id, Resume.parsed_data)
+                .where(Resume.id > last_id)
+                .order_by(Resume.id)
+                .limit(batch_size)
+            ).all()
+            if not batch:
+                break
+
+            ids = [row.id for row in batch]
+            self.db.execute(delete(ResumeSkill).where(ResumeSkill.resume_id.in_(ids)))
+            self.db.execute(delete(ResumeTerm).where(ResumeTerm.resume_id.in_(ids)))
+            self.index_many([{"id": row.id, "parsed_data": row.parsed_data} for row in batch])
+            self.db.commit()
+
+            indexed += len(batch)
+            last_id = ids[-1]
+
+        return {"indexed": indexed, "last_id": last_id}
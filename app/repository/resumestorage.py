@@ -0,0 +1,235 @@
+import asyncio
+import hashlib
+import os
+import tempfile
+from contextlib import asynccontextmanager, contextmanager
+from datetime import datetime, timezone
+from collections import Counter
+from typing import AsyncIterator, Dict, Iterable, Iterator, Optional, Tuple
+from sqlalchemy import case, func, select, update
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, UploadFile
+from app.database.upsert import upsert_insert
+from app.models.quarantinedfile import QuarantinedFile
+from app.models.storedfile import StoredFile
+from app.storage.base import CHUNK_SIZE, StorageDriver
+from app.storage.factory import get_storage_driver
+
+# file_path values with this prefix name a content-addressed object; anything
+# else is a legacy path on local disk (uploads/resumes/...)
+KEY_SCHEME = "cas:"
+# Where uploads were written before content-addressed storage
+LEGACY_UPLOAD_DIR = "uploads/resumes"
+
+
+def is_storage_key(path: Optional[str]) -> bool:
+    return bool(path) and path.startswith(KEY_SCHEME)
+
+
+def object_name(path: str) -> str:
+    return path[len(KEY_SCHEME):]
+
+
+def content_key(digest: str, extension: str) -> str:
+    return f"{digest[:2]}/{digest}{extension.lower()}"
+
+
+class ResumeStorageRepository:
+    def __init__(self, db: Session, driver: Optional[StorageDriver] = None):
+        self.db = db
+        self.driver = driver or get_storage_driver()
+
+    async def save_upload(self, upload: UploadFile, references: int = 1) -> str:
+        """Store an upload under its content hash and take `references` on it. Does not commit.
+
+        Returns the value to keep in file_path columns. Identical files map to
+        one object, so a resume sent with ten applications is stored once.
+        """
+        path, size = await self.store_upload(upload)
+        self.acquire(object_name(path), size, references)
+        return path
+
+    async def store_upload(self, upload: UploadFile) -> Tuple[str, int]:
+        """Write an upload's object without touching the database; returns (file_path value, size).
+
+        For callers with slow work (parsing) between storing and referencing the
+        file: they acquire() in the short transaction that writes the referencing
+        rows, so no write lock is held meanwhile. The orphan sweep's grace period
+        covers the object until then.
+        """
+        extension = os.path.splitext(upload.filename or "")[1]
+        digest = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(suffix=extension)
+        try:
+            with os.fdopen(fd, "wb") as spool:
+                while chunk := await upload.read(CHUNK_SIZE):
+                    digest.update(chunk)
+                    spool.write(chunk)
+                    size += len(chunk)
+            key = content_key(digest.hexdigest(), extension)
+            if not await self.driver.exists(key):
+                await self.driver.put_file(key, tmp_path)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Failed to save resume: {str(e)}")
+        finally:
+            os.remove(tmp_path)
+
+        return KEY_SCHEME + key, size
+
+    def acquire(self, key: str, size: int, references: int = 1):
+        """Count another upload of `key` holding `references` references. Does not commit.
+
+        One upsert, so concurrent first uploads of the same bytes both count.
+        """
+        self.db.execute(
+            upsert_insert(self.db, StoredFile)
+            .values(key=key, size=size, refcount=references, upload_count=1,
+                    created_at=datetime.utcnow(), updated_at=datetime.utcnow())
+            .on_conflict_do_update(index_elements=[StoredFile.key], set_={
+                "refcount": StoredFile.refcount + references,
+                "upload_count": StoredFile.upload_count + 1,
+                "updated_at": datetime.utcnow(),
+            })
+        )
+
+    def release(self, path: Optional[str], count: int = 1):
+        """Drop references to a stored object. Does not commit.
+
+        Objects are never unlinked here: one that reaches zero references is
+        left for the orphan sweep, so a concurrent upload of the same bytes
+        cannot lose its file between our check and a delete.
+        """
+        if not is_storage_key(path):
+            return
+        self.db.execute(
+            update(StoredFile)
+            .where(StoredFile.key == object_name(path))
+            .values(refcount=case((StoredFile.refcount > count, StoredFile.refcount - count), else_=0))
+        )
+
+    def release_all(self, paths: Iterable[Optional[str]]):
+        """release() for many paths (repeats count once each) in one grouped UPDATE. Does not commit."""
+        counts = Counter(object_name(path) for path in paths if is_storage_key(path))
+        if not counts:
+            return
+        released = case(counts, value=StoredFile.key)
+        self.db.execute(
+            update(StoredFile)
+            .where(StoredFile.key.in_(counts))
+            .values(refcount=case((StoredFile.refcount > released, StoredFile.refcount - released), else_=0))
+        )
+
+    @contextmanager
+    def local_copy(self, path: str) -> Iterator[str]:
+        """A local file path with the contents of `path`, for parsers that need one.
+
+        Legacy paths and objects the driver keeps on local disk are used in
+        place; remote objects are fetched into a temp file for the duration.
+        """
+        if not is_storage_key(path):
+            if not path or not os.path.isfile(path):
+                raise FileNotFoundError(path)
+            yield path
+            return
+
+        key = object_name(path)
+        in_place = self.driver.local_path(key)
+        if in_place:
+            yield in_place
+            return
+
+        fd, tmp_path = tempfile.mkstemp(suffix=os.path.splitext(key)[1])
+        os.close(fd)
+        try:
+            self.driver.fetch_to_path(key, tmp_path)
+            yield tmp_path
+        finally:
+            os.remove(tmp_path)
+
+    @asynccontextmanager
+    async def local_copy_async(self, path: str) -> AsyncIterator[str]:
+        """local_copy() for request handlers: remote objects are downloaded in a worker
+        thread, so the event loop keeps serving other requests meanwhile."""
+        if not is_storage_key(path) or self.driver.local_path(object_name(path)):
+            with self.local_copy(path) as local_path:
+                yield local_path
+            return
+
+        key = object_name(path)
+        fd, tmp_path = tempfile.mkstemp(suffix=os.path.splitext(key)[1])
+        os.close(fd)
+        try:
+            await asyncio.to_thread(self.driver.fetch_to_path, key, tmp_path)
+            yield tmp_path
+        finally:
+            os.remove(tmp_path)
+
+    def describe(self, path: Optional[str]) -> Optional[Dict]:
+        """Size, validators and (if any) local path of a stored file, or None if it is gone.
+
+        Stored objects are immutable, so their ETag is the content hash;
+        legacy files get an mtime/size ETag like Starlette's FileResponse.
+        """
+        if not path:
+            return None
+        if not is_storage_key(path):
+            try:
+                stat_result = os.stat(path)
+            except FileNotFoundError:
+                return None
+            tag = hashlib.md5(f"{stat_result.st_mtime}-{stat_result.st_size}".encode(),
+                              usedforsecurity=False).hexdigest()
+            return {
+                "key": None,
+                "local_path": path,
+                "size": stat_result.st_size,
+                "etag": f'"{tag}"',
+                "last_modified": datetime.fromtimestamp(stat_result.st_mtime, timezone.utc),
+            }
+
+        key = object_name(path)
+        stored = self.db.get(StoredFile, key)
+        if stored is None:
+            return None
+        return {
+            "key": key,
+            "local_path": self.driver.local_path(key),
+            "size": stored.size,
+            "etag": '"' + os.path.splitext(os.path.basename(key))[0] + '"',
+            "last_modified": stored.created_at,
+        }
+
+    def exists(self, path: Optional[str]) -> bool:
+        if not path:
+            return False
+        if not is_storage_key(path):
+            return os.path.isfile(path)
+        return self.db.scalar(select(StoredFile.key).where(StoredFile.key == object_name(path))) is not None
+
+    def stats(self) -> Dict:
+        """Disk usage of stored objects against what one-file-per-upload would have used"""
+        row = self.db.execute(select(
+            func.count(StoredFile.key),
+            func.coalesce(func.sum(StoredFile.size), 0),
+            func.coalesce(func.sum(StoredFile.size * StoredFile.upload_count), 0),
+            func.coalesce(func.sum(StoredFile.upload_count), 0),
+            func.count(StoredFile.key).filter(StoredFile.refcount == 0),
+        )).one()
+        objects, stored_bytes, logical_bytes, uploads, unreferenced = row
+        quarantined, quarantined_bytes = self.db.execute(select(
+            func.count(QuarantinedFile.id), func.coalesce(func.sum(QuarantinedFile.size), 0)
+        )).one()
+        return {
+            "driver": self.driver.name,
+            "objects": objects,
+            "uploads": uploads,
+            "unreferenced_objects": unreferenced,
+            "stored_bytes": stored_bytes,
+            "logical_bytes": logical_bytes,
+            "saved_bytes": logical_bytes - stored_bytes,
+            "dedup_ratio": round(logical_bytes / stored_bytes, 3) if stored_bytes else 1.0,
+            "quarantined_files": quarantined,
+            "quarantined_bytes": quarantined_bytes,
+        }
+
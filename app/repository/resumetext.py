@@ -0,0 +1,54 @@
+import hashlib
+import zlib
+from typing import Dict, Iterable, Optional
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from app.database.upsert import upsert_insert
+from app.models.resume import Resume
+from app.models.resumetext import ResumeText
+
+COMPRESSION_LEVEL = 6
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ResumeTextRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    def store(self, text: str) -> str:
+        """Store text if it is not stored yet and return its hash. Does not commit."""
+        content_hash = text_hash(text)
+        # INSERT .. ON CONFLICT DO NOTHING: two uploads of the same text never race on the hash
+        self.db.execute(
+            upsert_insert(self.db, ResumeText).values(
+                content_hash=content_hash,
+                compressed=zlib.compress(text.encode("utf-8"), COMPRESSION_LEVEL),
+                char_count=len(text)
+            ).on_conflict_do_nothing(index_elements=[ResumeText.content_hash])
+        )
+        return content_hash
+
+    def load(self, content_hash: Optional[str]) -> Optional[str]:
+        if not content_hash:
+            return None
+        compressed = self.db.scalar(select(ResumeText.compressed).where(ResumeText.content_hash == content_hash))
+        return zlib.decompress(compressed).decode("utf-8") if compressed is not None else None
+
+    def load_many(self, content_hashes: Iterable[str]) -> Dict[str, str]:
+        hashes = {h for h in content_hashes if h}
+        if not hashes:
+            return {}
+        rows = self.db.execute(
+            select(ResumeText.content_hash, ResumeText.compressed).where(ResumeText.content_hash.in_(hashes))
+        )
+        return {h: zlib.decompress(blob).decode("utf-8") for h, blob in rows}
+
+    def text_for_resume(self, resume: Resume) -> str:
+        """Full text if stored, else the summary kept in parsed_data (resumes parsed before text storage)"""
+        text = self.load(resume.text_hash)
+        if text is not None:
+            return text
+        return (resume.parsed_data or {}).get("extracted_text") or ""
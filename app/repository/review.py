@@ -1,8 +1,36 @@
+from typing import Dict, Optional
+from sqlalchemy import case, func, select, union, update
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
+from app.database.upsert import upsert_insert
 from app.models.review import Review
+from app.models.reviewstats import RATINGS, ReviewStats
 from app.schemas.review import ReviewCreate, ReviewUpdate
 
+PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+CHECK_BATCH_SIZE = 500
+
+def _adjust_stats(db: Session, reviewee_id: int, changes: Dict[int, int]):
+    """Apply {rating: +n/-n} to the reviewee's aggregates in the caller's transaction.
+
+    One INSERT .. ON CONFLICT DO UPDATE of `column = column + delta`, so
+    concurrent writers never overwrite each other's increments.
+    """
+    changes = {rating: delta for rating, delta in changes.items() if delta}
+    if not changes:
+        return
+    deltas = {
+        "review_count": sum(changes.values()),
+        "rating_sum": sum((rating or 0) * delta for rating, delta in changes.items()),
+        **{f"rating_{rating}": delta for rating, delta in changes.items() if rating in RATINGS},
+    }
+    statement = upsert_insert(db, ReviewStats).values(reviewee_id=reviewee_id, **deltas)
+    db.execute(statement.on_conflict_do_update(
+        index_elements=[ReviewStats.reviewee_id],
+        set_={column: getattr(ReviewStats, column) + delta for column, delta in deltas.items()},
+    ))
+
 def create_review(db: Session, reviewer_id: int, data: ReviewCreate):
     new_review = Review(
         reviewer_id=reviewer_id,
@@ -11,12 +39,30 @@ def create_review(db: Session, reviewer_id: int, data: ReviewCreate):
         comment=data.comment
     )
     db.add(new_review)
+    _adjust_stats(db, data.reviewee_id, {data.rating: 1})
     db.commit()
     db.refresh(new_review)
     return new_review
 
-def get_reviews_for_user(db: Session, user_id: int):
-    return db.query(Review).filter(Review.reviewee_id == user_id).all()
+def get_reviews_for_user(db: Session, user_id: int, limit: int = PAGE_SIZE, before_id: Optional[int] = None):
+    """Newest first, keyset-paginated on id: returns (reviews, next_before_id)"""
+    query = db.query(Review).filter(Review.reviewee_id == user_id)
+    if before_id is not None:
+        query = query.filter(Review.id < before_id)
+    rows = query.order_by(Review.id.desc()).limit(limit + 1).all()
+    reviews = rows[:limit]
+    return reviews, reviews[-1].id if len(rows) > limit else None
+
+def get_review_summary(db: Session, user_id: int):
+    """Count, average and histogram from the aggregate row: one primary-key lookup"""
+    stats = db.get(ReviewStats, user_id)
+    count = stats.review_count if stats else 0
+    return {
+        "reviewee_id": user_id,
+        "review_count": count,
+        "average_rating": round(stats.rating_sum / count, 2) if count else None,
+        "histogram": {str(rating): getattr(stats, f"rating_{rating}") if stats else 0 for rating in RATINGS},
+    }
 
 def get_review_detail(db: Session, review_id: int):
     review = db.query(Review).filter(Review.id == review_id).first()
@@ -31,6 +77,8 @@ def update_review(db: Session, review_id: int, data: ReviewUpdate, user_id: int)
     if review.reviewer_id != user_id:
         raise HTTPException(status_code=403, detail="Not authorized to update this review")
 
+    if data.rating != review.rating:
+        _adjust_stats(db, review.reviewee_id, {review.rating: -1, data.rating: 1})
     review.rating = data.rating
     review.comment = data.comment
     db.commit()
@@ -45,5 +93,71 @@ def delete_review(db: Session, review_id: int, user_id: int):
         raise HTTPException(status_code=403, detail="Not authorized to delete this review")
 
     db.delete(review)
+    _adjust_stats(db, review.reviewee_id, {review.rating: -1})
     db.commit()
     return {"detail": "Review deleted successfully"}
+
+AGGREGATE_COLUMNS = ["review_count", "rating_sum", *(f"rating_{rating}" for rating in RATINGS)]
+
+def _aggregate_expressions():
+    return [
+        func.count(Review.id),
+        func.coalesce(func.sum(Review.rating), 0),
+        *(func.coalesce(func.sum(case((Review.rating == rating, 1), else_=0)), 0) for rating in RATINGS),
+    ]
+
+def _aggregate_values(row) -> tuple:
+    return tuple(getattr(row, column) or 0 for column in AGGREGATE_COLUMNS) if row is not None \
+        else (0,) * len(AGGREGATE_COLUMNS)
+
+def check_review_stats(db: Session, batch_size: int = CHECK_BATCH_SIZE, fix: bool = True,
+                       after_id: Optional[int] = None, max_batches: Optional[int] = None) -> Dict:
+    """Recompute the aggregates from `reviews` one batch of reviewees at a time and repair drift.
+
+    Each batch costs one grouped query over its reviews and one read of the
+    stored rows. Mismatched rows are fixed by a single UPDATE whose values
+    are correlated subqueries over `reviews`, evaluated inside the statement,
+    so a review written while the check runs is never overwritten by a count
+    taken before it. Pass the returned last_id as after_id to continue.
+    """
+    reviewees = union(
+        select(Review.reviewee_id.label("id")), select(ReviewStats.reviewee_id.label("id"))
+    ).subquery()
+    result = {"checked": 0, "mismatched": 0, "fixed": 0, "last_id": after_id, "mismatched_ids": []}
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        query = select(reviewees.c.id).where(reviewees.c.id.isnot(None))
+        if result["last_id"] is not None:
+            query = query.where(reviewees.c.id > result["last_id"])
+        ids = db.execute(query.order_by(reviewees.c.id).limit(batch_size)).scalars().all()
+        if not ids:
+            break
+        actual = {
+            row[0]: tuple(value or 0 for value in row[1:])
+            for row in db.execute(
+                select(Review.reviewee_id, *_aggregate_expressions())
+                .where(Review.reviewee_id.in_(ids)).group_by(Review.reviewee_id)
+            )
+        }
+        stored = {row.reviewee_id: row for row in db.query(ReviewStats).filter(ReviewStats.reviewee_id.in_(ids))}
+        wrong = [
+            reviewee_id for reviewee_id in ids
+            if actual.get(reviewee_id, _aggregate_values(None)) != _aggregate_values(stored.get(reviewee_id))
+        ]
+        if wrong and fix:
+            db.execute(upsert_insert(db, ReviewStats).values([{"reviewee_id": reviewee_id} for reviewee_id in wrong])
+                       .on_conflict_do_nothing(index_elements=[ReviewStats.reviewee_id]))
+            recomputed = {
+                column: select(expression).where(Review.reviewee_id == ReviewStats.reviewee_id).scalar_subquery()
+                for column, expression in zip(AGGREGATE_COLUMNS, _aggregate_expressions())
+            }
+            db.execute(update(ReviewStats).where(ReviewStats.reviewee_id.in_(wrong)).values(**recomputed)
+                       .execution_options(synchronize_session=False))
+            result["fixed"] += len(wrong)
+        db.commit()
+        result["checked"] += len(ids)
+        result["mismatched"] += len(wrong)
+        result["mismatched_ids"] = (result["mismatched_ids"] + wrong)[:100]
+        result["last_id"] = ids[-1]
+        batches += 1
+    return result
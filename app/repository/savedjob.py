@@ -0,0 +1,161 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+import structlog
+from fastapi import HTTPException
+from sqlalchemy import delete
+from sqlalchemy.orm import Session, contains_eager, joinedload
+
+from app.database.upsert import upsert_insert
+from app.models.job import Job
+from app.models.savedjob import SavedJob
+from app.utils.redis_client import get_redis
+
+PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+MAX_CHECK_IDS = 100
+# Sets are rebuilt from the table at least this often, which bounds any drift
+SAVED_TTL_SECONDS = 24 * 3600
+# Always present in a cached set, so "no saved jobs" is cached too and a
+# missing key unambiguously means "not cached"
+EMPTY_MARKER = "-"
+
+# Writers bump the user's version and only touch a set that exists: a missing
+# one is rebuilt in full from the table on the next read, so creating it here
+# would cache a partial set
+CHANGE_IF_EXISTS = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    if ARGV[1] == 'add' then
+        return redis.call('SADD', KEYS[1], ARGV[2])
+    end
+    return redis.call('SREM', KEYS[1], ARGV[2])
+end
+return nil
+"""
+
+# A fill is only stored if no write bumped the version since it was read: the
+# rows it read may predate a change that found no set to apply to
+FILL_IF_MISSING = """
+if redis.call('EXISTS', KEYS[1]) == 0 and (redis.call('GET', KEYS[2]) or '0') == ARGV[2] then
+    redis.call('SADD', KEYS[1], unpack(ARGV, 3))
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+    return 1
+end
+return 0
+"""
+
+log = structlog.get_logger()
+
+
+def saved_key(user_id: int) -> str:
+    return f"saved_jobs:{user_id}"
+
+
+def saved_version_key(user_id: int) -> str:
+    return f"saved_jobs:{user_id}:version"
+
+
+class SavedJobRepository:
+    def __init__(self, db: Session):
+        self.db = db
+
+    async def save(self, user_id: int, job_id: int) -> SavedJob:
+        """Idempotent: saving a job twice keeps the first saved_at"""
+        if self.db.query(Job.id).filter(Job.id == job_id).first() is None:
+            raise HTTPException(status_code=404, detail=f"Job with id {job_id} not found")
+        # INSERT .. ON CONFLICT DO NOTHING: no read-then-write race between concurrent saves
+        self.db.execute(
+            upsert_insert(self.db, SavedJob).values(applicant_id=user_id, job_id=job_id, saved_at=datetime.utcnow())
+            .on_conflict_do_nothing(index_elements=[SavedJob.applicant_id, SavedJob.job_id])
+        )
+        self.db.commit()
+        await self._change_cached(user_id, "add", job_id)
+        return self.db.query(SavedJob).options(joinedload(SavedJob.job)).filter(
+            SavedJob.applicant_id == user_id, SavedJob.job_id == job_id
+        ).one()
+
+    async def unsave(self, user_id: int, job_id: int) -> bool:
+        """Idempotent: unsaving a job that is not saved is not an error"""
+        removed = self.db.execute(
+            delete(SavedJob).where(SavedJob.applicant_id == user_id, SavedJob.job_id == job_id)
+        ).rowcount
+        self.db.commit()
+        await self._change_cached(user_id, "remove", job_id)
+        return bool(removed)
+
+    def list_saved(self, user_id: int, limit: int = PAGE_SIZE, before_id: Optional[int] = None) -> Dict:
+        """Most recently saved first, keyset-paginated on id; jobs loaded in the same query"""
+        query = self.db.query(SavedJob).join(SavedJob.job).options(contains_eager(SavedJob.job)).filter(
+            SavedJob.applicant_id == user_id
+        )
+        if before_id is not None:
+            query = query.filter(SavedJob.id < before_id)
+        rows = query.order_by(SavedJob.id.desc()).limit(limit + 1).all()
+        items = rows[:limit]
+        return {"items": items, "next_before_id": items[-1].id if len(rows) > limit else None}
+
+    def saved_job_ids(self, user_id: int, job_ids: Optional[Iterable[int]] = None) -> Set[int]:
+        """All of the user's saved job ids, or those among `job_ids`, in one query"""
+        query = self.db.query(SavedJob.job_id).filter(SavedJob.applicant_id == user_id)
+        if job_ids is not None:
+            job_ids = list(job_ids)
+            if not job_ids:
+                return set()
+            query = query.filter(SavedJob.job_id.in_(job_ids))
+        return {row.job_id for row in query}
+
+    async def saved_ids(self, user_id: int) -> Set[int]:
+        """The user's whole saved set, served from Redis and rebuilt from the table when missing"""
+        try:
+            members = await get_redis().smembers(saved_key(user_id))
+        except Exception as e:
+            log.warning("saved_jobs.cache_failed", error=str(e))
+            return self.saved_job_ids(user_id)
+        if members:
+            return {int(member) for member in members if member != EMPTY_MARKER}
+        return await self._fill(user_id)
+
+    async def saved_among(self, user_id: int, job_ids: List[int]) -> Set[int]:
+        """Which of `job_ids` the user has saved: one SMISMEMBER; a missing set is rebuilt first"""
+        if not job_ids:
+            return set()
+        try:
+            flags = await get_redis().smismember(saved_key(user_id), [EMPTY_MARKER, *job_ids])
+        except Exception as e:
+            log.warning("saved_jobs.cache_failed", error=str(e))
+            return self.saved_job_ids(user_id, job_ids)
+        if flags[0]:
+            return {job_id for job_id, saved in zip(job_ids, flags[1:]) if saved}
+        return await self._fill(user_id) & set(job_ids)
+
+    async def _fill(self, user_id: int) -> Set[int]:
+        try:
+            version = await get_redis().get(saved_version_key(user_id)) or "0"
+        except Exception as e:
+            log.warning("saved_jobs.cache_failed", error=str(e))
+            return self.saved_job_ids(user_id)
+        saved = self.saved_job_ids(user_id)
+        try:
+            script = get_redis().register_script(FILL_IF_MISSING)
+            await script(keys=[saved_key(user_id), saved_version_key(user_id)],
+                         args=[SAVED_TTL_SECONDS, version, EMPTY_MARKER, *saved])
+        except Exception as e:
+            log.warning("saved_jobs.cache_failed", error=str(e))
+        return saved
+
+    async def _change_cached(self, user_id: int, action: str, job_id: int):
+        try:
+            script = get_redis().register_script(CHANGE_IF_EXISTS)
+            await script(keys=[saved_key(user_id), saved_version_key(user_id)],
+                         args=[action, job_id, SAVED_TTL_SECONDS])
+        except Exception as e:
+            # The write is committed; a stale set would misreport this job until
+            # it expires, so drop it (and any fill in flight) and let the next read rebuild it
+            log.warning("saved_jobs.cache_failed", error=str(e))
+            try:
+                await get_redis().incr(saved_version_key(user_id))
+                await get_redis().delete(saved_key(user_id))
+            except Exception:
+                pass
@@ -0,0 +1,206 @@
+import json
+import os
+import structlog
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+from sqlalchemy import delete, func, select, union_all, update
+from sqlalchemy.orm import Session
+from app.models.application import Application
+from app.models.quarantinedfile import QuarantinedFile
+from app.models.resume import Resume
+from app.models.storedfile import StoredFile
+from app.repository.resumebulk import save_checkpoint
+from app.repository.resumestorage import KEY_SCHEME, LEGACY_UPLOAD_DIR
+from app.storage.base import StorageDriver
+from app.storage.factory import get_storage_driver
+from app.storage.local import LocalStorageDriver
+
+# Objects younger than this are never collected: an upload writes its file
+# before the row that references it is committed
+GRACE_PERIOD = timedelta(hours=float(os.getenv("RESUME_GC_GRACE_HOURS", "24")))
+# How long quarantined files are kept (and restorable) before deletion
+RETENTION = timedelta(days=float(os.getenv("RESUME_GC_RETENTION_DAYS", "7")))
+BATCH_SIZE = 500
+QUARANTINE_PREFIX = ".quarantine/"  # hidden from LocalStorageDriver listings
+
+log = structlog.get_logger()
+
+
+class Store(NamedTuple):
+    name: str
+    driver: StorageDriver
+    db_path: Callable[[str], str]  # storage key -> value kept in file_path columns
+
+
+def load_gc_checkpoint(path: Optional[str]) -> Dict:
+    """Last key swept per store; a missing file starts at the beginning of every store"""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+class StorageGCRepository:
+    """Incremental orphan collection for resume uploads.
+
+    Walks each store's listing in key order and diffs it against the file
+    paths referenced by resumes and applications one batch at a time, so
+    memory stays bounded by the batch size however large the store is.
+    Orphans are moved to a quarantine prefix first and only deleted once
+    RETENTION has passed and they are still unreferenced.
+    """
+
+    def __init__(self, db: Session, driver: Optional[StorageDriver] = None,
+                 legacy_driver: Optional[StorageDriver] = None):
+        self.db = db
+        self.stores = [
+            Store("objects", driver or get_storage_driver(), lambda key: KEY_SCHEME + key),
+            Store("legacy", legacy_driver or LocalStorageDriver(LEGACY_UPLOAD_DIR),
+                  lambda key: f"{LEGACY_UPLOAD_DIR}/{key}"),
+        ]
+
+    def _reference_counts(self, paths: List[str]) -> Dict[str, int]:
+        """How many resume and application rows point at each of `paths` (one grouped query)"""
+        refs = union_all(
+            select(Resume.file_path.label("path")).where(Resume.file_path.in_(paths)),
+            select(Application.resume_file_path.label("path")).where(Application.resume_file_path.in_(paths)),
+        ).subquery()
+        return dict(self.db.execute(select(refs.c.path, func.count()).group_by(refs.c.path)).all())
+
+    async def _sweep_batch(self, store: Store, batch: List[Tuple[str, int, datetime]],
+                           cutoff: datetime, dry_run: bool, result: Dict):
+        paths = {store.db_path(key): key for key, _, _ in batch}
+        counts = self._reference_counts(list(paths))
+        by_key = {paths[path]: count for path, count in counts.items()}
+
+        stored, in_flight = {}, set()
+        if store.name == "objects":
+            keys = [key for key, _, _ in batch]
+            existing = set(self.db.execute(select(StoredFile.key).where(StoredFile.key.in_(keys))).scalars())
+            stored = {row.key: row for row in self.db.execute(
+                select(StoredFile.key, StoredFile.refcount, StoredFile.updated_at)
+                .where(StoredFile.key.in_(keys))
+                .with_for_update(skip_locked=True)
+            )}
+            # Rows the locked read skipped belong to an in-flight upload: treat them as live
+            in_flight = existing - set(stored)
+            repairs = [{"key": key, "refcount": by_key.get(key, 0)}
+                       for key, row in stored.items() if row.refcount != by_key.get(key, 0)]
+            if repairs and not dry_run:
+                self.db.execute(update(StoredFile), repairs)
+            result["refcounts_repaired"] += len(repairs)
+
+        orphans = []
+        for key, size, modified in batch:
+            result["scanned"] += 1
+            if by_key.get(key) or key in in_flight:
+                continue
+            row = stored.get(key)
+            recently_used = row is not None and row.updated_at and row.updated_at > cutoff
+            if modified.replace(tzinfo=None) > cutoff or recently_used:
+                continue
+            orphans.append((key, size))
+        result["orphans"] += len(orphans)
+        result["orphan_bytes"] += sum(size for _, size in orphans)
+        if dry_run:
+            return
+
+        # A key can come back after quarantine (same bytes uploaded again); reuse its row
+        requarantined = {q.key: q for q in self.db.query(QuarantinedFile).filter(
+            QuarantinedFile.store == store.name, QuarantinedFile.key.in_([key for key, _ in orphans])
+        )}
+        for key, size in orphans:
+            try:
+                await store.driver.move(key, QUARANTINE_PREFIX + key)
+            except Exception as e:
+                result["errors"] += 1
+                log.warning("storage.gc.quarantine_failed", store=store.name, key=key, error=str(e))
+                continue
+            if key in requarantined:
+                requarantined[key].size, requarantined[key].quarantined_at = size, datetime.utcnow()
+            else:
+                self.db.add(QuarantinedFile(store=store.name, key=key, size=size))
+        self.db.commit()
+
+    async def purge_quarantine(self, now: datetime, batch_size: int = BATCH_SIZE,
+                               dry_run: bool = False) -> Dict:
+        """Restore quarantined files that gained a reference; delete the expired rest"""
+        result = {"restored": 0, "purged": 0, "bytes_reclaimed": 0}
+        drivers = {store.name: store for store in self.stores}
+        expires_before = now - RETENTION
+        last_id = 0
+        while True:
+            batch = self.db.query(QuarantinedFile).filter(QuarantinedFile.id > last_id) \
+                .order_by(QuarantinedFile.id).limit(batch_size).all()
+            if not batch:
+                break
+            last_id = batch[-1].id
+
+            counts = self._reference_counts([drivers[q.store].db_path(q.key) for q in batch])
+            for item in batch:
+                store = drivers[item.store]
+                if counts.get(store.db_path(item.key)):
+                    result["restored"] += 1
+                    if not dry_run:
+                        await store.driver.move(QUARANTINE_PREFIX + item.key, item.key)
+                        self.db.delete(item)
+                elif item.quarantined_at < expires_before:
+                    result["purged"] += 1
+                    result["bytes_reclaimed"] += item.size
+                    if not dry_run:
+                        await store.driver.delete(QUARANTINE_PREFIX + item.key)
+                        if item.store == "objects":
+                            self.db.execute(delete(StoredFile).where(StoredFile.key == item.key))
+                        self.db.delete(item)
+            if not dry_run:
+                self.db.commit()
+        return result
+
+    async def sweep(self, batch_size: int = BATCH_SIZE, max_objects: Optional[int] = None,
+                    checkpoint_path: Optional[str] = None, dry_run: bool = False,
+                    now: Optional[datetime] = None) -> Dict:
+        """Quarantine orphans (up to max_objects listed per run), then purge expired quarantine.
+
+        With a checkpoint, each run continues the listing where the previous
+        one stopped and wraps around once a store has been fully walked.
+        """
+        now = now or datetime.utcnow()
+        cutoff = now - GRACE_PERIOD
+        checkpoint = load_gc_checkpoint(checkpoint_path)
+        result = {"scanned": 0, "orphans": 0, "orphan_bytes": 0, "refcounts_repaired": 0,
+                  "errors": 0, "complete": True}
+
+        budget = max_objects
+        for store in self.stores:
+            if budget is not None and budget <= 0:
+                result["complete"] = False
+                break
+            batch: List[Tuple[str, int, datetime]] = []
+            listed = 0
+            finished = True
+            async for key, size, modified in store.driver.list_objects(start_after=checkpoint.get(store.name, "")):
+                if key.startswith(QUARANTINE_PREFIX):
+                    continue
+                batch.append((key, size, modified))
+                listed += 1
+                if len(batch) >= batch_size:
+                    await self._sweep_batch(store, batch, cutoff, dry_run, result)
+                    checkpoint[store.name] = batch[-1][0]
+                    save_checkpoint(checkpoint_path, checkpoint)
+                    batch = []
+                if budget is not None and listed >= budget:
+                    finished = False
+                    break
+            if batch:
+                await self._sweep_batch(store, batch, cutoff, dry_run, result)
+                checkpoint[store.name] = batch[-1][0]
+            if finished:
+                checkpoint[store.name] = ""  # wrap around next run
+            else:
+                result["complete"] = False
+            save_checkpoint(checkpoint_path, checkpoint)
+            if budget is not None:
+                budget -= listed
+
+        result.update(await self.purge_quarantine(now, batch_size, dry_run))
+        return result
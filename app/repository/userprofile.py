@@ -1,10 +1,49 @@
-from http.client import HTTPException
+import os
+from typing import Dict, List, Set
 
+from fastapi import HTTPException
+from sqlalchemy import exists, select
 from sqlalchemy.orm import Session
-from sqlalchemy.sql.functions import current_user
 
+from app.models.application import Application
+from app.models.job import Job
+from app.models.user import User
 from app.models.userprofile import  UserProfile
 from app.schemas.userprofile import UserProfileCreate, UpdateProfile
+from app.utils.ttl_cache import TTLCache
+
+MAX_BATCH = 300
+# Profile cards by user id; writes through this module invalidate them in this worker
+profile_cache = TTLCache(ttl=float(os.getenv("PROFILE_CACHE_SECONDS", "60")))
+
+
+def applicants_of(employer_id: int):
+    """Subquery: users who applied to one of the employer's jobs"""
+    return select(Application.applicant_id).join(Job, Job.id == Application.job_id).where(
+        Job.posted_by == employer_id
+    )
+
+
+def can_view_profile(db: Session, current_user, user_id: int) -> bool:
+    """Admins see any profile, employers those of people who applied to their jobs,
+    everyone their own"""
+    if current_user.role == "admin" or current_user.id == user_id:
+        return True
+    if current_user.role != "employer":
+        return False
+    return db.execute(select(exists(applicants_of(current_user.id).where(
+        Application.applicant_id == user_id
+    )))).scalar()
+
+
+def employer_can_view(db: Session, employer_id: int, user_ids: List[int]) -> Set[int]:
+    """Which of `user_ids` applied to one of the employer's jobs (or are the employer):
+    one indexed lookup on applications.applicant_id, never cached"""
+    allowed = {employer_id} & set(user_ids)
+    others = [user_id for user_id in user_ids if user_id != employer_id]
+    if others:
+        allowed.update(db.scalars(applicants_of(employer_id).where(Application.applicant_id.in_(others)).distinct()))
+    return allowed
 
 
 def create_profile(db: Session, userprofile: UserProfileCreate, userID: int):
@@ -20,28 +59,63 @@ def create_profile(db: Session, userprofile: UserProfileCreate, userID: int):
     db.add(new_profile)
     db.commit()
     db.refresh(new_profile)
+    profile_cache.invalidate(userID)  # the cached card had no profile fields
     return new_profile
 
-def get_profile_details(id: int, db:Session, current_user):
-    profile = db.query(UserProfile).filter(UserProfile.id == id).fist()
+def get_profile_details(user_id: int, db:Session, current_user):
+    if not can_view_profile(db, current_user, user_id):
+        raise HTTPException(status_code=403, detail="Not authorized to view this")
+    profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
     if not profile:
-        raise HTTPException(status_code=404, detail=f"Profile with id {id} not found")
-    if profile.user_id != current_user.id:
-        raise HTTPException(status_code=403, details="Not authorized to view this")
+        raise HTTPException(status_code=404, detail=f"Profile for user {user_id} not found")
     return profile
 
+def get_profile_cards(user_ids: List[int], db: Session, current_user) -> List[Dict]:
+    """User + profile read model for many users: cache hits first, then one IN query
+    (users outer-joined to profiles) for the rest. Ids the caller may not see are left out
+    like unknown ones; order follows `user_ids`. Employers are authorized per request with
+    employer_can_view; callers other than employers must only pass ids they may view
+    (admins: any, others: their own). The cache holds profile data only."""
+    if current_user.role == "employer":
+        allowed = employer_can_view(db, current_user.id, user_ids)
+        user_ids = [user_id for user_id in user_ids if user_id in allowed]
+    cards = profile_cache.get_many(user_ids)
+    missing = [user_id for user_id in user_ids if user_id not in cards]
+    if missing:
+        query = select(User, UserProfile).outerjoin(UserProfile, UserProfile.user_id == User.id).where(
+            User.id.in_(missing)
+        )
+        rows = db.execute(query).all()
+        loaded = {
+            user.id: {
+                "user_id": user.id,
+                "email": user.email,
+                "name": user.name,
+                "role": user.role,
+                "profile_picture": user.profile_picture,
+                "profile_id": profile.id if profile else None,
+                **{field: getattr(profile, field) if profile else None
+                   for field in ("full_name", "bio", "linkedin", "github", "website")},
+            }
+            for user, profile in rows
+        }
+        profile_cache.set_many(loaded)
+        cards.update(loaded)
+    return [cards[user_id] for user_id in user_ids if user_id in cards]
+
 def update_profile(id: int, profile_data: UpdateProfile, db:Session, current_user):
     profile = db.query(UserProfile).filter(UserProfile.id == id).first()
     if not profile:
         raise HTTPException(status_code=404, detail="Profile not found")
     if profile.user_id != current_user.id:
-        raise HTTPException(status_code=403, details="Not authorized to update this profile")
+        raise HTTPException(status_code=403, detail="Not authorized to update this profile")
 
-    for key, value in profile_data.dict(exclude_unser=True).items():
+    for key, value in profile_data.dict(exclude_unset=True).items():
         setattr(profile, key, value)
 
     db.commit()
     db.refresh(profile)
+    profile_cache.invalidate(profile.user_id)
     return profile
 
 def delete_profile(id: int, db: Session, current_user):
@@ -53,4 +127,5 @@ def delete_profile(id: int, db: Session, current_user):
 
     db.delete(profile)
     db.commit()
-    return {"message": 'Profile deleted'}
\ No newline at end of file
+    profile_cache.invalidate(profile.user_id)
+    return {"message": 'Profile deleted'}
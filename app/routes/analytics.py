@@ -0,0 +1,64 @@
+from datetime import date
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.core.dependencies import get_current_user, get_db
+from app.models.user import User
+from app.repository.applicationevent import ApplicationEventRepository
+from app.schemas.applicationevent import FunnelReport, TimeToHireReport
+
+router = APIRouter(prefix="/analytics", tags=["Analytics"])
+
+Source = Literal["auto", "live", "rollup"]
+SOURCE_DESCRIPTION = "auto: daily rollups for large scopes, live events otherwise"
+
+
+def report_scope(repo: ApplicationEventRepository, current_user: User, job_id: Optional[int]):
+    """An employer's own jobs (or one of them); admins may report on any job or all of them"""
+    if current_user.role == "admin":
+        return repo.report_jobs(None, job_id)
+    if current_user.role != "employer":
+        raise HTTPException(status_code=403, detail="Access denied. Employer role required.")
+    return repo.report_jobs(current_user.id, job_id)
+
+
+def check_range(since: Optional[date], until: Optional[date]):
+    if since and until and since > until:
+        raise HTTPException(status_code=422, detail="since must not be after until")
+
+
+@router.get("/funnel", response_model=FunnelReport)
+def application_funnel(
+    job_id: Optional[int] = Query(None, description="One job; all of the employer's jobs when omitted"),
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    source: Source = Query("auto", description=SOURCE_DESCRIPTION),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Hiring funnel from the status history: per status, how many applications entered it
+    in the range, conversion from submission, and average time spent in it
+    """
+    check_range(since, until)
+    repo = ApplicationEventRepository(db)
+    return repo.funnel(report_scope(repo, current_user, job_id), since, until, source)
+
+
+@router.get("/time-to-hire", response_model=TimeToHireReport)
+def time_to_hire(
+    job_id: Optional[int] = Query(None, description="One job; all of the employer's jobs when omitted"),
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    source: Source = Query("auto", description=SOURCE_DESCRIPTION),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Time from submission to acceptance for applications accepted in the range
+    """
+    check_range(since, until)
+    repo = ApplicationEventRepository(db)
+    return repo.time_to_hire(report_scope(repo, current_user, job_id), since, until, source)
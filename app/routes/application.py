@@ -1,9 +1,6 @@
 from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
 from sqlalchemy.orm import Session
 from typing import List
-import shutil
-import os
-import uuid
 
 from app.schemas.application import (
     ApplicationCreate,
@@ -12,33 +9,29 @@ from app.schemas.application import (
 )
 from app.core.dependencies import get_db, get_current_user, require_role
 from app.repository import application as application_repo
+from app.repository.resumestorage import ResumeStorageRepository
+from app.utils.json_response import ListSerializer
 
 router = APIRouter(
     prefix="/applications",
     tags=["Applications"]
 )
 
-UPLOAD_DIR = "uploads/resumes"
-os.makedirs(UPLOAD_DIR, exist_ok=True)
-
+applications_serializer = ListSerializer(ApplicationResponse)
 
 @router.post("/create/", response_model=ApplicationResponse)
-def apply_for_job(
+async def apply_for_job(
     job_id: int = Form(...),
     cover_letter: str = Form(...),
     resume: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user=Depends(require_role("applicant"))
 ):
-    # Save uploaded resume
-    filename = f"{uuid.uuid4()}_{resume.filename}"
-    file_path = os.path.join(UPLOAD_DIR, filename)
-
-    try:
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(resume.file, buffer)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to save resume: {str(e)}")
+    # Save uploaded resume (content-addressed; the application holds one reference).
+    # Committed before parsing so no write lock is held while it runs; if the
+    # application is not created, the storage sweep repairs the count.
+    file_path = await ResumeStorageRepository(db).save_upload(resume, references=1)
+    db.commit()
 
     # Pass saved file path into schema
     application_data = ApplicationCreate(
@@ -47,7 +40,7 @@ def apply_for_job(
         resume_file_path=file_path
     )
 
-    return application_repo.create_application(db, current_user.id, application_data)
+    return await application_repo.create_application(db, current_user.id, application_data)
 
 
 @router.get("/{app_id}", response_model=ApplicationResponse)
@@ -57,12 +50,12 @@ def get_application(app_id: int, db: Session = Depends(get_db)):
 
 @router.get("/job/{job_id}", response_model=List[ApplicationResponse])
 def get_by_job(job_id: int, db: Session = Depends(get_db), user=Depends(get_current_user)):
-    return application_repo.get_applications_by_job(db, job_id)
+    return applications_serializer.response(application_repo.get_applications_by_job(db, job_id))
 
 
 @router.get("/me/", response_model=List[ApplicationResponse])
 def get_my_applications(db: Session = Depends(get_db), user=Depends(require_role("applicant"))):
-    return application_repo.get_applications_by_user(db, user.id)
+    return applications_serializer.response(application_repo.get_applications_by_user(db, user.id))
 
 
 @router.put("/{app_id}/status", response_model=ApplicationResponse)
@@ -72,7 +65,7 @@ def update_status(
     db: Session = Depends(get_db),
     user=Depends(get_current_user)
 ):
-    return application_repo.update_application_status(db, app_id, status_data)
+    return application_repo.update_application_status(db, app_id, status_data, actor_id=user.id)
 
 
 @router.delete("/{app_id}")
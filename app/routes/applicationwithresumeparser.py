@@ -1,20 +1,79 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+import mimetypes
+from typing import Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query, Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
 from sqlalchemy.orm import Session
 from pydantic import BaseModel
 
 from app.repository.applicationwithresumeparser import ApplicationWithResumeRepository
+from app.repository.resumededup import ResumeDedupRepository, DEFAULT_SIMILARITY_THRESHOLD
 from app.core.dependencies import get_current_user, get_current_employer, get_db
 from app.models.user import User
+from app.schemas.application import JobApplicationResponse, MyApplicationResponse
+from app.schemas.applicationevent import ApplicationEventResponse
+from app.storage.factory import get_storage_driver
+from app.utils.http_cache import (
+    RangeNotSatisfiable, conditional_response, http_date, is_not_modified, parse_single_range, version_etag
+)
+from app.utils.json_response import ListSerializer
 
 router = APIRouter(prefix="/applications", tags=["Applications with Resume Parser"])
 
+my_applications_serializer = ListSerializer(MyApplicationResponse)
+job_applications_serializer = ListSerializer(JobApplicationResponse)
+
 
 # Pydantic models for request/response
 class StatusUpdateRequest(BaseModel):
     status: str
 
 
+class BulkStatusUpdateRequest(BaseModel):
+    application_ids: List[int]
+    status: str
+
+
+def resume_file_response(request: Request, stored: Dict) -> Response:
+    """Serve a stored resume without buffering it: 304 when the client's copy is current,
+    sendfile-backed FileResponse for files on local disk, a chunked driver stream otherwise.
+    """
+    headers = {
+        "etag": stored["etag"],
+        "last-modified": http_date(stored["last_modified"]),
+        "cache-control": "private, no-cache",  # authorized content: revalidate, never share
+    }
+    if is_not_modified(request.headers, stored["etag"], stored["last_modified"]):
+        return Response(status_code=304, headers=headers)
+
+    if stored["local_path"]:
+        # Handles Range/If-Range itself and streams in 64 KiB chunks
+        # (zero-copy via the server's sendfile extension when available)
+        return FileResponse(stored["local_path"], filename=stored["filename"], headers=headers)
+
+    size = stored["size"]
+    if_range = request.headers.get("if-range")
+    try:
+        byte_range = parse_single_range(request.headers.get("range"), size) \
+            if if_range is None or if_range == stored["etag"] else None
+    except RangeNotSatisfiable:
+        return Response(status_code=416, headers={"content-range": f"bytes */{size}"})
+
+    start, end = byte_range or (0, size - 1)
+    headers.update({
+        "accept-ranges": "bytes",
+        "content-length": str(end - start + 1),
+        "content-disposition": f'attachment; filename="{stored["filename"]}"',
+    })
+    if byte_range:
+        headers["content-range"] = f"bytes {start}-{end}/{size}"
+    return StreamingResponse(
+        get_storage_driver().iter_chunks(stored["key"], start, end),
+        status_code=206 if byte_range else 200,
+        media_type=mimetypes.guess_type(stored["filename"])[0] or "application/octet-stream",
+        headers=headers
+    )
+
+
 # Test endpoint to verify the route is working
 @router.get("/test")
 async def test_endpoint():
@@ -57,7 +116,7 @@ async def submit_application_with_resume(
     repo = ApplicationWithResumeRepository(db)
 
     try:
-        result = repo.create_application_with_resume(
+        result = await repo.create_application_with_resume(
             job_id=job_id,
             applicant_id=current_user.id,
             resume_file=resume_file,
@@ -69,18 +128,24 @@ async def submit_application_with_resume(
         raise
 
 
-@router.get("/my-applications")
+@router.get("/my-applications", response_model=List[MyApplicationResponse])
 async def get_my_applications(
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     Get all applications submitted by the current user with parsed resume data
+    (answers If-None-Match with 304 before loading any application)
     """
     repo = ApplicationWithResumeRepository(db)
+    etag = version_etag("my-applications", current_user.id, *repo.user_applications_version(current_user.id))
+    not_modified, validators = conditional_response(request.headers, "applications.mine", etag)
+    if not_modified:
+        return not_modified
     applications = repo.get_user_applications_with_resumes(current_user.id)
 
-    return applications
+    return my_applications_serializer.response(applications, headers=validators)
 
 
 @router.get("/{application_id}")
@@ -101,7 +166,7 @@ async def get_application_details(
     return application
 
 
-@router.get("/job/{job_id}/applications")
+@router.get("/job/{job_id}/applications", response_model=List[JobApplicationResponse])
 async def get_job_applications(
     job_id: int,
     current_user: User = Depends(get_current_employer),
@@ -113,7 +178,58 @@ async def get_job_applications(
     repo = ApplicationWithResumeRepository(db)
     applications = repo.get_job_applications_with_resumes(job_id, current_user.id)
 
-    return applications
+    return job_applications_serializer.response(applications)
+
+
+@router.get("/{application_id}/resume")
+def download_resume(
+    application_id: int,
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Download the original resume file (applicant, employer who owns the job, or admin).
+    Supports Range requests and ETag/Last-Modified revalidation.
+    Plain def: the lookups run in the threadpool and the file streams afterwards,
+    so the event loop never blocks on the database while transfers are in flight.
+    """
+    repo = ApplicationWithResumeRepository(db)
+    stored = repo.get_resume_file_for_download(application_id, current_user)
+    return resume_file_response(request, stored)
+
+
+@router.get("/{application_id}/history", response_model=List[ApplicationEventResponse])
+def get_application_history(
+    application_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Status timeline of an application, oldest first (applicant, employer who owns the job, or admin)
+    """
+    return ApplicationWithResumeRepository(db).get_application_history(application_id, current_user)
+
+
+@router.patch("/status")
+def bulk_update_application_status(
+    status_update: BulkStatusUpdateRequest,
+    current_user: User = Depends(get_current_employer),
+    db: Session = Depends(get_db)
+):
+    """
+    Set one status on many applications to the employer's jobs in a single request
+    (e.g. rejecting everyone left once a role is filled). Returns each id's outcome:
+    updated, unchanged or not_found. Plain def: runs in the threadpool.
+    """
+    repo = ApplicationWithResumeRepository(db)
+    outcomes = repo.bulk_update_application_status(
+        status_update.application_ids, status_update.status, employer_id=current_user.id
+    )
+    counts = {outcome: 0 for outcome in ("updated", "unchanged", "not_found")}
+    for outcome in outcomes.values():
+        counts[outcome] += 1
+    return {"status": status_update.status, **counts, "results": outcomes}
 
 
 @router.patch("/{application_id}/status")
@@ -189,6 +305,24 @@ async def delete_application(
     return {"message": "Application deleted successfully"}
 
 
+@router.get("/{application_id}/near-duplicates")
+async def get_near_duplicate_applications(
+    application_id: int,
+    threshold: float = Query(DEFAULT_SIMILARITY_THRESHOLD, ge=0.5, le=1.0),
+    current_user: User = Depends(get_current_employer),
+    db: Session = Depends(get_db)
+):
+    """
+    Find near-duplicate resumes submitted to the employer's jobs (for employers)
+    """
+    repo = ResumeDedupRepository(db)
+    return repo.find_near_duplicates_for_application(
+        application_id,
+        employer_id=current_user.id,
+        threshold=threshold
+    )
+
+
 @router.get("/skills/analysis/{job_id}")
 async def analyze_skills_for_job(
     job_id: int,
@@ -229,11 +363,12 @@ async def analyze_skills_for_job(
 @router.get("/resume/preview/{application_id}")
 async def get_resume_preview(
     application_id: int,
+    chars: int = Query(1000, ge=1, le=20000, description="Number of characters of text to return"),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    Get a preview of the extracted resume text (first 1000 characters)
+    Get a preview of the extracted resume text (first 1000 characters by default)
     """
     repo = ApplicationWithResumeRepository(db)
     application = repo.get_application_with_parsed_resume(application_id, current_user.id)
@@ -241,12 +376,14 @@ async def get_resume_preview(
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
 
-    parsed_resume = application.get("parsed_resume", {})
-    extracted_text = parsed_resume.get("extracted_text", "No text available")
+    parsed_resume = application.get("parsed_resume") or {}
+    full_text = repo.get_resume_text_for_application(application_id, current_user.id)
+    extracted_text = full_text or parsed_resume.get("extracted_text") or "No text available"
 
     return {
         "application_id": application_id,
-        "preview_text": extracted_text,
+        "preview_text": extracted_text[:chars],
+        "truncated": len(extracted_text) > chars,
         "parsing_summary": {
             "name": parsed_resume.get("name"),
             "email": parsed_resume.get("email"),
@@ -0,0 +1,47 @@
+import os
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+
+from app.core.dependencies import get_db, get_current_user
+from app.models.user import User
+from app.repository.backgroundjob import get_background_job
+from app.schemas.backgroundjob import BackgroundJobResponse
+
+router = APIRouter(prefix="/background-jobs", tags=["Background Jobs"])
+
+
+def job_status_payload(job) -> dict:
+    payload = BackgroundJobResponse.model_validate(job).model_dump()
+    if job.status == "completed" and job.result_path:
+        payload["download_url"] = f"/background-jobs/{job.id}/download"
+    return payload
+
+
+@router.get("/{job_id}", response_model=BackgroundJobResponse)
+def get_job_status(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Poll the status of a background job
+    """
+    return job_status_payload(get_background_job(db, job_id, current_user))
+
+
+@router.get("/{job_id}/download")
+def download_job_result(
+    job_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Download the file produced by a completed background job
+    """
+    job = get_background_job(db, job_id, current_user)
+    if job.status != "completed" or not job.result_path:
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}, no file available yet")
+    if not os.path.exists(job.result_path):
+        raise HTTPException(status_code=410, detail="Result file has expired")
+    return FileResponse(job.result_path, filename=os.path.basename(job.result_path))
@@ -0,0 +1,23 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.dependencies import get_current_employer, get_db
+from app.models.user import User
+from app.repository.dashboard import DashboardRepository
+from app.schemas.dashboard import EmployerDashboard
+
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+
+
+@router.get("", response_model=EmployerDashboard)
+async def employer_dashboard(
+    record_visit: bool = Query(True, description="false: look without resetting new-since-last-visit"),
+    current_user: User = Depends(get_current_employer),
+    db: Session = Depends(get_db)
+):
+    """
+    Application counts by status for each of the employer's jobs, new applications
+    since the previous visit and distinct applicants overall. Replaces loading every
+    application through /applications/job/{job_id}/applications and counting client-side.
+    """
+    return await DashboardRepository(db).dashboard(current_user, record_visit=record_visit)
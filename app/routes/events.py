@@ -0,0 +1,49 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.core.dependencies import get_current_user, get_db
+from app.models.user import User
+from app.utils.event_broker import event_broker, format_sse
+
+router = APIRouter(prefix="/events", tags=["Events"])
+
+RETRY_MS = 5000  # client reconnect delay announced to EventSource
+
+
+def get_stream_user(
+    request: Request,
+    token: Optional[str] = Query(None, description="Access token (EventSource cannot send headers)"),
+    db: Session = Depends(get_db)
+) -> User:
+    bearer = request.headers.get("authorization", "").removeprefix("Bearer ").strip()
+    return get_current_user(token or bearer, db)
+
+
+@router.get("/stream")
+async def stream_events(current_user: User = Depends(get_stream_user)):
+    """
+    Server-Sent Events for the current user: `notification` and `application_status`
+    events, `: ping` heartbeats, and `resync` when the client fell too far behind
+    (refetch over REST). Replaces polling /applications/my-applications.
+    """
+    if event_broker.full():
+        raise HTTPException(status_code=503, detail="Too many open event streams", headers={"retry-after": "5"})
+    user_id = current_user.id  # the session behind current_user is closed before streaming starts
+
+    async def body():
+        subscription = await event_broker.subscribe(user_id)
+        try:
+            yield f"retry: {RETRY_MS}\n\n" + format_sse({"type": "ready"})
+            while True:
+                yield format_sse(await subscription.next())
+        finally:
+            await event_broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        body(),
+        media_type="text/event-stream",
+        headers={"cache-control": "no-cache", "x-accel-buffering": "no"}  # no proxy buffering
+    )
@@ -1,13 +1,25 @@
-from typing import List
-from fastapi import APIRouter, status, Depends, HTTPException
+import os
+from typing import List, Optional, Set
+from fastapi import APIRouter, status, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
-from app.repository.job import create_job, list_jobs, get_job_details, delete_job, update_job
-from app.core.dependencies import get_db, get_current_user
-from app.schemas.job import JobCreate, ShowJobs, UpdateJobs
+from app.repository.job import (
+    create_job, list_jobs, get_job_details, delete_job, update_job, jobs_listing_version, job_version
+)
+from app.core.dependencies import get_db, get_current_user, get_current_user_optional
+from app.schemas.job import JobCreate, JobListing, ShowJobs, UpdateJobs
 from app.models.user import User
+from app.repository.savedjob import SavedJobRepository
+from app.utils.compression import CompressedPayload, PayloadCache
+from app.utils.http_cache import conditional_response, version_etag
+from app.utils.json_response import ListSerializer
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
+jobs_serializer = ListSerializer(ShowJobs)
+listing_serializer = ListSerializer(JobListing)
+# Serialized listing pages with their gzip/br variants, keyed by listing version
+listing_cache = PayloadCache(ttl=float(os.getenv("JOB_LISTING_CACHE_SECONDS", "30")))
+
 @router.post("/create/", response_model=ShowJobs, status_code=status.HTTP_201_CREATED)
 def create_new_job(
     job: JobCreate,
@@ -16,14 +28,61 @@ def create_new_job(
 ):
     if current_user.role not in ["employer", "admin"]:
         raise HTTPException(status_code=403, detail="Only employers can post jobs")
-    return create_job(db, job, current_user.id)
+    new_job = create_job(db, job, current_user.id)
+    listing_cache.clear()
+    return new_job
+
+async def get_saved_job_ids(
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user_optional)
+) -> Optional[Set[int]]:
+    """The signed-in applicant's saved job ids (from the Redis set cache), or None"""
+    if current_user is None or current_user.role != "applicant":
+        return None
+    return await SavedJobRepository(db).saved_ids(current_user.id)
 
 @router.get("/all/", response_model=List[ShowJobs], status_code=status.HTTP_200_OK)
-def get_all_jobs(db: Session = Depends(get_db)):
-    return list_jobs(db)
+def get_all_jobs(
+    request: Request,
+    db: Session = Depends(get_db),
+    saved_ids: Optional[Set[int]] = Depends(get_saved_job_ids)
+):
+    """
+    All jobs. For a signed-in applicant each row also carries its id and
+    is_saved (see JobListing); the flags come from one saved-set lookup,
+    not a query per job.
+    """
+    version = jobs_listing_version(db)
+    if saved_ids is not None:
+        # Same rows and flags give the same bytes whoever asks, so the saved set can stand in for the user
+        etag = version_etag("jobs", *version, "saved", *sorted(saved_ids))
+        not_modified, validators = conditional_response(request.headers, "jobs.list.saved", etag)
+        if not_modified:
+            return not_modified
+        rows = [JobListing.model_validate(job, from_attributes=True) for job in list_jobs(db)]
+        for row in rows:
+            row.is_saved = row.id in saved_ids
+        return listing_serializer.response(rows, headers={**validators, "vary": "Authorization"})
+
+    # One aggregate query decides 304 before any rows are loaded or serialized
+    etag = version_etag("jobs", *version)
+    not_modified, validators = conditional_response(request.headers, "jobs.list", etag, "no-cache")
+    if not_modified:
+        return not_modified
+    key = f"{etag}?{request.url.query}"  # a write in any worker changes the etag, so stale pages are never served
+    payload = listing_cache.get(key) or listing_cache.set(key, CompressedPayload(jobs_serializer.dump(list_jobs(db))))
+    return payload.response(request.headers, {**validators, "vary": "Authorization, Accept-Encoding"})
 
 @router.get("/{id}", response_model=ShowJobs, status_code=status.HTTP_200_OK)
-def get_a_job_detail(id: int, db: Session = Depends(get_db)):
+def get_a_job_detail(id: int, request: Request, response: Response, db: Session = Depends(get_db)):
+    version = job_version(id, db)
+    if version is not None:
+        not_modified, validators = conditional_response(
+            request.headers, "jobs.detail", version_etag("job", id, version), "no-cache"
+        )
+        if not_modified:
+            return not_modified
+        response.headers.update(validators)
     return get_job_details(id, db)
 
 @router.delete("/delete/{id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -32,7 +91,9 @@ def destroy_job(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    return delete_job(id, db, current_user)
+    result = delete_job(id, db, current_user)
+    listing_cache.clear()
+    return result
 
 @router.put("/update/{id}", response_model=ShowJobs, status_code=status.HTTP_202_ACCEPTED)
 def update(
@@ -41,4 +102,6 @@ def update(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    return update_job(id, job, db, current_user)
+    updated = update_job(id, job, db, current_user)
+    listing_cache.clear()
+    return updated
@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Depends
+
+from app.core.dependencies import require_role
+from app.models.user import User
+from app.utils.http_cache import conditional_get_stats
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("/conditional-get")
+def get_conditional_get_metrics(current_user: User = Depends(require_role("admin"))):
+    """
+    Requests and 304 Not Modified answers per ETag-enabled route since this worker started (admin only)
+    """
+    return conditional_get_stats.snapshot()
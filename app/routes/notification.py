@@ -0,0 +1,49 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.dependencies import get_current_user, get_db
+from app.models.user import User
+from app.repository.notification import MAX_PAGE_SIZE, PAGE_SIZE, NotificationRepository
+from app.schemas.notification import MarkReadRequest, MarkReadResult, NotificationPage, UnreadCount
+
+router = APIRouter(prefix="/notifications", tags=["Notifications"])
+
+
+@router.get("", response_model=NotificationPage)
+def list_notifications(
+    limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    before_id: Optional[int] = Query(None, description="next_before_id from the previous page"),
+    unread_only: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    The current user's notifications, newest first (keyset-paginated)
+    """
+    return NotificationRepository(db).list_notifications(current_user.id, limit, before_id, unread_only)
+
+
+@router.get("/unread-count", response_model=UnreadCount)
+async def get_unread_count(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Unread badge count, served from a Redis counter
+    """
+    return {"unread": await NotificationRepository(db).unread_count(current_user.id)}
+
+
+@router.post("/mark-read", response_model=MarkReadResult)
+async def mark_notifications_read(
+    mark: MarkReadRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Mark notifications read in one statement: by ids, up to an id, or all of them
+    """
+    updated = await NotificationRepository(db).mark_read(current_user.id, mark.ids, mark.up_to_id)
+    return {"updated": updated}
@@ -0,0 +1,225 @@
+from typing import List, Optional
+import json
+from fastapi import APIRouter, BackgroundTasks, Depends, File, Form, HTTPException, Query, UploadFile, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.core.dependencies import get_db, get_current_user, require_role, require_any_role
+from app.database.session import SessionLocal
+from app.models.user import User
+from app.repository import backgroundjob as job_repo
+from app.repository.resumebulk import run_bulk_resume_operation, run_reparse_outdated
+from app.repository.resumeexport import ResumeExportRepository, run_resume_export_job
+from app.repository.resumeimport import ResumeImportRepository
+from app.repository.resumesearch import ResumeSearchRepository, MAX_PER_PAGE
+from app.repository.resumecomparison import ResumeComparisonRepository
+from app.repository.resumededup import ResumeDedupRepository, DEFAULT_SIMILARITY_THRESHOLD
+from app.routes.backgroundjob import job_status_payload
+from app.schemas.backgroundjob import BackgroundJobResponse
+from app.schemas.resume import (
+    BulkResumeOperation,
+    ReparseOutdatedRequest,
+    ResumeComparison,
+    ResumeExport,
+    ResumeImport,
+    ResumeImportResult,
+    ResumeNearDuplicatesResponse,
+    ResumeSearchFilters,
+    ResumeSearchResponse,
+)
+from app.utils.export_writers import FILE_EXTENSIONS, MEDIA_TYPES
+
+router = APIRouter(prefix="/resumes", tags=["Resumes"])
+
+
+@router.get("/search", response_model=ResumeSearchResponse)
+def search_resumes(
+    field: Optional[str] = None,
+    skills: Optional[List[str]] = Query(None, description="Any of these skills"),
+    education: Optional[str] = None,
+    experience_years_min: Optional[int] = Query(None, ge=0),
+    experience_years_max: Optional[int] = Query(None, ge=0),
+    current_position: Optional[str] = None,
+    email_domain: Optional[str] = None,
+    page: int = Query(1, ge=1),
+    per_page: int = Query(20, ge=1, le=MAX_PER_PAGE),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_any_role("employer", "admin"))
+):
+    """
+    Search resumes by indexed fields. Employers only see applicants to their own jobs.
+    """
+    filters = ResumeSearchFilters(
+        field=field,
+        skills=skills,
+        education=education,
+        experience_years_min=experience_years_min,
+        experience_years_max=experience_years_max,
+        current_position=current_position,
+        email_domain=email_domain
+    )
+    employer_id = current_user.id if current_user.role != "admin" else None
+    return ResumeSearchRepository(db).search(filters, page=page, per_page=per_page, employer_id=employer_id)
+
+
+@router.get("/{resume_id}/near-duplicates", response_model=ResumeNearDuplicatesResponse)
+def get_near_duplicate_resumes(
+    resume_id: int,
+    threshold: float = Query(DEFAULT_SIMILARITY_THRESHOLD, ge=0.5, le=1.0),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin"))
+):
+    """
+    Find resumes that are near-duplicates of this one (admin only)
+    """
+    repo = ResumeDedupRepository(db)
+    duplicates = repo.find_near_duplicates(resume_id, threshold=threshold)
+    return {"resume_id": resume_id, "duplicates": duplicates}
+
+
+@router.post("/export", responses={202: {"model": BackgroundJobResponse}})
+def export_resumes(
+    export: ResumeExport,
+    background_tasks: BackgroundTasks,
+    background: bool = Query(False, description="Run as a background job and return a download link"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_any_role("employer", "admin"))
+):
+    """
+    Export applicant resumes and applications as CSV, JSON Lines or XLSX.
+    Employers export applicants of their own jobs; admins export everything.
+    """
+    employer_id = current_user.id if current_user.role != "admin" else None
+    ResumeExportRepository.validate_fields(export)
+
+    if background:
+        job = job_repo.create_background_job(
+            db, kind="resume_export", owner_id=current_user.id, params=export.model_dump()
+        )
+        background_tasks.add_task(run_resume_export_job, job.id, export.model_dump(), employer_id)
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=jsonable_encoder(job_status_payload(job))
+        )
+
+    def body():
+        # The request-scoped session is closed before streaming starts, so the
+        # cursor gets a session of its own for the lifetime of the response.
+        stream_db = SessionLocal()
+        try:
+            yield from ResumeExportRepository(stream_db).stream(export, employer_id)
+        finally:
+            stream_db.close()
+
+    filename = f"resume_export.{FILE_EXTENSIONS[export.format]}"
+    return StreamingResponse(
+        body(),
+        media_type=MEDIA_TYPES[export.format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.post("/import", response_model=ResumeImportResult)
+def import_resumes(
+    file: UploadFile = File(...),
+    file_format: str = Form(..., description="csv or json (JSON Lines)"),
+    mapping: str = Form(..., description='JSON object, e.g. {"Email": "applicant_email", "CV": "file_path"}'),
+    validate_only: bool = Form(False),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin"))
+):
+    """
+    Bulk import resumes (and applications when job_id is mapped) from CSV or JSON Lines.
+    Rows are validated and inserted in chunks; each chunk is committed on its own.
+    """
+    try:
+        spec = ResumeImport(
+            file_format=file_format,
+            mapping=json.loads(mapping),
+            validate_only=validate_only
+        )
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid import options: {e}")
+
+    return ResumeImportRepository(db).run(file.file, spec)
+
+
+@router.get("/compare", response_model=ResumeComparison)
+def compare_resumes(
+    resume1_id: int,
+    resume2_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_any_role("employer", "admin"))
+):
+    """
+    Compare two resumes by text and skills similarity
+    """
+    repo = ResumeComparisonRepository(db)
+    employer_id = current_user.id if current_user.role != "admin" else None
+    return repo.compare(resume1_id, resume2_id, employer_id=employer_id)
+
+
+@router.get("/{resume_id}/compare/job/{job_id}", response_model=List[ResumeComparison])
+def compare_resume_with_job_applicants(
+    resume_id: int,
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_any_role("employer", "admin"))
+):
+    """
+    Compare one resume against every applicant of a job, most similar first
+    """
+    repo = ResumeComparisonRepository(db)
+    employer_id = current_user.id if current_user.role != "admin" else None
+    return repo.compare_against_job(resume_id, job_id, employer_id=employer_id)
+
+
+@router.post("/bulk", response_model=BackgroundJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def bulk_resume_operation(
+    operation: BulkResumeOperation,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Delete, reparse or archive up to 50 resumes. Runs in the background;
+    poll /background-jobs/{id} for progress and per-resume outcomes.
+    """
+    job = job_repo.create_background_job(
+        db,
+        kind=f"resume_bulk_{operation.operation}",
+        owner_id=current_user.id,
+        params=operation.model_dump(),
+        total=len(operation.resume_ids)
+    )
+    background_tasks.add_task(
+        run_bulk_resume_operation,
+        job.id,
+        operation.resume_ids,
+        operation.operation,
+        current_user.id,
+        current_user.role == "admin"
+    )
+    return job_status_payload(job)
+
+
+@router.post("/bulk/reparse-outdated", response_model=BackgroundJobResponse,
+             status_code=status.HTTP_202_ACCEPTED)
+def reparse_outdated_resumes(
+    request: ReparseOutdatedRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin"))
+):
+    """
+    Reparse every resume parsed by a parser version lower than `below_version`,
+    throttled against live traffic (admin only)
+    """
+    job = job_repo.create_background_job(
+        db, kind="resume_reparse_outdated", owner_id=current_user.id, params=request.model_dump()
+    )
+    background_tasks.add_task(
+        run_reparse_outdated, job.id, request.below_version, request.batch_size, request.max_load
+    )
+    return job_status_payload(job)
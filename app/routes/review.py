@@ -1,22 +1,47 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, Request, status
 from sqlalchemy.orm import Session
-from typing import List
-from app.schemas.review import ReviewCreate, ReviewResponse, ReviewUpdate
+from typing import List, Optional
+from app.schemas.review import ReviewCreate, ReviewResponse, ReviewSummary, ReviewUpdate
 from app.repository import review as review_repo
 from app.core.dependencies import get_db, get_current_user
+from app.utils.json_response import ListSerializer
 
 router = APIRouter(
     prefix="/reviews",
     tags=["Reviews"]
 )
 
+reviews_serializer = ListSerializer(ReviewResponse)
+
 @router.post("/", response_model=ReviewResponse, status_code=status.HTTP_201_CREATED)
 def create_review(data: ReviewCreate, db: Session = Depends(get_db), current_user=Depends(get_current_user)):
     return review_repo.create_review(db, current_user.id, data)
 
 @router.get("/user/{user_id}", response_model=List[ReviewResponse])
-def get_reviews_for_user(user_id: int, db: Session = Depends(get_db)):
-    return review_repo.get_reviews_for_user(db, user_id)
+def get_reviews_for_user(
+    user_id: int,
+    request: Request,
+    limit: int = Query(review_repo.PAGE_SIZE, ge=1, le=review_repo.MAX_PAGE_SIZE),
+    before_id: Optional[int] = Query(None, description="From the previous page's Link: rel=\"next\" header"),
+    db: Session = Depends(get_db)
+):
+    """
+    A user's reviews, newest first. Keyset-paginated: while more remain, the
+    response carries a `Link: <...>; rel="next"` header with the next page's URL.
+    """
+    reviews, next_before_id = review_repo.get_reviews_for_user(db, user_id, limit, before_id)
+    headers = {}
+    if next_before_id is not None:
+        next_url = request.url.include_query_params(limit=limit, before_id=next_before_id)
+        headers["link"] = f'<{next_url}>; rel="next"'
+    return reviews_serializer.response(reviews, headers=headers)
+
+@router.get("/user/{user_id}/summary", response_model=ReviewSummary)
+def get_review_summary(user_id: int, db: Session = Depends(get_db)):
+    """
+    Review count, average rating and rating histogram, read from the stored aggregates
+    """
+    return review_repo.get_review_summary(db, user_id)
 
 @router.get("/{review_id}", response_model=ReviewResponse)
 def get_review(review_id: int, db: Session = Depends(get_db)):
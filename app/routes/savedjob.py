@@ -0,0 +1,64 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session
+
+from app.core.dependencies import get_db, require_role
+from app.models.user import User
+from app.repository.savedjob import MAX_CHECK_IDS, MAX_PAGE_SIZE, PAGE_SIZE, SavedJobRepository
+from app.schemas.savedjob import SavedJobCheck, SavedJobPage, SavedJobResponse
+
+router = APIRouter(prefix="/saved-jobs", tags=["Saved Jobs"])
+
+
+@router.get("", response_model=SavedJobPage)
+def list_saved_jobs(
+    limit: int = Query(PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    before_id: Optional[int] = Query(None, description="next_before_id from the previous page"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("applicant"))
+):
+    """
+    The current applicant's saved jobs, most recently saved first (keyset-paginated)
+    """
+    return SavedJobRepository(db).list_saved(current_user.id, limit, before_id)
+
+
+@router.get("/check", response_model=SavedJobCheck)
+async def check_saved_jobs(
+    job_ids: List[int] = Query(..., description="Job ids shown on the page"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("applicant"))
+):
+    """
+    Which of the given jobs the current applicant has saved, in one lookup
+    """
+    if len(job_ids) > MAX_CHECK_IDS:
+        raise HTTPException(status_code=422, detail=f"At most {MAX_CHECK_IDS} job ids per request")
+    saved = await SavedJobRepository(db).saved_among(current_user.id, list(dict.fromkeys(job_ids)))
+    return {"saved": [job_id for job_id in job_ids if job_id in saved]}
+
+
+@router.put("/{job_id}", response_model=SavedJobResponse)
+async def save_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("applicant"))
+):
+    """
+    Save a job; saving it again is a no-op
+    """
+    return await SavedJobRepository(db).save(current_user.id, job_id)
+
+
+@router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def unsave_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("applicant"))
+):
+    """
+    Remove a saved job; removing one that is not saved is a no-op
+    """
+    await SavedJobRepository(db).unsave(current_user.id, job_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.core.dependencies import get_db, require_role
+from app.models.user import User
+from app.repository.resumestorage import ResumeStorageRepository
+
+router = APIRouter(prefix="/storage", tags=["Storage"])
+
+
+@router.get("/stats")
+def get_storage_stats(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_role("admin"))
+):
+    """
+    Resume storage usage and the bytes saved by content-addressed deduplication (admin only)
+    """
+    return ResumeStorageRepository(db).stats()
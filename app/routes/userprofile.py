@@ -1,28 +1,56 @@
-from fastapi import APIRouter, status, Depends, HTTPException
+from typing import List
+from fastapi import APIRouter, status, Depends, HTTPException, Query
 from app.models.userprofile import UserProfile
 from app.models.user import User
 from sqlalchemy.orm import Session
-from app.repository.userprofile import create_profile, get_profile_details,update_profile, delete_profile
-from app.schemas.userprofile import ShowUserProfile, UserProfileCreate,UpdateProfile
+from app.repository.userprofile import (
+    MAX_BATCH, create_profile, get_profile_cards, get_profile_details, update_profile, delete_profile
+)
+from app.schemas.userprofile import ProfileCard, ShowUserProfile, UserProfileCreate, UpdateProfile
 from app.core.dependencies import get_db, get_current_user
+from app.utils.json_response import ListSerializer
 
 
 router = APIRouter(prefix="/profiles", tags=["profiles"])
 
+cards_serializer = ListSerializer(ProfileCard)
+
+@router.get("", response_model=List[ProfileCard], status_code=status.HTTP_200_OK)
+def get_profiles(
+    user_ids: List[str] = Query(..., description="Comma-separated user ids (or the parameter repeated)"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    User and profile details for up to MAX_BATCH users in one request, e.g. an
+    employer's applicant list. Users without a profile come back with null profile
+    fields; unknown ids, and for employers users who never applied to their jobs,
+    are left out.
+    """
+    try:
+        ids = list(dict.fromkeys(int(part) for value in user_ids for part in value.split(",") if part.strip()))
+    except ValueError:
+        raise HTTPException(status_code=422, detail="user_ids must be integers")
+    if len(ids) > MAX_BATCH:
+        raise HTTPException(status_code=422, detail=f"At most {MAX_BATCH} user ids per request")
+    if current_user.role not in ("employer", "admin") and any(user_id != current_user.id for user_id in ids):
+        raise HTTPException(status_code=403, detail="Not authorized to view these profiles")
+    return cards_serializer.response(get_profile_cards(ids, db, current_user))
+
 @router.post("/create", response_model=ShowUserProfile, status_code=status.HTTP_201_CREATED)
 def create_new_profile(userprofile: UserProfileCreate, db: Session=Depends(get_db), current_user: User=Depends(get_current_user)):
     if current_user.role != "applicant":
         raise HTTPException(status_code=403, detail="Only employers can post jobs")
     return create_profile(db, userprofile, current_user.id)
 
-@router.get("/details/{id}", response_model=ShowUserProfile, status_code=status.HTTP_200_OK)
-def show_profile_details(id: int, db: Session=Depends(get_db), current_user: User = Depends(get_current_user)):
-    return get_profile_details(id, db, current_user)
+@router.get("/details/{user_id}", response_model=ShowUserProfile, status_code=status.HTTP_200_OK)
+def show_profile_details(user_id: int, db: Session=Depends(get_db), current_user: User = Depends(get_current_user)):
+    return get_profile_details(user_id, db, current_user)
 
 @router.put("/update/{id}", response_model=ShowUserProfile, status_code=status.HTTP_202_ACCEPTED)
-def update_user_profile(id: int, db: Session=Depends(get_db), profile=UpdateProfile, current_user: User=Depends(get_current_user)):
-    return update_profile(id, db, profile, current_user)
+def update_user_profile(id: int, profile: UpdateProfile, db: Session=Depends(get_db), current_user: User=Depends(get_current_user)):
+    return update_profile(id, profile, db, current_user)
 
 @router.delete("/delete/{id}", status_code=status.HTTP_204_NO_CONTENT)
 def destroy_job(id: int, db: Session=Depends(get_db), current_user: User=Depends(get_current_user)):
-    return delete_profile(id, db, current_user)
\ No newline at end of file
+    delete_profile(id, db, current_user)
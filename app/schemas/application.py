@@ -25,3 +25,26 @@ class ApplicationResponse(BaseModel):
 
     class Config:
         orm_mode = True
+
+
+class MyApplicationResponse(BaseModel):
+    """An applicant's own application, as listed by /applications/my-applications"""
+    id: int
+    job_id: int
+    job_title: Optional[str] = None
+    company_name: Optional[str] = None
+    status: Optional[str] = None
+    parsed_resume: Optional[dict] = None
+    created_at: Optional[datetime] = None
+
+
+class JobApplicationResponse(BaseModel):
+    """An application to one of the employer's jobs, as listed by /applications/job/{job_id}/applications"""
+    id: int
+    applicant_id: int
+    applicant_name: Optional[str] = None
+    applicant_email: Optional[str] = None
+    status: Optional[str] = None
+    cover_letter: Optional[str] = None
+    parsed_resume: Optional[dict] = None
+    created_at: Optional[datetime] = None
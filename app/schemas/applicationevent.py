@@ -0,0 +1,39 @@
+from datetime import date, datetime
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class ApplicationEventResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    from_status: Optional[str] = None
+    to_status: str
+    actor_id: Optional[int] = None
+    created_at: datetime
+
+
+class FunnelStage(BaseModel):
+    status: str
+    entered: int  # transitions into the status in the range
+    conversion: Optional[float] = None  # entered / submissions in the range
+    exited: int  # stays in the status that ended in the range...
+    avg_stage_seconds: Optional[float] = None  # ...and their average length
+    current: int  # applications in the status now (ignores the range)
+
+
+class FunnelReport(BaseModel):
+    since: Optional[date] = None
+    until: Optional[date] = None
+    source: Literal["live", "rollup"]
+    stages: List[FunnelStage]
+
+
+class TimeToHireReport(BaseModel):
+    since: Optional[date] = None
+    until: Optional[date] = None
+    source: Literal["live", "rollup"]
+    hired: int
+    avg_seconds: Optional[float] = None
+    min_seconds: Optional[float] = None  # live source only
+    max_seconds: Optional[float] = None  # live source only
@@ -0,0 +1,28 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class DashboardJob(BaseModel):
+    job_id: int
+    title: str
+    applications: int
+    new: int  # since the previous visit (all of them on the first)
+    by_status: Dict[str, int]
+    latest_application_at: Optional[datetime] = None
+
+
+class DashboardTotals(BaseModel):
+    jobs: int
+    applications: int
+    new: int
+    applicants: int  # distinct people across all of the employer's jobs
+    by_status: Dict[str, int]
+
+
+class EmployerDashboard(BaseModel):
+    last_visit_at: Optional[datetime] = None
+    cached: bool
+    totals: DashboardTotals
+    jobs: List[DashboardJob]
@@ -25,3 +25,8 @@ class ShowJobs(JobBase):
 
     class Config:
         orm_mode = True
+
+class JobListing(ShowJobs):
+    # listing row for a signed-in applicant, with their saved flag
+    id: int
+    is_saved: bool = False
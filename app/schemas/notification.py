@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class NotificationResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    message: str
+    is_read: bool
+    created_at: datetime
+
+
+class NotificationPage(BaseModel):
+    items: List[NotificationResponse]
+    next_before_id: Optional[int] = None
+
+
+class UnreadCount(BaseModel):
+    unread: int
+
+
+class MarkReadRequest(BaseModel):
+    ids: Optional[List[int]] = None  # these notifications
+    up_to_id: Optional[int] = None   # everything up to and including this id
+    # neither: every unread notification
+
+
+class MarkReadResult(BaseModel):
+    updated: int
@@ -128,6 +128,13 @@ class BulkResumeOperation(BaseModel):
     operation: str = Field(..., pattern="^(delete|reparse|archive)$")
 
 
+class ReparseOutdatedRequest(BaseModel):
+    """Schema for the admin "reparse everything older than parser version N" operation"""
+    below_version: int = Field(..., ge=1, description="Reparse resumes parsed by a version lower than this")
+    batch_size: int = Field(50, ge=1, le=500)
+    max_load: float = Field(0.7, gt=0.0, description="Pause while 1-minute load per CPU is above this")
+
+
 class ResumeUploadResponse(BaseModel):
     """Schema for resume upload response with additional metadata"""
     resume: ResumeResponse
@@ -214,3 +221,37 @@ class ApplicationCreate(BaseModel):
 class ApplicationUpdateStatus(BaseModel):
     """Schema for updating application status"""
     status: str = Field(..., pattern="^(pending|reviewed|rejected|accepted)$")
+
+
+class ResumeNearDuplicate(BaseModel):
+    """Schema for a near-duplicate resume match"""
+    resume_id: int
+    applicant_id: int
+    similarity: float = Field(..., ge=0.0, le=1.0, description="Estimated Jaccard similarity")
+    created_at: Optional[datetime] = None
+    applications: List[Dict[str, int]] = []
+
+
+class ResumeNearDuplicatesResponse(BaseModel):
+    """Schema for a near-duplicates lookup"""
+    resume_id: int
+    application_id: Optional[int] = None
+    duplicates: List[ResumeNearDuplicate] = []
+
+
+class ResumeImportRowError(BaseModel):
+    """Schema for a rejected import row"""
+    row: int
+    error: str
+
+
+class ResumeImportResult(BaseModel):
+    """Schema for the outcome of a resume import"""
+    total_rows: int
+    valid_rows: int
+    imported_resumes: int = 0
+    imported_applications: int = 0
+    error_count: int = 0
+    errors: List[ResumeImportRowError] = []
+    validate_only: bool = False
+    elapsed_seconds: float = 0.0
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, conint
-from typing import Optional
+from typing import Dict, Optional
 from datetime import datetime
 
 class ReviewBase(BaseModel):
@@ -20,3 +20,9 @@ class ReviewResponse(ReviewBase):
 
     class Config:
         orm_mode = True
+
+class ReviewSummary(BaseModel):
+    reviewee_id: int
+    review_count: int
+    average_rating: Optional[float] = None  # None until the first review
+    histogram: Dict[str, int]  # rating "1".."5" -> number of reviews
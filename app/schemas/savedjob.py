@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from app.schemas.job import ShowJobs
+
+
+class SavedJobResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    job_id: int
+    saved_at: datetime
+    job: ShowJobs
+
+
+class SavedJobPage(BaseModel):
+    items: List[SavedJobResponse]
+    next_before_id: Optional[int] = None
+
+
+class SavedJobCheck(BaseModel):
+    saved: List[int]  # the subset of the requested job ids the user has saved
@@ -22,8 +22,23 @@ class ShowUserProfile(UserProfileBase):
 
 
 class UpdateProfile(BaseModel):
-    full_name: Optional[str]
-    bio: Optional[str]
-    linkedin: Optional[str]
-    github: Optional[str]
-    website: Optional[str]
+    full_name: Optional[str] = None
+    bio: Optional[str] = None
+    linkedin: Optional[str] = None
+    github: Optional[str] = None
+    website: Optional[str] = None
+
+
+class ProfileCard(BaseModel):
+    # user fields with the profile's, which are None when the user has no profile
+    user_id: int
+    email: str
+    name: Optional[str] = None
+    role: str
+    profile_picture: Optional[str] = None
+    profile_id: Optional[int] = None
+    full_name: Optional[str] = None
+    bio: Optional[str] = None
+    linkedin: Optional[str] = None
+    github: Optional[str] = None
+    website: Optional[str] = None
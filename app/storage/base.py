@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import AsyncIterator, Optional, Tuple
+
+CHUNK_SIZE = 64 * 1024
+
+
+class StorageDriver(ABC):
+    """Blob store for uploaded files, addressed by relative object names like 'ab/abcd....pdf'"""
+
+    name = "abstract"
+
+    @abstractmethod
+    async def put_file(self, key: str, source_path: str) -> None:
+        """Store the file at source_path under key (overwriting is harmless: keys are content hashes)"""
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def size(self, key: str) -> Optional[int]:
+        """Object size in bytes, or None if it does not exist"""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def iter_chunks(self, key: str, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+        """Stream bytes start..end (inclusive) of an object"""
+
+    @abstractmethod
+    def list_objects(self, prefix: str = "", start_after: str = "") -> AsyncIterator[Tuple[str, int, datetime]]:
+        """Yield (key, size, last modified in UTC) for objects under prefix with key > start_after, in key order"""
+
+    @abstractmethod
+    async def move(self, key: str, dest_key: str) -> None:
+        """Rename an object within the store"""
+
+    @abstractmethod
+    def fetch_to_path(self, key: str, dest_path: str) -> None:
+        """Synchronously copy an object to a local file (for parsers that need a path)"""
+
+    def local_path(self, key: str) -> Optional[str]:
+        """Path of the object on local disk if the driver keeps one, for zero-copy access"""
+        return None
@@ -0,0 +1,38 @@
+import os
+from typing import Optional
+
+from app.storage.base import StorageDriver
+
+_driver: Optional[StorageDriver] = None
+
+
+def create_storage_driver() -> StorageDriver:
+    """Build the driver selected by RESUME_STORAGE_DRIVER ("local" or "s3")"""
+    kind = os.getenv("RESUME_STORAGE_DRIVER", "local").lower()
+    if kind == "local":
+        from app.storage.local import LocalStorageDriver
+        return LocalStorageDriver(os.getenv("RESUME_STORAGE_ROOT", "uploads/objects"))
+    if kind == "s3":
+        from app.storage.s3 import S3StorageDriver
+        return S3StorageDriver(
+            bucket=os.environ["RESUME_S3_BUCKET"],
+            endpoint_url=os.getenv("RESUME_S3_ENDPOINT", "https://s3.amazonaws.com"),
+            access_key=os.environ["AWS_ACCESS_KEY_ID"],
+            secret_key=os.environ["AWS_SECRET_ACCESS_KEY"],
+            region=os.getenv("RESUME_S3_REGION", "us-east-1"),
+            prefix=os.getenv("RESUME_S3_PREFIX", ""),
+        )
+    raise ValueError(f"Unknown RESUME_STORAGE_DRIVER: {kind}")
+
+
+def get_storage_driver() -> StorageDriver:
+    global _driver
+    if _driver is None:
+        _driver = create_storage_driver()
+    return _driver
+
+
+def set_storage_driver(driver: Optional[StorageDriver]):
+    """Swap the process-wide driver (tests, scripts); None resets to the configured one"""
+    global _driver
+    _driver = driver
@@ -0,0 +1,117 @@
+import asyncio
+import os
+import shutil
+import tempfile
+from datetime import datetime, timezone
+from typing import AsyncIterator, List, Optional, Tuple
+
+from app.storage.base import CHUNK_SIZE, StorageDriver
+
+
+class LocalStorageDriver(StorageDriver):
+    """Objects as files under a root directory; blocking file I/O runs in worker threads"""
+
+    name = "local"
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+
+    def _path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, key))
+        if not path.startswith(self.root + os.sep):
+            raise ValueError(f"Invalid storage key: {key}")
+        return path
+
+    def _put(self, key: str, source_path: str):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Copy to a temp file in the target directory, then rename: readers never see partial files
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as out, open(source_path, "rb") as src:
+                shutil.copyfileobj(src, out, CHUNK_SIZE)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    async def put_file(self, key: str, source_path: str) -> None:
+        await asyncio.to_thread(self._put, key, source_path)
+
+    async def exists(self, key: str) -> bool:
+        return await asyncio.to_thread(os.path.isfile, self._path(key))
+
+    async def size(self, key: str) -> Optional[int]:
+        try:
+            return (await asyncio.to_thread(os.stat, self._path(key))).st_size
+        except FileNotFoundError:
+            return None
+
+    async def delete(self, key: str) -> None:
+        try:
+            await asyncio.to_thread(os.remove, self._path(key))
+        except FileNotFoundError:
+            pass
+
+    async def iter_chunks(self, key: str, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+        file = await asyncio.to_thread(open, self._path(key), "rb")
+        try:
+            await asyncio.to_thread(file.seek, start)
+            remaining = None if end is None else end - start + 1
+            while remaining is None or remaining > 0:
+                size = CHUNK_SIZE if remaining is None else min(CHUNK_SIZE, remaining)
+                chunk = await asyncio.to_thread(file.read, size)
+                if not chunk:
+                    break
+                if remaining is not None:
+                    remaining -= len(chunk)
+                yield chunk
+        finally:
+            await asyncio.to_thread(file.close)
+
+    def _list_dir(self, directory: str) -> List[Tuple[str, bool, int, float]]:
+        try:
+            entries = list(os.scandir(directory))
+        except FileNotFoundError:
+            return []
+        listing = []
+        for entry in entries:
+            if entry.name.startswith("."):  # temp uploads, quarantine
+                continue
+            if entry.is_dir():
+                listing.append((entry.name + "/", True, 0, 0.0))
+            else:
+                stat_result = entry.stat()
+                listing.append((entry.name, False, stat_result.st_size, stat_result.st_mtime))
+        return sorted(listing)  # directories sort as "name/", matching their keys
+
+    async def list_objects(self, prefix: str = "", start_after: str = "",
+                           _relative: str = "") -> AsyncIterator[Tuple[str, int, datetime]]:
+        # Recursing in sorted order yields keys sorted, one directory listing in memory per level
+        entries = await asyncio.to_thread(self._list_dir, os.path.join(self.root, _relative))
+        for name, is_dir, size, mtime in entries:
+            key = _relative + name
+            if is_dir:
+                in_prefix = prefix.startswith(key) or key.startswith(prefix)
+                # skip whole directories that sort before start_after
+                if in_prefix and (key > start_after or start_after.startswith(key)):
+                    async for item in self.list_objects(prefix, start_after, key):
+                        yield item
+            elif key.startswith(prefix) and key > start_after:
+                yield key, size, datetime.fromtimestamp(mtime, timezone.utc)
+
+    def _move(self, key: str, dest_key: str):
+        dest = self._path(dest_key)
+        os.makedirs(os.path.dirname(dest), exist_ok=True)
+        os.replace(self._path(key), dest)
+
+    async def move(self, key: str, dest_key: str) -> None:
+        await asyncio.to_thread(self._move, key, dest_key)
+
+    def fetch_to_path(self, key: str, dest_path: str) -> None:
+        shutil.copyfile(self._path(key), dest_path)
+
+    def local_path(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        return path if os.path.isfile(path) else None
@@ -0,0 +1,179 @@
+import asyncio
+import hashlib
+import hmac
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, Optional, Tuple
+from urllib.parse import quote, urlsplit
+from xml.etree import ElementTree
+
+import httpx
+
+from app.storage.base import CHUNK_SIZE, StorageDriver
+
+UNSIGNED_PAYLOAD = "UNSIGNED-PAYLOAD"
+EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+S3_NS = "{http://s3.amazonaws.com/doc/2006-03-01/}"
+
+
+def _hmac(key: bytes, message: str) -> bytes:
+    return hmac.new(key, message.encode("utf-8"), hashlib.sha256).digest()
+
+
+class S3StorageDriver(StorageDriver):
+    """S3-compatible object storage (AWS S3, MinIO, ...) over plain HTTP with SigV4 signing.
+
+    Uses path-style URLs ({endpoint}/{bucket}/{key}) so it works with MinIO
+    and other self-hosted stand-ins without DNS setup.
+    """
+
+    name = "s3"
+
+    def __init__(self, bucket: str, endpoint_url: str, access_key: str, secret_key: str,
+                 region: str = "us-east-1", prefix: str = "", timeout: float = 30.0):
+        self.bucket = bucket
+        self.endpoint_url = endpoint_url.rstrip("/")
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.region = region
+        self.prefix = prefix
+        self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+
+    # --- signing --------------------------------------------------------------
+
+    def _object_path(self, key: str = "") -> str:
+        return f"/{self.bucket}/{self.prefix}{key}" if key or self.prefix else f"/{self.bucket}"
+
+    def _signed_headers(self, method: str, path: str, query: Dict[str, str],
+                        payload_hash: str, extra: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        now = datetime.now(timezone.utc)
+        amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+        date = now.strftime("%Y%m%d")
+
+        headers = {k.lower(): str(v) for k, v in (extra or {}).items()}
+        headers.update({
+            "host": urlsplit(self.endpoint_url).netloc,
+            "x-amz-content-sha256": payload_hash,
+            "x-amz-date": amz_date,
+        })
+        signed = ";".join(sorted(headers))
+        canonical_request = "\n".join([
+            method,
+            quote(path, safe="/-_.~"),
+            "&".join(f"{quote(k, safe='-_.~')}={quote(v, safe='-_.~')}" for k, v in sorted(query.items())),
+            "".join(f"{k}:{headers[k].strip()}\n" for k in sorted(headers)),
+            signed,
+            payload_hash,
+        ])
+        scope = f"{date}/{self.region}/s3/aws4_request"
+        string_to_sign = "\n".join([
+            "AWS4-HMAC-SHA256", amz_date, scope, hashlib.sha256(canonical_request.encode()).hexdigest()
+        ])
+        key = _hmac(("AWS4" + self.secret_key).encode(), date)
+        for part in (self.region, "s3", "aws4_request"):
+            key = _hmac(key, part)
+        signature = hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+
+        headers["authorization"] = (
+            f"AWS4-HMAC-SHA256 Credential={self.access_key}/{scope}, "
+            f"SignedHeaders={signed}, Signature={signature}"
+        )
+        del headers["host"]  # httpx sets it
+        return headers
+
+    def _request_args(self, method: str, key: str = "", query: Optional[Dict[str, str]] = None,
+                      payload_hash: str = EMPTY_SHA256, extra: Optional[Dict[str, str]] = None) -> Dict:
+        path = self._object_path(key)
+        query = query or {}
+        return {
+            "method": method,
+            "url": self.endpoint_url + quote(path, safe="/-_.~"),
+            "params": query,
+            "headers": self._signed_headers(method, path, query, payload_hash, extra),
+        }
+
+    def _client_for_loop(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+
+    # --- StorageDriver --------------------------------------------------------
+
+    async def put_file(self, key: str, source_path: str) -> None:
+        body = await asyncio.to_thread(_read_file, source_path)
+        response = await self._client_for_loop().request(
+            content=body,
+            **self._request_args("PUT", key, payload_hash=UNSIGNED_PAYLOAD,
+                                 extra={"content-length": str(len(body))})
+        )
+        response.raise_for_status()
+
+    async def exists(self, key: str) -> bool:
+        return await self.size(key) is not None
+
+    async def size(self, key: str) -> Optional[int]:
+        response = await self._client_for_loop().request(**self._request_args("HEAD", key))
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return int(response.headers.get("content-length", 0))
+
+    async def delete(self, key: str) -> None:
+        response = await self._client_for_loop().request(**self._request_args("DELETE", key))
+        if response.status_code not in (200, 204, 404):
+            response.raise_for_status()
+
+    async def iter_chunks(self, key: str, start: int = 0, end: Optional[int] = None) -> AsyncIterator[bytes]:
+        extra = {}
+        if start or end is not None:
+            extra["range"] = f"bytes={start}-{'' if end is None else end}"
+        request = self._client_for_loop().build_request(**self._request_args("GET", key, extra=extra))
+        response = await self._client_for_loop().send(request, stream=True)
+        try:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                yield chunk
+        finally:
+            await response.aclose()
+
+    async def list_objects(self, prefix: str = "", start_after: str = "") -> AsyncIterator[Tuple[str, int, datetime]]:
+        """ListObjectsV2, one page (up to 1000 keys) in memory at a time"""
+        token = None
+        while True:
+            query = {"list-type": "2", "prefix": self.prefix + prefix}
+            if token:
+                query["continuation-token"] = token
+            elif start_after:
+                query["start-after"] = self.prefix + start_after
+            response = await self._client_for_loop().request(**self._request_args("GET", query=query))
+            response.raise_for_status()
+            root = ElementTree.fromstring(response.content)
+            for item in root.iter(f"{S3_NS}Contents"):
+                key = item.findtext(f"{S3_NS}Key")[len(self.prefix):]
+                modified = datetime.fromisoformat(item.findtext(f"{S3_NS}LastModified").replace("Z", "+00:00"))
+                yield key, int(item.findtext(f"{S3_NS}Size") or 0), modified
+            if root.findtext(f"{S3_NS}IsTruncated") != "true":
+                break
+            token = root.findtext(f"{S3_NS}NextContinuationToken")
+
+    async def move(self, key: str, dest_key: str) -> None:
+        """S3 has no rename: server-side copy, then delete the source"""
+        source = quote(f"/{self.bucket}/{self.prefix}{key}", safe="/-_.~")
+        response = await self._client_for_loop().request(
+            **self._request_args("PUT", dest_key, extra={"x-amz-copy-source": source})
+        )
+        response.raise_for_status()
+        await self.delete(key)
+
+    def fetch_to_path(self, key: str, dest_path: str) -> None:
+        with httpx.Client(timeout=self.timeout) as client:
+            with client.stream(**self._request_args("GET", key)) as response:
+                response.raise_for_status()
+                with open(dest_path, "wb") as out:
+                    for chunk in response.iter_bytes(CHUNK_SIZE):
+                        out.write(chunk)
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
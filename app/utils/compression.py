@@ -0,0 +1,236 @@
+import os
+import re
+import threading
+import time
+import zlib
+from typing import Dict, Iterable, Optional, Pattern, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:  # br is only offered when the optional brotli package is installed
+    import brotli
+except ImportError:
+    brotli = None
+
+MINIMUM_SIZE = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+GZIP_LEVEL = 6  # on-the-fly: most of level 9's ratio for a fraction of the CPU
+BROTLI_QUALITY = 4
+PRECOMPRESSED_GZIP_LEVEL = 9  # paid once per cache fill, so spend more CPU for fewer bytes
+PRECOMPRESSED_BROTLI_QUALITY = 9
+
+# Formats that are already compressed (or must not be buffered) are sent as-is
+SKIP_CONTENT_TYPES = (
+    "application/pdf", "application/zip", "application/gzip", "application/octet-stream",
+    "application/msword", "application/vnd.openxmlformats", "image/", "audio/", "video/",
+    "font/woff", "text/event-stream",
+)
+
+
+def supported_encodings() -> Tuple[str, ...]:
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """Pick the best supported content coding from an Accept-Encoding header (None = identity)"""
+    if not accept_encoding:
+        return None
+    weights: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        weights[coding.strip().lower()] = q
+    best, best_q = None, 0.0
+    for coding in supported_encodings():  # server preference breaks ties
+        q = weights.get(coding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+
+def compress(data: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=BROTLI_QUALITY if level is None else level)
+    compressor = gzip_compressor(GZIP_LEVEL if level is None else level)
+    return compressor.compress(data) + compressor.flush()
+
+
+def gzip_compressor(level: int):
+    return zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31: gzip container
+
+
+class StreamCompressor:
+    """Incremental encoder for responses sent in several body messages"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        self._impl = brotli.Compressor(quality=BROTLI_QUALITY) if encoding == "br" else gzip_compressor(GZIP_LEVEL)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._impl.process(data) if self.encoding == "br" else self._impl.compress(data)
+
+    def finish(self) -> bytes:
+        return self._impl.finish() if self.encoding == "br" else self._impl.flush()
+
+
+def _skip_content_type(content_type: str) -> bool:
+    return any(content_type.startswith(prefix) for prefix in SKIP_CONTENT_TYPES)
+
+
+def _weaken_etag(headers: MutableHeaders):
+    # The encoded bytes differ from the identity representation a strong ETag names
+    etag = headers.get("etag")
+    if etag and not etag.startswith("W/"):
+        headers["etag"] = "W/" + etag
+
+
+def _add_vary(headers: MutableHeaders):
+    vary = headers.get("vary")
+    if not vary:
+        headers["vary"] = "Accept-Encoding"
+    elif "accept-encoding" not in vary.lower():
+        headers["vary"] = vary + ", Accept-Encoding"
+
+
+class CompressionMiddleware:
+    """gzip/br response compression negotiated from Accept-Encoding.
+
+    Bodies below `minimum_size`, responses that already carry a
+    Content-Encoding (e.g. CompressedPayload hits), partial and bodiless
+    responses, skip-listed content types and paths matching `skip_paths`
+    pass through untouched. Streamed bodies are compressed incrementally.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = MINIMUM_SIZE, skip_paths: Iterable[str] = ()):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.skip_paths: Tuple[Pattern, ...] = tuple(re.compile(p) for p in skip_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or any(p.match(scope["path"]) for p in self.skip_paths):
+            return await self.app(scope, receive, send)
+        headers = Headers(scope=scope)
+        encoding = negotiate_encoding(headers.get("accept-encoding"))
+        if encoding is None or "range" in headers:
+            return await self.app(scope, receive, send)
+        await self.app(scope, receive, _CompressingSend(send, encoding, self.minimum_size))
+
+
+class _CompressingSend:
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start: Optional[Message] = None
+        self.passthrough = False
+        self.compressor: Optional[StreamCompressor] = None
+
+    async def __call__(self, message: Message):
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                message["status"] in (204, 206, 304)
+                or "content-encoding" in headers
+                or _skip_content_type(headers.get("content-type", ""))
+            )
+            if self.passthrough:
+                await self.send(message)
+            else:
+                self.start = message  # held until the first body message decides
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            return await self.send(message)
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start is not None:
+            start, self.start = self.start, None
+            headers = MutableHeaders(scope=start)
+            if not more_body:
+                if len(body) >= self.minimum_size:
+                    body = compress(body, self.encoding)
+                    headers["content-encoding"] = self.encoding
+                    headers["content-length"] = str(len(body))
+                    _weaken_etag(headers)
+                _add_vary(headers)
+                await self.send(start)
+                return await self.send({"type": "http.response.body", "body": body})
+            self.compressor = StreamCompressor(self.encoding)
+            headers["content-encoding"] = self.encoding
+            del headers["content-length"]
+            _weaken_etag(headers)
+            _add_vary(headers)
+            await self.send(start)
+
+        if self.compressor is None:  # a short unstreamed body already went out
+            return await self.send(message)
+        data = self.compressor.compress(body)
+        if not more_body:
+            data += self.compressor.finish()
+        if data or not more_body:
+            await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+
+class CompressedPayload:
+    """Serialized response bytes plus their encoded variants, each produced at most once.
+
+    Meant for cached hot payloads: a cache hit answers with stored bytes
+    and a Content-Encoding header, which CompressionMiddleware leaves alone.
+    """
+
+    def __init__(self, body: bytes, media_type: str = "application/json"):
+        self.body = body
+        self.media_type = media_type
+        self._variants: Dict[str, bytes] = {}
+
+    def variant(self, encoding: str) -> bytes:
+        if encoding not in self._variants:
+            level = PRECOMPRESSED_BROTLI_QUALITY if encoding == "br" else PRECOMPRESSED_GZIP_LEVEL
+            self._variants[encoding] = compress(self.body, encoding, level)
+        return self._variants[encoding]
+
+    def response(self, request_headers: Headers, headers: Optional[Dict[str, str]] = None) -> Response:
+        headers = {"vary": "Accept-Encoding", **(headers or {})}
+        encoding = negotiate_encoding(request_headers.get("accept-encoding"))
+        if encoding is None or len(self.body) < MINIMUM_SIZE or "range" in request_headers:
+            return Response(self.body, media_type=self.media_type, headers=headers)
+        response = Response(self.variant(encoding), media_type=self.media_type, headers=headers)
+        response.headers["content-encoding"] = encoding
+        _weaken_etag(response.headers)
+        return response
+
+
+class PayloadCache:
+    """Small per-process TTL cache of CompressedPayloads keyed by request parameters"""
+
+    def __init__(self, ttl: float, max_entries: int = 64):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[str, Tuple[float, CompressedPayload]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CompressedPayload]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, key: str, payload: CompressedPayload) -> CompressedPayload:
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                now = time.monotonic()
+                self._entries = {k: v for k, v in self._entries.items() if v[0] >= now}
+                if len(self._entries) >= self.max_entries:
+                    self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (time.monotonic() + self.ttl, payload)
+        return payload
+
+    def clear(self):
+        with self._lock:
+            self._entries = {}
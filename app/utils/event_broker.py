@@ -0,0 +1,204 @@
+import asyncio
+import json
+import os
+from collections import deque
+from typing import Deque, Dict, Iterable, Optional, Set, Tuple
+
+import structlog
+
+from app.utils.redis_client import get_redis
+
+HEARTBEAT_SECONDS = float(os.getenv("EVENTS_HEARTBEAT_SECONDS", "20"))
+QUEUE_SIZE = 16  # events buffered per connection before the client is told to resync
+MAX_CONNECTIONS = int(os.getenv("EVENTS_MAX_CONNECTIONS", "20000"))  # per worker
+CHANNEL_PREFIX = "events:user:"
+RECONNECT_DELAY = 1.0
+
+HEARTBEAT = object()
+RESYNC = {"type": "resync"}  # sent instead of events dropped for a slow client
+
+log = structlog.get_logger()
+
+
+def user_channel(user_id: int) -> str:
+    return f"{CHANNEL_PREFIX}{user_id}"
+
+
+async def publish_events(events: Iterable[Tuple[int, Dict]]):
+    """Deliver (user_id, event) pairs to the users' open streams on whichever worker holds them
+    (one pipelined round trip; best effort, since clients resync over REST on reconnect)"""
+    events = list(events)
+    if not events:
+        return
+    try:
+        pipe = get_redis().pipeline(transaction=False)
+        for user_id, event in events:
+            pipe.publish(user_channel(user_id), json.dumps(event, default=str))
+        await pipe.execute()
+    except Exception as e:
+        log.warning("events.publish_failed", events=len(events), error=str(e))
+
+
+class Subscription:
+    """One client connection: a small bounded buffer and a wake-up signal.
+
+    Deliberately no task or timer of its own, so an idle connection costs
+    a few hundred bytes; heartbeats come from the broker's single ticker.
+    """
+
+    __slots__ = ("user_id", "events", "_ready", "overflowed")
+
+    def __init__(self, user_id: int):
+        self.user_id = user_id
+        self.events: Deque = deque()
+        self._ready = asyncio.Event()
+        self.overflowed = False
+
+    def offer(self, event):
+        if event is HEARTBEAT:
+            if not self.events:  # a pending event already proves the connection is alive
+                self.events.append(HEARTBEAT)
+        elif len(self.events) >= QUEUE_SIZE or self.overflowed:
+            # Backpressure: a client this far behind refetches over REST instead of
+            # making the worker buffer an unbounded backlog for it
+            self.events.clear()
+            self.events.append(RESYNC)
+            self.overflowed = True
+        else:
+            self.events.append(event)
+        self._ready.set()
+
+    async def next(self):
+        while not self.events:
+            self._ready.clear()
+            await self._ready.wait()
+        event = self.events.popleft()
+        if event is RESYNC:
+            self.overflowed = False
+        return event
+
+
+class EventBroker:
+    """Per-worker fan-out of Redis pub/sub events to local SSE connections.
+
+    The worker holds one pub/sub connection and subscribes it to a user's
+    channel only while that user has a connection here, so each worker
+    receives just the events it can deliver.
+    """
+
+    def __init__(self, redis_factory=get_redis, heartbeat: float = HEARTBEAT_SECONDS,
+                 max_connections: int = MAX_CONNECTIONS):
+        self.redis_factory = redis_factory
+        self.heartbeat = heartbeat
+        self.max_connections = max_connections
+        self._subscribers: Dict[int, Set[Subscription]] = {}
+        self._connections = 0
+        self._pubsub = None
+        self._subscribed = asyncio.Event()
+        self._tasks = []
+
+    @property
+    def connections(self) -> int:
+        return self._connections
+
+    def full(self) -> bool:
+        return self._connections >= self.max_connections
+
+    async def subscribe(self, user_id: int) -> Subscription:
+        self._ensure_started()
+        subscription = Subscription(user_id)
+        local = self._subscribers.setdefault(user_id, set())
+        local.add(subscription)
+        self._connections += 1
+        if len(local) == 1:
+            await self._pubsub.subscribe(user_channel(user_id))
+            self._subscribed.set()
+        return subscription
+
+    async def unsubscribe(self, subscription: Subscription):
+        local = self._subscribers.get(subscription.user_id)
+        if not local or subscription not in local:
+            return
+        local.discard(subscription)
+        self._connections -= 1
+        if not local:
+            del self._subscribers[subscription.user_id]
+            try:
+                await self._pubsub.unsubscribe(user_channel(subscription.user_id))
+            except Exception as e:
+                log.warning("events.unsubscribe_failed", error=str(e))
+
+    def dispatch(self, channel: str, data: str):
+        user_id = int(channel[len(CHANNEL_PREFIX):])
+        event = json.loads(data)
+        for subscription in self._subscribers.get(user_id, ()):
+            subscription.offer(event)
+
+    def _ensure_started(self):
+        if self._pubsub is None:
+            self._pubsub = self.redis_factory().pubsub()
+            loop = asyncio.get_running_loop()
+            self._tasks = [loop.create_task(self._listen()), loop.create_task(self._tick())]
+
+    async def _listen(self):
+        while True:
+            if not self._subscribers:
+                self._subscribed.clear()
+                await self._subscribed.wait()
+            try:
+                message = await self._pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.warning("events.listen_failed", error=str(e))
+                await asyncio.sleep(RECONNECT_DELAY)
+                await self._resubscribe()
+                continue
+            if message and message.get("type") == "message":
+                try:
+                    self.dispatch(message["channel"], message["data"])
+                except (ValueError, TypeError) as e:
+                    log.warning("events.bad_message", channel=message.get("channel"), error=str(e))
+
+    async def _resubscribe(self):
+        try:
+            channels = [user_channel(user_id) for user_id in self._subscribers]
+            if channels:
+                await self._pubsub.subscribe(*channels)
+        except Exception as e:
+            log.warning("events.resubscribe_failed", error=str(e))
+
+    async def _tick(self):
+        while True:
+            await asyncio.sleep(self.heartbeat)
+            for local in list(self._subscribers.values()):
+                for subscription in list(local):
+                    subscription.offer(HEARTBEAT)
+
+    async def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.aclose()
+            except Exception:
+                pass
+            self._pubsub = None
+
+
+def format_sse(event, event_id: Optional[int] = None) -> str:
+    if event is HEARTBEAT:
+        return ": ping\n\n"
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines.append(f"event: {event.get('type', 'message')}")
+    lines.append("data: " + json.dumps(event, default=str))
+    return "\n".join(lines) + "\n\n"
+
+
+event_broker = EventBroker()
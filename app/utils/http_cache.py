@@ -0,0 +1,113 @@
+import hashlib
+import threading
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.responses import Response
+
+
+def http_date(value: datetime) -> str:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)  # stored timestamps are naive UTC
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _etag_list(header: str):
+    return [tag.strip().removeprefix("W/") for tag in header.split(",")]
+
+
+def is_not_modified(headers: Headers, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """Whether a GET can be answered 304 (RFC 9110 13.2.2: If-None-Match wins over If-Modified-Since)"""
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = _etag_list(if_none_match)
+        return "*" in tags or etag.removeprefix("W/") in tags
+
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)  # "-0000": UTC, source unknown (RFC 5322 3.3)
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def version_etag(*parts) -> str:
+    """Strong ETag from version data (ids, counts, updated_at) rather than the rendered body"""
+    return '"' + hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=12).hexdigest() + '"'
+
+
+class ConditionalGetStats:
+    """Per-route counts of conditional-GET outcomes (per process)"""
+
+    def __init__(self):
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, route: str, not_modified: bool):
+        with self._lock:
+            counts = self._counts.setdefault(route, {"requests": 0, "not_modified": 0})
+            counts["requests"] += 1
+            counts["not_modified"] += not_modified
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            routes = {route: dict(counts) for route, counts in self._counts.items()}
+        for counts in routes.values():
+            counts["not_modified_ratio"] = round(counts["not_modified"] / counts["requests"], 4)
+        total = sum(c["requests"] for c in routes.values())
+        hits = sum(c["not_modified"] for c in routes.values())
+        return {"requests": total, "not_modified": hits,
+                "not_modified_ratio": round(hits / total, 4) if total else 0.0, "routes": routes}
+
+    def reset(self):
+        with self._lock:
+            self._counts = {}
+
+
+conditional_get_stats = ConditionalGetStats()
+
+
+def conditional_response(headers: Headers, route: str, etag: str,
+                         cache_control: str = "private, no-cache") -> Tuple[Optional[Response], Dict[str, str]]:
+    """(304 response or None, validator headers for the full response).
+
+    Call before loading or serializing the body: a match short-circuits
+    the whole read path. Every call is counted in conditional_get_stats.
+    """
+    validators = {"etag": etag, "cache-control": cache_control}
+    not_modified = is_not_modified(headers, etag)
+    conditional_get_stats.record(route, not_modified)
+    return (Response(status_code=304, headers=validators) if not_modified else None), validators
+
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+
+def parse_single_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """(start, end) inclusive for a single 'bytes=' range, or None to send the whole body.
+
+    Multi-range and malformed headers are ignored (a full 200 response is
+    always a valid answer to a Range request).
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, _, last = header[len("bytes="):].strip().partition("-")
+    try:
+        if first:
+            start, end = int(first), int(last) if last else size - 1
+        else:
+            start, end = max(size - int(last), 0), size - 1  # suffix range: last N bytes
+    except ValueError:
+        return None
+    if start >= size or start > end:
+        raise RangeNotSatisfiable()
+    return start, min(end, size - 1)
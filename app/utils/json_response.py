@@ -0,0 +1,35 @@
+from typing import Any, Generic, Iterable, List, Type, TypeVar
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class FastJSONResponse(JSONResponse):
+    """Default response class: renders with pydantic-core's serializer (Rust, writes
+    UTF-8 bytes directly) instead of the stdlib json module. Handles everything
+    jsonable_encoder produces plus datetimes, UUIDs, enums and pydantic models."""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+class ListSerializer(Generic[T]):
+    """Prebuilt serializer for a `List[schema]` response.
+
+    Validates ORM rows straight into the schema and dumps JSON bytes in one
+    pass, skipping FastAPI's intermediate dicts and the encode step. Routes
+    keep `response_model=List[schema]` for the OpenAPI docs and return
+    `serializer.response(rows)`, which FastAPI passes through untouched.
+    """
+
+    def __init__(self, item_type: Type[T]):
+        self.adapter = TypeAdapter(List[item_type])
+
+    def dump(self, rows: Iterable[Any]) -> bytes:
+        return self.adapter.dump_json(self.adapter.validate_python(list(rows), from_attributes=True))
+
+    def response(self, rows: Iterable[Any], **kwargs) -> Response:
+        return Response(self.dump(rows), media_type="application/json", **kwargs)
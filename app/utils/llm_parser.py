@@ -0,0 +1,143 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from typing import Dict, Optional
+
+MODEL = os.getenv("OPENAI_RESUME_MODEL", "gpt-4")
+BASE_URL = os.getenv("OPENAI_BASE_URL")  # e.g. a local stub server in tests
+MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))
+DEADLINE_SECONDS = float(os.getenv("LLM_DEADLINE_SECONDS", "20"))
+MAX_INPUT_TOKENS = int(os.getenv("LLM_MAX_INPUT_TOKENS", "3000"))
+# Stop calling the LLM for LLM_COOLDOWN_SECONDS once this many calls failed
+# or timed out within LLM_ERROR_WINDOW_SECONDS
+ERROR_BUDGET = int(os.getenv("LLM_ERROR_BUDGET", "5"))
+ERROR_WINDOW_SECONDS = float(os.getenv("LLM_ERROR_WINDOW_SECONDS", "60"))
+COOLDOWN_SECONDS = float(os.getenv("LLM_COOLDOWN_SECONDS", "60"))
+
+CHARS_PER_TOKEN = 4  # rough average for English prose; no tokenizer dependency
+
+# Bump whenever PROMPT changes so cached results are not reused
+PROMPT_VERSION = 1
+PROMPT = """
+Extract the following structured JSON from the resume text:
+
+{{
+    "name": "",
+    "email": "",
+    "phone": "",
+    "education": [{{"degree": "", "institution": "", "year": ""}}],
+    "experience": [{{"title": "", "company": "", "dates": "", "description": ""}}],
+    "skills": []
+}}
+
+Resume text:
+\"\"\"{text}\"\"\"
+"""
+
+
+class LLMUnavailable(Exception):
+    """The LLM path was skipped or failed; callers should use the local parser"""
+
+
+class ErrorBudget:
+    def __init__(self):
+        self.failures = deque()
+        self.open_until = 0.0
+
+    def record_failure(self):
+        now = time.monotonic()
+        self.failures.append(now)
+        while self.failures and self.failures[0] < now - ERROR_WINDOW_SECONDS:
+            self.failures.popleft()
+        if len(self.failures) >= ERROR_BUDGET:
+            self.open_until = now + COOLDOWN_SECONDS
+            self.failures.clear()
+
+    def exhausted(self) -> bool:
+        return time.monotonic() < self.open_until
+
+
+_client = None
+_semaphore: Optional[asyncio.Semaphore] = None
+_budget = ErrorBudget()
+
+
+def content_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def truncate_to_budget(text: str, max_tokens: Optional[int] = None) -> str:
+    """Keep the start of the resume within an approximate token budget, cut at a line break"""
+    max_chars = (max_tokens or MAX_INPUT_TOKENS) * CHARS_PER_TOKEN
+    if len(text) <= max_chars:
+        return text
+    cut = text.rfind("\n", 0, max_chars)
+    return text[:cut if cut > max_chars // 2 else max_chars]
+
+
+def get_client():
+    """Process-wide AsyncOpenAI client so HTTP connections are pooled and reused"""
+    global _client
+    if _client is None:
+        from openai import AsyncOpenAI
+
+        _client = AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            base_url=BASE_URL,
+            timeout=DEADLINE_SECONDS,
+            max_retries=0  # the deadline and local fallback replace retries
+        )
+    return _client
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+    return _semaphore
+
+
+def reset():
+    """Drop the client, semaphore and error budget (they are bound to one event loop)"""
+    global _client, _semaphore, _budget
+    _client, _semaphore, _budget = None, None, ErrorBudget()
+
+
+async def _request(client, text: str) -> Dict:
+    async with _get_semaphore():
+        response = await client.chat.completions.create(
+            model=MODEL,
+            messages=[{"role": "user", "content": PROMPT.format(text=text)}],
+            temperature=0,
+        )
+    return json.loads(response.choices[0].message.content)
+
+
+async def parse_with_llm(text: str) -> Dict:
+    """Parse resume text with the LLM within DEADLINE_SECONDS (queueing included).
+
+    Raises LLMUnavailable when no API key is configured, the error budget is
+    exhausted, or the call fails or misses its deadline.
+    """
+    if not os.getenv("OPENAI_API_KEY"):
+        raise LLMUnavailable("OPENAI_API_KEY is not set")
+    if _budget.exhausted():
+        raise LLMUnavailable("LLM error budget exhausted")
+
+    client = get_client()  # outside the deadline: the first call pays for imports and setup
+    try:
+        result = await asyncio.wait_for(_request(client, truncate_to_budget(text)), timeout=DEADLINE_SECONDS)
+    except asyncio.TimeoutError:
+        _budget.record_failure()
+        raise LLMUnavailable(f"LLM parse exceeded {DEADLINE_SECONDS}s deadline")
+    except Exception as e:
+        _budget.record_failure()
+        raise LLMUnavailable(f"LLM parse failed: {e}")
+
+    if not isinstance(result, dict):
+        _budget.record_failure()
+        raise LLMUnavailable("LLM returned non-object JSON")
+    return result
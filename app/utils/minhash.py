@@ -0,0 +1,76 @@
+import hashlib
+import re
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+# 128 permutations split into 16 bands of 8 rows puts the LSH threshold
+# around (1/16) ** (1/8) ~= 0.71 Jaccard similarity.
+NUM_PERM = 128
+BANDS = 16
+ROWS_PER_BAND = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+
+_MERSENNE_PRIME = np.uint64(4294967311)  # smallest prime above 2**32
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+
+_rng = np.random.default_rng(seed=20240826)
+_PERM_A = _rng.integers(1, 2**32 - 1, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.integers(0, 2**32 - 1, size=NUM_PERM, dtype=np.uint64)
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> set:
+    """Return the set of lowercase word n-grams of a text"""
+    tokens = _TOKEN_RE.findall(text.lower())
+    if len(tokens) < size:
+        return {" ".join(tokens)} if tokens else set()
+    return {" ".join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+
+def _hash_shingles(items: Iterable[str]) -> np.ndarray:
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=4).digest(), "little")
+         for s in items),
+        dtype=np.uint64,
+    )
+
+
+def compute_signature(text: str) -> Optional[bytes]:
+    """Compute a packed MinHash signature (NUM_PERM little-endian uint32) for a text"""
+    items = shingles(text or "")
+    if not items:
+        return None
+
+    hashes = _hash_shingles(items)
+    # (a * x + b) fits in uint64 because a, b and x are all below 2**32
+    permuted = (np.outer(hashes, _PERM_A) + _PERM_B) % _MERSENNE_PRIME
+    signature = np.bitwise_and(permuted, _MAX_HASH).min(axis=0)
+    return signature.astype("<u4").tobytes()
+
+
+def unpack_signature(signature: bytes) -> np.ndarray:
+    return np.frombuffer(signature, dtype="<u4")
+
+
+def estimate_similarity(sig1: bytes, sig2: bytes) -> float:
+    """Estimate Jaccard similarity from two packed signatures"""
+    return float(np.mean(unpack_signature(sig1) == unpack_signature(sig2)))
+
+
+def band_buckets(signature: bytes) -> List[int]:
+    """Hash each band of a signature to a signed 64-bit bucket key.
+
+    The band index is mixed into the hash so all buckets can live in one
+    indexed column and be looked up with a single IN query.
+    """
+    values = unpack_signature(signature)
+    buckets = []
+    for band in range(BANDS):
+        chunk = values[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]
+        digest = hashlib.blake2b(
+            band.to_bytes(2, "little") + chunk.tobytes(), digest_size=8
+        ).digest()
+        buckets.append(int.from_bytes(digest, "little", signed=True))
+    return buckets
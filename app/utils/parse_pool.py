@@ -0,0 +1,74 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Iterable, Iterator, Tuple
+
+from app.utils.resume_parser import ResumeParser
+
+PARSE_WORKERS = int(os.getenv("RESUME_PARSE_WORKERS", "0")) or max(1, (os.cpu_count() or 2) - 1)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def parse_file(file_path: str) -> Tuple[Dict, str]:
+    """Parse one resume file; runs inside a worker process"""
+    parser = ResumeParser(file_path)
+    parsed_data = parser.get_extracted_data()
+    return parsed_data, parser.text
+
+
+def get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: workers never inherit the parent's DB connections or threads
+            _pool = ProcessPoolExecutor(
+                max_workers=PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _pool
+
+
+def _reset_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def parse_many(items: Iterable[Tuple[int, str]]) -> Iterator[Tuple[int, Dict, str]]:
+    """Parse (key, file_path) pairs across the worker pool, yielding in completion order.
+
+    Failures are reported as parsed data with an "error" key, like
+    ResumeParser.get_extracted_data() does.
+    """
+    items = list(items)
+    done = set()
+    try:
+        pool = get_pool()
+        futures = {pool.submit(parse_file, path): key for key, path in items}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                parsed_data, text = future.result()
+            except BrokenProcessPool:
+                raise
+            except Exception as e:
+                parsed_data, text = {"error": f"Failed to parse resume: {e}"}, ""
+            done.add(key)
+            yield key, parsed_data, text
+    except BrokenProcessPool:
+        # A crashed worker poisons the pool; rebuild it next time and finish inline
+        _reset_pool()
+        for key, path in items:
+            if key in done:
+                continue
+            try:
+                parsed_data, text = parse_file(path)
+            except Exception as e:
+                parsed_data, text = {"error": f"Failed to parse resume: {e}"}, ""
+            yield key, parsed_data, text
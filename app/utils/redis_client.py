@@ -0,0 +1,21 @@
+import os
+from typing import Optional
+
+import redis.asyncio as redis
+
+_client: Optional[redis.Redis] = None
+
+
+def get_redis() -> redis.Redis:
+    """Process-wide async Redis client for caches and counters (REDIS_URL)"""
+    global _client
+    if _client is None:
+        _client = redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379/0"),
+                                 encoding="utf-8", decode_responses=True)
+    return _client
+
+
+def set_redis(client: Optional[redis.Redis]):
+    """Replace the shared client (tests); None makes the next get_redis() reconnect"""
+    global _client
+    _client = client
@@ -1,53 +1,45 @@
+import hashlib
 import os
 import re
+from functools import lru_cache
 from typing import Dict, List, Optional
-import PyPDF2
-import docx
 from fastapi import HTTPException
+from app.utils import text_extractors
+
+NO_SKILLS_PLACEHOLDER = "No specific skills identified - please review manually"
+# parsed data keeps only the start of the text; the full text is stored separately (resume_texts)
+TEXT_SUMMARY_CHARS = 300
+
+
+@lru_cache(maxsize=1)
+def parser_fingerprint() -> str:
+    """Short hash of the parser version and the parser/extractor source.
+
+    Any edit to the extraction code changes the fingerprint, so stale parses
+    can be found even when nobody remembered to bump ResumeParser.VERSION.
+    """
+    digest = hashlib.sha256(str(ResumeParser.VERSION).encode())
+    for path in (__file__, text_extractors.__file__):
+        with open(path, "rb") as source:
+            digest.update(source.read())
+    return digest.hexdigest()[:16]
 
 
 class ResumeParser:
+    # Bump whenever extraction logic changes so stored parses can be found and refreshed
+    VERSION = 3
+
     def __init__(self, file_path: str):
         self.file_path = file_path
         self.text = ""
 
     def extract_text(self) -> str:
-        """Extract text from PDF or DOCX files using only PyPDF2 and python-docx"""
+        """Extract text from PDF or DOCX files via the text extractor registry"""
         try:
-            if self.file_path.lower().endswith('.pdf'):
-                return self._extract_from_pdf_simple()
-            elif self.file_path.lower().endswith(('.docx', '.doc')):
-                return self._extract_from_docx()
-            else:
-                raise ValueError("Unsupported file format")
+            return text_extractors.extract_text(self.file_path)
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"Failed to extract text: {str(e)}")
 
-    def _extract_from_pdf_simple(self) -> str:
-        """Extract text from PDF using only PyPDF2"""
-        text = ""
-        try:
-            with open(self.file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Failed to read PDF: {str(e)}")
-        return text
-
-    def _extract_from_docx(self) -> str:
-        """Extract text from DOCX files"""
-        try:
-            doc = docx.Document(self.file_path)
-            text = ""
-            for paragraph in doc.paragraphs:
-                text += paragraph.text + "\n"
-            return text
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"Failed to read DOCX: {str(e)}")
-
     def extract_emails(self, text: str) -> List[str]:
         email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
         return re.findall(email_pattern, text)
@@ -105,7 +97,7 @@ class ResumeParser:
                         found_skills.add(cleaned.lower())
 
         cleaned_skills = list(set([skill.title() for skill in found_skills if skill]))
-        return cleaned_skills or ["No specific skills identified - please review manually"]
+        return cleaned_skills or [NO_SKILLS_PLACEHOLDER]
 
     def extract_education(self, text: str) -> List[str]:
         education_info = []
@@ -149,25 +141,27 @@ class ResumeParser:
     def get_extracted_data(self) -> Dict:
         try:
             self.text = self.extract_text()
-
-            if not self.text.strip():
-                return {"error": "No text could be extracted from the resume"}
-
-            emails = self.extract_emails(self.text)
-            phones = self.extract_phone_numbers(self.text)
-            skills = self.extract_skills(self.text)
-            education = self.extract_education(self.text)
-            name = self.extract_name(self.text, emails[0] if emails else None)
-
-            return {
-                "name": name,
-                "email": emails[0] if emails else None,
-                "mobile_number": phones[0] if phones else None,
-                "skills": skills,
-                "education": education,
-                "extracted_text": self.text[:1000] + "..." if len(self.text) > 1000 else self.text,
-                "no_of_pages": len(self.text) // 3000 + 1
-            }
-
+            return self.parse_text(self.text)
         except Exception as e:
             return {"error": f"Failed to parse resume: {str(e)}"}
+
+    def parse_text(self, text: str) -> Dict:
+        """Run the field extractors over already-extracted resume text"""
+        if not text.strip():
+            return {"error": "No text could be extracted from the resume"}
+
+        emails = self.extract_emails(text)
+        phones = self.extract_phone_numbers(text)
+        skills = self.extract_skills(text)
+        education = self.extract_education(text)
+        name = self.extract_name(text, emails[0] if emails else None)
+
+        return {
+            "name": name,
+            "email": emails[0] if emails else None,
+            "mobile_number": phones[0] if phones else None,
+            "skills": skills,
+            "education": education,
+            "extracted_text": text[:TEXT_SUMMARY_CHARS] + "..." if len(text) > TEXT_SUMMARY_CHARS else text,
+            "no_of_pages": len(text) // 3000 + 1
+        }
@@ -0,0 +1,78 @@
+import hashlib
+import math
+import re
+from collections import Counter
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from app.utils.resume_parser import NO_SKILLS_PLACEHOLDER
+
+# Hashed feature space: one block for resume text, one for normalized skills.
+TEXT_DIM = 2048
+SKILL_DIM = 512
+VECTOR_DIM = TEXT_DIM + SKILL_DIM
+
+# Share of the cosine score contributed by each block (must sum to 1).
+TEXT_WEIGHT = 0.6
+SKILL_WEIGHT = 0.4
+
+_DTYPE = np.float16
+_TOKEN_RE = re.compile(r"[a-z][a-z0-9+#.]*[a-z0-9+#]|[a-z]")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it of on or our that the their this to "
+    "was were will with i me my we you your he she they them his her its".split()
+)
+
+
+def normalize_skills(skills: Optional[Iterable[str]]) -> List[str]:
+    """Lowercase, strip and dedupe skills, dropping the parser's placeholder"""
+    seen = []
+    for skill in skills or []:
+        if not skill or skill == NO_SKILLS_PLACEHOLDER:
+            continue
+        cleaned = skill.lower().strip()
+        if cleaned and cleaned not in seen:
+            seen.append(cleaned)
+    return seen
+
+
+def _bucket(feature: str, dim: int) -> tuple:
+    digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "little")
+    # Signed hashing keeps collisions from systematically inflating similarity
+    return digest % dim, (1.0 if digest >> 63 else -1.0)
+
+
+def _hashed_block(counts: Counter, dim: int) -> np.ndarray:
+    block = np.zeros(dim, dtype=np.float32)
+    for feature, count in counts.items():
+        index, sign = _bucket(feature, dim)
+        block[index] += sign * (1.0 + math.log(count))  # sublinear term frequency
+    norm = np.linalg.norm(block)
+    return block / norm if norm else block
+
+
+def build_vector(text: str, skills: Optional[Iterable[str]]) -> np.ndarray:
+    """Build a weighted, L2-normalized hashed feature vector for a resume"""
+    tokens = [t for t in _TOKEN_RE.findall((text or "").lower()) if t not in _STOPWORDS]
+    text_block = _hashed_block(Counter(tokens), TEXT_DIM)
+    skill_block = _hashed_block(Counter(normalize_skills(skills)), SKILL_DIM)
+    return np.concatenate([
+        text_block * math.sqrt(TEXT_WEIGHT),
+        skill_block * math.sqrt(SKILL_WEIGHT),
+    ])
+
+
+def pack_vector(vector: np.ndarray) -> bytes:
+    return vector.astype(_DTYPE).tobytes()
+
+
+def unpack_vector(data: bytes) -> np.ndarray:
+    return np.frombuffer(data, dtype=_DTYPE).astype(np.float32)
+
+
+def similarity_scores(query: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """Cosine similarity of one vector against each row of `matrix`, clipped to [0, 1]"""
+    if matrix.size == 0:
+        return np.zeros(0, dtype=np.float32)
+    return np.clip(matrix @ query, 0.0, 1.0)
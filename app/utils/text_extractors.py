@@ -0,0 +1,132 @@
+import os
+from typing import Callable, Dict, Iterator, List, Optional
+
+# Pages (PDF) or paragraphs-per-page chunks (DOCX) beyond this are never read
+MAX_PAGES = int(os.getenv("RESUME_MAX_PAGES", "20"))
+# Stop reading once this much text has been collected; a resume's useful
+# content is at the start, and parsing cost grows with text length
+MAX_CHARS = int(os.getenv("RESUME_MAX_CHARS", "60000"))
+
+DOCX_PARAGRAPHS_PER_CHUNK = 50
+
+FORMATS = {".pdf": "pdf", ".docx": "docx", ".doc": "docx"}
+
+# Backend name -> generator yielding the text of one page at a time
+_BACKENDS: Dict[str, Callable[[str], Iterator[str]]] = {}
+
+# Default order per format, fastest first; later backends are only tried when
+# the earlier ones fail or find no text. On the synthetic benchmark corpus
+# (benchmarks/resume_parsing.py, 10-page PDFs) PyPDF2 extracts ~240 pages/s
+# with a 0.2 MB peak against pdfminer's ~11 pages/s and 5 MB.
+DEFAULT_ORDER = {
+    "pdf": ["pypdf2", "pdfminer"],
+    "docx": ["python-docx", "docx2txt"],
+}
+
+
+class UnsupportedFormatError(ValueError):
+    pass
+
+
+def register_backend(name: str):
+    """Register a page-by-page text extractor under `name`"""
+    def decorator(func: Callable[[str], Iterator[str]]):
+        _BACKENDS[name] = func
+        return func
+    return decorator
+
+
+@register_backend("pypdf2")
+def _pypdf2_pages(file_path: str) -> Iterator[str]:
+    import PyPDF2
+
+    with open(file_path, "rb") as file:
+        for page in PyPDF2.PdfReader(file).pages:  # pages are parsed lazily
+            yield page.extract_text() or ""
+
+
+@register_backend("pdfminer")
+def _pdfminer_pages(file_path: str) -> Iterator[str]:
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LTTextContainer
+
+    for layout in extract_pages(file_path):
+        yield "".join(element.get_text() for element in layout if isinstance(element, LTTextContainer))
+
+
+@register_backend("python-docx")
+def _python_docx_pages(file_path: str) -> Iterator[str]:
+    import docx
+
+    # DOCX has no fixed pages; hand out fixed-size paragraph chunks instead
+    chunk = []
+    for paragraph in docx.Document(file_path).paragraphs:
+        chunk.append(paragraph.text)
+        if len(chunk) >= DOCX_PARAGRAPHS_PER_CHUNK:
+            yield "\n".join(chunk)
+            chunk = []
+    if chunk:
+        yield "\n".join(chunk)
+
+
+@register_backend("docx2txt")
+def _docx2txt_pages(file_path: str) -> Iterator[str]:
+    import docx2txt
+
+    yield docx2txt.process(file_path) or ""
+
+
+def detect_format(file_path: str) -> str:
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in FORMATS:
+        raise UnsupportedFormatError(f"Unsupported file format: {extension or file_path}")
+    return FORMATS[extension]
+
+
+def backend_order(file_format: str) -> List[str]:
+    """Backends to try for a format; RESUME_<FORMAT>_BACKENDS overrides the default order"""
+    configured = os.getenv(f"RESUME_{file_format.upper()}_BACKENDS")
+    if configured:
+        return [name.strip() for name in configured.split(",") if name.strip()]
+    return DEFAULT_ORDER[file_format]
+
+
+def extract_with(backend: str, file_path: str, max_pages: int = MAX_PAGES,
+                 max_chars: int = MAX_CHARS) -> str:
+    """Run one backend, stopping at the page cap or once max_chars have been gathered"""
+    pages = []
+    collected = 0
+    for page_number, page_text in enumerate(_BACKENDS[backend](file_path), start=1):
+        pages.append(page_text)
+        collected += len(page_text)
+        if page_number >= max_pages or collected >= max_chars:
+            break
+    return "\n".join(pages)[:max_chars]
+
+
+def extract_text(file_path: str, max_pages: int = MAX_PAGES, max_chars: int = MAX_CHARS,
+                 backends: Optional[List[str]] = None) -> str:
+    """Extract resume text with the fastest backend for its format.
+
+    Falls back to the next backend when one raises or yields only
+    whitespace (e.g. a PDF whose text layer PyPDF2 cannot decode). Returns
+    an empty string if no backend finds any text; raises the last error if
+    every backend failed.
+    """
+    backends = backends or backend_order(detect_format(file_path))
+    last_error = None
+    any_succeeded = False
+    for backend in backends:
+        if backend not in _BACKENDS:
+            raise ValueError(f"Unknown text extraction backend: {backend}")
+        try:
+            text = extract_with(backend, file_path, max_pages=max_pages, max_chars=max_chars)
+        except Exception as e:
+            last_error = e
+            continue
+        if text.strip():
+            return text
+        any_succeeded = True
+    if last_error is not None and not any_succeeded:
+        raise last_error
+    return ""
@@ -0,0 +1,125 @@
+"""Benchmark JSON serialization of large list responses (jobs, applications, reviews).
+
+Usage:
+    python benchmarks/list_serialization.py
+    python benchmarks/list_serialization.py --rows 10000 50000 --repeat 5 --json .bench/serialization.json
+
+Each payload is serialized three ways from the same transient ORM rows:
+    fastapi    FastAPI's own path: response_model validation, dump to dicts,
+               stdlib json via JSONResponse (the behaviour before this harness existed)
+    default    the same path rendered by FastJSONResponse (the app's default class)
+    prebuilt   ListSerializer: one TypeAdapter validates the rows and emits bytes
+
+Every method must produce the same JSON document; the script checks that
+before timing anything.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+DEFAULT_ROWS = (10000,)
+DEFAULT_REPEAT = 5
+
+
+def build_rows(count: int) -> Dict[str, list]:
+    from app.models import job, resume, review, user  # noqa: F401  (configure mappers)
+    from app.models.application import Application
+    from app.models.job import Job
+    from app.models.review import Review
+
+    started = datetime(2026, 1, 1)
+    skills = ["Python", "SQL", "Docker", "React", "AWS", "Communication"]
+    jobs = [Job(id=i, title=f"Backend engineer {i}", description="Build and run hiring services. " * 8,
+                location="Nairobi", company_name=f"Company {i % 97}", skills_required=skills[: i % 6 + 1])
+            for i in range(count)]
+    applications = [Application(id=i, job_id=i % 500, applicant_id=i, cover_letter="I would love to join. " * 10,
+                                resume_file_path=f"cas:ab/{i:064x}.pdf", status="pending",
+                                parsed_resume={"name": f"Applicant {i}", "skills": skills, "experience": ["Acme"]},
+                                created_at=started + timedelta(minutes=i))
+                    for i in range(count)]
+    reviews = [Review(id=i, reviewer_id=i, reviewee_id=i % 50, rating=i % 5 + 1, comment="Great to work with.",
+                      created_at=started + timedelta(minutes=i))
+               for i in range(count)]
+    return {"jobs": jobs, "applications": applications, "reviews": reviews}
+
+
+def serializers(schema) -> Dict[str, Callable[[list], bytes]]:
+    from typing import List as ListOf
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+    from fastapi.utils import create_model_field
+
+    from app.utils.json_response import FastJSONResponse, ListSerializer
+
+    field = create_model_field(name=f"Response_{schema.__name__}", type_=ListOf[schema], mode="serialization")
+    prebuilt = ListSerializer(schema)
+
+    def fastapi_path(response_class):
+        def run(rows):
+            content = asyncio.run(serialize_response(field=field, response_content=rows))
+            return response_class(content).body
+        return run
+
+    return {
+        "fastapi": fastapi_path(JSONResponse),
+        "default": fastapi_path(FastJSONResponse),
+        "prebuilt": prebuilt.dump,
+    }
+
+
+def time_call(fn: Callable[[], bytes], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def run(row_counts: List[int], repeat: int) -> List[Dict]:
+    from app.schemas.application import ApplicationResponse
+    from app.schemas.job import ShowJobs
+    from app.schemas.review import ReviewResponse
+
+    schemas = {"jobs": ShowJobs, "applications": ApplicationResponse, "reviews": ReviewResponse}
+    results = []
+    for count in row_counts:
+        rows = build_rows(count)
+        for name, schema in schemas.items():
+            methods = serializers(schema)
+            outputs = {method: json.loads(fn(rows[name])) for method, fn in methods.items()}
+            if any(output != outputs["fastapi"] for output in outputs.values()):
+                raise SystemExit(f"{name}: serializers disagree")
+            baseline = None
+            for method, fn in methods.items():
+                seconds = time_call(lambda: fn(rows[name]), repeat)
+                baseline = baseline or seconds
+                results.append({"payload": name, "rows": count, "method": method,
+                                "ms": round(seconds * 1000, 2), "speedup": round(baseline / seconds, 2)})
+                print(f"{name:>12} {count:>7} rows  {method:>8} {seconds * 1000:>9.2f} ms  x{baseline / seconds:.2f}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=list(DEFAULT_ROWS))
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="runs per measurement (median reported)")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, os.getcwd())
+    results = run(args.rows, args.repeat)
+    if args.json:
+        os.makedirs(os.path.dirname(args.json) or ".", exist_ok=True)
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""Benchmark response compression: bytes on the wire versus CPU per request.
+
+Usage:
+    python benchmarks/response_compression.py
+    python benchmarks/response_compression.py --rows 1000 --requests 300 --json .bench/compression.json
+
+Two parts, both on synthetic job and application listings (the latter
+carrying parsed_resume documents):
+
+codecs     size, ratio and compress/decompress time for identity, gzip
+           levels 1/6/9 and brotli qualities 4/9/11 (when brotli is installed)
+serving    requests/s and bytes per response through the ASGI stack for
+           identity responses, CompressionMiddleware compressing every
+           response, and a CompressedPayload cache hit (precompressed variant)
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import zlib
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_ROWS = 1000
+DEFAULT_REPEAT = 5
+DEFAULT_REQUESTS = 200
+
+
+def payloads(rows: int) -> Dict[str, bytes]:
+    from list_serialization import build_rows
+
+    from app.schemas.application import ApplicationResponse
+    from app.schemas.job import ShowJobs
+    from app.utils.json_response import ListSerializer
+
+    data = build_rows(rows)
+    return {
+        "jobs": ListSerializer(ShowJobs).dump(data["jobs"]),
+        "applications": ListSerializer(ApplicationResponse).dump(data["applications"]),
+    }
+
+
+def median_seconds(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def codecs():
+    from app.utils import compression
+
+    table = [("gzip-1", "gzip", 1), ("gzip-6", "gzip", 6), ("gzip-9", "gzip", 9)]
+    if compression.brotli is not None:
+        table += [("br-4", "br", 4), ("br-9", "br", 9), ("br-11", "br", 11)]
+    decompress = {"gzip": lambda data: zlib.decompress(data, 31)}
+    if compression.brotli is not None:
+        decompress["br"] = compression.brotli.decompress
+    return table, decompress
+
+
+def run_codecs(bodies: Dict[str, bytes], repeat: int) -> List[Dict]:
+    from app.utils.compression import compress
+
+    table, decompress = codecs()
+    results = []
+    for name, body in bodies.items():
+        print(f"{name}: {len(body) / 1024:.0f} KiB identity")
+        for label, encoding, level in table:
+            encoded = compress(body, encoding, level)
+            row = {
+                "payload": name, "codec": label, "bytes": len(encoded),
+                "ratio": round(len(body) / len(encoded), 1),
+                "compress_ms": round(median_seconds(lambda: compress(body, encoding, level), repeat) * 1000, 2),
+                "decompress_ms": round(median_seconds(lambda: decompress[encoding](encoded), repeat) * 1000, 2),
+            }
+            results.append(row)
+            print(f"  {label:>7} {row['bytes'] / 1024:>8.1f} KiB  x{row['ratio']:<5} "
+                  f"compress {row['compress_ms']:>7} ms  decompress {row['decompress_ms']:>6} ms")
+    if len(table) == 3:
+        print("  (brotli not installed: br rows skipped)")
+    return results
+
+
+async def run_serving(bodies: Dict[str, bytes], total: int) -> List[Dict]:
+    from fastapi import FastAPI, Request
+    from fastapi.responses import Response
+    from resume_download import AsgiClient
+
+    from app.utils.compression import CompressedPayload, CompressionMiddleware, negotiate_encoding
+
+    encoding = negotiate_encoding("gzip, br")
+    results = []
+    for name, body in bodies.items():
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware)
+        cached = CompressedPayload(body)
+
+        @app.get("/raw")
+        def raw():
+            return Response(body, media_type="application/json")
+
+        @app.get("/cached")
+        def cached_hit(request: Request):
+            return cached.response(request.headers)
+
+        client = AsgiClient(app)
+        modes = [("identity", "/raw", {}), ("on-the-fly", "/raw", {"accept-encoding": "gzip, br"}),
+                 ("precompressed", "/cached", {"accept-encoding": "gzip, br"})]
+        for mode, url, headers in modes:
+            size = await client.fetch(url, headers)  # also warms the precompressed variant
+            started = time.perf_counter()
+            for _ in range(total):
+                await client.fetch(url, headers)
+            elapsed = time.perf_counter() - started
+            row = {"payload": name, "mode": mode, "encoding": encoding if headers else "identity",
+                   "bytes_per_response": size, "requests_per_second": round(total / elapsed, 1),
+                   "ms_per_request": round(elapsed / total * 1000, 3)}
+            results.append(row)
+            print(f"{name:>12} {mode:>13} {row['encoding']:>8} {size / 1024:>8.1f} KiB/resp "
+                  f"{row['requests_per_second']:>8} req/s {row['ms_per_request']:>7} ms/req")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS, help="rows per listing payload")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="runs per codec timing (median)")
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS, help="requests per serving mode")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, os.getcwd())
+    bodies = payloads(args.rows)
+    results = {"codecs": run_codecs(bodies, args.repeat), "serving": asyncio.run(run_serving(bodies, args.requests))}
+    if args.json:
+        os.makedirs(os.path.dirname(args.json) or ".", exist_ok=True)
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
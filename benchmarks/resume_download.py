@@ -0,0 +1,273 @@
+"""Benchmark concurrent resume downloads through GET /applications/{id}/resume.
+
+Usage:
+    # in-process (ASGI transport), all serving modes, default sizes/concurrency
+    python benchmarks/resume_download.py
+
+    # pick sizes (KiB) and concurrency levels, write JSON
+    python benchmarks/resume_download.py --sizes 256 4096 --concurrency 1 16 64 --json .bench/download.json
+
+    # against a running server (real sockets, sendfile) with a bearer token
+    python benchmarks/resume_download.py --url http://localhost:8000 --application-id 12 --token $TOKEN
+
+Serving modes compared in-process:
+    file      FileResponse on the local object (the production path for the local driver)
+    stream    chunked driver stream (the path taken for S3-compatible storage)
+    buffered  baseline that reads the whole file into memory per request
+
+In-process runs call the ASGI app directly and discard the body as it is
+sent: there is no socket, so they measure framework and chunking overhead
+(not sendfile) plus server-side peak memory. Use --url against a real
+server to measure network throughput.
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Dict, List
+
+DEFAULT_SIZES_KIB = (256, 2048)
+DEFAULT_CONCURRENCY = (1, 8, 32)
+DEFAULT_REQUESTS = 200
+MODES = ("file", "stream", "buffered")
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def hammer(client, url: str, concurrency: int, total: int, headers: Dict[str, str]) -> Dict:
+    """Issue `total` GETs with `concurrency` in flight; return throughput and latency figures"""
+    latencies: List[float] = []
+    received = 0
+    queue = iter(range(total))
+
+    async def worker():
+        nonlocal received
+        for _ in queue:
+            started = time.perf_counter()
+            size = await client.fetch(url, headers)
+            received += size
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": total,
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 4),
+        "requests_per_second": round(total / elapsed, 1),
+        "mib_per_second": round(received / elapsed / 2 ** 20, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+    }
+
+
+class AsgiClient:
+    """Calls the ASGI app directly and discards body chunks as they arrive, so neither
+    timings nor memory include client-side buffering (httpx's ASGI transport keeps
+    every response body in memory)."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def fetch(self, url: str, headers: Dict[str, str]) -> int:
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+            "scheme": "http", "path": url, "raw_path": url.encode(), "query_string": b"",
+            "root_path": "", "server": ("bench", 80), "client": ("127.0.0.1", 1),
+            "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        }
+        received = 0
+        status = None
+        request_sent = False
+        finished = asyncio.Event()
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await finished.wait()  # streaming responses poll for a disconnect until done
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal received, status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                received += len(message.get("body", b""))
+                if not message.get("more_body", False):
+                    finished.set()
+
+        await self.app(scope, receive, send)
+        if status != 200:
+            raise RuntimeError(f"GET {url} returned {status}")
+        return received
+
+
+class HttpClient:
+    def __init__(self, client):
+        self.client = client
+
+    async def fetch(self, url: str, headers: Dict[str, str]) -> int:
+        received = 0
+        async with self.client.stream("GET", url, headers=headers) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_raw():
+                received += len(chunk)
+        return received
+
+
+async def peak_memory(client, url: str, concurrency: int) -> float:
+    """Peak traced allocation while `concurrency` downloads are in flight
+    (a separate pass: tracemalloc slows everything down)"""
+    tracemalloc.start()
+    try:
+        await hammer(client, url, concurrency, concurrency, {})
+        return round(tracemalloc.get_traced_memory()[1] / 2 ** 20, 1)
+    finally:
+        tracemalloc.stop()
+
+
+async def build_app(mode: str, workdir: str, size_kib: int):
+    """A minimal app with the download router, a scratch SQLite db and one stored resume"""
+    from fastapi import Depends, FastAPI
+    from fastapi.responses import Response
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from starlette.datastructures import UploadFile
+
+    from app.core.dependencies import get_current_user, get_db
+    from app.database.base import Base
+    from app.models import application, job, resume, resumetext, storedfile, user  # noqa: F401
+    from app.models.application import Application
+    from app.models.user import User
+    from app.repository.applicationwithresumeparser import ApplicationWithResumeRepository
+    from app.repository.resumestorage import ResumeStorageRepository
+    from app.routes import applicationwithresumeparser
+    from app.storage.factory import set_storage_driver
+    from app.storage.local import LocalStorageDriver
+
+    class RemoteOnlyDriver(LocalStorageDriver):
+        def local_path(self, key):
+            return None
+
+    driver = (RemoteOnlyDriver if mode == "stream" else LocalStorageDriver)(os.path.join(workdir, "objects"))
+    set_storage_driver(driver)
+
+    engine = create_engine(f"sqlite:///{os.path.join(workdir, 'bench.db')}",
+                           connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    admin = User(email="admin@example.com", role="admin")
+    db.add(admin)
+    db.flush()
+    payload = os.urandom(size_kib * 1024)
+    path = await ResumeStorageRepository(db, driver).save_upload(
+        UploadFile(file=io.BytesIO(payload), filename="resume.pdf")
+    )
+    app_row = Application(job_id=1, applicant_id=admin.id, resume_file_path=path)
+    db.add(app_row)
+    db.commit()
+    app_id = app_row.id
+    admin_id = admin.id
+    db.close()
+
+    def session():
+        s = Session()
+        try:
+            yield s
+        finally:
+            s.close()
+
+    app = FastAPI()
+    app.include_router(applicationwithresumeparser.router)
+    app.dependency_overrides[get_db] = session
+    current_user = SimpleNamespace(id=admin_id, role="admin")  # detached stand-in, no per-request lookup
+    app.dependency_overrides[get_current_user] = lambda: current_user
+
+    @app.get("/buffered/{application_id}")
+    def buffered(application_id: int, db=Depends(get_db)):
+        # Same authorization lookup, then the whole file is read into memory
+        stored = ApplicationWithResumeRepository(db).get_resume_file_for_download(application_id, current_user)
+        with open(stored["local_path"], "rb") as f:
+            return Response(f.read(), media_type="application/pdf")
+
+    url = f"/buffered/{app_id}" if mode == "buffered" else f"/applications/{app_id}/resume"
+    return app, url
+
+
+async def run_in_process(sizes: List[int], modes: List[str], levels: List[int], total: int) -> List[Dict]:
+    results = []
+    for size_kib in sizes:
+        for mode in modes:
+            with tempfile.TemporaryDirectory() as workdir:
+                app, url = await build_app(mode, workdir, size_kib)
+                client = AsgiClient(app)
+                await hammer(client, url, 1, 5, {})  # warm up
+                for level in levels:
+                    row = await hammer(client, url, level, total, {})
+                    row["peak_mib"] = await peak_memory(client, url, level)
+                    results.append({"mode": mode, "size_kib": size_kib, **row})
+                    print(f"{mode:>8} {size_kib:>6} KiB  c={level:<3} "
+                          f"{row['requests_per_second']:>8} req/s {row['mib_per_second']:>8} MiB/s "
+                          f"p50 {row['p50_ms']:>7} ms  p95 {row['p95_ms']:>7} ms  "
+                          f"peak {row['peak_mib']:>6} MiB")
+    return results
+
+
+async def run_remote(base_url: str, application_id: int, token: str, levels: List[int], total: int) -> List[Dict]:
+    import httpx
+
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    results = []
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as http:
+        client = HttpClient(http)
+        url = f"/applications/{application_id}/resume"
+        for level in levels:
+            row = await hammer(client, url, level, total, headers)
+            results.append({"mode": "server", **row})
+            print(f"server c={level:<3} {row['requests_per_second']:>8} req/s {row['mib_per_second']:>8} MiB/s "
+                  f"p50 {row['p50_ms']:>7} ms  p95 {row['p95_ms']:>7} ms")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES_KIB), help="file sizes in KiB")
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    parser.add_argument("--concurrency", type=int, nargs="+", default=list(DEFAULT_CONCURRENCY))
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS, help="requests per measurement")
+    parser.add_argument("--url", help="benchmark a running server instead of in-process")
+    parser.add_argument("--application-id", type=int)
+    parser.add_argument("--token", default=os.getenv("BENCH_TOKEN", ""))
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, os.getcwd())
+    if args.url:
+        if not args.application_id:
+            parser.error("--application-id is required with --url")
+        results = asyncio.run(run_remote(args.url, args.application_id, args.token, args.concurrency, args.requests))
+    else:
+        results = asyncio.run(run_in_process(args.sizes, args.modes, args.concurrency, args.requests))
+
+    if args.json:
+        os.makedirs(os.path.dirname(args.json) or ".", exist_ok=True)
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
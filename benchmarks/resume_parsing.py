@@ -0,0 +1,384 @@
+"""Benchmark resume parsing against a deterministic synthetic corpus.
+
+Usage:
+    # build the corpus (PDF + DOCX, no network access needed)
+    python benchmarks/resume_parsing.py corpus --out .bench/corpus
+
+    # time every parsing stage on the current checkout
+    python benchmarks/resume_parsing.py run --corpus .bench/corpus --json .bench/head.json
+
+    # run the same corpus against two git revisions and flag regressions
+    python benchmarks/resume_parsing.py compare main HEAD --threshold 0.10
+
+`compare` checks each revision out into a temporary git worktree and runs
+this file against it, so the revisions do not need to contain the harness.
+Use the pseudo-revision WORKTREE for uncommitted changes.
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+PAGE_COUNTS = (1, 2, 5, 10)
+SKILL_DENSITIES = {"low": 2, "medium": 8, "high": 24}  # skill mentions per page
+LINES_PER_PAGE = 50
+DEFAULT_SEED = 1337
+DEFAULT_THRESHOLD = 0.10
+NOISE_FLOOR_SECONDS = 0.0002  # ignore regressions smaller than this per file
+STAGE_BUDGET_SECONDS = 0.5  # stop repeating a slow stage once it has used this much time
+
+FIRST_NAMES = ["Amina", "Brian", "Chloe", "Daniel", "Esther", "Felix", "Grace", "Hassan", "Irene", "Joseph"]
+LAST_NAMES = ["Otieno", "Wanjiru", "Smith", "Kamau", "Njoroge", "Garcia", "Mwangi", "Chen", "Achieng", "Patel"]
+SKILLS = [
+    "Python", "Java", "JavaScript", "TypeScript", "React", "Django", "Flask", "SQL", "PostgreSQL",
+    "MongoDB", "Redis", "Docker", "AWS", "Git", "Project Management", "Leadership", "Excel",
+    "Financial Analysis", "SEO", "Digital Marketing", "Communication", "Teamwork", "Problem Solving",
+]
+EDUCATION = [
+    "Bachelor of Science in Computer Science",
+    "Master of Business Administration",
+    "Bachelor of Commerce in Finance",
+    "Strathmore University",
+    "Kenyatta University",
+    "ALX Software Engineering Program",
+]
+WORDS = (
+    "delivered scalable services for regional clients while improving reliability and reducing "
+    "operating costs across distributed teams working on payments logistics analytics and hiring"
+).split()
+
+
+# --- corpus generation ------------------------------------------------------
+
+def resume_lines(rng: random.Random, pages: int, skill_density: int) -> List[List[str]]:
+    """Lines of one synthetic resume, grouped per page"""
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    email = name.lower().replace(" ", ".") + f"{rng.randint(1, 99)}@example.com"
+    phone = f"+254 7{rng.randint(10, 99)} {rng.randint(100, 999)} {rng.randint(100, 999)}"
+
+    result = []
+    for page in range(pages):
+        lines = [name, email, phone, ""] if page == 0 else []
+        lines.append("SKILLS:")
+        lines.append(", ".join(rng.choice(SKILLS) for _ in range(skill_density)))
+        lines.append("EDUCATION:")
+        lines.append(rng.choice(EDUCATION))
+        lines.append("EXPERIENCE:")
+        while len(lines) < LINES_PER_PAGE:
+            lines.append(" ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 14))))
+        result.append(lines)
+    return result
+
+
+def _pdf_escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf(path: str, pages: List[List[str]]):
+    """Write a minimal text-only PDF (Helvetica, one content stream per page)"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"]
+    page_ids = []
+    for lines in pages:
+        body = "BT /F1 10 Tf 12 TL 50 790 Td " + " ".join(f"({_pdf_escape(line)}) '" for line in lines) + " ET"
+        stream = body.encode("latin-1", "replace")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        page_ids.append(len(objects))
+    kids = " ".join(f"{i} 0 R" for i in page_ids).encode()
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_ids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + obj + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    with open(path, "wb") as f:
+        f.write(out)
+
+
+def write_docx(path: str, pages: List[List[str]]):
+    import docx
+
+    document = docx.Document()
+    for page_number, lines in enumerate(pages):
+        if page_number:
+            document.add_page_break()
+        for line in lines:
+            document.add_paragraph(line)
+    document.save(path)
+
+
+def build_corpus(out_dir: str, seed: int = DEFAULT_SEED, copies: int = 2,
+                 page_counts=PAGE_COUNTS) -> Dict:
+    """Generate `copies` resumes per (format, page count, skill density) combination"""
+    os.makedirs(out_dir, exist_ok=True)
+    rng = random.Random(seed)
+    files = []
+    for pages in page_counts:
+        for density_name, density in SKILL_DENSITIES.items():
+            for copy in range(copies):
+                content = resume_lines(rng, pages, density)
+                for fmt, writer in (("pdf", write_pdf), ("docx", write_docx)):
+                    name = f"resume_p{pages:02d}_{density_name}_{copy}.{fmt}"
+                    writer(os.path.join(out_dir, name), content)
+                    files.append({"file": name, "format": fmt, "pages": pages, "skills": density_name})
+
+    manifest = {"seed": seed, "copies": copies, "files": files}
+    with open(os.path.join(out_dir, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+# --- measurement ------------------------------------------------------------
+
+def _stages(path: str) -> Dict[str, Callable[[], object]]:
+    """Stage name -> zero-argument callable, for one resume file"""
+    from app.utils.resume_parser import ResumeParser
+
+    parser = ResumeParser(path)
+    text = parser.extract_text()
+    emails = parser.extract_emails(text)
+    stages = {
+        "extract_text": parser.extract_text,
+        "emails_phones": lambda: (parser.extract_emails(text), parser.extract_phone_numbers(text)),
+        "skills": lambda: parser.extract_skills(text),
+        "education": lambda: parser.extract_education(text),
+        "name": lambda: parser.extract_name(text, emails[0] if emails else None),
+        "parse_total": lambda: ResumeParser(path).get_extracted_data(),
+    }
+    try:
+        from app.repository.application import extract_resume_text
+        stages["extract_text_legacy"] = lambda: extract_resume_text(path)
+    except ImportError:
+        pass
+    try:
+        from app.utils import text_extractors
+    except ImportError:  # revisions before the extractor registry
+        return stages
+    for backend in text_extractors.DEFAULT_ORDER[text_extractors.detect_format(path)]:
+        try:
+            text_extractors.extract_with(backend, path)
+        except ImportError:
+            continue  # optional backend not installed
+        stages[f"backend:{backend}"] = lambda backend=backend: text_extractors.extract_with(backend, path)
+    return stages
+
+
+def _time_call(fn: Callable, repeat: int) -> float:
+    """Best of up to `repeat` runs; slow stages stop early after STAGE_BUDGET_SECONDS"""
+    samples = []
+    while len(samples) < repeat and sum(samples) < STAGE_BUDGET_SECONDS:
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return min(samples)
+
+
+def _peak_memory(fn: Callable) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmark(corpus_dir: str, repeat: int = 5) -> Dict:
+    """Best-of-N seconds and tracemalloc peak bytes per stage, aggregated per corpus group"""
+    with open(os.path.join(corpus_dir, "manifest.json")) as f:
+        manifest = json.load(f)
+
+    groups: Dict[str, Dict] = {}
+    for entry in manifest["files"]:
+        path = os.path.join(corpus_dir, entry["file"])
+        key = f"{entry['format']}/p{entry['pages']:02d}/{entry['skills']}"
+        group = groups.setdefault(key, {"files": 0, "pages": 0, "bytes": 0, "stages": {}})
+        group["files"] += 1
+        group["pages"] += entry["pages"]
+        group["bytes"] += os.path.getsize(path)
+
+        for stage, fn in _stages(path).items():
+            totals = group["stages"].setdefault(stage, {"seconds": 0.0, "peak_bytes": 0})
+            totals["seconds"] += _time_call(fn, repeat)
+            totals["peak_bytes"] = max(totals["peak_bytes"], _peak_memory(fn))
+
+    for group in groups.values():
+        for totals in group["stages"].values():
+            seconds = totals["seconds"] or 1e-12
+            totals["seconds_per_file"] = totals["seconds"] / group["files"]
+            totals["files_per_second"] = group["files"] / seconds
+            totals["pages_per_second"] = group["pages"] / seconds
+            totals["mb_per_second"] = group["bytes"] / seconds / 1e6
+
+    return {"python": sys.version.split()[0], "repeat": repeat, "seed": manifest["seed"], "groups": groups}
+
+
+def compare_results(base: Dict, head: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """Per format and stage timing deltas over the whole corpus.
+
+    Totals are compared rather than individual groups, which are too small
+    to be stable on their own. `regression` is set beyond the threshold.
+    """
+    def totals(result: Dict) -> Dict:
+        summed: Dict = {}
+        for key, group in result["groups"].items():
+            fmt = key.split("/", 1)[0]
+            for stage, values in group["stages"].items():
+                entry = summed.setdefault((fmt, stage), {"seconds": 0.0, "files": 0, "peak_bytes": 0})
+                entry["seconds"] += values["seconds"]
+                entry["files"] += group["files"]
+                entry["peak_bytes"] = max(entry["peak_bytes"], values["peak_bytes"])
+        return summed
+
+    base_totals, head_totals = totals(base), totals(head)
+    rows = []
+    for (fmt, stage), after in sorted(head_totals.items()):
+        before = base_totals.get((fmt, stage))
+        if not before:
+            continue
+        before_per_file = before["seconds"] / before["files"]
+        after_per_file = after["seconds"] / after["files"]
+        change = (after_per_file - before_per_file) / before_per_file if before_per_file else 0.0
+        rows.append({
+            "group": fmt,
+            "stage": stage,
+            "base_ms": before_per_file * 1000,
+            "head_ms": after_per_file * 1000,
+            "change": change,
+            "base_peak_kib": before["peak_bytes"] / 1024,
+            "head_peak_kib": after["peak_bytes"] / 1024,
+            "regression": change > threshold and after_per_file - before_per_file > NOISE_FLOOR_SECONDS,
+        })
+    return rows
+
+
+# --- git revision comparison ------------------------------------------------
+
+def _repo_root() -> str:
+    return subprocess.check_output(["git", "rev-parse", "--show-toplevel"], text=True).strip()
+
+
+def _run_at_revision(revision: str, corpus_dir: str, repeat: int, workdir: str) -> Dict:
+    root = _repo_root()
+    if revision == "WORKTREE":
+        checkout = root
+    else:
+        checkout = os.path.join(workdir, f"rev-{len(os.listdir(workdir))}")
+        subprocess.run(["git", "worktree", "add", "--detach", "--quiet", checkout, revision],
+                       cwd=root, check=True)
+
+    out = os.path.join(workdir, f"{revision.replace('/', '_')}.json")
+    try:
+        env = dict(os.environ, PYTHONPATH=checkout)
+        subprocess.run(
+            [sys.executable, "-W", "ignore", os.path.abspath(__file__), "run", "--corpus", corpus_dir,
+             "--repeat", str(repeat), "--json", out, "--quiet"],
+            cwd=checkout, env=env, check=True
+        )
+    finally:
+        if checkout != root:
+            subprocess.run(["git", "worktree", "remove", "--force", checkout], cwd=root, check=False)
+
+    with open(out) as f:
+        return json.load(f)
+
+
+def _print_comparison(rows: List[Dict], base: str, head: str):
+    print(f"{'format':<18} {'stage':<22} {base[:10]:>10} {head[:10]:>10} {'change':>8}  peak KiB")
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"{row['group']:<18} {row['stage']:<22} {row['base_ms']:>8.2f}ms {row['head_ms']:>8.2f}ms "
+              f"{row['change']:>+7.1%}  {row['base_peak_kib']:.0f} -> {row['head_peak_kib']:.0f}{flag}")
+
+
+def _print_run(result: Dict):
+    print(f"{'group':<18} {'stage':<22} {'ms/file':>9} {'files/s':>9} {'pages/s':>9} {'peak KiB':>9}")
+    for key, group in sorted(result["groups"].items()):
+        for stage, totals in sorted(group["stages"].items()):
+            print(f"{key:<18} {stage:<22} {totals['seconds_per_file'] * 1000:>9.2f} "
+                  f"{totals['files_per_second']:>9.1f} {totals['pages_per_second']:>9.1f} "
+                  f"{totals['peak_bytes'] / 1024:>9.0f}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    corpus = commands.add_parser("corpus", help="Generate the synthetic corpus")
+    corpus.add_argument("--out", required=True)
+    corpus.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    corpus.add_argument("--copies", type=int, default=2)
+    corpus.add_argument("--pages", default=",".join(map(str, PAGE_COUNTS)),
+                        help="Comma-separated page counts")
+
+    run = commands.add_parser("run", help="Benchmark the current checkout")
+    run.add_argument("--corpus", required=True)
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--json", help="Write raw results to this file")
+    run.add_argument("--quiet", action="store_true", help="Do not print the results table")
+
+    compare = commands.add_parser("compare", help="Benchmark two git revisions on the same corpus")
+    compare.add_argument("base")
+    compare.add_argument("head", nargs="?", default="WORKTREE")
+    compare.add_argument("--corpus", help="Existing corpus directory (generated if omitted)")
+    compare.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    compare.add_argument("--repeat", type=int, default=5)
+    compare.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                         help="Relative slowdown that counts as a regression (0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    if args.command == "corpus":
+        manifest = build_corpus(args.out, seed=args.seed, copies=args.copies,
+                                page_counts=[int(p) for p in args.pages.split(",")])
+        print(f"wrote {len(manifest['files'])} files to {args.out}")
+        return 0
+
+    if args.command == "run":
+        sys.path.insert(0, os.getcwd())  # benchmark the checkout we are run from
+        result = run_benchmark(args.corpus, repeat=args.repeat)
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(result, f, indent=2)
+        if not args.quiet:
+            _print_run(result)
+        return 0
+
+    workdir = tempfile.mkdtemp(prefix="resume-bench-")
+    try:
+        corpus_dir = os.path.abspath(args.corpus) if args.corpus else os.path.join(workdir, "corpus")
+        if not args.corpus:
+            build_corpus(corpus_dir, seed=args.seed)
+        runs = os.path.join(workdir, "runs")
+        os.makedirs(runs)
+        base = _run_at_revision(args.base, corpus_dir, args.repeat, runs)
+        head = _run_at_revision(args.head, corpus_dir, args.repeat, runs)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    rows = compare_results(base, head, threshold=args.threshold)
+    _print_comparison(rows, args.base, args.head)
+    regressions = [row for row in rows if row["regression"]]
+    if regressions:
+        print(f"\n{len(regressions)} stage(s) slower than {args.threshold:.0%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""Benchmark GET /resumes/search filters at production size (p50/p99 per filter mix).
+
+Usage:
+    python benchmarks/resume_search.py                          # 1M resumes in a temp SQLite file
+    python benchmarks/resume_search.py --rows 300000 --queries 100 --json .bench/search.json
+    python benchmarks/resume_search.py --database .bench/search.db     # build once, reuse on later runs
+    python benchmarks/resume_search.py --database-url postgresql://bench@localhost/bench
+
+Each query runs ResumeSearchRepository.search (exact COUNT plus the first page
+of 20 newest resumes) with words drawn at random from the generated
+vocabulary, so selective and broad queries are both in the sample. --baseline
+also times the previous LIKE '%word%' filters on education_text and
+current_position for comparison.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+DEFAULT_ROWS = 1_000_000
+DEFAULT_QUERIES = 200
+TARGET_P99_MS = 100
+BATCH_SIZE = 20_000
+
+SENIORITY = ["", "junior", "senior", "lead", "principal", "staff", "associate", "head of"]
+AREAS = ["backend", "frontend", "data", "mobile", "devops", "security", "qa", "platform", "product", "growth",
+         "sales", "marketing", "support", "finance", "people", "design", "research", "infrastructure"]
+ROLES = ["engineer", "developer", "manager", "analyst", "designer", "scientist", "specialist", "consultant"]
+DEGREES = ["bachelor of science", "master of science", "bachelor of arts", "master of arts", "phd", "mba",
+           "diploma", "bsc", "msc", "certificate"]
+SUBJECTS = ["computer science", "mathematics", "economics", "physics", "statistics", "business administration",
+            "electrical engineering", "mechanical engineering", "information systems", "psychology", "design",
+            "accounting", "marketing", "biology", "chemistry", "law", "journalism", "education"]
+CITIES = [f"city{i}" for i in range(300)]
+FIELDS = ["engineering", "marketing", "finance", "design", "sales", "operations", "data", "support"]
+SKILLS = ["python", "sql", "go", "java", "react", "aws", "docker", "excel", "seo", "figma", "kubernetes", "rust"]
+
+
+def generate(rng: random.Random, index: int) -> Dict:
+    position = " ".join(part for part in (rng.choice(SENIORITY), rng.choice(AREAS), rng.choice(ROLES)) if part)
+    education = [f"{rng.choice(DEGREES)} in {rng.choice(SUBJECTS)}, university of {rng.choice(CITIES)}"
+                 for _ in range(rng.choice((0, 1, 1, 2)))]
+    return {"field": rng.choice(FIELDS), "current_position": position, "education": education,
+            "email": f"applicant{index}@example.com", "years_experience": rng.randrange(0, 30),
+            "skills": rng.sample(SKILLS, rng.randrange(1, 5))}
+
+
+def build(db, rows: int, seed: int = 7):
+    from sqlalchemy import func, insert, select
+
+    from app.models.resume import Resume
+    from app.models.resumeskill import ResumeSkill
+    from app.models.resumeterm import ResumeTerm
+    from app.repository.resumesearch import search_columns, term_rows
+    from app.utils.resume_vectors import normalize_skills
+
+    existing = db.scalar(select(func.count(Resume.id)))
+    if existing >= rows:
+        return
+    rng = random.Random(seed)
+    started = datetime(2024, 1, 1)
+    for first in range(existing, rows, BATCH_SIZE):
+        parsed = [generate(rng, i) for i in range(first, min(first + BATCH_SIZE, rows))]
+        resume_rows = [{"id": first + n + 1, "applicant_id": None, "file_path": f"/cv/{first + n}.pdf",
+                        "parsed_data": data, "created_at": started + timedelta(minutes=first + n),
+                        **search_columns(data)} for n, data in enumerate(parsed)]
+        db.execute(insert(Resume), resume_rows)
+        db.execute(insert(ResumeSkill), [{"resume_id": row["id"], "skill": skill} for row in resume_rows
+                                         for skill in normalize_skills(row["parsed_data"]["skills"])])
+        db.execute(insert(ResumeTerm), [term for row in resume_rows for term in term_rows(row["id"], row)])
+        db.commit()
+        print(f"  built {first + len(parsed):>9} resumes", end="\r", flush=True)
+    print()
+
+
+def scenarios(rng: random.Random) -> Dict[str, Callable[[], Dict]]:
+    return {
+        "current_position": lambda: {"current_position": rng.choice(AREAS + ROLES)},
+        "position 2 words": lambda: {"current_position": f"{rng.choice(AREAS)} {rng.choice(ROLES)}"},
+        "education": lambda: {"education": rng.choice(SUBJECTS).split()[0]},
+        "education city": lambda: {"education": rng.choice(CITIES)},
+        "field+position": lambda: {"field": rng.choice(FIELDS), "current_position": rng.choice(ROLES)},
+        "skills+education": lambda: {"skills": [rng.choice(SKILLS)], "education": rng.choice(DEGREES).split()[0]},
+    }
+
+
+def like_filters(apply_search_filters):
+    """The filters before resume_terms: substring LIKE on the promoted columns"""
+    from app.models.resume import Resume
+
+    def apply(stmt, filters, per_row=False):
+        stmt = apply_search_filters(stmt, filters.model_copy(update={"education": None, "current_position": None}),
+                                    per_row)
+        if filters.education:
+            stmt = stmt.where(Resume.education_text.contains(filters.education.strip().lower(), autoescape=True))
+        if filters.current_position:
+            stmt = stmt.where(
+                Resume.current_position.contains(filters.current_position.strip().lower(), autoescape=True)
+            )
+        return stmt
+    return apply
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run(db, rows: int, queries: int, baseline: bool) -> List[Dict]:
+    from app.repository import resumesearch
+    from app.repository.resumesearch import ResumeSearchRepository
+    from app.schemas.resume import ResumeSearchFilters
+
+    repo = ResumeSearchRepository(db)
+    methods = {"terms": resumesearch.apply_search_filters}
+    if baseline:
+        methods["like"] = like_filters(methods["terms"])
+    results = []
+    for name, make in scenarios(random.Random(11)).items():
+        sample = [ResumeSearchFilters(**make()) for _ in range(queries)]
+        for method, apply_filters in methods.items():
+            resumesearch.apply_search_filters = apply_filters
+            timings, totals = [], []
+            try:
+                for filters in sample:
+                    started = time.perf_counter()
+                    totals.append(repo.search(filters, page=1, per_page=20)["total"])
+                    timings.append((time.perf_counter() - started) * 1000)
+            finally:
+                resumesearch.apply_search_filters = methods["terms"]
+            result = {"scenario": name, "method": method, "rows": rows, "queries": len(sample),
+                      "p50_ms": round(statistics.median(timings), 2), "p99_ms": round(percentile(timings, 0.99), 2),
+                      "median_matches": int(statistics.median(totals))}
+            results.append(result)
+            flag = "" if result["p99_ms"] < TARGET_P99_MS else f"  (over {TARGET_P99_MS} ms)"
+            print(f"{name:>18} {method:>6}  p50 {result['p50_ms']:>8.2f} ms  p99 {result['p99_ms']:>8.2f} ms"
+                  f"  ~{result['median_matches']:>7} matches{flag}")
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--queries", type=int, default=DEFAULT_QUERIES, help="queries per scenario")
+    parser.add_argument("--database", help="SQLite file to build into (kept and reused)")
+    parser.add_argument("--database-url", help="any SQLAlchemy URL instead of SQLite (tables are created)")
+    parser.add_argument("--baseline", action="store_true", help="also time the LIKE filters")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args(argv)
+
+    sys.path.insert(0, os.getcwd())
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from app.database.base import Base
+    from app.models import resume, resumeskill, resumeterm, user  # noqa: F401  (register tables)
+
+    scratch = None
+    url = args.database_url
+    if not url:
+        path = args.database
+        if not path:
+            scratch = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+            path = scratch.name
+        url = f"sqlite:///{path}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine, tables=[resume.Resume.__table__, resumeskill.ResumeSkill.__table__,
+                                             resumeterm.ResumeTerm.__table__])
+    db = sessionmaker(bind=engine)()
+    try:
+        build(db, args.rows)
+        results = run(db, args.rows, args.queries, args.baseline)
+    finally:
+        db.close()
+        engine.dispose()
+        if scratch:
+            os.remove(scratch.name)
+
+    if args.json:
+        os.makedirs(os.path.dirname(args.json) or ".", exist_ok=True)
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+"""Load-test the /events/stream SSE endpoint: memory per idle connection and fan-out latency.
+
+Usage:
+    python benchmarks/sse_load.py
+    python benchmarks/sse_load.py --clients 5000 --users 1000 --json .bench/sse.json
+    python benchmarks/sse_load.py --url http://localhost:8000 --token $TOKEN --clients 500
+
+In-process (default): the events router runs in this process against an
+in-memory stand-in for Redis pub/sub, and every client is a real ASGI
+request held open on /events/stream. Reports traced bytes per idle
+connection (broker subscription + streaming response + its task) and the
+time from publish_events() until every subscribed connection has written
+the event.
+
+--url: opens --clients EventSource-style streams to a running server with
+httpx and reports connect time and heartbeats; with REDIS_URL and BENCH_USER_ID
+(the token's user) set, it also publishes a test event and reports delivery latency.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from typing import Dict, List
+
+DEFAULT_CLIENTS = 2000
+DEFAULT_USERS = 500
+DEFAULT_ROUNDS = 5
+
+
+class MemoryPubSub:
+    def __init__(self, hub: "MemoryRedis"):
+        self.hub = hub
+        self.channels = set()
+        self.queue: asyncio.Queue = asyncio.Queue()
+
+    async def subscribe(self, *channels):
+        self.channels.update(channels)
+
+    async def unsubscribe(self, *channels):
+        self.channels.difference_update(channels)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=None):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        self.hub.pubsubs.remove(self)
+
+
+class MemoryPipeline:
+    def __init__(self, hub: "MemoryRedis"):
+        self.hub = hub
+        self.commands = []
+
+    def publish(self, channel, data):
+        self.commands.append((channel, data))
+
+    async def execute(self):
+        return [self.hub.deliver(channel, data) for channel, data in self.commands]
+
+
+class MemoryRedis:
+    """Just the pub/sub surface EventBroker and publish_events use"""
+
+    def __init__(self):
+        self.pubsubs: List[MemoryPubSub] = []
+
+    def pubsub(self):
+        pubsub = MemoryPubSub(self)
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+    def pipeline(self, transaction=True):
+        return MemoryPipeline(self)
+
+    def deliver(self, channel, data) -> int:
+        receivers = [p for p in self.pubsubs if channel in p.channels]
+        for pubsub in receivers:
+            pubsub.queue.put_nowait({"type": "message", "channel": channel, "data": data})
+        return len(receivers)
+
+
+class StreamClient:
+    """One open /events/stream request driven straight through ASGI"""
+
+    def __init__(self, app, user_id: int, watch: Dict[str, List["StreamClient"]]):
+        self.app = app
+        self.user_id = user_id
+        self.ready = asyncio.Event()
+        self.closed = asyncio.Event()
+        self.received_at: Dict[str, float] = {}
+        self.watch = watch
+
+    async def run(self):
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+            "scheme": "http", "path": "/events/stream", "raw_path": b"/events/stream",
+            "query_string": f"user={self.user_id}".encode(), "root_path": "",
+            "server": ("bench", 80), "client": ("127.0.0.1", 1), "headers": [],
+        }
+        request_sent = False
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await self.closed.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            body = message.get("body")
+            if not body:
+                return
+            if b"event: ready" in body:
+                self.ready.set()
+            elif b"event: bench" in body:
+                marker = json.loads(body.split(b"data: ", 1)[1])["marker"]
+                self.received_at[marker] = time.perf_counter()
+                self.watch[marker].remove(self)
+
+        await self.app(scope, receive, send)
+
+
+def build_app():
+    from fastapi import FastAPI, Query
+
+    from app.routes import events
+
+    class StreamUser:
+        def __init__(self, user_id: int):
+            self.id = user_id
+
+    def stream_user(user: int = Query(...)) -> StreamUser:
+        return StreamUser(user)  # stands in for token auth; the query string names the user
+
+    app = FastAPI()
+    app.include_router(events.router)
+    app.dependency_overrides[events.get_stream_user] = stream_user
+    return app
+
+
+async def run_in_process(clients: int, users: int, rounds: int) -> Dict:
+    from app.routes import events
+    from app.utils.event_broker import EventBroker, publish_events
+    from app.utils.redis_client import set_redis
+
+    set_redis(MemoryRedis())
+    broker = EventBroker(max_connections=clients + 1)
+    events.event_broker = broker
+    app = build_app()
+    watch: Dict[str, List[StreamClient]] = defaultdict(list)
+
+    # Warm up one connection so imports and first-call caches stay out of the measurement
+    warm = StreamClient(app, users + 1, watch)
+    warm_task = asyncio.create_task(warm.run())
+    await warm.ready.wait()
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    streams = [StreamClient(app, i % users, watch) for i in range(clients)]
+    tasks = [asyncio.create_task(stream.run()) for stream in streams]
+    await asyncio.gather(*(stream.ready.wait() for stream in streams))
+    await asyncio.sleep(0.1)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    traced = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    per_connection = traced / clients
+    print(f"{clients} idle connections for {users} users: {traced / 1024 / 1024:.1f} MiB traced, "
+          f"{per_connection / 1024:.1f} KiB per connection")
+
+    latencies = []
+    for round_no in range(rounds):
+        marker = f"r{round_no}"
+        watch[marker] = list(streams)
+        event = {"type": "bench", "marker": marker}
+        started = time.perf_counter()
+        await publish_events((user_id, event) for user_id in range(users))
+        while watch[marker]:
+            await asyncio.sleep(0.001)
+        received = [stream.received_at[marker] - started for stream in streams]
+        latencies.append({"p50_ms": statistics.median(received) * 1000, "max_ms": max(received) * 1000})
+        print(f"  fan-out round {round_no + 1}: {users} publishes -> {clients} connections, "
+              f"p50 {latencies[-1]['p50_ms']:.1f} ms, last delivered {latencies[-1]['max_ms']:.1f} ms")
+
+    for stream in streams + [warm]:
+        stream.closed.set()
+    await asyncio.gather(*tasks, warm_task)
+    assert broker.connections == 0
+    await broker.stop()
+    set_redis(None)
+    return {
+        "clients": clients, "users": users, "traced_bytes": traced,
+        "bytes_per_connection": round(per_connection),
+        "fan_out_p50_ms": round(statistics.median(r["p50_ms"] for r in latencies), 2),
+        "fan_out_max_ms": round(max(r["max_ms"] for r in latencies), 2),
+    }
+
+
+async def run_against_url(url: str, token: str, clients: int, seconds: float) -> Dict:
+    import httpx
+
+    connected, heartbeats, delivered = [], [0], []
+    marker = f"bench-{os.getpid()}"
+    ready = asyncio.Event()
+
+    async def client(http: httpx.AsyncClient):
+        started = time.perf_counter()
+        async with http.stream("GET", "/events/stream", params={"token": token}) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if line.startswith("event: ready"):
+                    connected.append(time.perf_counter() - started)
+                    if len(connected) == clients:
+                        ready.set()
+                elif line.startswith(": ping"):
+                    heartbeats[0] += 1
+                elif line.startswith("data: ") and marker in line:
+                    delivered.append(time.perf_counter())
+
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=0)
+    async with httpx.AsyncClient(base_url=url, timeout=None, limits=limits) as http:
+        tasks = [asyncio.create_task(client(http)) for _ in range(clients)]
+        await asyncio.wait_for(ready.wait(), 60)
+        print(f"{clients} streams open: connect p50 {statistics.median(connected) * 1000:.1f} ms, "
+              f"max {max(connected) * 1000:.1f} ms")
+        published = None
+        if os.getenv("REDIS_URL"):
+            from app.utils.event_broker import publish_events
+
+            user_id = int(os.environ["BENCH_USER_ID"]) if os.getenv("BENCH_USER_ID") else None
+            if user_id is None:
+                print("  set BENCH_USER_ID to the token's user id to measure delivery latency")
+            else:
+                published = time.perf_counter()
+                await publish_events([(user_id, {"type": "bench", "marker": marker})])
+        await asyncio.sleep(seconds)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    result = {"clients": clients, "connect_p50_ms": round(statistics.median(connected) * 1000, 2),
+              "connect_max_ms": round(max(connected) * 1000, 2), "heartbeats": heartbeats[0]}
+    if published is not None and delivered:
+        result["delivered"] = len(delivered)
+        result["delivery_max_ms"] = round((max(delivered) - published) * 1000, 2)
+        print(f"  event delivered to {len(delivered)}/{clients} streams, last after {result['delivery_max_ms']} ms")
+    print(f"  {heartbeats[0]} heartbeats in {seconds:.0f} s")
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=DEFAULT_CLIENTS, help="concurrent streams")
+    parser.add_argument("--users", type=int, default=DEFAULT_USERS, help="distinct users (in-process)")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="fan-out rounds (in-process)")
+    parser.add_argument("--url", help="base URL of a running server")
+    parser.add_argument("--token", help="access token for --url")
+    parser.add_argument("--seconds", type=float, default=30, help="how long to hold --url streams open")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args(argv)
+
+    if args.url:
+        if not args.token:
+            parser.error("--url needs --token")
+        result = asyncio.run(run_against_url(args.url, args.token, args.clients, args.seconds))
+    else:
+        sys.path.insert(0, os.getcwd())
+        result = asyncio.run(run_in_process(args.clients, args.users, args.rounds))
+    if args.json:
+        os.makedirs(os.path.dirname(args.json) or ".", exist_ok=True)
+        with open(args.json, "w") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
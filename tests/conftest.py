@@ -0,0 +1,175 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.database.base import Base
+from app.models import (  # noqa: F401  register mappers
+    application, applicationevent, backgroundjob, job, notification, quarantinedfile, resume, resumelsh,
+    resumeparsecache, resumeskill, resumeterm, resumetext, review, reviewstats, savedjob, storedfile, user,
+    userprofile
+)
+from app.repository.notification import ADJUST_IF_EXISTS, SET_IF_UNCHANGED
+from app.repository.savedjob import CHANGE_IF_EXISTS, FILL_IF_MISSING
+from app.utils.redis_client import set_redis
+
+
+@pytest.fixture
+def db():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+class FakeRedis:
+    """In-memory stand-in for the handful of redis.asyncio calls the app makes (TTLs are ignored)"""
+
+    def __init__(self):
+        self.data = {}
+        self.pubsubs = []
+
+    async def get(self, key):
+        value = self.data.get(key)
+        return None if value is None else str(value)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = str(value)
+        return True
+
+    async def mget(self, *keys):
+        return [await self.get(key) for key in keys]
+
+    async def incr(self, key):
+        self.data[key] = str(int(self.data.get(key, 0)) + 1)
+        return int(self.data[key])
+
+    async def expire(self, key, seconds):
+        return int(key in self.data)
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def publish(self, channel, message):
+        receivers = [pubsub for pubsub in self.pubsubs if channel in pubsub.channels]
+        for pubsub in receivers:
+            pubsub.queue.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(receivers)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    def pubsub(self):
+        pubsub = FakePubSub()
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+    async def smembers(self, key):
+        return set(self.data.get(key, ()))
+
+    async def smismember(self, key, values):
+        members = self.data.get(key, ())
+        return [int(str(value) in members) for value in values]
+
+    def register_script(self, source):
+        scripts = {
+            ADJUST_IF_EXISTS: self._adjust_if_exists,
+            SET_IF_UNCHANGED: self._set_if_unchanged,
+            CHANGE_IF_EXISTS: self._change_if_exists,
+            FILL_IF_MISSING: self._fill_if_missing,
+        }
+        assert source in scripts, "FakeRedis only implements the scripts the app registers"
+        return scripts[source]
+
+    async def _adjust_if_exists(self, keys, args):
+        await self.incr(keys[1])
+        if keys[0] not in self.data:
+            return None
+        value = max(int(self.data[keys[0]]) + int(args[0]), 0)
+        self.data[keys[0]] = str(value)
+        return value
+
+    async def _set_if_unchanged(self, keys, args):
+        if keys[0] in self.data or self.data.get(keys[1], "0") != str(args[1]):
+            return 0
+        self.data[keys[0]] = str(args[0])
+        return 1
+
+    async def _change_if_exists(self, keys, args):
+        await self.incr(keys[1])
+        if keys[0] not in self.data:
+            return None
+        members, value = self.data[keys[0]], str(args[1])
+        changed = (value not in members) if args[0] == "add" else (value in members)
+        (members.add if args[0] == "add" else members.discard)(value)
+        return int(changed)
+
+    async def _fill_if_missing(self, keys, args):
+        if keys[0] in self.data or self.data.get(keys[1], "0") != str(args[1]):
+            return 0
+        self.data[keys[0]] = {str(value) for value in args[2:]}
+        return 1
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def publish(self, channel, message):
+        self.calls.append(self.client.publish(channel, message))
+        return self
+
+    def incr(self, key):
+        self.calls.append(self.client.incr(key))
+        return self
+
+    def expire(self, key, seconds):
+        self.calls.append(self.client.expire(key, seconds))
+        return self
+
+    async def execute(self):
+        return [await call for call in self.calls]
+
+
+class FakePubSub:
+    def __init__(self):
+        self.channels = set()
+        self.queue = asyncio.Queue()
+
+    async def subscribe(self, *channels):
+        self.channels.update(channels)
+
+    async def unsubscribe(self, *channels):
+        self.channels.difference_update(channels)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=0.0):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        self.channels.clear()
+
+
+@pytest.fixture
+def fake_redis():
+    client = FakeRedis()
+    set_redis(client)
+    try:
+        yield client
+    finally:
+        set_redis(None)
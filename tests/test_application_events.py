@@ -0,0 +1,165 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.core.dependencies import get_current_user, get_db
+from app.models.application import Application
+from app.models.applicationevent import ApplicationDailyStats, ApplicationEvent
+from app.models.job import Job
+from app.models.user import User
+from app.repository import notification as notification_repo
+from app.repository.applicationevent import ApplicationEventRepository
+from app.repository.applicationwithresumeparser import ApplicationWithResumeRepository
+from app.repository.notification import NotificationOutbox
+from app.routes import analytics, applicationwithresumeparser
+
+DAY = date(2026, 10, 1)
+
+
+@pytest.fixture
+def board(db, monkeypatch):
+    monkeypatch.setattr(notification_repo, "notification_outbox",
+                        NotificationOutbox(session_factory=sessionmaker(bind=db.get_bind())))
+    employer, rival = User(email="boss@example.com", role="employer"), User(email="rival@example.com", role="employer")
+    applicant = User(email="jane@example.com", role="applicant")
+    db.add_all([employer, rival, applicant])
+    db.flush()
+    mine, theirs = (Job(title=title, description="d", location="Remote", company_name="Acme", posted_by=owner.id)
+                    for title, owner in (("Backend", employer), ("Frontend", rival)))
+    db.add_all([mine, theirs])
+    db.commit()
+    return employer, rival, applicant, mine, theirs
+
+
+def client_for(db, user):
+    app = FastAPI()
+    app.include_router(analytics.router)
+    app.include_router(applicationwithresumeparser.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: user
+    return TestClient(app)
+
+
+def at(day, hours):
+    return datetime.combine(DAY + timedelta(days=day), datetime.min.time()) + timedelta(hours=hours)
+
+
+def add_history(db, job, applicant, *steps):
+    """One application moving through (status, day, hour) steps"""
+    application = Application(job_id=job.id, applicant_id=applicant.id, status=steps[-1][0])
+    db.add(application)
+    db.flush()
+    previous = None
+    for status, day, hour in steps:
+        db.add(ApplicationEvent(application_id=application.id, job_id=job.id, from_status=previous,
+                                to_status=status, created_at=at(day, hour)))
+        previous = status
+    return application
+
+
+def test_status_changes_append_history_in_the_same_transaction(db, board):
+    employer, rival, applicant, mine, theirs = board
+    applications = [Application(job_id=mine.id, applicant_id=applicant.id, status="pending") for _ in range(3)]
+    db.add_all(applications)
+    db.commit()
+    repo = ApplicationWithResumeRepository(db)
+
+    assert repo.update_application_status(applications[0].id, "reviewed", employer_id=employer.id)
+    assert repo.update_application_status(applications[0].id, "reviewed", employer_id=employer.id)  # no-op
+    assert not repo.update_application_status(applications[0].id, "accepted", employer_id=rival.id)
+    repo.bulk_update_application_status([app.id for app in applications], "rejected", employer_id=employer.id)
+
+    history = client_for(db, applicant).get(f"/applications/{applications[0].id}/history").json()
+    assert [(item["from_status"], item["to_status"], item["actor_id"]) for item in history] == [
+        ("pending", "reviewed", employer.id), ("reviewed", "rejected", employer.id)
+    ]
+    assert db.query(ApplicationEvent).filter(ApplicationEvent.to_status == "rejected").count() == 3
+    assert client_for(db, rival).get(f"/applications/{applications[0].id}/history").status_code == 403
+
+
+def test_funnel_and_time_to_hire_are_single_windowed_queries(db, board):
+    employer, rival, applicant, mine, theirs = board
+    add_history(db, mine, applicant, ("pending", 0, 9), ("reviewed", 0, 21), ("accepted", 2, 9))
+    add_history(db, mine, applicant, ("pending", 0, 10), ("reviewed", 1, 10), ("rejected", 1, 16))
+    add_history(db, mine, applicant, ("pending", 1, 8), ("reviewed", 1, 12), ("accepted", 3, 8))
+    add_history(db, mine, applicant, ("pending", 2, 0))
+    add_history(db, theirs, applicant, ("pending", 0, 9), ("accepted", 0, 10))
+    db.commit()
+    client = client_for(db, employer)
+    queries = []
+    event.listen(db.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: queries.append(statement)
+                 if "application_events" in statement else None)
+
+    funnel = client.get("/analytics/funnel", params={"job_id": mine.id, "source": "live"}).json()
+    stages = {stage["status"]: stage for stage in funnel["stages"]}
+    assert [stage["status"] for stage in funnel["stages"]] == ["pending", "reviewed", "accepted", "rejected"]
+    assert stages["pending"]["entered"] == 4 and stages["pending"]["exited"] == 3
+    assert stages["pending"]["avg_stage_seconds"] == pytest.approx((12 + 24 + 4) * 3600 / 3)
+    assert stages["reviewed"]["conversion"] == 0.75 and stages["accepted"]["current"] == 2
+    assert len(queries) == 1 and "OVER (PARTITION BY" in queries[0]
+
+    hire = client.get("/analytics/time-to-hire", params={"source": "live"}).json()  # all of the employer's jobs
+    assert hire["hired"] == 2 and hire["min_seconds"] == pytest.approx(48 * 3600)
+    assert hire["avg_seconds"] == pytest.approx(48 * 3600)
+
+    ranged = client.get("/analytics/funnel", params={"since": "2026-10-02", "until": "2026-10-02", "source": "live"})
+    stages = {stage["status"]: stage for stage in ranged.json()["stages"]}
+    assert (stages["pending"]["entered"], stages["reviewed"]["entered"], stages["rejected"]["entered"]) == (1, 2, 1)
+    assert stages["pending"]["exited"] == 2  # stays that began the day before still end here
+
+    assert client_for(db, rival).get("/analytics/funnel", params={"job_id": mine.id}).status_code == 404
+    assert client_for(db, applicant).get("/analytics/funnel").status_code == 403
+
+
+def test_rollups_match_the_live_answer(db, board, monkeypatch):
+    employer, rival, applicant, mine, theirs = board
+    add_history(db, mine, applicant, ("pending", 0, 9), ("reviewed", 0, 21), ("accepted", 2, 9))
+    add_history(db, mine, applicant, ("pending", 0, 10), ("reviewed", 1, 10), ("rejected", 1, 16))
+    add_history(db, mine, applicant, ("pending", 1, 8), ("reviewed", 1, 12), ("accepted", 4, 8))
+    db.commit()
+    repo = ApplicationEventRepository(db)
+    for day in range(3):  # day 3 is left to the live tail
+        repo.rollup_day(DAY + timedelta(days=day))
+    repo.rollup_day(DAY)  # idempotent
+    assert db.query(ApplicationDailyStats).filter(ApplicationDailyStats.day == DAY).count() == 2
+
+    client = client_for(db, employer)
+    for params in ({}, {"since": "2026-10-02"}, {"since": "2026-10-02", "until": "2026-10-03"}):
+        live = client.get("/analytics/funnel", params={**params, "source": "live"}).json()
+        rollup = client.get("/analytics/funnel", params={**params, "source": "rollup"}).json()
+        assert rollup["source"] == "rollup"
+        for rolled, counted in zip(rollup["stages"], live["stages"]):
+            assert rolled == {**counted, "avg_stage_seconds": pytest.approx(counted["avg_stage_seconds"])}
+
+    hire = client.get("/analytics/time-to-hire", params={"source": "rollup"}).json()
+    assert hire["hired"] == 2 and hire["avg_seconds"] == pytest.approx((48 + 72) * 3600 / 2)
+
+    monkeypatch.setattr("app.repository.applicationevent.ROLLUP_THRESHOLD", 2)
+    assert client.get("/analytics/funnel").json()["source"] == "rollup"
+    monkeypatch.setattr("app.repository.applicationevent.ROLLUP_THRESHOLD", 100)
+    assert client.get("/analytics/funnel").json()["source"] == "live"
+
+
+def test_days_before_the_first_rollup_are_read_live(db, board):
+    employer, rival, applicant, mine, theirs = board
+    add_history(db, mine, applicant, ("pending", 0, 9), ("reviewed", 0, 21), ("accepted", 2, 9))
+    add_history(db, mine, applicant, ("pending", 0, 10), ("reviewed", 1, 10), ("rejected", 1, 16))
+    add_history(db, mine, applicant, ("pending", 1, 8), ("reviewed", 1, 12), ("accepted", 4, 8))
+    db.commit()
+    repo = ApplicationEventRepository(db)
+    repo.rollup_day(DAY)
+    repo.rollup_day(DAY + timedelta(days=2))  # the nightly job's first run, after a gap
+    assert repo.rollup_coverage() == (DAY + timedelta(days=2), DAY + timedelta(days=2))
+
+    client = client_for(db, employer)
+    for params in ({}, {"until": "2026-10-02"}, {"since": "2026-10-03", "until": "2026-10-03"}):
+        live = client.get("/analytics/funnel", params={**params, "source": "live"}).json()
+        rollup = client.get("/analytics/funnel", params={**params, "source": "rollup"}).json()
+        for rolled, counted in zip(rollup["stages"], live["stages"]):
+            assert rolled == {**counted, "avg_stage_seconds": pytest.approx(counted["avg_stage_seconds"])}
+    assert client.get("/analytics/time-to-hire", params={"source": "rollup"}).json()["hired"] == 2
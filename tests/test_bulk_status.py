@@ -0,0 +1,66 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.core.dependencies import get_current_employer, get_db
+from app.models.application import Application
+from app.models.job import Job
+from app.models.user import User
+from app.repository import notification as notification_repo
+from app.repository.applicationwithresumeparser import ApplicationWithResumeRepository
+from app.repository.notification import NotificationOutbox
+from app.routes import applicationwithresumeparser
+
+
+@pytest.fixture
+def board(db, monkeypatch):
+    outbox = NotificationOutbox(session_factory=sessionmaker(bind=db.get_bind()))
+    monkeypatch.setattr(notification_repo, "notification_outbox", outbox)
+    employer, rival = User(email="boss@example.com", role="employer"), User(email="rival@example.com", role="employer")
+    applicant = User(email="jane@example.com", role="applicant")
+    db.add_all([employer, rival, applicant])
+    db.flush()
+    mine, theirs = (Job(title=title, description="d", location="Remote", company_name="Acme", posted_by=owner.id)
+                    for title, owner in (("Backend", employer), ("Frontend", rival)))
+    db.add_all([mine, theirs])
+    db.flush()
+    db.add_all([Application(job_id=mine.id, applicant_id=applicant.id, status="rejected" if i % 10 == 0 else "pending")
+                for i in range(1100)])
+    db.add_all([Application(job_id=theirs.id, applicant_id=applicant.id, status="pending") for _ in range(5)])
+    db.commit()
+    return employer, outbox
+
+
+def test_bulk_reject_is_chunked_set_based_and_reports_each_id(db, board):
+    employer, outbox = board
+    app = FastAPI()
+    app.include_router(applicationwithresumeparser.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_employer] = lambda: employer
+    ids = [row.id for row in db.query(Application.id).order_by(Application.id)] + [99999]
+    updates = []
+    event.listen(db.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: updates.append(statement)
+                 if statement.startswith("UPDATE applications") else None)
+
+    body = TestClient(app).patch("/applications/status", json={"application_ids": ids, "status": "rejected"}).json()
+
+    assert (body["updated"], body["unchanged"], body["not_found"]) == (990, 110, 6)
+    assert len(updates) == 3  # 1106 ids in chunks of 500
+    assert body["results"][str(ids[0])] == "unchanged" and body["results"][str(ids[1])] == "updated"
+    assert body["results"][str(ids[-2])] == "not_found"  # another employer's application
+    assert db.query(Application).filter(Application.status == "rejected").count() == 1100
+    assert outbox.pending == 990  # one status-change notification per updated application
+
+
+def test_single_update_checks_ownership_through_posted_by(db, board):
+    employer, outbox = board
+    repo = ApplicationWithResumeRepository(db)
+    mine = db.query(Application).join(Job).filter(Job.posted_by == employer.id, Application.status == "pending").first()
+    theirs = db.query(Application).join(Job).filter(Job.posted_by != employer.id).first()
+
+    assert repo.update_application_status(mine.id, "reviewed", employer_id=employer.id)
+    assert not repo.update_application_status(theirs.id, "reviewed", employer_id=employer.id)
+    assert db.get(Application, mine.id).status == "reviewed" and outbox.pending == 1
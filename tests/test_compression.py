@@ -0,0 +1,111 @@
+import gzip
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.dependencies import get_current_user, get_db
+from app.models.user import User
+from app.routes import job
+from app.utils import compression
+from app.utils.compression import CompressionMiddleware, negotiate_encoding
+
+BIG = json.dumps([{"title": "Backend engineer", "skills": ["Python", "SQL"]}] * 200).encode()
+
+
+@pytest.mark.parametrize("header, expected", [
+    (None, None),
+    ("gzip, deflate", "gzip"),
+    ("gzip;q=0", None),
+    ("identity", None),
+    ("*;q=0.5", "gzip"),
+    ("br;q=1.0, gzip;q=0.8", "br" if compression.brotli else "gzip"),
+])
+def test_negotiate_encoding(header, expected):
+    assert negotiate_encoding(header) == expected
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=500, skip_paths=[r"^/applications/\d+/resume$"])
+
+    @app.get("/big")
+    def big():
+        return Response(BIG, media_type="application/json", headers={"etag": '"v1"'})
+
+    @app.get("/small")
+    def small():
+        return Response(b'{"ok": true}', media_type="application/json")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([BIG[:4000], BIG[4000:]]), media_type="application/x-ndjson")
+
+    @app.get("/pdf")
+    def pdf():
+        return Response(BIG, media_type="application/pdf")
+
+    @app.get("/applications/{app_id}/resume")
+    def resume(app_id: int):
+        return Response(BIG, media_type="text/plain")
+
+    return TestClient(app)
+
+
+def test_compresses_large_bodies_and_streams(client):
+    response = client.get("/big", headers={"accept-encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"v1"'
+    assert int(response.headers["content-length"]) < len(BIG) / 5
+    assert response.content == BIG
+
+    streamed = client.get("/stream", headers={"accept-encoding": "gzip"})
+    assert streamed.headers["content-encoding"] == "gzip"
+    assert streamed.content == BIG
+
+
+@pytest.mark.parametrize("path, headers", [
+    ("/small", {"accept-encoding": "gzip"}),
+    ("/pdf", {"accept-encoding": "gzip"}),
+    ("/applications/7/resume", {"accept-encoding": "gzip"}),
+    ("/big", {"accept-encoding": "identity"}),
+    ("/big", {"accept-encoding": "gzip", "range": "bytes=0-9"}),
+])
+def test_passes_through(client, path, headers):
+    response = client.get(path, headers=headers)
+    assert "content-encoding" not in response.headers
+    assert response.content in (BIG, b'{"ok": true}')
+
+
+def test_job_listing_serves_precompressed_cached_variant(db):
+    employer = User(email="boss@example.com", role="employer")
+    db.add(employer)
+    db.commit()
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+    app.include_router(job.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: employer
+    client = TestClient(app)
+    job.listing_cache.clear()
+
+    def create(i):
+        payload = {"title": f"Engineer {i}", "description": "Build things. " * 20, "location": "Nairobi",
+                   "company_name": "Acme", "skills_required": ["Python"]}
+        assert client.post("/jobs/create/", json=payload).status_code == 201
+
+    for i in range(10):
+        create(i)
+    first = client.get("/jobs/all/", headers={"accept-encoding": "gzip"})
+    assert first.headers["content-encoding"] == "gzip"
+    cached = job.listing_cache.get(first.headers["etag"].removeprefix("W/") + "?")
+    assert cached.variant("gzip") is cached.variant("gzip")
+    assert gzip.decompress(cached.variant("gzip")) == cached.body == first.content
+    assert json.loads(client.get("/jobs/all/").content) == json.loads(first.content)
+
+    create(10)  # a write in this process drops the cached pages
+    assert len(client.get("/jobs/all/", headers={"accept-encoding": "gzip"}).json()) == 11
@@ -0,0 +1,104 @@
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.datastructures import Headers
+
+from app.core.dependencies import get_current_user, get_db
+from app.models.application import Application
+from app.models.job import Job
+from app.models.user import User
+from app.routes import applicationwithresumeparser, job
+from app.utils.http_cache import conditional_get_stats, is_not_modified
+
+
+@pytest.fixture
+def setup(db):
+    employer = User(email="boss@example.com", role="employer")
+    applicant = User(email="jane@example.com", role="applicant")
+    db.add_all([employer, applicant])
+    db.flush()
+    posting = Job(title="Backend", description="Build and run hiring services. " * 50, location="Remote", company_name="Acme",
+                  skills_required=["Python"], posted_by=employer.id)
+    db.add(posting)
+    db.flush()
+    application = Application(job_id=posting.id, applicant_id=applicant.id, status="pending")
+    db.add(application)
+    db.commit()
+
+    app = FastAPI()
+    app.include_router(job.router)
+    app.include_router(applicationwithresumeparser.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: applicant
+    job.listing_cache.clear()
+    conditional_get_stats.reset()
+    return TestClient(app), posting, application
+
+
+def revalidate(client, url):
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    second = client.get(url, headers={"if-none-match": etag})
+    return etag, second
+
+
+def test_job_listing_answers_304_before_loading_rows(setup, db, monkeypatch):
+    client, posting, _ = setup
+    weak, second = revalidate(client, "/jobs/all/")  # TestClient accepts gzip: precompressed variant
+    assert weak.startswith("W/")
+    assert second.status_code == 304 and second.content == b""
+    etag = second.headers["etag"]
+    assert client.get("/jobs/all/", headers={"accept-encoding": "identity"}).headers["etag"] == etag == weak[2:]
+
+    monkeypatch.setattr(job, "list_jobs", lambda db: pytest.fail("listing loaded for a 304"))
+    assert client.get("/jobs/all/", headers={"if-none-match": etag}).status_code == 304
+    monkeypatch.undo()
+
+    posting.title = "Backend engineer"
+    db.commit()
+    changed = client.get("/jobs/all/", headers={"if-none-match": etag})
+    assert changed.status_code == 200 and changed.headers["etag"] != etag
+    assert changed.json()[0]["title"] == "Backend engineer"
+
+
+def test_job_detail_etag_follows_updated_at(setup, db):
+    client, posting, _ = setup
+    etag, second = revalidate(client, f"/jobs/{posting.id}")
+    assert second.status_code == 304
+
+    posting.location = "Nairobi"
+    db.commit()
+    assert client.get(f"/jobs/{posting.id}", headers={"if-none-match": etag}).status_code == 200
+    assert client.get("/jobs/999").status_code == 404
+
+
+def test_my_applications_revalidate_on_status_and_job_changes(setup, db):
+    client, posting, application = setup
+    etag, second = revalidate(client, "/applications/my-applications")
+    assert second.status_code == 304
+    assert second.headers["cache-control"] == "private, no-cache"
+
+    application.status = "reviewed"
+    db.commit()
+    after_status = client.get("/applications/my-applications", headers={"if-none-match": etag})
+    assert after_status.status_code == 200 and after_status.json()[0]["status"] == "reviewed"
+
+    etag = after_status.headers["etag"]
+    posting.company_name = "Acme Ltd"  # shown in the list, so it must change the validator too
+    db.commit()
+    assert client.get("/applications/my-applications", headers={"if-none-match": etag}).status_code == 200
+
+    stats = conditional_get_stats.snapshot()
+    assert stats["routes"]["applications.mine"] == {"requests": 4, "not_modified": 1, "not_modified_ratio": 0.25}
+    assert stats["requests"] == 4
+
+
+def test_if_modified_since_accepts_unknown_zone_dates():
+    last_modified = datetime(2026, 10, 1, 12, 0, 0)
+    for value, expected in (("Thu, 01 Oct 2026 12:00:00 -0000", True), ("Sun, 06 Nov 1994 08:49:37 -0000", False),
+                            ("Thu, 01 Oct 2026 12:00:00 GMT", True), ("not a date", False)):
+        headers = Headers({"if-modified-since": value})
+        assert is_not_modified(headers, '"etag"', last_modified) is expected
@@ -0,0 +1,123 @@
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.core.dependencies import get_current_employer, get_db
+from app.models.application import Application
+from app.models.job import Job
+from app.models.user import User
+from app.repository import notification as notification_repo
+from app.repository.applicationwithresumeparser import ApplicationWithResumeRepository
+from app.repository.dashboard import DashboardRepository, dashboard_invalidations, invalidate_dashboards
+from app.repository.notification import NotificationOutbox
+from app.routes import dashboard
+
+
+@pytest.fixture
+def board(db, fake_redis, monkeypatch):
+    monkeypatch.setattr(notification_repo, "notification_outbox",
+                        NotificationOutbox(session_factory=sessionmaker(bind=db.get_bind())))
+    dashboard_invalidations._pending.clear()
+    employer, rival = User(email="boss@example.com", role="employer"), User(email="rival@example.com", role="employer")
+    applicants = [User(email=f"a{i}@example.com", role="applicant") for i in range(3)]
+    db.add_all([employer, rival, *applicants])
+    db.flush()
+    backend, frontend, empty, theirs = (
+        Job(title=title, description="d", location="Remote", company_name="Acme", posted_by=owner.id)
+        for title, owner in (("Backend", employer), ("Frontend", employer), ("Design", employer), ("Ops", rival))
+    )
+    db.add_all([backend, frontend, empty, theirs])
+    db.flush()
+    earlier = datetime.utcnow() - timedelta(days=1)
+    db.add_all([
+        Application(job_id=backend.id, applicant_id=applicants[0].id, status="pending", created_at=earlier),
+        Application(job_id=backend.id, applicant_id=applicants[1].id, status="reviewed", created_at=earlier),
+        Application(job_id=frontend.id, applicant_id=applicants[0].id, status="rejected", created_at=earlier),
+        Application(job_id=theirs.id, applicant_id=applicants[2].id, status="pending", created_at=earlier),
+    ])
+    db.commit()
+    app = FastAPI()
+    app.include_router(dashboard.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_employer] = lambda: employer
+    return TestClient(app), employer, applicants, (backend, frontend, empty)
+
+
+def test_dashboard_is_one_grouped_query_then_cached_until_an_application_changes(db, board):
+    client, employer, applicants, (backend, frontend, empty) = board
+    reads = []
+    event.listen(db.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: reads.append(statement)
+                 if statement.startswith("SELECT") and "applications" in statement else None)
+
+    first = client.get("/dashboard").json()
+    assert first["cached"] is False and first["last_visit_at"] is None
+    assert first["totals"] == {"jobs": 3, "applications": 3, "new": 3, "applicants": 2,
+                               "by_status": {"pending": 1, "reviewed": 1, "accepted": 0, "rejected": 1}}
+    jobs = {job["title"]: job for job in first["jobs"]}
+    assert jobs["Backend"]["by_status"]["reviewed"] == 1 and jobs["Design"]["applications"] == 0
+    assert len(reads) == 1 and "GROUP BY" in reads[0]
+
+    second = client.get("/dashboard").json()
+    assert second["cached"] is True and second["totals"]["new"] == 0 and second["last_visit_at"] is not None
+    assert second["totals"]["by_status"] == first["totals"]["by_status"]
+    assert len(reads) == 1  # nothing arrived since the last visit: no query at all
+
+    repo = ApplicationWithResumeRepository(db)
+    pending = db.query(Application).filter(Application.job_id == backend.id, Application.status == "pending").one()
+    assert repo.update_application_status(pending.id, "accepted", employer_id=employer.id)
+    third = client.get("/dashboard").json()
+    assert third["cached"] is False and third["totals"]["by_status"]["accepted"] == 1
+
+    rejected = db.query(Application).filter(Application.job_id == frontend.id).one()
+    assert repo.delete_application(rejected.id, applicants[0].id)
+    assert client.get("/dashboard").json()["totals"]["applications"] == 2
+
+
+def test_new_since_last_visit_is_recounted_on_a_cache_hit(db, board):
+    client, employer, applicants, (backend, frontend, empty) = board
+    client.get("/dashboard")
+    db.add(Application(job_id=empty.id, applicant_id=applicants[2].id, status="pending"))
+    db.commit()
+    invalidate_dashboards(employer.id)
+
+    peek = client.get("/dashboard", params={"record_visit": False}).json()
+    assert peek["cached"] is False and peek["totals"]["new"] == 1 and peek["totals"]["applicants"] == 3
+    again = client.get("/dashboard").json()  # same last visit, served from the cache
+    assert again["cached"] is True and again["totals"]["new"] == 1
+    assert {job["title"]: job["new"] for job in again["jobs"]} == {"Backend": 0, "Frontend": 0, "Design": 1}
+    assert client.get("/dashboard").json()["totals"]["new"] == 0
+
+
+def test_queries_run_off_the_event_loop(db, board, monkeypatch):
+    client, employer, applicants, (backend, frontend, empty) = board
+    called = []
+    for name in ("compute", "count_new", "_record_visit", "_cached"):
+        original = getattr(DashboardRepository, name)
+        if name == "_cached":
+            async def wrapper(self, *args, _original=original):
+                called.append(("loop", threading.get_ident()))
+                return await _original(self, *args)
+        else:
+            def wrapper(self, *args, _original=original, _name=name):
+                called.append((_name, threading.get_ident()))
+                return _original(self, *args)
+        monkeypatch.setattr(DashboardRepository, name, wrapper)
+
+    with client:  # one event loop for every request
+        client.get("/dashboard")
+        db.add(Application(job_id=empty.id, applicant_id=applicants[2].id, status="pending"))
+        db.commit()
+        invalidate_dashboards(employer.id)
+        client.get("/dashboard", params={"record_visit": False})
+        assert client.get("/dashboard").json()["totals"]["new"] == 1  # a cache hit that recounts
+
+    loop = {ident for name, ident in called if name == "loop"}
+    queries = [(name, ident) for name, ident in called if name != "loop"]
+    assert {name for name, _ in queries} == {"compute", "count_new", "_record_visit"}
+    assert len(loop) == 1 and not loop & {ident for _, ident in queries}
@@ -0,0 +1,115 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from sqlalchemy.orm import sessionmaker
+
+from app.models.user import User
+from app.repository import notification as notification_repo
+from app.repository.notification import NotificationOutbox, notify_status_change
+from app.routes import events
+from app.utils import event_broker as broker_module
+from app.utils.event_broker import HEARTBEAT, QUEUE_SIZE, RESYNC, EventBroker, format_sse, publish_events
+
+
+async def next_event(subscription, timeout=1.0):
+    return await asyncio.wait_for(subscription.next(), timeout)
+
+
+@pytest.mark.asyncio
+async def test_events_fan_out_only_to_the_users_connections(fake_redis):
+    broker = EventBroker()
+    first, second = await broker.subscribe(1), await broker.subscribe(1)
+    other = await broker.subscribe(2)
+    pubsub = fake_redis.pubsubs[0]
+    assert len(fake_redis.pubsubs) == 1  # one pub/sub connection per worker
+    assert pubsub.channels == {"events:user:1", "events:user:2"}
+
+    await publish_events([(1, {"type": "application_status", "application_id": 7, "status": "reviewed"})])
+    assert (await next_event(first))["status"] == "reviewed"
+    assert (await next_event(second))["application_id"] == 7
+    assert not other.events
+
+    await broker.unsubscribe(first)
+    assert "events:user:1" in pubsub.channels
+    await broker.unsubscribe(second)
+    assert pubsub.channels == {"events:user:2"} and broker.connections == 1
+    await broker.stop()
+
+
+@pytest.mark.asyncio
+async def test_slow_client_gets_resync_instead_of_unbounded_backlog(fake_redis):
+    broker = EventBroker()
+    slow = await broker.subscribe(1)
+    for i in range(QUEUE_SIZE * 3):
+        slow.offer({"type": "notification", "id": i})
+        assert len(slow.events) <= QUEUE_SIZE
+    assert await next_event(slow) is RESYNC
+    slow.offer({"type": "notification", "id": 99})
+    assert (await next_event(slow))["id"] == 99
+    await broker.stop()
+
+
+@pytest.mark.asyncio
+async def test_idle_connections_get_heartbeats(fake_redis):
+    broker = EventBroker(heartbeat=0.01)
+    idle = await broker.subscribe(1)
+    assert await next_event(idle) is HEARTBEAT
+    assert format_sse(HEARTBEAT) == ": ping\n\n"
+    await broker.stop()
+
+
+@pytest.mark.asyncio
+async def test_flushed_status_change_reaches_the_stream(db, fake_redis, monkeypatch):
+    applicant = User(email="jane@example.com", role="applicant")
+    db.add(applicant)
+    db.commit()
+    outbox = NotificationOutbox(session_factory=sessionmaker(bind=db.get_bind()))
+    monkeypatch.setattr(notification_repo, "notification_outbox", outbox)
+    broker = EventBroker()
+    monkeypatch.setattr(events, "event_broker", broker)
+
+    app = FastAPI()
+    app.include_router(events.router)
+    app.dependency_overrides[events.get_stream_user] = lambda: applicant
+    chunks, disconnect, requested = [], asyncio.Event(), []
+
+    async def receive():
+        if not requested:
+            requested.append(True)
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnect.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            chunks.append(dict(message["headers"])[b"content-type"])
+        elif message.get("body"):
+            chunks.append(message["body"].decode())
+            if "application_status" in chunks[-1]:
+                disconnect.set()
+
+    scope = {"type": "http", "method": "GET", "path": "/events/stream", "raw_path": b"/events/stream",
+             "query_string": b"", "headers": [], "root_path": "", "scheme": "http", "http_version": "1.1",
+             "server": ("test", 80), "client": ("127.0.0.1", 1), "asgi": {"version": "3.0"}}
+    stream = asyncio.create_task(app(scope, receive, send))
+    while broker.connections == 0:
+        await asyncio.sleep(0.01)
+
+    notify_status_change(applicant.id, 7, "Backend", "reviewed")
+    await outbox.flush()
+    await asyncio.wait_for(stream, 2)
+
+    assert chunks[0].startswith(b"text/event-stream")
+    assert chunks[1].startswith("retry: 5000") and "event: ready" in chunks[1]
+    payloads = [json.loads(chunk.split("data: ")[1]) for chunk in chunks[2:]]
+    assert [p["type"] for p in payloads] == ["notification", "application_status"]
+    assert payloads[0]["message"] == "Your application for Backend is now reviewed"
+    assert payloads[1] == {"type": "application_status", "application_id": 7, "status": "reviewed"}
+    assert broker.connections == 0  # disconnect released the subscription
+    await broker.stop()
+
+
+def test_module_broker_is_shared_by_routes():
+    assert events.event_broker is broker_module.event_broker
@@ -0,0 +1,91 @@
+import json
+from datetime import datetime
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.dependencies import get_current_employer, get_current_user, get_db
+from app.models.application import Application
+from app.models.job import Job
+from app.models.review import Review
+from app.models.user import User
+from app.routes import applicationwithresumeparser, job, review
+from app.schemas.review import ReviewResponse
+from app.utils.json_response import FastJSONResponse, ListSerializer
+
+
+def make_client(db):
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.include_router(job.router)
+    app.include_router(review.router)
+    app.dependency_overrides[get_db] = lambda: db
+    job.listing_cache.clear()
+    return TestClient(app)
+
+
+def test_list_endpoints_emit_the_same_documents_as_response_model(db):
+    employer = User(email="boss@example.com", role="employer")
+    db.add(employer)
+    db.flush()
+    db.add_all([
+        Job(title=f"Développeur {i}", description="d", location="Nairobi", company_name="Acme",
+            skills_required=["Python", "SQL"][: i + 1], posted_by=employer.id)
+        for i in range(2)
+    ])
+    db.add(Review(reviewer_id=employer.id, reviewee_id=employer.id, rating=5, comment=None,
+                  created_at=datetime(2026, 3, 1, 9, 30)))
+    db.commit()
+    client = make_client(db)
+
+    jobs = client.get("/jobs/all/")
+    assert jobs.headers["content-type"] == "application/json"
+    assert jobs.json() == [
+        {"title": "Développeur 0", "description": "d", "location": "Nairobi", "company_name": "Acme",
+         "skills_required": ["Python"]},
+        {"title": "Développeur 1", "description": "d", "location": "Nairobi", "company_name": "Acme",
+         "skills_required": ["Python", "SQL"]},
+    ]
+
+    reviews = client.get(f"/reviews/user/{employer.id}")
+    assert reviews.json() == [{"rating": 5, "comment": None, "id": 1, "reviewer_id": employer.id,
+                               "reviewee_id": employer.id, "created_at": "2026-03-01T09:30:00"}]
+
+
+def test_application_lists_are_rendered_by_their_serializers(db):
+    employer, applicant = User(email="boss@example.com", role="employer"), User(email="zoë@example.com", role="applicant")
+    db.add_all([employer, applicant])
+    db.flush()
+    posting = Job(title="Backend", description="d", location="Remote", company_name="Acme", posted_by=employer.id)
+    db.add(posting)
+    db.flush()
+    db.add(Application(job_id=posting.id, applicant_id=applicant.id, status="pending", cover_letter="Hi",
+                       parsed_resume={"skills": ["Python"]}, created_at=datetime(2026, 3, 1, 9, 30)))
+    db.commit()
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.include_router(applicationwithresumeparser.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: applicant
+    app.dependency_overrides[get_current_employer] = lambda: employer
+    client = TestClient(app)
+
+    mine = client.get("/applications/my-applications")
+    assert mine.headers["etag"] and mine.json() == [
+        {"id": 1, "job_id": posting.id, "job_title": "Backend", "company_name": "Acme", "status": "pending",
+         "parsed_resume": {"skills": ["Python"]}, "created_at": "2026-03-01T09:30:00"}
+    ]
+    assert client.get(f"/applications/job/{posting.id}/applications").json() == [
+        {"id": 1, "applicant_id": applicant.id, "applicant_name": "zoë@example.com",
+         "applicant_email": "zoë@example.com", "status": "pending", "cover_letter": "Hi",
+         "parsed_resume": {"skills": ["Python"]}, "created_at": "2026-03-01T09:30:00"}
+    ]
+
+
+def test_default_response_class_renders_utf8_and_datetimes():
+    body = FastJSONResponse({"name": "Zoë", "at": datetime(2026, 1, 2, 3, 4, 5), "tags": ("a",)}).body
+    assert json.loads(body) == {"name": "Zoë", "at": "2026-01-02T03:04:05", "tags": ["a"]}
+    assert "Zoë".encode() in body
+
+
+def test_list_serializer_accepts_any_iterable_of_rows():
+    rows = (Review(id=i, reviewer_id=1, reviewee_id=2, rating=3, created_at=datetime(2026, 1, 1)) for i in range(3))
+    assert [item["id"] for item in json.loads(ListSerializer(ReviewResponse).dump(rows))] == [0, 1, 2]
@@ -0,0 +1,115 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from sqlalchemy import event
+
+from app.models.resumeparsecache import ResumeParseCache
+from app.models.user import User
+from app.repository.application import parse_resume_with_openai
+from app.utils import llm_parser
+
+RESUME_TEXT = "Jane Doe\njane@example.com\nSKILLS:\nPython, SQL\nBachelor of Science in Computer Science\n"
+LLM_RESULT = {"name": "Jane Doe", "email": "jane@example.com", "skills": ["Python", "SQL"]}
+
+
+class StubOpenAI(BaseHTTPRequestHandler):
+    """Minimal /chat/completions endpoint; behaviour is set on the server object"""
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append(body)
+        time.sleep(self.server.delay)
+        if self.server.status != 200:
+            self.send_response(self.server.status)
+            self.end_headers()
+            return
+        payload = json.dumps({
+            "id": "chatcmpl-stub", "object": "chat.completion", "created": 0, "model": body["model"],
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": json.dumps(LLM_RESULT)}}],
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubOpenAI)
+    server.requests, server.delay, server.status = [], 0.0, 200
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(llm_parser, "BASE_URL", f"http://127.0.0.1:{server.server_port}/v1")
+    monkeypatch.setattr(llm_parser, "DEADLINE_SECONDS", 0.5)
+    llm_parser.reset()
+    yield server
+    llm_parser.reset()
+    server.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_llm_result_is_cached_by_content_hash(db, stub_server):
+    first = await parse_resume_with_openai(db, RESUME_TEXT)
+    second = await parse_resume_with_openai(db, RESUME_TEXT)
+
+    assert first["source"] == "llm" and first["skills"] == ["Python", "SQL"]
+    assert second == first
+    assert len(stub_server.requests) == 1
+    assert db.query(ResumeParseCache).count() == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_is_used_off_the_loop_and_outside_the_callers_transaction(db, stub_server):
+    threads = []
+    event.listen(db.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: threads.append(threading.get_ident())
+                 if "resume_parse_cache" in statement else None)
+    pending = User(email="pending@example.com", role="applicant")
+    db.add(pending)
+
+    await parse_resume_with_openai(db, RESUME_TEXT)
+    await parse_resume_with_openai(db, RESUME_TEXT)
+    assert len(threads) == 3 and threading.get_ident() not in threads  # lookup, insert, lookup
+    assert pending in db.new  # the cache commit neither flushed nor discarded the caller's work
+    db.commit()
+    assert db.query(User).filter_by(email="pending@example.com").count() == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_llm_falls_back_to_local_parser(db, stub_server):
+    stub_server.delay = 1.0
+    started = time.monotonic()
+    result = await parse_resume_with_openai(db, RESUME_TEXT)
+
+    assert time.monotonic() - started < 1.0
+    assert result["source"] == "local"
+    assert result["email"] == "jane@example.com"
+    assert db.query(ResumeParseCache).count() == 0
+
+
+@pytest.mark.asyncio
+async def test_error_budget_stops_calling_the_llm(db, stub_server, monkeypatch):
+    monkeypatch.setattr(llm_parser, "ERROR_BUDGET", 2)
+    stub_server.status = 500
+
+    for i in range(4):
+        result = await parse_resume_with_openai(db, RESUME_TEXT + str(i))
+        assert result["source"] == "local"
+    assert len(stub_server.requests) == 2
+
+
+def test_truncate_to_budget_cuts_at_line_break():
+    text = "\n".join(f"line {i:04d}" for i in range(1000))
+    truncated = llm_parser.truncate_to_budget(text, max_tokens=100)
+
+    assert len(truncated) <= 100 * llm_parser.CHARS_PER_TOKEN
+    assert text.startswith(truncated) and truncated.endswith("line 0039")
@@ -0,0 +1,57 @@
+from app.models.resume import Resume
+from app.models.user import User
+from app.repository.resumededup import ResumeDedupRepository
+from app.utils.minhash import compute_signature, estimate_similarity, band_buckets, BANDS
+
+BASE_TEXT = (
+    "Jane Doe Senior Backend Engineer jane.doe@example.com "
+    "Experience building distributed systems in Python and Go at Acme Corp for six years. "
+    "Designed PostgreSQL schemas, Redis caches and Kafka pipelines serving millions of users. "
+    "Led a team of five engineers and mentored interns. "
+    "Education Bachelor of Science in Computer Science University of Nairobi. "
+    "Skills Python Go Docker Kubernetes AWS SQL Redis FastAPI Django Flask"
+)
+
+
+def test_signature_is_deterministic_and_compact():
+    sig = compute_signature(BASE_TEXT)
+    assert sig == compute_signature(BASE_TEXT)
+    assert len(sig) == 512
+    assert len(band_buckets(sig)) == BANDS
+    assert compute_signature("") is None
+
+
+def test_similarity_separates_near_duplicates_from_unrelated():
+    edited = BASE_TEXT.replace("six years", "seven years").replace("five engineers", "six engineers")
+    unrelated = (
+        "John Smith Registered Nurse with ten years of experience in intensive care units. "
+        "Certified in advanced cardiac life support and patient triage across county hospitals."
+    )
+    base_sig = compute_signature(BASE_TEXT)
+    assert estimate_similarity(base_sig, compute_signature(edited)) > 0.7
+    assert estimate_similarity(base_sig, compute_signature(unrelated)) < 0.2
+
+
+def test_lsh_lookup_finds_near_duplicate_resumes(db):
+    users = [User(email=f"user{i}@example.com", role="applicant") for i in range(3)]
+    db.add_all(users)
+    db.flush()
+
+    texts = [
+        BASE_TEXT,
+        BASE_TEXT.replace("Acme Corp", "Acme Corporation"),
+        "Completely different resume for a pastry chef who loves sourdough and croissants.",
+    ]
+    resumes = []
+    repo = ResumeDedupRepository(db)
+    for user, text in zip(users, texts):
+        resume = Resume(applicant_id=user.id, file_path=f"/tmp/{user.id}.pdf", parsed_data={})
+        db.add(resume)
+        db.flush()
+        repo.index_resume(resume, text)
+        resumes.append(resume)
+    db.commit()
+
+    matches = repo.find_near_duplicates(resumes[0].id)
+    assert [m["resume_id"] for m in matches] == [resumes[1].id]
+    assert repo.find_near_duplicates(resumes[2].id) == []
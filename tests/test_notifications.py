@@ -0,0 +1,140 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.core.dependencies import get_current_user, get_db
+from app.models.application import Application
+from app.models.job import Job
+from app.models.notification import Notification
+from app.models.user import User
+from app.repository import notification as notification_repo
+from app.repository.applicationwithresumeparser import ApplicationWithResumeRepository
+from app.repository.notification import NotificationOutbox, NotificationRepository, unread_key
+from app.routes import notification
+
+
+@pytest.fixture
+def people(db):
+    employer = User(email="boss@example.com", role="employer")
+    applicant = User(email="jane@example.com", role="applicant")
+    db.add_all([employer, applicant])
+    db.commit()
+    return employer, applicant
+
+
+@pytest.fixture
+def outbox(db, monkeypatch):
+    box = NotificationOutbox(session_factory=sessionmaker(bind=db.get_bind()), batch_size=10)
+    monkeypatch.setattr(notification_repo, "notification_outbox", box)
+    return box
+
+
+@pytest.mark.asyncio
+async def test_status_changes_are_buffered_then_written_in_batches(db, people, outbox, fake_redis, monkeypatch):
+    employer, applicant = people
+    job = Job(title="Backend", description="d", location="Remote", company_name="Acme", posted_by=employer.id)
+    db.add(job)
+    db.flush()
+    application = Application(job_id=job.id, applicant_id=applicant.id)
+    db.add(application)
+    db.commit()
+    repo = NotificationRepository(db)
+    assert await repo.unread_count(applicant.id) == 0  # builds the counter from the table
+
+    # The request path only appends to the buffer
+    inserts = []
+    real_insert = notification_repo.insert_notifications
+
+    def counting_insert(db, rows):
+        inserts.append(len(rows))
+        return real_insert(db, rows)
+
+    monkeypatch.setattr(notification_repo, "insert_notifications", counting_insert)
+    ApplicationWithResumeRepository(db).update_application_status(application.id, "reviewed")
+    for i in range(24):
+        outbox.enqueue(applicant.id, f"note {i}")
+    assert db.query(Notification).count() == 0 and outbox.pending == 25
+
+    assert await outbox.flush() == 25
+    assert inserts == [10, 10, 5]
+    assert db.query(Notification).filter_by(user_id=applicant.id).first().message == \
+        "Your application for Backend is now reviewed"
+
+    # The badge is now served from Redis alone
+    monkeypatch.setattr(NotificationRepository, "count_unread", lambda self, user_id: pytest.fail("hit the DB"))
+    assert await repo.unread_count(applicant.id) == 25
+    newest = db.query(Notification.id).order_by(Notification.id.desc()).first()[0]
+    assert await repo.mark_read(applicant.id, ids=[newest, newest - 1]) == 2
+    assert await repo.unread_count(applicant.id) == 23
+    assert await repo.mark_read(applicant.id) == 23
+    assert fake_redis.data[unread_key(applicant.id)] == "0"
+
+
+@pytest.mark.asyncio
+async def test_a_rebuilt_counter_that_raced_a_write_is_not_stored(db, people, fake_redis, monkeypatch):
+    _, applicant = people
+    db.add(Notification(user_id=applicant.id, message="old", is_read=False))
+    db.commit()
+    count_table = NotificationRepository.count_unread
+
+    def count_then_notify(self, user_id):
+        count = count_table(self, user_id)
+        # A notification lands after the table was counted but before the counter is stored
+        db.add(Notification(user_id=user_id, message="new", is_read=False))
+        db.commit()
+        with ThreadPoolExecutor(1) as flusher:  # its own event loop, as the outbox task would be
+            flusher.submit(asyncio.run, notification_repo.adjust_unread({user_id: 1})).result()
+        return count
+
+    monkeypatch.setattr(NotificationRepository, "count_unread", count_then_notify)
+    assert await NotificationRepository(db).unread_count(applicant.id) == 1
+    assert unread_key(applicant.id) not in fake_redis.data  # the stale count was thrown away
+    monkeypatch.setattr(NotificationRepository, "count_unread", count_table)
+    assert await NotificationRepository(db).unread_count(applicant.id) == 2
+    assert fake_redis.data[unread_key(applicant.id)] == "2"
+
+
+@pytest.mark.asyncio
+async def test_failed_batches_are_retried_then_dropped(people, outbox, fake_redis, monkeypatch):
+    _, applicant = people
+    attempts = []
+
+    def failing_write(rows):
+        attempts.append(len(rows))
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(outbox, "_write", failing_write)
+    outbox.enqueue(applicant.id, "hello")
+    for _ in range(5):
+        assert await outbox.flush() == 0
+    assert attempts == [1, 1, 1] and outbox.pending == 0
+
+
+def test_keyset_pages_and_unread_count_endpoint(db, people, fake_redis):
+    _, applicant = people
+    db.add_all([Notification(user_id=applicant.id, message=f"note {i}", is_read=i % 2 == 0) for i in range(25)])
+    db.commit()
+    app = FastAPI()
+    app.include_router(notification.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: applicant
+    client = TestClient(app)
+
+    seen, before_id = [], None
+    while True:
+        page = client.get("/notifications", params={"limit": 10, **({"before_id": before_id} if before_id else {})}).json()
+        seen += [item["message"] for item in page["items"]]
+        before_id = page["next_before_id"]
+        if before_id is None:
+            break
+    assert seen == [f"note {i}" for i in reversed(range(25))]
+
+    unread = client.get("/notifications", params={"unread_only": True, "limit": 100}).json()["items"]
+    assert len(unread) == 12 and not any(item["is_read"] for item in unread)
+    assert client.get("/notifications/unread-count").json() == {"unread": 12}
+    assert client.post("/notifications/mark-read", json={"up_to_id": unread[5]["id"]}).json() == {"updated": 7}
+    assert client.get("/notifications/unread-count").json() == {"unread": 5}  # the five newest
@@ -0,0 +1,23 @@
+from benchmarks.resume_parsing import build_corpus, compare_results
+from app.utils.resume_parser import ResumeParser
+
+
+def test_synthetic_corpus_is_parseable_and_deterministic(tmp_path):
+    first = build_corpus(str(tmp_path / "a"), seed=7, copies=1, page_counts=[1])
+    build_corpus(str(tmp_path / "b"), seed=7, copies=1, page_counts=[1])
+
+    for entry in first["files"]:
+        parsed = [ResumeParser(str(tmp_path / d / entry["file"])).get_extracted_data() for d in "ab"]
+        assert "error" not in parsed[0]
+        assert parsed[0]["email"].endswith("@example.com")
+        assert parsed[0] == parsed[1]
+
+
+def _result(seconds):
+    stage = {"seconds": seconds, "peak_bytes": 1024}
+    return {"groups": {"pdf/p01/low": {"files": 1, "pages": 1, "bytes": 1, "stages": {"skills": stage}}}}
+
+
+def test_compare_flags_only_slowdowns_beyond_threshold():
+    assert compare_results(_result(0.010), _result(0.0105))[0]["regression"] is False
+    assert compare_results(_result(0.010), _result(0.020))[0]["regression"] is True
@@ -0,0 +1,104 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.core.dependencies import get_current_user, get_db
+from app.models.application import Application
+from app.models.job import Job
+from app.models.user import User
+from app.models.userprofile import UserProfile
+from app.repository.userprofile import MAX_BATCH, profile_cache
+from app.routes import userprofile
+
+
+@pytest.fixture
+def people(db):
+    profile_cache.clear()
+    employer = User(email="boss@example.com", role="employer")
+    admin = User(email="admin@example.com", role="admin")
+    applicants = [User(email=f"a{i}@example.com", role="applicant", name=f"A{i}") for i in range(4)]
+    db.add_all([employer, admin, *applicants])
+    db.flush()
+    db.add_all([UserProfile(user_id=applicant.id, full_name=f"Applicant {i}", bio="b", linkedin="l",
+                            github="g", website="w") for i, applicant in enumerate(applicants[:2])])
+    job = Job(title="Backend", description="d", location="Remote", company_name="Acme", posted_by=employer.id)
+    db.add(job)
+    db.flush()
+    # applicants[3] never applied to the employer's job
+    db.add_all([Application(job_id=job.id, applicant_id=applicant.id) for applicant in applicants[:3]])
+    db.commit()
+    return employer, admin, applicants
+
+
+def client_for(db, user):
+    app = FastAPI()
+    app.include_router(userprofile.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: user
+    return TestClient(app)
+
+
+def test_batch_lookup_is_one_join_then_cached_until_a_write(db, people):
+    employer, admin, applicants = people
+    client = client_for(db, admin)
+    ids = f"{applicants[2].id},{applicants[0].id},9999,{applicants[1].id}"
+    lookups = []
+    event.listen(db.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: lookups.append(statement) if "user_profiles" in statement
+                 else None)
+
+    cards = client.get("/profiles", params={"user_ids": ids}).json()
+    assert [card["user_id"] for card in cards] == [applicants[2].id, applicants[0].id, applicants[1].id]
+    assert cards[0]["full_name"] is None and cards[0]["name"] == "A2"  # no profile yet: user fields only
+    assert cards[1]["full_name"] == "Applicant 0" and cards[1]["email"] == "a0@example.com"
+    assert len(lookups) == 1 and "JOIN user_profiles" in lookups[0]
+
+    assert client.get("/profiles", params={"user_ids": ids}).json() == cards
+    assert len(lookups) == 2 and "IN (?)" in lookups[1]  # only 9999 (unknown, not cached) is looked up again
+
+    owner = client_for(db, applicants[0])
+    profile_id = cards[1]["profile_id"]
+    assert owner.put(f"/profiles/update/{profile_id}", json={"bio": "new bio"}).json()["bio"] == "new bio"
+    assert client.get("/profiles", params={"user_ids": [applicants[0].id]}).json()[0]["bio"] == "new bio"
+    assert owner.delete(f"/profiles/delete/{profile_id}").status_code == 204
+    assert client.get("/profiles", params={"user_ids": [applicants[0].id]}).json()[0]["profile_id"] is None
+
+
+def test_employers_only_see_people_who_applied_to_their_jobs(db, people):
+    employer, admin, applicants = people
+    client = client_for(db, employer)
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+
+    ids = f"{applicants[0].id},{applicants[3].id},{admin.id},{applicants[2].id}"
+    cards = client.get("/profiles", params={"user_ids": ids}).json()
+    assert [card["user_id"] for card in cards] == [applicants[0].id, applicants[2].id]
+    lookups = [statement for statement in statements if "user_profiles" in statement]
+    assert len(lookups) == 1 and "applications" not in lookups[0]  # cached cards carry no access decision
+
+    statements.clear()
+    assert client.get("/profiles", params={"user_ids": ids}).json() == cards  # cards come from the cache
+    assert len(statements) == 1 and "jobs.posted_by" in statements[0]  # only the access check runs again
+    assert "applications.applicant_id IN" in statements[0]
+    assert client.get(f"/profiles/details/{applicants[3].id}").status_code == 403
+    assert client.get(f"/profiles/details/{applicants[0].id}").json()["full_name"] == "Applicant 0"
+
+    outsider = client_for(db, User(id=employer.id + 100, email="new@example.com", role="employer"))
+    assert outsider.get("/profiles", params={"user_ids": ids}).json() == []
+    assert outsider.get(f"/profiles/details/{applicants[0].id}").status_code == 403
+
+
+def test_details_look_up_by_user_id_and_access_is_checked(db, people):
+    employer, admin, applicants = people
+    applicant = client_for(db, applicants[1])
+    assert applicant.get(f"/profiles/details/{applicants[1].id}").json()["full_name"] == "Applicant 1"
+    assert applicant.get(f"/profiles/details/{applicants[0].id}").status_code == 403
+    assert applicant.get("/profiles", params={"user_ids": f"{applicants[1].id},{applicants[0].id}"}).status_code == 403
+    assert client_for(db, employer).get(f"/profiles/details/{applicants[2].id}").status_code == 404
+
+    employer_client = client_for(db, employer)
+    too_many = ",".join(str(i) for i in range(MAX_BATCH + 1))
+    assert employer_client.get("/profiles", params={"user_ids": too_many}).status_code == 422
+    assert employer_client.get("/profiles", params={"user_ids": "1,x"}).status_code == 422
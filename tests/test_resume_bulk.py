@@ -0,0 +1,102 @@
+from app.models.application import Application
+from app.models.job import Job
+from app.models.resume import Resume
+from app.models.resumeskill import ResumeSkill
+from app.models.user import User
+from app.repository.resumebulk import ResumeBulkRepository
+from app.repository.resumesearch import ResumeSearchRepository
+from app.schemas.resume import ResumeSearchFilters
+
+
+def _seed(db, tmp_path):
+    owner = User(email="owner@example.com", role="applicant")
+    other = User(email="other@example.com", role="applicant")
+    employer = User(email="boss@example.com", role="employer")
+    db.add_all([owner, other, employer])
+    db.flush()
+    job = Job(title="Backend", description="d", location="Remote", company_name="Acme",
+              posted_by=employer.id)
+    db.add(job)
+    db.flush()
+
+    resumes = []
+    for i, applicant in enumerate([owner, owner, other]):
+        path = tmp_path / f"{i}.pdf"
+        path.write_bytes(b"%PDF")
+        resume = Resume(applicant_id=applicant.id, file_path=str(path),
+                        parsed_data={"skills": ["Python"], "field": "engineering"})
+        db.add(resume)
+        db.flush()
+        ResumeSearchRepository(db).index_resume(resume)
+        resumes.append(resume)
+    db.add(Application(job_id=job.id, applicant_id=owner.id, resume_file_path=resumes[1].file_path))
+    db.commit()
+    return owner, resumes
+
+
+def test_resolve_targets_reports_missing_and_foreign(db, tmp_path):
+    owner, resumes = _seed(db, tmp_path)
+    targets = ResumeBulkRepository(db).resolve_targets(
+        [resumes[0].id, resumes[2].id, 999], owner.id, is_admin=False
+    )
+
+    assert targets["allowed"] == [resumes[0].id]
+    assert targets["outcomes"] == {resumes[2].id: "forbidden", 999: "not_found"}
+
+
+def test_archive_hides_resumes_from_search(db, tmp_path):
+    _, resumes = _seed(db, tmp_path)
+    ResumeBulkRepository(db).archive([resumes[0].id])
+
+    result = ResumeSearchRepository(db).search(ResumeSearchFilters(field="engineering"))
+    assert result["total"] == 2
+    assert resumes[0].id not in {r.id for r in result["resumes"]}
+
+
+def test_delete_keeps_files_still_used_by_applications(db, tmp_path):
+    _, resumes = _seed(db, tmp_path)
+    paths = [r.file_path for r in resumes[:2]]
+    ids = [r.id for r in resumes[:2]]
+
+    outcomes = ResumeBulkRepository(db).delete(ids)
+
+    assert outcomes == {ids[0]: "deleted", ids[1]: "deleted"}
+    assert db.query(Resume).filter(Resume.id.in_(ids)).count() == 0
+    assert db.query(ResumeSkill).filter(ResumeSkill.resume_id.in_(ids)).count() == 0
+    assert not (tmp_path / "0.pdf").exists()
+    assert (tmp_path / "1.pdf").exists()
+    in_use = {path for (path,) in db.query(Application.resume_file_path)}
+    assert paths[1] in in_use and paths[0] not in in_use
+
+
+def test_reparse_stale_is_newest_first_and_resumable(db, tmp_path, monkeypatch):
+    from datetime import datetime, timedelta
+    from app.repository import resumebulk
+    from app.utils.resume_parser import parser_fingerprint
+
+    _, resumes = _seed(db, tmp_path)
+    base = datetime(2026, 1, 1)
+    for offset, resume in enumerate(resumes):
+        resume.created_at = base + timedelta(days=offset)
+    resumes[1].parser_fingerprint = parser_fingerprint()  # already current
+    db.commit()
+
+    parsed_order = []
+
+    def fake_parse_many(items):
+        for key, _ in items:
+            parsed_order.append(key)
+            yield key, {"skills": ["Go"]}, "text"
+
+    monkeypatch.setattr(resumebulk, "parse_many", fake_parse_many)
+    checkpoint = str(tmp_path / "reparse.checkpoint.json")
+    repo = ResumeBulkRepository(db)
+
+    first = repo.reparse_stale(batch_size=1, checkpoint_path=checkpoint, max_batches=1)
+    assert first["processed"] == 1 and not first["complete"]
+    resumed = repo.reparse_stale(batch_size=1, checkpoint_path=checkpoint)
+
+    assert parsed_order == [resumes[2].id, resumes[0].id]
+    assert resumed["processed"] == 2 and resumed["complete"]
+    assert resumed["outcomes"] == {"reparsed": 2}
+    assert {r.parser_fingerprint for r in db.query(Resume)} == {parser_fingerprint()}
@@ -0,0 +1,66 @@
+import pytest
+from fastapi import HTTPException
+
+from app.models.application import Application
+from app.models.job import Job
+from app.models.resume import Resume
+from app.models.user import User
+from app.repository.resumecomparison import ResumeComparisonRepository
+
+
+def _setup(db):
+    employer = User(email="boss@example.com", role="employer")
+    other_employer = User(email="other@example.com", role="employer")
+    applicants = [User(email=f"a{i}@example.com", role="applicant") for i in range(3)]
+    db.add_all([employer, other_employer, *applicants])
+    db.flush()
+
+    job = Job(title="Backend", description="d", location="Remote", company_name="Acme",
+              posted_by=employer.id)
+    db.add(job)
+    db.flush()
+
+    profiles = [
+        ("python backend engineer fastapi postgresql redis docker", ["Python", "Docker", "Sql"]),
+        ("python backend developer fastapi postgresql kafka docker", ["Python", "Docker", "Aws"]),
+        ("pastry chef sourdough croissants bakery management", ["Leadership"]),
+    ]
+    resumes = []
+    for applicant, (text, skills) in zip(applicants, profiles):
+        path = f"/uploads/{applicant.id}.pdf"
+        resume = Resume(applicant_id=applicant.id, file_path=path,
+                        parsed_data={"extracted_text": text, "skills": skills})
+        db.add(resume)
+        db.add(Application(job_id=job.id, applicant_id=applicant.id, resume_file_path=path))
+        resumes.append(resume)
+    db.commit()
+    return employer, other_employer, job, resumes
+
+
+def test_compare_returns_scores_and_skill_sets(db):
+    employer, _, _, resumes = _setup(db)
+    repo = ResumeComparisonRepository(db)
+
+    result = repo.compare(resumes[0].id, resumes[1].id, employer_id=employer.id)
+
+    assert 0.0 < result["similarity_score"] <= 1.0
+    assert result["common_skills"] == ["python", "docker"]
+    assert result["skill_differences"] == {"resume1_only": ["sql"], "resume2_only": ["aws"]}
+    assert resumes[0].feature_vector is not None
+
+
+def test_compare_against_job_ranks_applicants_in_one_batch(db):
+    employer, _, job, resumes = _setup(db)
+    results = ResumeComparisonRepository(db).compare_against_job(resumes[0].id, job.id, employer.id)
+
+    assert [r["resume2_id"] for r in results] == [resumes[1].id, resumes[2].id]
+    assert results[0]["similarity_score"] > results[1]["similarity_score"]
+
+
+def test_compare_rejects_other_employers(db):
+    _, other_employer, job, resumes = _setup(db)
+    repo = ResumeComparisonRepository(db)
+
+    with pytest.raises(HTTPException) as exc:
+        repo.compare(resumes[0].id, resumes[1].id, employer_id=other_employer.id)
+    assert exc.value.status_code == 403
@@ -0,0 +1,100 @@
+import asyncio
+import hashlib
+import io
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.datastructures import UploadFile
+
+from app.core.dependencies import get_current_user, get_db
+from app.models.application import Application
+from app.models.job import Job
+from app.models.user import User
+from app.repository.resumestorage import ResumeStorageRepository
+from app.routes import applicationwithresumeparser
+from app.storage.factory import set_storage_driver
+from app.storage.local import LocalStorageDriver
+
+RESUME_BYTES = bytes(range(256)) * 1024  # 256 KiB, several chunks
+
+
+class RemoteOnlyDriver(LocalStorageDriver):
+    """Local files that claim to be remote, to exercise the streaming path"""
+
+    def local_path(self, key):
+        return None
+
+
+@pytest.fixture(params=[LocalStorageDriver, RemoteOnlyDriver])
+def setup(request, db, tmp_path):
+    driver = request.param(str(tmp_path / "objects"))
+    set_storage_driver(driver)
+
+    employer = User(email="boss@example.com", role="employer")
+    other_employer = User(email="rival@example.com", role="employer")
+    applicant = User(email="jane@example.com", role="applicant")
+    db.add_all([employer, other_employer, applicant])
+    db.flush()
+    job = Job(title="Backend", description="d", location="Remote", company_name="Acme", posted_by=employer.id)
+    db.add(job)
+    db.flush()
+
+    path = asyncio.run(ResumeStorageRepository(db, driver).save_upload(
+        UploadFile(file=io.BytesIO(RESUME_BYTES), filename="jane.pdf")
+    ))
+    application = Application(job_id=job.id, applicant_id=applicant.id, resume_file_path=path)
+    db.add(application)
+    db.commit()
+
+    app = FastAPI()
+    app.include_router(applicationwithresumeparser.router)
+    app.dependency_overrides[get_db] = lambda: db
+    users = {"employer": employer, "other": other_employer, "applicant": applicant}
+
+    def client_for(who):
+        app.dependency_overrides[get_current_user] = lambda: users[who]
+        return TestClient(app)
+
+    try:
+        yield client_for, f"/applications/{application.id}/resume"
+    finally:
+        set_storage_driver(None)
+
+
+def test_owner_downloads_whole_file_with_validators(setup):
+    client_for, url = setup
+    response = client_for("employer").get(url)
+    assert response.status_code == 200
+    assert response.content == RESUME_BYTES
+    assert response.headers["etag"] == '"' + hashlib.sha256(RESUME_BYTES).hexdigest() + '"'
+    assert "last-modified" in response.headers
+    assert response.headers["content-disposition"].startswith("attachment")
+
+    assert client_for("applicant").get(url).status_code == 200
+    assert client_for("other").get(url).status_code == 403
+
+
+def test_range_and_conditional_requests(setup):
+    client_for, url = setup
+    client = client_for("employer")
+    etag = client.get(url).headers["etag"]
+
+    partial = client.get(url, headers={"Range": "bytes=1000-1999"})
+    assert partial.status_code == 206
+    assert partial.content == RESUME_BYTES[1000:2000]
+    assert partial.headers["content-range"] == f"bytes 1000-1999/{len(RESUME_BYTES)}"
+
+    suffix = client.get(url, headers={"Range": "bytes=-10"})
+    assert suffix.content == RESUME_BYTES[-10:]
+
+    assert client.get(url, headers={"Range": f"bytes={len(RESUME_BYTES)}-"}).status_code == 416
+
+    not_modified = client.get(url, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert client.get(url, headers={"If-None-Match": '"stale"'}).status_code == 200
+
+    stale_if_range = client.get(url, headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+    assert stale_if_range.status_code == 200
+    assert stale_if_range.content == RESUME_BYTES
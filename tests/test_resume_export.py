@@ -0,0 +1,73 @@
+import csv
+import io
+import json
+import zipfile
+from xml.etree import ElementTree
+
+from app.models.application import Application
+from app.models.job import Job
+from app.models.resume import Resume
+from app.models.user import User
+from app.repository.resumeexport import ResumeExportRepository
+from app.repository.resumesearch import ResumeSearchRepository
+from app.schemas.resume import ResumeExport, ResumeSearchFilters
+
+
+def _seed(db):
+    employer = User(email="boss@example.com", role="employer")
+    db.add(employer)
+    db.flush()
+    job = Job(title="Backend", description="d", location="Remote", company_name="Acme",
+              posted_by=employer.id)
+    db.add(job)
+    db.flush()
+    for i, (skills, email) in enumerate([(["Python"], "a@gmail.com"), (["Java"], "b@acme.io")]):
+        applicant = User(email=f"applicant{i}@example.com", role="applicant")
+        db.add(applicant)
+        db.flush()
+        path = f"/uploads/{applicant.id}.pdf"
+        resume = Resume(applicant_id=applicant.id, file_path=path,
+                        parsed_data={"name": f"Applicant {i}", "email": email, "skills": skills})
+        db.add(resume)
+        db.flush()
+        ResumeSearchRepository(db).index_resume(resume)
+        db.add(Application(job_id=job.id, applicant_id=applicant.id, resume_file_path=path))
+    db.commit()
+    return employer
+
+
+def _export(db, employer, **kwargs):
+    export = ResumeExport(fields=["application_id", "name", "email", "skills"], **kwargs)
+    return b"".join(ResumeExportRepository(db).stream(export, employer.id))
+
+
+def test_csv_export_honors_filters(db):
+    employer = _seed(db)
+    body = _export(db, employer, format="csv",
+                   filters=ResumeSearchFilters(skills=["python"]))
+
+    rows = list(csv.DictReader(io.StringIO(body.decode())))
+    assert [r["email"] for r in rows] == ["a@gmail.com"]
+    assert rows[0]["skills"] == "Python"
+
+
+def test_jsonl_export_emits_one_object_per_line(db):
+    employer = _seed(db)
+    lines = _export(db, employer, format="json").decode().splitlines()
+
+    assert [json.loads(line)["name"] for line in lines] == ["Applicant 0", "Applicant 1"]
+
+
+def test_xlsx_export_is_a_valid_workbook(db):
+    employer = _seed(db)
+    body = _export(db, employer, format="xlsx",
+                   filters=ResumeSearchFilters(email_domain="@acme.io"))
+
+    with zipfile.ZipFile(io.BytesIO(body)) as archive:
+        assert "xl/workbook.xml" in archive.namelist()
+        sheet = ElementTree.fromstring(archive.read("xl/worksheets/sheet1.xml"))
+
+    ns = {"s": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+    rows = sheet.findall(".//s:row", ns)
+    assert len(rows) == 2  # header + one matching row
+    assert "b@acme.io" in ElementTree.tostring(rows[1], encoding="unicode")
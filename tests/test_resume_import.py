@@ -0,0 +1,111 @@
+import io
+import json
+
+from app.models.application import Application
+from app.models.applicationevent import ApplicationEvent
+from app.models.job import Job
+from app.models.resume import Resume
+from app.models.user import User
+from app.repository.dashboard import dashboard_invalidations
+from app.repository.resumeimport import ResumeImportRepository
+from app.schemas.resume import ResumeImport
+
+MAPPING = {
+    "Email": "applicant_email",
+    "CV": "file_path",
+    "Job": "job_id",
+    "Skills": "skills",
+    "Years": "years_experience",
+}
+
+
+def _seed(db):
+    employer = User(email="boss@example.com", role="employer")
+    applicants = [User(email=f"a{i}@example.com", role="applicant") for i in range(3)]
+    db.add_all([employer, *applicants])
+    db.flush()
+    job = Job(title="Backend", description="d", location="Remote", company_name="Acme",
+              posted_by=employer.id)
+    db.add(job)
+    db.commit()
+    return job
+
+
+def _csv(job_id):
+    return io.BytesIO((
+        "Email,CV,Job,Skills,Years\n"
+        f"a0@example.com,/cv/0.pdf,{job_id},Python; SQL,4\n"
+        f"A1@example.com,/cv/1.pdf,{job_id},Go,x\n"
+        f"missing@example.com,/cv/2.pdf,{job_id},Go,2\n"
+        f"a2@example.com,/cv/3.pdf,{job_id},Rust,1\n"
+        f"a2@example.com,/cv/4.pdf,{job_id},Rust,1\n"
+    ).encode())
+
+
+def test_csv_import_inserts_valid_rows_and_reports_errors(db):
+    job = _seed(db)
+    dashboard_invalidations._pending.clear()
+    result = ResumeImportRepository(db).run(_csv(job.id), ResumeImport(file_format="csv", mapping=MAPPING))
+
+    assert result["total_rows"] == 5
+    assert result["imported_resumes"] == 2
+    assert result["imported_applications"] == 2
+    assert [e["row"] for e in result["errors"]] == [2, 3, 5]
+
+    resume = db.query(Resume).filter(Resume.file_path == "/cv/0.pdf").one()
+    assert resume.parsed_data["skills"] == ["Python", "SQL"]
+    assert resume.parsed_data["years_experience"] == 4
+    assert db.query(Application).count() == 2
+    assert list(dashboard_invalidations._pending) == [job.posted_by]  # the employer's cached dashboard
+
+
+def test_imported_applications_get_their_status_history(db):
+    job = _seed(db)
+    lines = "\n".join(json.dumps({"Email": f"a{i}@example.com", "CV": f"/cv/{i}.pdf", "Job": job.id, "State": status})
+                      for i, status in enumerate(["pending", "accepted"]))
+    spec = ResumeImport(file_format="json", mapping={**MAPPING, "State": "status"})
+    assert ResumeImportRepository(db).run(io.BytesIO(lines.encode()), spec)["imported_applications"] == 2
+
+    accepted = db.query(Application).filter(Application.status == "accepted").one()
+    history = {(event.application_id, event.from_status, event.to_status) for event in db.query(ApplicationEvent)}
+    assert len(history) == 3 and (accepted.id, "pending", "accepted") in history
+    assert {event.job_id for event in db.query(ApplicationEvent)} == {job.id}
+
+
+def test_validate_only_writes_nothing(db):
+    job = _seed(db)
+    spec = ResumeImport(file_format="csv", mapping=MAPPING, validate_only=True)
+    result = ResumeImportRepository(db).run(_csv(job.id), spec)
+
+    assert result["valid_rows"] == 2
+    assert result["imported_resumes"] == 0
+    assert db.query(Resume).count() == 0
+
+
+def test_json_lines_import(db):
+    _seed(db)
+    lines = "\n".join(json.dumps(r) for r in [
+        {"Email": "a0@example.com", "CV": "/cv/0.pdf", "Skills": ["Python"]},
+        [1, 2, 3],
+    ])
+    spec = ResumeImport(file_format="json", mapping=MAPPING)
+    result = ResumeImportRepository(db).run(io.BytesIO(lines.encode()), spec)
+
+    assert result["imported_resumes"] == 1
+    assert result["imported_applications"] == 0
+    assert result["errors"][0]["row"] == 2
+
+
+def test_json_values_of_the_wrong_type_are_row_errors(db):
+    _seed(db)
+    lines = "\n".join(json.dumps(r) for r in [
+        {"Email": "a0@example.com", "CV": "/cv/0.pdf", "Skills": 5},  # a number in a list field: one skill
+        {"Email": ["a1@example.com"], "CV": "/cv/1.pdf"},
+        {"Email": "a2@example.com", "CV": {"path": "/cv/2.pdf"}},
+    ])
+    spec = ResumeImport(file_format="json", mapping=MAPPING)
+    result = ResumeImportRepository(db).run(io.BytesIO(lines.encode()), spec)
+
+    assert result["imported_resumes"] == 1
+    assert db.query(Resume).one().parsed_data["skills"] == ["5"]
+    assert [(e["row"], e["error"].split(":")[0]) for e in result["errors"]] == [(2, "applicant_email"), (3, "file_path")]
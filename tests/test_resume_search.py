@@ -0,0 +1,94 @@
+from sqlalchemy import select, text
+
+from app.models.application import Application
+from app.models.job import Job
+from app.models.resume import Resume
+from app.models.user import User
+from app.repository.resumesearch import ResumeSearchRepository, apply_search_filters
+from app.schemas.resume import ResumeSearchFilters
+
+PROFILES = [
+    {"field": "Engineering", "skills": ["Python", "SQL"], "email": "a@gmail.com",
+     "years_experience": 5, "current_position": "Senior Backend Engineer",
+     "education": ["Bachelor of Science in Computer Science"]},
+    {"field": "engineering", "skills": ["Go"], "email": "b@acme.io",
+     "years_experience": 2, "current_position": "Backend Engineer", "education": []},
+    {"field": "Marketing", "skills": ["SEO"], "email": "c@gmail.com",
+     "years_experience": 8, "current_position": "Growth Lead", "education": ["MBA"]},
+]
+
+
+def _seed(db):
+    employer = User(email="boss@example.com", role="employer")
+    db.add(employer)
+    db.flush()
+    job = Job(title="Backend", description="d", location="Remote", company_name="Acme",
+              posted_by=employer.id)
+    db.add(job)
+    db.flush()
+
+    repo = ResumeSearchRepository(db)
+    for i, parsed in enumerate(PROFILES):
+        applicant = User(email=f"applicant{i}@example.com", role="applicant")
+        db.add(applicant)
+        db.flush()
+        resume = Resume(applicant_id=applicant.id, file_path=f"/cv/{i}.pdf", parsed_data=parsed)
+        db.add(resume)
+        db.flush()
+        repo.index_resume(resume)
+        if i < 2:
+            db.add(Application(job_id=job.id, applicant_id=applicant.id, resume_file_path=f"/cv/{i}.pdf"))
+    db.commit()
+    return employer
+
+
+def _emails(result):
+    return sorted(r.parsed_data["email"] for r in result["resumes"])
+
+
+def test_filters_use_promoted_columns(db):
+    _seed(db)
+    repo = ResumeSearchRepository(db)
+
+    assert _emails(repo.search(ResumeSearchFilters(field="ENGINEERING"))) == ["a@gmail.com", "b@acme.io"]
+    assert _emails(repo.search(ResumeSearchFilters(skills=["python", "seo"]))) == ["a@gmail.com", "c@gmail.com"]
+    assert _emails(repo.search(ResumeSearchFilters(email_domain="@gmail.com",
+                                                   experience_years_min=6))) == ["c@gmail.com"]
+    assert _emails(repo.search(ResumeSearchFilters(current_position="backend",
+                                                   education="computer"))) == ["a@gmail.com"]
+
+
+def test_pagination_reports_exact_totals(db):
+    _seed(db)
+    result = ResumeSearchRepository(db).search(ResumeSearchFilters(), page=2, per_page=2)
+
+    assert result["total"] == 3
+    assert result["pages"] == 2
+    assert len(result["resumes"]) == 1
+
+
+def test_employers_only_see_their_applicants(db):
+    employer = _seed(db)
+    result = ResumeSearchRepository(db).search(ResumeSearchFilters(), employer_id=employer.id)
+
+    assert result["total"] == 2
+
+
+def test_free_text_filters_match_word_prefixes_through_the_term_index(db, monkeypatch):
+    employer = _seed(db)
+    repo = ResumeSearchRepository(db)
+
+    for sort_limit in (1000, 0):  # ids sorted, or the newest-first index walked with per-row probes
+        monkeypatch.setattr("app.repository.resumesearch.SORT_LIMIT", sort_limit)
+        assert _emails(repo.search(ResumeSearchFilters(current_position="Backend Eng"))) == ["a@gmail.com",
+                                                                                             "b@acme.io"]
+        assert _emails(repo.search(ResumeSearchFilters(current_position="end"))) == []  # not the start of a word
+        assert _emails(repo.search(ResumeSearchFilters(education="science bachelor", skills=["sql"]))) == [
+            "a@gmail.com"]
+        assert _emails(repo.search(ResumeSearchFilters(education="%"))) == []
+        assert repo.search(ResumeSearchFilters(current_position="engineer"), employer_id=employer.id)["total"] == 2
+
+    filtered = apply_search_filters(select(Resume.id), ResumeSearchFilters(education="comp"))
+    plan = " ".join(row[-1] for row in db.execute(text("EXPLAIN QUERY PLAN " + str(
+        filtered.compile(compile_kwargs={"literal_binds": True})))))
+    assert "ix_resume_terms_field_term_resume_id (field=? AND term>? AND term<?)" in plan
@@ -0,0 +1,262 @@
+import io
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+from xml.sax.saxutils import escape
+
+import pytest
+from starlette.datastructures import UploadFile
+
+from app.models.application import Application
+from app.models.job import Job
+from app.models.storedfile import StoredFile
+from app.models.user import User
+from app.repository import applicationwithresumeparser, job as job_repo
+from app.repository.resumestorage import KEY_SCHEME, ResumeStorageRepository
+from app.storage.local import LocalStorageDriver
+from app.storage.s3 import S3StorageDriver
+
+PDF_BYTES = b"%PDF-1.4 resume bytes " * 500
+
+
+def upload(data: bytes, filename: str = "cv.pdf") -> UploadFile:
+    return UploadFile(file=io.BytesIO(data), filename=filename)
+
+
+async def read_all(driver, key, start=0, end=None) -> bytes:
+    return b"".join([chunk async for chunk in driver.iter_chunks(key, start, end)])
+
+
+@pytest.mark.asyncio
+async def test_identical_uploads_share_one_object_and_are_refcounted(db, tmp_path):
+    repo = ResumeStorageRepository(db, LocalStorageDriver(str(tmp_path)))
+    first = await repo.save_upload(upload(PDF_BYTES, "jane.pdf"), references=2)
+    second = await repo.save_upload(upload(PDF_BYTES, "jane-copy.PDF"))
+    other = await repo.save_upload(upload(b"another resume"))
+    db.commit()
+
+    assert first == second and first.startswith(KEY_SCHEME)
+    assert other != first
+    stored = db.get(StoredFile, first[len(KEY_SCHEME):])
+    assert (stored.refcount, stored.upload_count, stored.size) == (3, 2, len(PDF_BYTES))
+
+    stats = repo.stats()
+    assert stats["objects"] == 2
+    assert stats["saved_bytes"] == len(PDF_BYTES)
+    assert stats["dedup_ratio"] > 1.9
+
+    # Releasing never unlinks; zero-reference objects wait for the orphan sweep
+    repo.release(first, count=5)
+    db.commit()
+    db.refresh(stored)
+    assert stored.refcount == 0
+    with repo.local_copy(first) as path:
+        assert open(path, "rb").read() == PDF_BYTES
+    assert repo.stats()["unreferenced_objects"] == 1
+
+
+@pytest.mark.asyncio
+async def test_submission_references_the_upload_only_after_parsing(db, tmp_path, monkeypatch):
+    driver = LocalStorageDriver(str(tmp_path))
+    monkeypatch.setattr("app.repository.resumestorage.get_storage_driver", lambda: driver)
+    employer, applicant = User(email="boss@example.com", role="employer"), User(email="jane@example.com", role="applicant")
+    db.add_all([employer, applicant])
+    db.flush()
+    job = Job(title="Backend", description="d", location="Remote", company_name="Acme", posted_by=employer.id)
+    db.add(job)
+    db.commit()
+    rows_while_parsing = []
+
+    class Parser(applicationwithresumeparser.ResumeParser):
+        def extract_text(self):
+            rows_while_parsing.append(db.query(StoredFile).count())  # a write here would hold the lock
+            return "Jane Doe\njane@example.com\nSkills: Python, SQL"
+
+    monkeypatch.setattr(applicationwithresumeparser, "ResumeParser", Parser)
+    repo = applicationwithresumeparser.ApplicationWithResumeRepository(db)
+    await repo.create_application_with_resume(job.id, applicant.id, upload(PDF_BYTES))
+
+    assert rows_while_parsing == [0]
+    (stored,) = db.query(StoredFile).all()
+    assert (stored.refcount, stored.upload_count) == (2, 1)
+    ResumeStorageRepository(db, driver).acquire(stored.key, stored.size)  # one upsert: never a duplicate INSERT
+    db.commit()
+    db.refresh(stored)
+    assert (stored.refcount, stored.upload_count) == (3, 2)
+
+
+@pytest.mark.asyncio
+async def test_deleting_a_job_releases_its_applications_references(db, tmp_path, monkeypatch):
+    driver = LocalStorageDriver(str(tmp_path))
+    monkeypatch.setattr("app.repository.resumestorage.get_storage_driver", lambda: driver)
+    employer = User(email="boss@example.com", role="employer")
+    applicants = [User(email=f"a{i}@example.com", role="applicant") for i in range(3)]
+    db.add_all([employer, *applicants])
+    db.flush()
+    job = Job(title="Backend", description="d", location="Remote", company_name="Acme", posted_by=employer.id)
+    db.add(job)
+    db.flush()
+    repo = ResumeStorageRepository(db, driver)
+    shared = await repo.save_upload(upload(PDF_BYTES), references=3)  # two applications and a resume
+    single = await repo.save_upload(upload(b"another resume"))
+    db.add_all([Application(job_id=job.id, applicant_id=applicant.id, resume_file_path=path)
+                for applicant, path in zip(applicants, (shared, shared, single))])
+    db.commit()
+
+    job_repo.delete_job(job.id, db, employer)
+    refcounts = {key: refcount for key, refcount in db.query(StoredFile.key, StoredFile.refcount)}
+    assert refcounts == {shared[len(KEY_SCHEME):]: 1, single[len(KEY_SCHEME):]: 0}
+    assert repo.stats()["unreferenced_objects"] == 1
+
+
+@pytest.mark.asyncio
+async def test_local_driver_ranges_listing_and_key_guard(tmp_path):
+    driver = LocalStorageDriver(str(tmp_path / "objects"))
+    source = tmp_path / "source.pdf"
+    source.write_bytes(PDF_BYTES)
+    for key in ("bb/two.pdf", "aa/one.pdf", "aa/three.docx"):
+        await driver.put_file(key, str(source))
+
+    assert await read_all(driver, "aa/one.pdf", 10, 19) == PDF_BYTES[10:20]
+    assert await driver.size("aa/one.pdf") == len(PDF_BYTES)
+    assert [key async for key, _, _ in driver.list_objects()] == ["aa/one.pdf", "aa/three.docx", "bb/two.pdf"]
+    assert [key async for key, _, _ in driver.list_objects("bb/")] == ["bb/two.pdf"]
+    assert [key async for key, _, _ in driver.list_objects(start_after="aa/one.pdf")] == ["aa/three.docx", "bb/two.pdf"]
+
+    await driver.delete("aa/one.pdf")
+    assert not await driver.exists("aa/one.pdf")
+    with pytest.raises(ValueError):
+        driver.local_path("../escape.pdf")
+
+
+class StubS3(BaseHTTPRequestHandler):
+    """Path-style, in-memory S3 subset: PUT/GET(Range)/HEAD/DELETE objects and ListObjectsV2"""
+
+    def _target(self):
+        url = urlsplit(self.path)
+        _, bucket, *rest = unquote(url.path).split("/", 2)
+        return bucket, (rest[0] if rest else ""), parse_qs(url.query)
+
+    def _reply(self, status, body=b"", headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _authorized(self):
+        auth = self.headers.get("Authorization", "")
+        self.server.auth_headers.append(auth)
+        return auth.startswith("AWS4-HMAC-SHA256 Credential=test-key/") and self.headers.get("x-amz-date")
+
+    def do_PUT(self):
+        _, key, _ = self._target()
+        if not self._authorized():
+            return self._reply(403)
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if "x-amz-copy-source" in self.headers:
+            body = self.server.objects[unquote(self.headers["x-amz-copy-source"]).split("/", 2)[2]]
+        self.server.objects[key] = body
+        self._reply(200)
+
+    def do_HEAD(self):
+        _, key, _ = self._target()
+        if key not in self.server.objects:
+            return self._reply(404)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(self.server.objects[key])))
+        self.end_headers()
+
+    def do_DELETE(self):
+        _, key, _ = self._target()
+        self.server.objects.pop(key, None)
+        self._reply(204)
+
+    def do_GET(self):
+        _, key, query = self._target()
+        if not self._authorized():
+            return self._reply(403)
+        if query.get("list-type") == ["2"]:
+            return self._list(query)
+        if key not in self.server.objects:
+            return self._reply(404)
+        data = self.server.objects[key]
+        if "Range" in self.headers:
+            start, end = self.headers["Range"].split("=")[1].split("-")
+            data = data[int(start):int(end) + 1 if end else None]
+            return self._reply(206, data)
+        self._reply(200, data)
+
+    def _list(self, query):
+        prefix = query.get("prefix", [""])[0]
+        start_after = query.get("start-after", [""])[0]
+        keys = sorted(k for k in self.server.objects if k.startswith(prefix) and k > start_after)
+        start = int(query.get("continuation-token", ["0"])[0])
+        page = keys[start:start + self.server.page_size]
+        truncated = start + self.server.page_size < len(keys)
+        body = '<ListBucketResult xmlns="http://s3.amazonaws.com/doc/2006-03-01/">'
+        body += "".join(f"<Contents><Key>{escape(k)}</Key><Size>{len(self.server.objects[k])}</Size>"
+                        f"<LastModified>2026-10-22T10:00:00.000Z</LastModified></Contents>"
+                        for k in page)
+        body += f"<IsTruncated>{'true' if truncated else 'false'}</IsTruncated>"
+        if truncated:
+            body += f"<NextContinuationToken>{start + self.server.page_size}</NextContinuationToken>"
+        self._reply(200, (body + "</ListBucketResult>").encode())
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def s3_driver():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubS3)
+    server.objects, server.auth_headers, server.page_size = {}, [], 2
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    driver = S3StorageDriver(bucket="resumes", endpoint_url=f"http://127.0.0.1:{server.server_port}",
+                             access_key="test-key", secret_key="test-secret", prefix="cv/")
+    try:
+        yield driver, server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_s3_driver_against_stub_server(db, s3_driver):
+    driver, server = s3_driver
+    repo = ResumeStorageRepository(db, driver)
+    path = await repo.save_upload(upload(PDF_BYTES))
+    await repo.save_upload(upload(PDF_BYTES))  # already present: no second PUT
+    for name in ("a.docx", "b.docx"):
+        await repo.save_upload(upload(name.encode() * 10, name))
+    db.commit()
+
+    key = path[len(KEY_SCHEME):]
+    assert set(server.objects) == {"cv/" + k for k, in db.query(StoredFile.key)}
+    assert await driver.size(key) == len(PDF_BYTES)
+    assert await read_all(driver, key, 5, 14) == PDF_BYTES[5:15]
+
+    listed = [k async for k, _, _ in driver.list_objects()]  # three objects, pages of two
+    assert listed == sorted(k for k, in db.query(StoredFile.key))
+    assert [k async for k, _, _ in driver.list_objects(start_after=listed[0])] == listed[1:]
+
+    await driver.move(listed[-1], "moved/" + listed[-1])
+    assert not await driver.exists(listed[-1])
+    assert await driver.exists("moved/" + listed[-1])
+
+    with repo.local_copy(path) as local_path:
+        assert local_path.endswith(".pdf")
+        assert open(local_path, "rb").read() == PDF_BYTES
+    fetched_on = []
+    fetch_to_path = driver.fetch_to_path
+    driver.fetch_to_path = lambda *args: fetched_on.append(threading.get_ident()) or fetch_to_path(*args)
+    async with repo.local_copy_async(path) as local_path:
+        assert open(local_path, "rb").read() == PDF_BYTES
+    assert fetched_on and fetched_on[0] != threading.get_ident()  # downloaded off the event loop
+    assert not os.path.exists(local_path)
+
+    await driver.delete(key)
+    assert not await driver.exists(key)
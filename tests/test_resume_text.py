@@ -0,0 +1,68 @@
+from sqlalchemy import event
+
+from app.models.application import Application
+from app.models.job import Job
+from app.models.resume import Resume
+from app.models.resumetext import ResumeText
+from app.models.user import User
+from app.repository.applicationwithresumeparser import ApplicationWithResumeRepository
+from app.repository.resumebulk import ResumeBulkRepository
+from app.repository.resumetext import ResumeTextRepository
+from app.utils.resume_parser import TEXT_SUMMARY_CHARS, ResumeParser
+
+FULL_TEXT = "Jane Doe\njane@example.com\n" + "Built payment services in Python and SQL.\n" * 200
+
+
+def test_text_is_stored_once_compressed_and_round_trips(db):
+    repo = ResumeTextRepository(db)
+    first = repo.store(FULL_TEXT)
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    second = repo.store(FULL_TEXT)  # already stored: a no-op insert, not a read then a write
+    assert len(statements) == 1 and statements[0].startswith("INSERT") and "ON CONFLICT" in statements[0]
+    db.commit()
+
+    stored = db.query(ResumeText).one()
+    assert first == second == stored.content_hash
+    assert len(stored.compressed) < len(FULL_TEXT) / 10
+    assert repo.load(first) == FULL_TEXT
+
+
+def test_parse_keeps_summary_and_full_text_is_loaded_for_preview(db):
+    employer = User(email="boss@example.com", role="employer")
+    applicant = User(email="jane@example.com", role="applicant")
+    db.add_all([employer, applicant])
+    db.flush()
+    job = Job(title="Backend", description="d", location="Remote", company_name="Acme", posted_by=employer.id)
+    db.add(job)
+    db.flush()
+
+    parsed = ResumeParser("").parse_text(FULL_TEXT)
+    resume = Resume(applicant_id=applicant.id, file_path="/cv/jane.pdf", parsed_data=parsed)
+    db.add(resume)
+    db.flush()
+    repo = ApplicationWithResumeRepository(db)
+    repo.apply_parse_result(resume, parsed, FULL_TEXT)
+    application = Application(job_id=job.id, applicant_id=applicant.id,
+                              resume_file_path="/cv/jane.pdf", parsed_resume=parsed)
+    db.add(application)
+    db.commit()
+
+    assert len(parsed["extracted_text"]) <= TEXT_SUMMARY_CHARS + 3
+    assert repo.get_resume_text_for_application(application.id, applicant.id) == FULL_TEXT
+
+
+def test_deleting_last_resume_drops_its_text(db):
+    user = User(email="a@example.com", role="applicant")
+    db.add(user)
+    db.flush()
+    text_hash = ResumeTextRepository(db).store(FULL_TEXT)
+    resumes = [Resume(applicant_id=user.id, file_path=f"/cv/{i}.pdf", text_hash=text_hash) for i in range(2)]
+    db.add_all(resumes)
+    db.commit()
+
+    ResumeBulkRepository(db).delete([resumes[0].id])
+    assert db.query(ResumeText).count() == 1
+    ResumeBulkRepository(db).delete([resumes[1].id])
+    assert db.query(ResumeText).count() == 0
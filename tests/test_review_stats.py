@@ -0,0 +1,85 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.dependencies import get_current_user, get_db
+from app.models.review import Review
+from app.models.reviewstats import ReviewStats
+from app.models.user import User
+from app.repository.review import check_review_stats
+from app.routes import review
+
+
+@pytest.fixture
+def users(db):
+    people = [User(email=f"user{i}@example.com", role="applicant") for i in range(6)]
+    db.add_all(people)
+    db.commit()
+    return people
+
+
+def make_client(db, reviewer):
+    app = FastAPI()
+    app.include_router(review.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: reviewer
+    return TestClient(app)
+
+
+def test_writes_keep_the_aggregates_and_summary_in_step(db, users):
+    reviewee = users[0]
+    ids = []
+    for reviewer, rating in zip(users[1:4], (5, 4, 4)):
+        response = make_client(db, reviewer).post("/reviews/", json={"reviewee_id": reviewee.id, "rating": rating})
+        ids.append(response.json()["id"])
+    client = make_client(db, users[1])
+    assert client.get(f"/reviews/user/{reviewee.id}/summary").json() == {
+        "reviewee_id": reviewee.id, "review_count": 3, "average_rating": 4.33,
+        "histogram": {"1": 0, "2": 0, "3": 0, "4": 2, "5": 1},
+    }
+
+    client.put(f"/reviews/{ids[0]}", json={"rating": 1, "comment": "changed my mind"})
+    make_client(db, users[2]).delete(f"/reviews/{ids[1]}")
+    summary = client.get(f"/reviews/user/{reviewee.id}/summary").json()
+    assert summary["review_count"] == 2 and summary["average_rating"] == 2.5
+    assert summary["histogram"] == {"1": 1, "2": 0, "3": 0, "4": 1, "5": 0}
+    assert client.get(f"/reviews/user/{users[5].id}/summary").json()["average_rating"] is None
+    assert check_review_stats(db)["mismatched"] == 0
+
+
+def test_review_listing_is_keyset_paginated_newest_first(db, users):
+    reviewee = users[0]
+    db.add_all([Review(reviewer_id=users[1].id, reviewee_id=reviewee.id, rating=3, comment=f"#{i}") for i in range(7)])
+    db.commit()
+    client = make_client(db, users[1])
+
+    comments, url = [], f"/reviews/user/{reviewee.id}?limit=3"
+    while url:
+        response = client.get(url)
+        comments += [item["comment"] for item in response.json()]
+        url = response.links.get("next", {}).get("url")
+    assert comments == [f"#{i}" for i in reversed(range(7))]
+
+
+def test_checker_repairs_drift_in_batches(db, users):
+    for reviewee in users[:5]:
+        for rating in (2, 5):
+            db.add(Review(reviewer_id=users[5].id, reviewee_id=reviewee.id, rating=rating))
+    db.commit()  # written around the repository: no aggregates at all yet
+    db.add(ReviewStats(reviewee_id=users[5].id, review_count=4, rating_sum=9))  # stale row, no reviews left
+    db.commit()
+
+    dry = check_review_stats(db, batch_size=2, fix=False)
+    assert dry["checked"] == 6 and dry["mismatched"] == 6 and dry["fixed"] == 0
+    assert db.query(ReviewStats).count() == 1
+
+    first = check_review_stats(db, batch_size=2, max_batches=1)
+    assert first["checked"] == 2 and first["last_id"] == users[1].id
+    rest = check_review_stats(db, batch_size=2, after_id=first["last_id"])
+    assert rest["fixed"] == 4 and rest["last_id"] == users[5].id
+
+    stats = {row.reviewee_id: row for row in db.query(ReviewStats)}
+    assert (stats[users[3].id].review_count, stats[users[3].id].rating_sum,
+            stats[users[3].id].rating_2, stats[users[3].id].rating_5) == (2, 7, 1, 1)
+    assert stats[users[5].id].review_count == 0 and stats[users[5].id].rating_sum == 0
+    assert check_review_stats(db)["mismatched"] == 0
@@ -0,0 +1,137 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.core.dependencies import get_current_user, get_current_user_optional, get_db
+from app.models.job import Job
+from app.models.savedjob import SavedJob
+from app.models.user import User
+from app.repository.savedjob import SavedJobRepository, saved_key
+from app.routes import job, savedjob
+
+
+@pytest.fixture
+def setup(db, fake_redis):
+    employer = User(email="boss@example.com", role="employer")
+    applicant = User(email="jane@example.com", role="applicant")
+    db.add_all([employer, applicant])
+    db.flush()
+    jobs = [Job(title=f"Job {i}", description="d", location="Remote", company_name="Acme",
+                skills_required=["python"], posted_by=employer.id) for i in range(50)]
+    db.add_all(jobs)
+    db.commit()
+    job.listing_cache.clear()
+
+    app = FastAPI()
+    app.include_router(job.router)
+    app.include_router(savedjob.router)
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: applicant
+    return app, applicant, jobs
+
+
+def count_reads(db, table):
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    return lambda: sum(statement.startswith("SELECT") and table in statement for statement in statements)
+
+
+def test_save_and_unsave_are_idempotent_and_list_is_keyset_paginated(db, setup):
+    app, applicant, jobs = setup
+    client = TestClient(app)
+
+    first = client.put(f"/saved-jobs/{jobs[3].id}")
+    assert first.status_code == 200 and first.json()["job"]["title"] == "Job 3"
+    assert client.put(f"/saved-jobs/{jobs[3].id}").json()["saved_at"] == first.json()["saved_at"]
+    assert db.query(SavedJob).count() == 1
+    assert client.put("/saved-jobs/9999").status_code == 404
+
+    for index in (5, 7, 9):
+        client.put(f"/saved-jobs/{jobs[index].id}")
+    assert client.delete(f"/saved-jobs/{jobs[5].id}").status_code == 204
+    assert client.delete(f"/saved-jobs/{jobs[5].id}").status_code == 204
+
+    seen, before_id = [], None
+    while True:
+        page = client.get("/saved-jobs", params={"limit": 2, **({"before_id": before_id} if before_id else {})}).json()
+        seen += [item["job"]["title"] for item in page["items"]]
+        before_id = page["next_before_id"]
+        if before_id is None:
+            break
+    assert seen == ["Job 9", "Job 7", "Job 3"]
+
+
+def test_listing_flags_come_from_one_lookup_then_the_redis_set(db, setup, fake_redis):
+    app, applicant, jobs = setup
+    client = TestClient(app)
+    for index in (1, 4):
+        client.put(f"/saved-jobs/{jobs[index].id}")
+
+    anonymous = client.get("/jobs/all/")
+    assert "is_saved" not in anonymous.json()[0]
+    assert anonymous.headers["vary"] == "Authorization, Accept-Encoding"
+
+    app.dependency_overrides[get_current_user_optional] = lambda: applicant
+    saved_queries = count_reads(db, "saved_jobs")
+    listing = client.get("/jobs/all/")
+    rows = listing.json()
+    assert len(rows) == 50 and saved_queries() == 1  # the saved set is built once, not per job
+    assert [row["title"] for row in rows if row["is_saved"]] == ["Job 1", "Job 4"]
+    assert listing.headers["cache-control"] == "private, no-cache"
+
+    # Cached set: no more saved_jobs queries, and writes update it in place
+    assert client.get("/jobs/all/", headers={"if-none-match": listing.headers["etag"].removeprefix("W/")}
+                      ).status_code == 304
+    assert saved_queries() == 1
+    client.delete(f"/saved-jobs/{jobs[4].id}")
+    client.put(f"/saved-jobs/{jobs[8].id}")
+    assert fake_redis.data[saved_key(applicant.id)] == {"-", str(jobs[1].id), str(jobs[8].id)}
+    saved_queries = count_reads(db, "saved_jobs")
+    rows = client.get("/jobs/all/", headers={"if-none-match": listing.headers["etag"]}).json()
+    assert [row["title"] for row in rows if row["is_saved"]] == ["Job 1", "Job 8"]
+    assert saved_queries() == 0
+
+
+def test_check_answers_a_page_of_ids_in_one_call(db, setup, fake_redis, monkeypatch):
+    app, applicant, jobs = setup
+    client = TestClient(app)
+    client.put(f"/saved-jobs/{jobs[2].id}")
+    page = [j.id for j in jobs[:10]]
+
+    assert client.get("/saved-jobs/check", params={"job_ids": page}).json() == {"saved": [jobs[2].id]}
+    assert fake_redis.data[saved_key(applicant.id)] == {"-", str(jobs[2].id)}  # rebuilt on the miss
+    assert client.get("/saved-jobs/check", params={"job_ids": list(range(101))}).status_code == 422
+
+    async def unavailable(*args, **kwargs):
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(type(fake_redis), "smismember", unavailable)
+    saved_queries = count_reads(db, "saved_jobs")
+    assert client.get("/saved-jobs/check", params={"job_ids": page}).json() == {"saved": [jobs[2].id]}
+    assert saved_queries() == 1  # falls back to a single IN query
+
+
+def test_a_fill_that_raced_a_write_is_not_cached(db, setup, fake_redis):
+    app, applicant, jobs = setup
+    repo = SavedJobRepository(db)
+    read_table = repo.saved_job_ids
+
+    def read_then_save(user_id, job_ids=None):
+        saved = read_table(user_id, job_ids)
+        # A save commits after the fill read the table but before it stores the set
+        db.add(SavedJob(applicant_id=user_id, job_id=jobs[5].id))
+        db.commit()
+        with ThreadPoolExecutor(1) as writer:  # its own event loop, as another request would be
+            writer.submit(asyncio.run, SavedJobRepository(db)._change_cached(user_id, "add", jobs[5].id)).result()
+        return saved
+
+    repo.saved_job_ids = read_then_save
+    assert asyncio.run(repo.saved_ids(applicant.id)) == set()
+    assert saved_key(applicant.id) not in fake_redis.data  # the stale set was thrown away
+    assert asyncio.run(SavedJobRepository(db).saved_ids(applicant.id)) == {jobs[5].id}
+    assert fake_redis.data[saved_key(applicant.id)] == {"-", str(jobs[5].id)}
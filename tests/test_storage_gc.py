@@ -0,0 +1,143 @@
+import io
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from starlette.datastructures import UploadFile
+
+from app.models.quarantinedfile import QuarantinedFile
+from app.models.resume import Resume
+from app.models.storedfile import StoredFile
+from app.models.user import User
+from app.repository.resumestorage import KEY_SCHEME, LEGACY_UPLOAD_DIR, ResumeStorageRepository
+from app.repository.storagegc import QUARANTINE_PREFIX, StorageGCRepository
+from app.storage.local import LocalStorageDriver
+
+LATER = datetime.utcnow() + timedelta(days=2)  # past the grace period for everything created now
+
+
+@pytest.fixture
+def stores(db, tmp_path):
+    objects = LocalStorageDriver(str(tmp_path / "objects"))
+    legacy = LocalStorageDriver(str(tmp_path / "legacy"))
+    user = User(email="jane@example.com", role="applicant")
+    db.add(user)
+    db.flush()
+
+    storage = ResumeStorageRepository(db, objects)
+
+    async def upload(data: bytes, referenced: bool) -> str:
+        path = await storage.save_upload(UploadFile(file=io.BytesIO(data), filename="cv.pdf"))
+        if referenced:
+            db.add(Resume(applicant_id=user.id, file_path=path))
+        db.commit()
+        return path
+
+    def legacy_file(name: str, referenced: bool):
+        os.makedirs(legacy.root, exist_ok=True)
+        with open(os.path.join(legacy.root, name), "wb") as f:
+            f.write(b"legacy " + name.encode())
+        if referenced:
+            db.add(Resume(applicant_id=user.id, file_path=f"{LEGACY_UPLOAD_DIR}/{name}"))
+            db.commit()
+
+    gc = StorageGCRepository(db, objects, legacy)
+    return gc, objects, legacy, upload, legacy_file, user
+
+
+async def live_keys(driver):
+    return [key async for key, _, _ in driver.list_objects()]
+
+
+@pytest.mark.asyncio
+async def test_orphans_are_quarantined_then_purged(db, stores):
+    gc, objects, legacy, upload, legacy_file, _ = stores
+    kept = await upload(b"kept resume", referenced=True)
+    orphan = await upload(b"orphaned resume", referenced=False)  # refcount 1 but no row points at it
+    legacy_file("resume_1_1.pdf", referenced=True)
+    legacy_file("resume_1_2.pdf", referenced=False)
+
+    # Within the grace period nothing is touched
+    fresh = await gc.sweep(batch_size=1)
+    assert fresh["orphans"] == 0
+    assert fresh["refcounts_repaired"] == 1
+
+    result = await gc.sweep(batch_size=1, now=LATER)
+    assert result["orphans"] == 2
+    assert result["orphan_bytes"] == len(b"orphaned resume") + len(b"legacy resume_1_2.pdf")
+    assert await live_keys(objects) == [kept[len(KEY_SCHEME):]]
+    assert await live_keys(legacy) == ["resume_1_1.pdf"]
+    assert await objects.exists(QUARANTINE_PREFIX + orphan[len(KEY_SCHEME):])
+    assert db.get(StoredFile, orphan[len(KEY_SCHEME):]).refcount == 0
+    assert result["purged"] == 0
+
+    purged = await gc.sweep(now=LATER + timedelta(days=8))
+    assert purged["purged"] == 2
+    assert purged["bytes_reclaimed"] == result["orphan_bytes"]
+    assert db.query(QuarantinedFile).count() == 0
+    assert db.get(StoredFile, orphan[len(KEY_SCHEME):]) is None
+    assert not await objects.exists(QUARANTINE_PREFIX + orphan[len(KEY_SCHEME):])
+
+
+@pytest.mark.asyncio
+async def test_quarantined_file_is_restored_when_referenced_again(db, stores):
+    gc, objects, _, upload, _, user = stores
+    path = await upload(b"resume that comes back", referenced=False)
+    await gc.sweep(now=LATER)
+    assert not await objects.exists(path[len(KEY_SCHEME):])
+
+    db.add(Resume(applicant_id=user.id, file_path=path))
+    db.commit()
+    result = await gc.sweep(now=LATER)
+    assert result["restored"] == 1
+    assert await objects.exists(path[len(KEY_SCHEME):])
+    assert db.query(QuarantinedFile).count() == 0
+
+
+@pytest.mark.asyncio
+async def test_rows_locked_by_an_in_flight_upload_are_treated_as_live(db, stores, monkeypatch):
+    gc, objects, _, upload, _, _ = stores
+    path = await upload(b"resume being re-uploaded", referenced=False)
+    key = path[len(KEY_SCHEME):]
+    execute = db.execute
+
+    def skip_locked(statement, *args, **kwargs):
+        # SQLite has no row locks: drop the row from the locked read as SKIP LOCKED would
+        if getattr(statement, "_for_update_arg", None) is not None:
+            statement = statement.where(StoredFile.key != key)
+        return execute(statement, *args, **kwargs)
+
+    monkeypatch.setattr(db, "execute", skip_locked)
+    result = await gc.sweep(now=LATER)
+    assert result["orphans"] == 0 and await objects.exists(key)
+
+    monkeypatch.undo()
+    assert (await gc.sweep(now=LATER))["orphans"] == 1  # once the upload is gone it is collected
+
+
+@pytest.mark.asyncio
+async def test_incremental_runs_resume_from_checkpoint(db, stores, tmp_path):
+    gc, objects, _, upload, _, _ = stores
+    for i in range(3):
+        await upload(f"orphan {i}".encode(), referenced=False)
+    checkpoint = str(tmp_path / "gc.checkpoint.json")
+
+    first = await gc.sweep(batch_size=1, max_objects=2, checkpoint_path=checkpoint, now=LATER)
+    assert (first["scanned"], first["complete"]) == (2, False)
+    assert json.load(open(checkpoint))["objects"]
+
+    second = await gc.sweep(batch_size=1, max_objects=2, checkpoint_path=checkpoint, now=LATER)
+    assert second["scanned"] == 1
+    assert db.query(QuarantinedFile).count() == 3
+    assert await live_keys(objects) == []
+
+
+@pytest.mark.asyncio
+async def test_dry_run_changes_nothing(db, stores):
+    gc, objects, _, upload, _, _ = stores
+    await upload(b"orphan", referenced=False)
+    result = await gc.sweep(dry_run=True, now=LATER)
+    assert result["orphans"] == 1
+    assert len(await live_keys(objects)) == 1
+    assert db.query(QuarantinedFile).count() == 0
@@ -0,0 +1,59 @@
+import pytest
+
+from app.utils import text_extractors
+from benchmarks.resume_parsing import build_corpus
+
+
+def _pages(*pages):
+    def backend(file_path):
+        yield from pages
+    return backend
+
+
+@pytest.fixture
+def fake_backends(monkeypatch):
+    def install(**backends):
+        for name, func in backends.items():
+            monkeypatch.setitem(text_extractors._BACKENDS, name, func)
+    return install
+
+
+def test_falls_back_when_fast_backend_finds_no_text(fake_backends):
+    fake_backends(fast=_pages("  ", "\n"), slow=_pages("John Doe", "Python"))
+    assert text_extractors.extract_text("cv.pdf", backends=["fast", "slow"]) == "John Doe\nPython"
+
+
+def test_falls_back_when_backend_raises(fake_backends):
+    def broken(file_path):
+        raise ValueError("bad xref")
+        yield
+
+    fake_backends(fast=broken, slow=_pages("text"))
+    assert text_extractors.extract_text("cv.pdf", backends=["fast", "slow"]) == "text"
+
+
+def test_page_cap_and_early_stop(fake_backends):
+    consumed = []
+
+    def counting(file_path):
+        for n in range(100):
+            consumed.append(n)
+            yield "x" * 10
+
+    fake_backends(counting=counting)
+    assert text_extractors.extract_with("counting", "cv.pdf", max_pages=3) == "\n".join(["x" * 10] * 3)
+    consumed.clear()
+    assert len(text_extractors.extract_with("counting", "cv.pdf", max_chars=25)) == 25
+    assert consumed == [0, 1, 2]
+
+
+def test_unsupported_format():
+    with pytest.raises(text_extractors.UnsupportedFormatError):
+        text_extractors.extract_text("cv.txt")
+
+
+def test_default_backends_read_real_files(tmp_path):
+    build_corpus(str(tmp_path), seed=3, copies=1, page_counts=[2])
+    for name in ("resume_p02_low_0.pdf", "resume_p02_low_0.docx"):
+        text = text_extractors.extract_text(str(tmp_path / name))
+        assert text.count("EXPERIENCE:") == 2